@@ -0,0 +1,412 @@
+"""
+API HTTP/JSON local sobre TaskService.
+
+Servidor opcional basado en ``http.server`` de la biblioteca estándar, para
+acceder a las tareas sin la interfaz gráfica. Cada petición abre su propia
+sesión sobre un motor con pool de conexiones y la cierra al responder, en
+lugar de compartir una sesión de larga duración entre hilos. Lo que dura lo
+que el servidor es la caché de respuestas GET (véase más abajo).
+
+Rutas:
+
+    GET    /tasks                 Página de tareas (cursor, page_size, estado,
+                                  prioridad, categoria, include_deleted)
+    GET    /tasks/search?q=...    Búsqueda por palabras clave
+    GET    /tasks/changes         Cambios desde ``since`` (token de la respuesta
+                                  anterior; sin él, todas las tareas), con ``limit``
+    GET    /tasks/<id>            Una tarea (incluidas las eliminadas)
+    POST   /tasks                 Crear una tarea
+    PATCH  /tasks/<id>            Actualizar título, descripción, fecha, prioridad o categoría
+    DELETE /tasks/<id>            Enviar a la papelera (``?permanent=1`` la borra)
+    POST   /tasks/batch           ``{"action": ..., "ids": [...]}`` con action en
+                                  complete, delete, restore, favorite, unfavorite
+
+Las respuestas GET llevan ``ETag``, calculado a partir del token del
+registro de cambios (``TaskService.change_token``) y de la ruta pedida. Se
+conoce antes de ejecutar la consulta: con ``If-None-Match`` se responde 304
+sin cuerpo y sin consultar si nada cambió. Las respuestas se guardan en una
+caché del servidor con la misma clave, por lo que cualquier cambio, venga de
+la API o de otra conexión, deja de coincidir con las entradas anteriores.
+
+Uso (desde ``src``):
+
+    python -m todo_app.api --port 8765 --pool-size 8
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import traceback
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from sqlalchemy import make_url
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from todo_app.models.database import create_db_engine, default_url, sqlite_url
+from todo_app.models.models import Categoria, NivelPrioridad
+from todo_app.models.sqlite_profiles import PROFILES
+from todo_app.repositories.bulk import export_value
+from todo_app.repositories.controllers import DEFAULT_PAGE_SIZE
+from todo_app.services.query_cache import DEFAULT_MAX_ENTRIES, QueryCache
+from todo_app.services.task_service import TaskService
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_POOL_SIZE = 8
+MAX_PAGE_SIZE = 500
+
+TASK_FIELDS = [
+    'id', 'titulo', 'descripcion', 'fecha_vencimiento', 'prioridad',
+    'categoria', 'completada', 'favorita', 'eliminada'
+]
+ESTADOS = ('completadas', 'pendientes')
+BATCH_ACTIONS = {
+    'complete': lambda service, ids: service.complete_tasks(ids),
+    'delete': lambda service, ids: service.delete_tasks(ids),
+    'restore': lambda service, ids: service.restore_tasks(ids),
+    'favorite': lambda service, ids: service.favorite_tasks(ids, is_favorite=True),
+    'unfavorite': lambda service, ids: service.favorite_tasks(ids, is_favorite=False),
+}
+
+
+class APIError(Exception):
+    """Error que se devuelve al cliente con un código HTTP y un mensaje."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def task_to_dict(task):
+    """
+    Convierte una tarea en un diccionario serializable a JSON.
+
+    Args:
+        task (Tarea | TaskRow): Tarea del ORM o fila de solo lectura.
+
+    Returns:
+        dict: Campos de la tarea, con enums por nombre y fechas ISO.
+    """
+    return {field: export_value(getattr(task, field)) for field in TASK_FIELDS}
+
+
+def _choice(params, name, allowed):
+    value = params.get(name)
+    if value is not None and value not in allowed:
+        raise APIError(HTTPStatus.BAD_REQUEST, f"{name} inválido: {value!r} (valores: {', '.join(allowed)})")
+    return value
+
+
+def _flag(params, name):
+    return params.get(name, '').lower() in ('1', 'true', 'si', 'sí', 'yes')
+
+
+def _encode(result):
+    return json.dumps(result, ensure_ascii=False).encode('utf-8')
+
+
+def _task_id(text):
+    try:
+        return int(text)
+    except ValueError:
+        raise APIError(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: /tasks/{text}") from None
+
+
+def _text(body, name):
+    value = body.get(name)
+    if value is not None and not isinstance(value, str):
+        raise APIError(HTTPStatus.BAD_REQUEST, f"{name} debe ser una cadena de texto o null")
+    return value
+
+
+def _task_fields(body, required):
+    """Valida los campos de una tarea recibidos en el cuerpo de la petición."""
+    unknown = set(body) - {'titulo', 'descripcion', 'fecha_vencimiento', 'prioridad', 'categoria'}
+    if unknown:
+        raise APIError(HTTPStatus.BAD_REQUEST, f"Campos desconocidos: {', '.join(sorted(unknown))}")
+    titulo, descripcion = _text(body, 'titulo'), _text(body, 'descripcion')
+    if required and not (titulo or '').strip():
+        raise APIError(HTTPStatus.BAD_REQUEST, "titulo es obligatorio")
+    try:
+        due = body.get('fecha_vencimiento')
+        due = date.fromisoformat(due) if due else None
+    except (TypeError, ValueError):
+        raise APIError(HTTPStatus.BAD_REQUEST, f"fecha_vencimiento inválida: {due!r}") from None
+    prioridad = _choice(body, 'prioridad', [member.name for member in NivelPrioridad])
+    categoria = _choice(body, 'categoria', [member.name for member in Categoria])
+    return titulo, descripcion, due, prioridad, categoria
+
+
+class TaskAPI:
+    """Enrutado y lógica de la API, independiente del servidor HTTP."""
+
+    def __init__(self, engine, cache_size=DEFAULT_MAX_ENTRIES):
+        """
+        Inicializa la API sobre un motor de base de datos.
+
+        Args:
+            engine (Engine): Motor con pool; cada petición abre una sesión propia.
+            cache_size (int): Respuestas GET guardadas.
+        """
+        self.session_factory = sessionmaker(bind=engine)
+        # Cuerpos de las respuestas GET por (token de cambios, ruta); compartida
+        # por los hilos del servidor.
+        self.responses = QueryCache(cache_size)
+
+    def handle(self, method, target, body=b'', if_none_match=None):
+        """
+        Atiende una petición.
+
+        Los errores inesperados se responden con 500 y un cuerpo JSON, en
+        lugar de cerrar la conexión sin respuesta.
+
+        Args:
+            method (str): Método HTTP.
+            target (str): Ruta con la cadena de consulta.
+            body (bytes): Cuerpo de la petición.
+            if_none_match (str): Cabecera ``If-None-Match``, si la hay.
+
+        Returns:
+            tuple: (código HTTP, cuerpo en bytes, cabeceras adicionales).
+        """
+        url = urlsplit(target)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise APIError(HTTPStatus.BAD_REQUEST, "Se esperaba un objeto JSON")
+            with self.session_factory() as session:
+                service = TaskService(session=session, query_cache=False)
+                if method == 'GET':
+                    return self._cached_get(target, parts, params, payload, service, if_none_match)
+                status, result = self._route(method, parts, params, payload, service)
+        except APIError as exc:
+            status, result = exc.status, {'error': str(exc)}
+        except ValueError as exc:
+            status, result = HTTPStatus.BAD_REQUEST, {'error': str(exc)}
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            status, result = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': "Error interno del servidor"}
+
+        return status, _encode(result), {}
+
+    def _cached_get(self, target, parts, params, payload, service, if_none_match):
+        # Las respuestas GET dependen solo del estado de la base y de la ruta.
+        state = service.change_token()
+        etag = '"%s"' % hashlib.blake2b(f'{state} {target}'.encode('utf-8'), digest_size=16).hexdigest()
+        headers = {'ETag': etag}
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(',')]:
+            return HTTPStatus.NOT_MODIFIED, b'', headers
+        # Los errores se lanzan dentro de load() y no se guardan.
+        data = self.responses.get_or_load(
+            (state, target), lambda: _encode(self._route('GET', parts, params, payload, service)[1])
+        )
+        return HTTPStatus.OK, data, headers
+
+    def _route(self, method, parts, params, body, service):
+        if not parts or parts[0] != 'tasks' or len(parts) > 2:
+            raise APIError(HTTPStatus.NOT_FOUND, "Ruta no encontrada")
+        if len(parts) == 1:
+            handlers = {'GET': self._list, 'POST': self._create}
+            args = (params, body, service)
+        elif parts[1] == 'search':
+            handlers = {'GET': self._search}
+            args = (params, service)
+        elif parts[1] == 'changes':
+            handlers = {'GET': self._changes}
+            args = (params, service)
+        elif parts[1] == 'batch':
+            handlers = {'POST': self._batch}
+            args = (body, service)
+        else:
+            handlers = {'GET': self._get, 'PATCH': self._update, 'DELETE': self._delete}
+            args = (_task_id(parts[1]), params, body, service)
+        if method not in handlers:
+            raise APIError(HTTPStatus.METHOD_NOT_ALLOWED, f"Método no permitido: {method}")
+        return handlers[method](*args)
+
+    def _list(self, params, body, service):
+        try:
+            page_size = int(params.get('page_size', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise APIError(HTTPStatus.BAD_REQUEST, "page_size debe ser un entero") from None
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"page_size debe estar entre 1 y {MAX_PAGE_SIZE}")
+        page = service.get_task_rows_page(
+            params.get('cursor'), page_size,
+            include_deleted=_flag(params, 'include_deleted'),
+            estado=_choice(params, 'estado', ESTADOS),
+            prioridad=_choice(params, 'prioridad', [member.name for member in NivelPrioridad]),
+            categoria=_choice(params, 'categoria', [member.name for member in Categoria]),
+        )
+        return HTTPStatus.OK, {
+            'tasks': [task_to_dict(task) for task in page.tasks],
+            'next_cursor': page.next_cursor,
+        }
+
+    def _search(self, params, service):
+        tasks = service.search_task_rows(params.get('q', ''))
+        return HTTPStatus.OK, {'tasks': [task_to_dict(task) for task in tasks]}
+
+    def _changes(self, params, service):
+        try:
+            limit = int(params.get('limit', MAX_PAGE_SIZE))
+        except ValueError:
+            raise APIError(HTTPStatus.BAD_REQUEST, "limit debe ser un entero") from None
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"limit debe estar entre 1 y {MAX_PAGE_SIZE}")
+        changes = service.changes_since(params.get('since'), limit)
+        return HTTPStatus.OK, {
+            'created': [task_to_dict(task) for task in changes.created],
+            'updated': [task_to_dict(task) for task in changes.updated],
+            'deleted': changes.deleted,
+            'token': changes.token,
+            'has_more': changes.has_more,
+        }
+
+    def _find(self, task_id, service):
+        found = service.get_task_rows_by_ids([task_id])
+        if not found:
+            raise APIError(HTTPStatus.NOT_FOUND, f"No existe la tarea {task_id}")
+        return found[0]
+
+    def _get(self, task_id, params, body, service):
+        return HTTPStatus.OK, task_to_dict(self._find(task_id, service))
+
+    def _create(self, params, body, service):
+        titulo, descripcion, due, prioridad, categoria = _task_fields(body, required=True)
+        task = service.create_task(titulo.strip(), descripcion, due, prioridad or 'media', categoria)
+        return HTTPStatus.CREATED, task_to_dict(task)
+
+    def _update(self, task_id, params, body, service):
+        self._find(task_id, service)
+        titulo, descripcion, due, prioridad, categoria = _task_fields(body, required=False)
+        service.update_task(task_id, titulo, descripcion, due, prioridad, categoria)
+        return HTTPStatus.OK, task_to_dict(self._find(task_id, service))
+
+    def _delete(self, task_id, params, body, service):
+        self._find(task_id, service)
+        if _flag(params, 'permanent'):
+            service.permanently_delete_task(task_id)
+        else:
+            service.delete_task(task_id)
+        return HTTPStatus.OK, {'id': task_id, 'deleted': True}
+
+    def _batch(self, body, service):
+        action = BATCH_ACTIONS.get(body.get('action'))
+        if action is None:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"action debe ser una de: {', '.join(BATCH_ACTIONS)}")
+        ids = body.get('ids')
+        if not isinstance(ids, list) or not all(type(task_id) is int for task_id in ids):
+            raise APIError(HTTPStatus.BAD_REQUEST, "ids debe ser una lista de enteros")
+        return HTTPStatus.OK, {'changed': action(service, ids)}
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    """Traduce las peticiones HTTP a ``TaskAPI.handle``."""
+
+    server_version = 'TodoAPI/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def _dispatch(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, data, headers = self.server.api.handle(
+            self.command, self.path, body, self.headers.get('If-None-Match')
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def _pool_options(url, pool_size):
+    """
+    Opciones de pool para ``create_db_engine`` según el pool que use la URL.
+
+    Solo los pools de tipo ``QueuePool`` aceptan ``pool_size``; una base en
+    memoria usa uno que no lo admite y se deja con sus opciones por defecto.
+    El pool solo multiplica los lectores: SQLite admite un único escritor y
+    las escrituras concurrentes esperan su turno en el bloqueo de la base.
+
+    Args:
+        url (str): URL de SQLAlchemy.
+        pool_size (int): Conexiones que mantener abiertas.
+
+    Returns:
+        dict: Argumentos adicionales para ``create_engine``.
+    """
+    url = make_url(url)
+    if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        return {'pool_size': pool_size}
+    return {}
+
+
+def make_server(engine, host=DEFAULT_HOST, port=DEFAULT_PORT, verbose=False, cache_size=DEFAULT_MAX_ENTRIES):
+    """
+    Crea el servidor HTTP (un hilo por conexión) sin arrancarlo.
+
+    Args:
+        engine (Engine): Motor con pool de conexiones.
+        host (str): Dirección en la que escuchar.
+        port (int): Puerto (0 para uno libre).
+        verbose (bool): Si True, registra cada petición en stderr.
+        cache_size (int): Respuestas GET guardadas por el servidor.
+
+    Returns:
+        ThreadingHTTPServer: Servidor listo para ``serve_forever()``.
+    """
+    server = ThreadingHTTPServer((host, port), APIRequestHandler)
+    server.daemon_threads = True
+    server.api = TaskAPI(engine, cache_size)
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    """Punto de entrada: ``python -m todo_app.api``."""
+    parser = argparse.ArgumentParser(prog='todo_app.api', description='API HTTP/JSON local de tareas.')
+    parser.add_argument('--db', help='Archivo SQLite (por defecto, el de la aplicación)')
+    parser.add_argument('--profile', choices=list(PROFILES),
+                        help='Perfil de SQLite (por defecto, TODO_DB_PROFILE o balanced)')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='Dirección en la que escuchar')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Puerto (0 para uno libre)')
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE,
+                        help='Conexiones de lectura mantenidas en el pool')
+    parser.add_argument('--verbose', action='store_true', help='Registrar cada petición')
+    args = parser.parse_args(argv)
+
+    url = sqlite_url(args.db) if args.db else default_url()
+    engine = create_db_engine(url, args.profile, **_pool_options(url, args.pool_size))
+    server = make_server(engine, args.host, args.port, args.verbose)
+    host, port = server.server_address[:2]
+    print(f'Sirviendo en http://{host}:{port}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        engine.dispose()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""
+Pruebas de rendimiento de la aplicación To-Do List.
+
+Cada módulo se ejecuta con ``python -m todo_app.benchmarks.<modulo>`` desde
+el directorio ``src`` y no forma parte de la suite de pruebas unitarias.
+"""
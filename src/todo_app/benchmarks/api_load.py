@@ -0,0 +1,176 @@
+"""
+Prueba de carga de la API HTTP local (``todo_app.api``).
+
+Arranca el servidor en un subproceso sobre una copia de una base generada
+con ``benchmarks.data`` y lanza ``--clients`` hilos, cada uno con su propia
+conexión HTTP persistente, que hacen ``--requests`` peticiones mezclando
+páginas filtradas, búsquedas, GET condicionales (``If-None-Match``) y, con
+``--write-ratio``, marcados de favoritas en lote.
+
+Informa peticiones por segundo, latencias p50 y p99 y la proporción de
+respuestas 304. Con ``--url`` se mide un servidor ya en marcha.
+
+Uso (desde ``src``):
+
+    python -m todo_app.benchmarks.api_load --tasks 100000 --clients 16 --requests 500
+"""
+
+import argparse
+import http.client
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+from todo_app.benchmarks.cold_start import DEFAULT_CACHE_DIR
+from todo_app.benchmarks.data import ensure_database
+
+PAGE_QUERIES = [
+    '/tasks?page_size=50',
+    '/tasks?page_size=50&estado=pendientes',
+    '/tasks?page_size=50&prioridad=alta',
+    '/tasks?page_size=50&categoria=hogar&estado=completadas',
+]
+KEYWORDS = ['informe', 'reunión', 'factura', 'jardín']
+
+
+def start_server(db_path, pool_size):
+    """
+    Arranca ``python -m todo_app.api`` en un puerto libre.
+
+    Returns:
+        tuple: (proceso, URL base del servidor).
+    """
+    src = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src, os.environ.get('PYTHONPATH')])))
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'todo_app.api', '--db', db_path, '--port', '0',
+         '--pool-size', str(pool_size)],
+        stdout=subprocess.PIPE, text=True, env=env,
+    )
+    line = process.stdout.readline().strip()
+    if not line.startswith('Sirviendo en '):
+        process.kill()
+        raise RuntimeError(f"El servidor no arrancó: {line!r}")
+    return process, line[len('Sirviendo en '):]
+
+
+def _request_plan(index, write_ratio):
+    """Devuelve (método, ruta, cuerpo) de la petición ``index``."""
+    if write_ratio and index % round(1 / write_ratio) == 0:
+        body = {'action': 'favorite' if index % 2 else 'unfavorite', 'ids': [index % 1000 + 1]}
+        return 'POST', '/tasks/batch', body
+    if index % 3 == 1:
+        keyword = f'{KEYWORDS[index % len(KEYWORDS)]} {index * 37 % 1000}'
+        return 'GET', '/tasks/search?q=' + quote(keyword), None
+    return 'GET', PAGE_QUERIES[index % len(PAGE_QUERIES)], None
+
+
+def run_client(base_url, offset, requests, write_ratio, results):
+    """
+    Hace ``requests`` peticiones por una conexión persistente.
+
+    Guarda en ``results`` tuplas (latencia en ms, código HTTP). Recuerda el
+    ETag de cada ruta para repetirla como GET condicional.
+    """
+    url = urlsplit(base_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=30)
+    etags = {}
+    try:
+        for i in range(requests):
+            method, path, body = _request_plan(offset + i, write_ratio)
+            headers = {}
+            if method == 'GET' and path in etags:
+                headers['If-None-Match'] = etags[path]
+            data = None
+            if body is not None:
+                data = json.dumps(body).encode('utf-8')
+                headers['Content-Type'] = 'application/json'
+            start = time.perf_counter()
+            connection.request(method, path, data, headers)
+            response = connection.getresponse()
+            response.read()
+            results.append(((time.perf_counter() - start) * 1000, response.status))
+            if response.getheader('ETag'):
+                etags[path] = response.getheader('ETag')
+    finally:
+        connection.close()
+
+
+def run_load(base_url, clients, requests, write_ratio=0.0):
+    """
+    Lanza los clientes en paralelo.
+
+    Returns:
+        tuple: (lista de (latencia ms, código), segundos totales).
+    """
+    results = []
+    threads = [
+        threading.Thread(target=run_client, args=(base_url, n * requests, requests, write_ratio, results))
+        for n in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.perf_counter() - start
+
+
+def summarize(results, elapsed):
+    """Formatea el informe."""
+    latencies = [latency for latency, _ in results]
+    statuses = [status for _, status in results]
+    errors = sum(1 for status in statuses if status >= 400)
+    p99 = statistics.quantiles(latencies, n=100)[-1]
+    lines = [
+        f"peticiones     {len(results)}",
+        f"peticiones/s   {len(results) / elapsed:.0f}",
+        f"p50 ms         {statistics.median(latencies):.2f}",
+        f"p99 ms         {p99:.2f}",
+        f"304            {statuses.count(304) / len(statuses):.0%}",
+        f"errores        {errors}",
+    ]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Prepara la base, arranca el servidor (salvo con ``--url``) y mide."""
+    parser = argparse.ArgumentParser(description='Prueba de carga de la API HTTP local.')
+    parser.add_argument('--tasks', type=int, default=100000, help='Tareas en la base')
+    parser.add_argument('--clients', type=int, default=16, help='Clientes simultáneos')
+    parser.add_argument('--requests', type=int, default=500, help='Peticiones por cliente')
+    parser.add_argument('--write-ratio', type=float, default=0.0,
+                        help='Fracción de peticiones que son escrituras en lote (0 a 1)')
+    parser.add_argument('--pool-size', type=int, default=None,
+                        help='Conexiones del pool del servidor (por defecto, una por cliente)')
+    parser.add_argument('--url', help='Medir un servidor ya en marcha en lugar de arrancar uno')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Carpeta de bases generadas')
+    args = parser.parse_args(argv)
+
+    if args.url:
+        results, elapsed = run_load(args.url, args.clients, args.requests, args.write_ratio)
+        print(summarize(results, elapsed))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Copia de la base en caché: las escrituras no deben alterarla.
+        db_path = os.path.join(tmp, 'tareas.db')
+        shutil.copyfile(ensure_database(args.cache_dir, args.tasks), db_path)
+        process, base_url = start_server(db_path, args.pool_size or args.clients)
+        try:
+            results, elapsed = run_load(base_url, args.clients, args.requests, args.write_ratio)
+        finally:
+            process.terminate()
+            process.wait()
+    print(summarize(results, elapsed))
+
+
+if __name__ == '__main__':
+    main()
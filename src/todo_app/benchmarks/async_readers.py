@@ -0,0 +1,141 @@
+"""
+Lectores simultáneos: AsyncTaskService frente a TaskService con ``run_in_executor``.
+
+Sobre una misma base generada con ``benchmarks.data`` lanza ``--readers``
+corrutinas que hacen ``--queries`` lecturas cada una (una página filtrada y
+una búsqueda alternadas), y compara:
+
+- ``async``: un AsyncTaskService por corrutina sobre un motor ``aiosqlite``.
+- ``executor``: un TaskService por hilo de un ``ThreadPoolExecutor``, que es
+  lo que había que hacer antes para llamar al servicio desde asyncio.
+
+Requiere ``aiosqlite`` y ``greenlet``.
+
+Uso (desde ``src``):
+
+    python -m todo_app.benchmarks.async_readers --tasks 100000 --readers 50 --queries 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from todo_app.benchmarks.cold_start import DEFAULT_CACHE_DIR
+from todo_app.benchmarks.data import ensure_database
+from todo_app.models.database import create_async_db_engine, create_db_engine, sqlite_url
+from todo_app.services.task_service import TaskService
+
+FILTERS = [
+    {'estado': 'pendientes'},
+    {'prioridad': 'alta'},
+    {'categoria': 'hogar'},
+    {'estado': 'completadas', 'prioridad': 'baja'},
+]
+KEYWORDS = ['informe', 'reunión', 'factura', 'jardín']
+
+
+def _query(index):
+    """Devuelve la operación ``index`` de la secuencia de lecturas."""
+    if index % 2:
+        # Palabra más prefijo numérico del título: decenas de resultados, no miles.
+        keyword = f'{KEYWORDS[index % len(KEYWORDS)]} {index * 37 % 1000}'
+        return 'search_tasks', (keyword,), {}
+    return 'get_tasks_page', (), dict(page_size=50, **FILTERS[index % len(FILTERS)])
+
+
+async def run_async(url, readers, queries):
+    """
+    Ejecuta los lectores con un AsyncTaskService cada uno.
+
+    Returns:
+        list: Latencias por lectura en milisegundos.
+    """
+    from todo_app.services.async_task_service import AsyncTaskService
+
+    engine = await create_async_db_engine(url, pool_size=readers)
+    latencies = []
+
+    async def reader(offset):
+        async with AsyncTaskService(engine) as service:
+            for i in range(queries):
+                operation, args, kwargs = _query(offset + i)
+                start = time.perf_counter()
+                await getattr(service, operation)(*args, **kwargs)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    try:
+        await asyncio.gather(*(reader(offset) for offset in range(readers)))
+    finally:
+        await engine.dispose()
+    return latencies
+
+
+async def run_executor(url, readers, queries):
+    """
+    Ejecuta los lectores llamando a TaskService mediante ``run_in_executor``.
+
+    Returns:
+        list: Latencias por lectura en milisegundos.
+    """
+    engine = create_db_engine(url, pool_size=readers)
+    local = threading.local()
+    services = []
+    latencies = []
+
+    def call(operation, args, kwargs):
+        service = getattr(local, 'service', None)
+        if service is None:
+            service = local.service = TaskService(engine=engine)
+            services.append(service)
+        getattr(service, operation)(*args, **kwargs)
+        service.controller.session.rollback()
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=readers)
+
+    async def reader(offset):
+        for i in range(queries):
+            operation, args, kwargs = _query(offset + i)
+            start = time.perf_counter()
+            await loop.run_in_executor(executor, call, operation, args, kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    try:
+        await asyncio.gather(*(reader(offset) for offset in range(readers)))
+    finally:
+        executor.shutdown()
+        for service in services:
+            service.controller.session.close()
+        engine.dispose()
+    return latencies
+
+
+def summarize(name, latencies, elapsed):
+    """Formatea una línea del informe."""
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    rate = len(latencies) / elapsed
+    return f"{name:<10} {statistics.median(latencies):>11.2f} {p95:>9.2f} {rate:>12.0f}"
+
+
+def main(argv=None):
+    """Genera (o reutiliza) la base y compara ambos modos."""
+    parser = argparse.ArgumentParser(description='Lectores simultáneos sync/async.')
+    parser.add_argument('--tasks', type=int, default=100000, help='Tareas en la base')
+    parser.add_argument('--readers', type=int, default=50, help='Corrutinas lectoras simultáneas')
+    parser.add_argument('--queries', type=int, default=20, help='Lecturas por corrutina')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Carpeta de bases generadas')
+    args = parser.parse_args(argv)
+
+    url = sqlite_url(ensure_database(args.cache_dir, args.tasks))
+    print(f"{'modo':<10} {'mediana ms':>11} {'p95 ms':>9} {'lecturas/s':>12}")
+    for name, runner in (('async', run_async), ('executor', run_executor)):
+        start = time.perf_counter()
+        latencies = asyncio.run(runner(url, args.readers, args.queries))
+        print(summarize(name, latencies, time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
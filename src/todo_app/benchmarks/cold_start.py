@@ -0,0 +1,139 @@
+"""
+Benchmark de arranque en frío de ``main.py`` con bases de distintos tamaños.
+
+Para cada tamaño (por defecto 1k, 100k y 1M tareas) lanza varios procesos
+nuevos de ``python -m todo_app.main --exit-after-paint`` con la plataforma
+Qt ``offscreen`` y ``TODO_TRACE_STARTUP=json``, y resume el tiempo total
+hasta el primer pintado y el desglose por fases.
+
+"En frío" significa proceso nuevo: no se vacía la caché de páginas del
+sistema operativo, que requiere privilegios de administrador.
+
+Termina con código 1 si algún tamaño supera ``--max-ms`` o si empeora más
+de ``--tolerance`` respecto a la línea base guardada con ``--save-baseline``.
+
+Uso (desde ``src``):
+
+    python -m todo_app.benchmarks.cold_start --sizes 1000 100000 --save-baseline base.json
+    python -m todo_app.benchmarks.cold_start --sizes 1000 100000 --baseline base.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from todo_app.benchmarks.data import ensure_database
+from todo_app.main import EXIT_AFTER_PAINT_FLAG
+from todo_app.models.database import DB_PATH_ENV_VAR
+from todo_app.startup_trace import TRACE_ENV_VAR
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DEFAULT_SIZES = [1000, 100000, 1000000]
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'todo_app_bench')
+
+
+def run_once(db_path):
+    """
+    Arranca la aplicación una vez y devuelve las trazas del proceso.
+
+    Args:
+        db_path (str): Base de datos a abrir.
+
+    Returns:
+        dict: Trazas en el formato de ``StartupTracer.as_dict``.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PYTHONPATH=SRC_DIR)
+    env[DB_PATH_ENV_VAR] = db_path
+    env[TRACE_ENV_VAR] = 'json'
+    result = subprocess.run(
+        [sys.executable, '-m', 'todo_app.main', EXIT_AFTER_PAINT_FLAG],
+        env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(db_path, runs):
+    """
+    Ejecuta ``runs`` arranques y agrega las medianas.
+
+    Returns:
+        dict: ``{'total_ms': mediana, 'phases': {fase: mediana_ms}}``.
+    """
+    traces = [run_once(db_path) for _ in range(runs)]
+    phases = {}
+    for trace in traces:
+        for phase in trace['phases']:
+            phases.setdefault(phase['name'], []).append(phase['duration_ms'])
+    return {
+        'total_ms': statistics.median(trace['total_ms'] for trace in traces),
+        'phases': {name: statistics.median(values) for name, values in phases.items()},
+    }
+
+
+def find_regressions(results, baseline, tolerance, max_ms):
+    """
+    Compara los resultados con la línea base y el presupuesto absoluto.
+
+    Args:
+        results (dict): ``{tamaño: medición}`` de esta ejecución.
+        baseline (dict): ``{tamaño: medición}`` guardada, o None.
+        tolerance (float): Empeoramiento relativo permitido (0.2 = 20 %).
+        max_ms (float): Tiempo máximo absoluto, o None.
+
+    Returns:
+        list: Mensajes describiendo cada regresión.
+    """
+    problems = []
+    for size, result in results.items():
+        total = result['total_ms']
+        if max_ms is not None and total > max_ms:
+            problems.append(f'{size} tareas: {total:.0f} ms supera el máximo de {max_ms:.0f} ms')
+        reference = (baseline or {}).get(str(size))
+        if reference and total > reference['total_ms'] * (1 + tolerance):
+            problems.append(
+                f"{size} tareas: {total:.0f} ms frente a {reference['total_ms']:.0f} ms "
+                f"de la línea base (+{tolerance:.0%} permitido)"
+            )
+    return problems
+
+
+def main(argv=None):
+    """Ejecuta el benchmark e imprime el desglose por tamaño."""
+    parser = argparse.ArgumentParser(description='Arranque en frío de la aplicación por tamaño de base.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Número de tareas')
+    parser.add_argument('--runs', type=int, default=5, help='Arranques por tamaño')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Carpeta de las bases generadas')
+    parser.add_argument('--baseline', help='Archivo JSON con una línea base para comparar')
+    parser.add_argument('--save-baseline', help='Guardar los resultados como línea base')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Empeoramiento permitido')
+    parser.add_argument('--max-ms', type=float, help='Tiempo máximo absoluto hasta el primer pintado')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for size in args.sizes:
+        db_path = ensure_database(args.cache_dir, size)
+        results[size] = measure(db_path, args.runs)
+        print(f'\n== {size} tareas: {results[size]["total_ms"]:.1f} ms hasta el primer pintado')
+        for name, duration in results[size]['phases'].items():
+            print(f'{duration:>10.1f} ms  {name}')
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as stream:
+            json.dump({str(size): result for size, result in results.items()}, stream, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as stream:
+            baseline = json.load(stream)
+    problems = find_regressions(results, baseline, args.tolerance, args.max_ms)
+    for problem in problems:
+        print(f'REGRESIÓN: {problem}', file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Latencia de commit por perfil de SQLite.
+
+Crea una base temporal en disco por cada perfil y mide cuánto tarda
+``TaskController.add_task`` (una tarea, un commit) en cada caso.
+
+Uso (desde ``src``):
+
+    python -m todo_app.benchmarks.commit_latency --commits 500
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+
+from todo_app.models.database import create_db_engine, sqlite_url
+from todo_app.models.sqlite_profiles import PROFILES
+from todo_app.repositories.controllers import TaskController
+
+
+def measure(profile, commits, directory):
+    """
+    Mide la latencia de ``commits`` inserciones confirmadas una a una.
+
+    Args:
+        profile (str): Perfil de SQLite.
+        commits (int): Número de tareas a insertar.
+        directory (str): Carpeta donde crear la base temporal.
+
+    Returns:
+        list: Latencias en milisegundos.
+    """
+    path = os.path.join(directory, f'{profile}.db')
+    engine = create_db_engine(sqlite_url(path), profile)
+    controller = TaskController(engine=engine)
+    latencies = []
+    for i in range(commits):
+        start = time.perf_counter()
+        controller.add_task(f'Tarea {i}', 'Benchmark', date.today())
+        latencies.append((time.perf_counter() - start) * 1000)
+    controller.session.close()
+    engine.dispose()
+    return latencies
+
+
+def main(argv=None):
+    """Ejecuta la medición para todos los perfiles e imprime un resumen."""
+    parser = argparse.ArgumentParser(description='Latencia de commit por perfil de SQLite.')
+    parser.add_argument('--commits', type=int, default=300, help='Commits por perfil')
+    parser.add_argument('--dir', help='Carpeta para las bases temporales (por defecto, una temporal)')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        print(f"{'perfil':<10} {'mediana ms':>11} {'p95 ms':>9} {'commits/s':>10}")
+        for profile in PROFILES:
+            latencies = measure(profile, args.commits, directory)
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            rate = len(latencies) / (sum(latencies) / 1000)
+            print(f"{profile:<10} {statistics.median(latencies):>11.3f} {p95:>9.3f} {rate:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
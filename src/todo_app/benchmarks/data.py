@@ -0,0 +1,118 @@
+"""
+Generador de datos sintéticos para los benchmarks.
+
+Produce tareas con distribuciones parecidas a las de un uso real:
+la mayoría con prioridad media, un tercio completadas, unas pocas en la
+papelera y fechas de vencimiento concentradas alrededor de hoy.
+"""
+
+import os
+import random
+from datetime import date, timedelta
+
+from sqlalchemy import func, select
+
+from todo_app.models.database import create_db_engine, sqlite_url
+from todo_app.models.models import Tarea, TareaBorrada, NivelPrioridad, Categoria
+
+DEFAULT_SEED = 1234
+INSERT_BATCH_SIZE = 10000
+
+PRIORIDADES = [(NivelPrioridad.baja, 30), (NivelPrioridad.media, 50), (NivelPrioridad.alta, 20)]
+CATEGORIAS = [(Categoria.trabajo, 40), (Categoria.hogar, 30), (Categoria.estudio, 20), (None, 10)]
+PALABRAS = [
+    'informe', 'reunión', 'comprar', 'llamar', 'revisar', 'proyecto', 'canción', 'examen',
+    'limpiar', 'pagar', 'factura', 'médico', 'entregar', 'presentación', 'leer', 'capítulo',
+    'correo', 'cliente', 'jardín', 'cocina', 'viaje', 'reservar', 'estudiar', 'práctica',
+]
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def generate_tasks(count, seed=DEFAULT_SEED, today=None):
+    """
+    Genera diccionarios con los valores de columna de ``count`` tareas.
+
+    Args:
+        count (int): Número de tareas.
+        seed (int): Semilla para que los datos sean reproducibles.
+        today (date): Fecha de referencia para los vencimientos.
+
+    Yields:
+        dict: Valores listos para ``insert()``.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    for i in range(count):
+        due = None
+        if rng.random() >= 0.1:
+            due = today + timedelta(days=int(rng.gauss(10, 30)))
+        yield {
+            'titulo': ' '.join(rng.sample(PALABRAS, rng.randint(2, 4))).capitalize() + f' {i}',
+            'descripcion': ' '.join(rng.choices(PALABRAS, k=rng.randint(0, 12))) or None,
+            'fecha_vencimiento': due,
+            'completada': rng.random() < 0.35,
+            'prioridad': _weighted(rng, PRIORIDADES),
+            'categoria': _weighted(rng, CATEGORIAS),
+            'favorita': rng.random() < 0.08,
+            'eliminada': rng.random() < 0.05,
+        }
+
+
+def populate(engine, count, seed=DEFAULT_SEED, batch_size=INSERT_BATCH_SIZE):
+    """
+    Inserta ``count`` tareas sintéticas por lotes.
+
+    Args:
+        engine (Engine): Motor de la base destino (con el esquema creado).
+        count (int): Número de tareas.
+        seed (int): Semilla de generación.
+        batch_size (int): Tareas por transacción.
+    """
+    statement = Tarea.__table__.insert()
+    batch = []
+    for values in generate_tasks(count, seed):
+        batch.append(values)
+        if len(batch) >= batch_size:
+            with engine.begin() as connection:
+                connection.execute(statement, batch)
+            batch = []
+    if batch:
+        with engine.begin() as connection:
+            connection.execute(statement, batch)
+
+
+def ensure_database(directory, count, seed=DEFAULT_SEED, profile='fast'):
+    """
+    Devuelve la ruta de una base con ``count`` tareas, generándola si no existe.
+
+    Las bases se reutilizan entre ejecuciones, ya que generar millones de
+    filas lleva más tiempo que el propio benchmark.
+
+    Args:
+        directory (str): Carpeta donde guardar las bases.
+        count (int): Número de tareas.
+        seed (int): Semilla de generación.
+        profile (str): Perfil de SQLite usado durante la generación.
+
+    Returns:
+        str: Ruta al archivo SQLite.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'tareas_{count}_{seed}.db')
+    engine = create_db_engine(sqlite_url(path), profile)
+    try:
+        with engine.connect() as connection:
+            existing = connection.execute(select(func.count()).select_from(Tarea)).scalar()
+        if existing != count:
+            with engine.begin() as connection:
+                connection.execute(Tarea.__table__.delete())
+                # El trigger de borrado deja una marca por tarea; no son cambios reales.
+                connection.execute(TareaBorrada.__table__.delete())
+            populate(engine, count, seed)
+    finally:
+        engine.dispose()
+    return path
@@ -0,0 +1,102 @@
+"""
+Latencia por pulsación de la búsqueda en vivo.
+
+Reproduce lo que consulta la caja de búsqueda de la ventana principal al
+escribir cada una de las frases de ``--queries`` letra a letra: para cada
+prefijo mide ``TaskService.search_task_rows_page`` con ``prefix_last``
+(primera página, sin caché de consultas) y, si hay más resultados, la página
+siguiente que se pediría al desplazarse.
+
+Informa por tamaño la mediana, el p95 y el máximo por pulsación, y cuántas
+superan el presupuesto (``--budget-ms``, 50 ms por defecto). Termina con
+código 1 si el p95 de la primera página lo supera.
+
+Uso (desde ``src``):
+
+    python -m todo_app.benchmarks.live_search --sizes 100000 500000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from todo_app.benchmarks.cold_start import DEFAULT_CACHE_DIR
+from todo_app.benchmarks.data import ensure_database
+
+DEFAULT_SIZES = [500000]
+DEFAULT_QUERIES = [
+    'informe reunión 123', 'presentación jardín', 'factura cliente 4999', 'canción', 'zzz',
+]
+BUDGET_MS = 50.0
+
+
+def _elapsed_ms(operation):
+    start = time.perf_counter()
+    result = operation()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def measure(db_path, queries):
+    """
+    Teclea cada frase y mide la primera y la segunda página de cada prefijo.
+
+    Returns:
+        tuple: (latencias de la primera página, latencias de la segunda), en ms.
+    """
+    from todo_app.models.database import create_db_engine, sqlite_url
+    from todo_app.services.task_service import TaskService
+
+    # create_db_engine migra el índice de búsqueda si la base es anterior.
+    engine = create_db_engine(sqlite_url(db_path))
+    service = TaskService(engine=engine, query_cache=False)
+    service.search_task_rows_page('calentamiento', prefix_last=True)
+    first_pages, next_pages = [], []
+    for query in queries:
+        for length in range(1, len(query) + 1):
+            keyword = query[:length]
+            elapsed, page = _elapsed_ms(lambda: service.search_task_rows_page(keyword, prefix_last=True))
+            first_pages.append(elapsed)
+            if page.next_cursor:
+                elapsed, _ = _elapsed_ms(lambda: service.search_task_rows_page(
+                    keyword, page.next_cursor, prefix_last=True))
+                next_pages.append(elapsed)
+    service.controller.session.close()
+    engine.dispose()
+    return first_pages, next_pages
+
+
+def _summary(latencies, budget_ms):
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    over = sum(1 for latency in latencies if latency > budget_ms)
+    return statistics.median(latencies), p95, max(latencies), over
+
+
+def main(argv=None):
+    """Mide cada tamaño, imprime el resumen y comprueba el presupuesto."""
+    parser = argparse.ArgumentParser(description='Latencia por pulsación de la búsqueda en vivo.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Número de tareas')
+    parser.add_argument('--queries', nargs='+', default=DEFAULT_QUERIES, help='Frases a teclear')
+    parser.add_argument('--budget-ms', type=float, default=BUDGET_MS, help='Presupuesto por pulsación')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Carpeta de las bases generadas')
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'tareas':>9} {'página':<10} {'consultas':>9} {'mediana ms':>11} {'p95 ms':>8} "
+          f"{'máx ms':>8} {'> presupuesto':>14}")
+    for size in args.sizes:
+        first_pages, next_pages = measure(ensure_database(args.cache_dir, size), args.queries)
+        for label, latencies in (('primera', first_pages), ('siguiente', next_pages)):
+            if not latencies:
+                continue
+            median, p95, worst, over = _summary(latencies, args.budget_ms)
+            print(f"{size:>9} {label:<10} {len(latencies):>9} {median:>11.1f} {p95:>8.1f} "
+                  f"{worst:>8.1f} {over:>14}")
+        failed = failed or _summary(first_pages, args.budget_ms)[1] > args.budget_ms
+    if failed:
+        print(f"El p95 de la primera página supera {args.budget_ms:g} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,335 @@
+"""
+Suite de rendimiento de las operaciones de ``TaskController`` y ``TaskService``.
+
+Para cada tamaño (por defecto 1k, 100k y 1M tareas generadas con
+``benchmarks.data``) y cada almacenamiento (archivo en disco y
+``:memory:``), ejecuta cada operación del repositorio y del servicio tras
+``--warmup`` llamadas de calentamiento y guarda la mediana, el mínimo y el
+p95 de ``--runs`` repeticiones.
+
+- ``file``: copia de la base en caché en una carpeta temporal, para que las
+  escrituras no la alteren.
+- ``memory``: la misma base volcada en ``sqlite://`` con la API de copia de
+  seguridad de SQLite.
+
+El servicio se crea sin caché de consultas, para medir las consultas y no
+los aciertos. Las escrituras actúan sobre tareas existentes elegidas con una
+semilla fija, de modo que dos ejecuciones hacen el mismo trabajo.
+
+Los resultados se escriben en JSON con ``--output`` (``-`` para la salida
+estándar). Con ``--baseline`` se comparan con un JSON anterior y el proceso
+termina con código 1 si alguna operación empeora más de ``--tolerance`` y,
+a la vez, más de ``--min-delta-ms`` (para no marcar el ruido de las
+operaciones de microsegundos).
+
+Uso (desde ``src``):
+
+    python -m todo_app.benchmarks.operations --sizes 1000 100000 --output base.json
+    python -m todo_app.benchmarks.operations --sizes 1000 100000 --baseline base.json
+    python -m todo_app.benchmarks.operations --sizes 1000 --only 'controller.*' --storages memory
+"""
+
+import argparse
+import fnmatch
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import select
+
+from todo_app.benchmarks.cold_start import DEFAULT_CACHE_DIR
+from todo_app.benchmarks.data import DEFAULT_SEED, ensure_database, generate_tasks
+from todo_app.models.database import create_db_engine, sqlite_url
+from todo_app.models.models import Tarea
+from todo_app.repositories import bulk
+from todo_app.repositories.controllers import TaskController
+from todo_app.repositories.task_query import TaskQuery
+from todo_app.services.task_service import TaskService
+
+DEFAULT_SIZES = [1000, 100000, 1000000]
+STORAGES = ('file', 'memory')
+# Tareas existentes sobre las que actúan las escrituras y las lecturas por ID.
+SAMPLE_SIZE = 2000
+BATCH_IDS = 500
+IMPORT_TASKS = 1000
+KEYWORD = 'informe'
+
+
+class BenchContext:
+    """Controlador, servicio y tareas de muestra compartidos por las operaciones."""
+
+    def __init__(self, engine, reserve):
+        """
+        Prepara la muestra de IDs con una semilla fija.
+
+        Args:
+            engine (Engine): Motor de la base a medir.
+            reserve (int): Tareas apartadas para los borrados definitivos
+                (una por llamada).
+        """
+        self.controller = TaskController(engine=engine)
+        self.service = TaskService(session=self.controller.session, query_cache=False)
+        self.today = date.today()
+        ids = self.controller.session.execute(
+            select(Tarea.id).where(Tarea.eliminada.is_(False)).order_by(Tarea.id)
+        ).scalars().all()
+        sample = random.Random(DEFAULT_SEED).sample(ids, min(len(ids), SAMPLE_SIZE))
+        self._purge = sample[:reserve]
+        self.ids = sample[reserve:]
+        self._next = itertools.cycle(self.ids)
+        self.token = self.controller.current_change_token()
+        self.import_payload = ''.join(
+            json.dumps({field: bulk.export_value(values[field]) for field in bulk.FIELDS}) + '\n'
+            for values in generate_tasks(IMPORT_TASKS, seed=DEFAULT_SEED + 1)
+        )
+        self.controller.session.close()
+
+    def next_id(self):
+        """Siguiente ID de la muestra, en rotación."""
+        return next(self._next)
+
+    def next_ids(self, count=BATCH_IDS):
+        """Los siguientes ``count`` IDs de la muestra."""
+        return [self.next_id() for _ in range(count)]
+
+    def purge_id(self):
+        """Un ID apartado que aún no se ha borrado."""
+        return self._purge.pop()
+
+
+def _export(ctx):
+    with open(os.devnull, 'w', encoding='utf-8') as stream:
+        return ctx.service.export_tasks(stream, 'jsonl')
+
+
+# Lecturas primero, para que las midan sobre los datos generados; después las
+# escrituras y, al final, las que añaden o borran tareas.
+OPERATIONS = [
+    ('controller.get_tasks', lambda ctx: ctx.controller.get_tasks()),
+    ('controller.get_tasks_by_ids', lambda ctx: ctx.controller.get_tasks_by_ids(ctx.next_ids(100))),
+    ('controller.page_tasks', lambda ctx: ctx.controller.page_tasks()),
+    ('controller.page_tasks.filtered',
+     lambda ctx: ctx.controller.page_tasks(estado='pendientes', prioridad='alta')),
+    ('controller.iter_tasks', lambda ctx: sum(1 for _ in ctx.controller.iter_tasks())),
+    ('controller.filter_tasks', lambda ctx: ctx.controller.filter_tasks(estado='pendientes', categoria='hogar')),
+    ('controller.search_tasks', lambda ctx: ctx.controller.search_tasks(KEYWORD)),
+    ('controller.get_task_rows', lambda ctx: ctx.controller.get_task_rows()),
+    ('controller.page_task_rows', lambda ctx: ctx.controller.page_task_rows()),
+    ('controller.get_task_rows_by_ids', lambda ctx: ctx.controller.get_task_rows_by_ids(ctx.next_ids(100))),
+    ('controller.search_task_rows', lambda ctx: ctx.controller.search_task_rows(KEYWORD)),
+    ('controller.page_search_task_rows',
+     lambda ctx: ctx.controller.page_search_task_rows(KEYWORD + ' reunión 1', prefix_last=True)),
+    ('controller.reminder_summaries', lambda ctx: ctx.controller.reminder_summaries(ctx.next_ids(100))),
+    ('controller.stats', lambda ctx: ctx.controller.stats()),
+    ('controller.date_view_counts', lambda ctx: ctx.controller.date_view_counts()),
+    ('controller.page_date_view', lambda ctx: ctx.controller.page_date_view('semana')),
+    ('controller.query_task_rows', lambda ctx: ctx.controller.query_task_rows(
+        TaskQuery(estado='pendientes', prioridades={'alta', 'media'}, favorita=True))),
+    ('controller.query_task_rows.keyword', lambda ctx: ctx.controller.query_task_rows(
+        TaskQuery(keyword=KEYWORD, categorias='trabajo', orden='-fecha_vencimiento'))),
+    ('controller.current_change_token', lambda ctx: ctx.controller.current_change_token()),
+    ('controller.changes_since', lambda ctx: ctx.controller.changes_since(ctx.token)),
+    ('service.get_tasks_page', lambda ctx: ctx.service.get_tasks_page(estado='completadas')),
+    ('service.get_task_rows_page', lambda ctx: ctx.service.get_task_rows_page(categoria='trabajo')),
+    ('service.filter_tasks', lambda ctx: ctx.service.filter_tasks(prioridad='baja')),
+    ('service.search_tasks', lambda ctx: ctx.service.search_tasks(KEYWORD)),
+    ('service.get_favorite_tasks', lambda ctx: ctx.service.get_favorite_tasks()),
+    ('service.stats', lambda ctx: ctx.service.stats()),
+    ('service.export_tasks', _export),
+    ('controller.update_task', lambda ctx: ctx.controller.update_task(ctx.next_id(), title='Editada')),
+    ('controller.complete_task', lambda ctx: ctx.controller.complete_task(ctx.next_id())),
+    ('controller.favorite_task', lambda ctx: ctx.controller.favorite_task(ctx.next_id())),
+    ('controller.delete_task', lambda ctx: ctx.controller.delete_task(ctx.next_id())),
+    ('controller.restore_task', lambda ctx: ctx.controller.restore_task(ctx.next_id())),
+    ('controller.add_reminder',
+     lambda ctx: ctx.controller.add_reminder(ctx.next_id(), datetime.now() + timedelta(days=1))),
+    ('controller.complete_tasks', lambda ctx: ctx.controller.complete_tasks(ctx.next_ids())),
+    ('controller.favorite_tasks', lambda ctx: ctx.controller.favorite_tasks(ctx.next_ids())),
+    ('controller.delete_tasks', lambda ctx: ctx.controller.delete_tasks(ctx.next_ids())),
+    ('controller.restore_tasks', lambda ctx: ctx.controller.restore_tasks(ctx.next_ids())),
+    ('service.update_task', lambda ctx: ctx.service.update_task(ctx.next_id(), description='Editada')),
+    ('service.complete_tasks', lambda ctx: ctx.service.complete_tasks(ctx.next_ids())),
+    ('controller.add_task', lambda ctx: ctx.controller.add_task('Benchmark', 'Desc', ctx.today)),
+    ('service.create_task', lambda ctx: ctx.service.create_task('Benchmark', 'Desc', ctx.today, 'alta')),
+    ('service.import_tasks', lambda ctx: ctx.service.import_tasks(io.StringIO(ctx.import_payload), 'jsonl')),
+    ('service.permanently_delete_task', lambda ctx: ctx.service.permanently_delete_task(ctx.purge_id())),
+]
+
+
+def open_engine(db_path, storage, directory):
+    """
+    Abre la base generada en el almacenamiento indicado.
+
+    Args:
+        db_path (str): Base en caché (no se modifica).
+        storage (str): 'file' o 'memory'.
+        directory (str): Carpeta temporal para la copia en disco.
+
+    Returns:
+        Engine: Motor sobre la copia.
+    """
+    if storage == 'file':
+        path = os.path.join(directory, 'tareas.db')
+        shutil.copyfile(db_path, path)
+        return create_db_engine(sqlite_url(path))
+    engine = create_db_engine('sqlite://')
+    source = sqlite3.connect(db_path)
+    try:
+        with engine.connect() as connection:
+            source.backup(connection.connection.driver_connection)
+    finally:
+        source.close()
+    return engine
+
+
+def time_operation(operation, ctx, runs, warmup):
+    """
+    Mide una operación.
+
+    Returns:
+        dict: ``{'median_ms', 'min_ms', 'p95_ms', 'runs'}``.
+    """
+    for _ in range(warmup):
+        operation(ctx)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        operation(ctx)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': statistics.median(timings),
+        'min_ms': min(timings),
+        'p95_ms': statistics.quantiles(timings, n=20)[-1] if runs > 1 else timings[0],
+        'runs': runs,
+    }
+
+
+def run_suite(db_path, storage, operations, runs, warmup):
+    """
+    Mide ``operations`` sobre una copia de ``db_path``.
+
+    Returns:
+        dict: ``{operación: medición}``.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        engine = open_engine(db_path, storage, directory)
+        try:
+            ctx = BenchContext(engine, reserve=runs + warmup)
+            results = {}
+            for name, operation in operations:
+                results[name] = time_operation(operation, ctx, runs, warmup)
+                ctx.controller.session.close()
+            return results
+        finally:
+            engine.dispose()
+
+
+def find_regressions(results, baseline, tolerance, min_delta_ms):
+    """
+    Compara los resultados con una línea base.
+
+    Args:
+        results (dict): ``{almacenamiento: {tamaño: {operación: medición}}}``.
+        baseline (dict): Misma estructura, leída de un JSON anterior.
+        tolerance (float): Empeoramiento relativo permitido (0.25 = 25 %).
+        min_delta_ms (float): Empeoramiento absoluto mínimo para contar.
+
+    Returns:
+        list: Mensajes describiendo cada regresión.
+    """
+    problems = []
+    for storage, sizes in results.items():
+        for size, operations in sizes.items():
+            reference = baseline.get(storage, {}).get(str(size), {})
+            for name, result in operations.items():
+                before = reference.get(name)
+                if not before:
+                    continue
+                now, then = result['median_ms'], before['median_ms']
+                if now > then * (1 + tolerance) and now - then > min_delta_ms:
+                    problems.append(
+                        f'{storage}/{size} {name}: {now:.2f} ms frente a {then:.2f} ms '
+                        f'de la línea base (+{tolerance:.0%} permitido)'
+                    )
+    return problems
+
+
+def main(argv=None):
+    """Ejecuta la suite, imprime una tabla y escribe o compara el JSON."""
+    parser = argparse.ArgumentParser(description='Rendimiento de TaskController y TaskService.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Número de tareas')
+    parser.add_argument('--storages', nargs='+', choices=STORAGES, default=list(STORAGES),
+                        help='Bases en archivo y/o en memoria')
+    parser.add_argument('--only', nargs='+', help="Patrones de operaciones a medir (p. ej. 'service.*')")
+    parser.add_argument('--runs', type=int, default=5, help='Repeticiones medidas por operación')
+    parser.add_argument('--warmup', type=int, default=1, help='Llamadas previas sin medir')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Carpeta de las bases generadas')
+    parser.add_argument('--output', help="Archivo JSON de resultados ('-' para la salida estándar)")
+    parser.add_argument('--baseline', help='Archivo JSON de una ejecución anterior para comparar')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Empeoramiento relativo permitido')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0,
+                        help='Empeoramiento absoluto por debajo del cual no hay regresión')
+    args = parser.parse_args(argv)
+
+    operations = [
+        (name, operation) for name, operation in OPERATIONS
+        if not args.only or any(fnmatch.fnmatch(name, pattern) for pattern in args.only)
+    ]
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as stream:
+            baseline = json.load(stream)['results']
+    # Con --output - la salida estándar queda para el JSON.
+    table = sys.stderr if args.output == '-' else sys.stdout
+
+    results = {}
+    for size in args.sizes:
+        db_path = ensure_database(args.cache_dir, size)
+        for storage in args.storages:
+            measured = run_suite(db_path, storage, operations, args.runs, args.warmup)
+            results.setdefault(storage, {})[str(size)] = measured
+            reference = baseline.get(storage, {}).get(str(size), {})
+            print(f'\n== {storage}, {size} tareas', file=table)
+            print(f"{'operación':<36} {'mediana ms':>11} {'p95 ms':>9} {'base ms':>9}", file=table)
+            for name, result in measured.items():
+                before = reference.get(name)
+                base = f"{before['median_ms']:>9.2f}" if before else f"{'-':>9}"
+                print(f"{name:<36} {result['median_ms']:>11.2f} {result['p95_ms']:>9.2f} {base}", file=table)
+
+    document = {
+        'meta': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'runs': args.runs,
+            'warmup': args.warmup,
+            'seed': DEFAULT_SEED,
+            'date': datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': results,
+    }
+    if args.output == '-':
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            json.dump(document, stream, indent=2)
+
+    problems = find_regressions(results, baseline, args.tolerance, args.min_delta_ms)
+    for problem in problems:
+        print(f'REGRESIÓN: {problem}', file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
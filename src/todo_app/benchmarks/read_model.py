@@ -0,0 +1,114 @@
+"""
+Listados con entidades del ORM frente al modelo de lectura (``TaskRow``).
+
+Para cada tamaño (por defecto 100k y 1M tareas) carga el listado completo de
+tareas activas de dos formas, cada una en un proceso nuevo para que la
+memoria de una no afecte a la otra:
+
+- ``orm``: ``TaskController.get_tasks()``, con instancias de ``Tarea`` en el
+  mapa de identidad de la sesión.
+- ``rows``: ``TaskController.get_task_rows()``, tuplas ``TaskRow`` creadas a
+  partir de las columnas del SELECT.
+
+Informa el tiempo de carga (mediana de ``--runs``) y el aumento del RSS
+máximo del proceso mientras el resultado sigue en memoria.
+
+Uso (desde ``src``):
+
+    python -m todo_app.benchmarks.read_model --sizes 100000 1000000
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from todo_app.benchmarks.cold_start import DEFAULT_CACHE_DIR, SRC_DIR
+from todo_app.benchmarks.data import ensure_database
+
+DEFAULT_SIZES = [100000, 1000000]
+MODES = ('orm', 'rows')
+
+
+def _max_rss_mb():
+    # ru_maxrss está en KiB en Linux y en bytes en macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def run_child(db_path, mode, runs):
+    """
+    Mide un modo en el proceso actual.
+
+    Returns:
+        dict: ``{'rows', 'load_ms', 'rss_mb'}``.
+    """
+    from todo_app.models.database import create_db_engine, sqlite_url
+    from todo_app.repositories.controllers import TaskController
+
+    engine = create_db_engine(sqlite_url(db_path))
+    controller = TaskController(engine=engine)
+    controller.get_tasks_by_ids([1])  # Abre la conexión y carga los mappers.
+    controller.session.expunge_all()
+    baseline = _max_rss_mb()
+
+    timings = []
+    result = None
+    for _ in range(runs):
+        result = None
+        controller.session.expunge_all()
+        start = time.perf_counter()
+        result = controller.get_tasks() if mode == 'orm' else controller.get_task_rows()
+        timings.append((time.perf_counter() - start) * 1000)
+    measurement = {
+        'rows': len(result),
+        'load_ms': statistics.median(timings),
+        'rss_mb': _max_rss_mb() - baseline,
+    }
+    controller.session.close()
+    engine.dispose()
+    return measurement
+
+
+def measure(db_path, mode, runs):
+    """Ejecuta ``run_child`` en un proceso nuevo y devuelve su medición."""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run(
+        [sys.executable, '-m', 'todo_app.benchmarks.read_model',
+         '--child', mode, '--db', db_path, '--runs', str(runs)],
+        env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    """Genera (o reutiliza) las bases y compara ambos modos por tamaño."""
+    parser = argparse.ArgumentParser(description='Listados con el ORM frente a TaskRow.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Número de tareas')
+    parser.add_argument('--runs', type=int, default=3, help='Cargas por modo (se informa la mediana)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Carpeta de las bases generadas')
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_child(args.db, args.child, args.runs)))
+        return
+
+    print(f"{'tareas':>9} {'modo':<5} {'filas':>9} {'carga ms':>10} {'RSS MB':>8}")
+    for size in args.sizes:
+        db_path = ensure_database(args.cache_dir, size)
+        results = {mode: measure(db_path, mode, args.runs) for mode in MODES}
+        for mode, result in results.items():
+            print(f"{size:>9} {mode:<5} {result['rows']:>9} {result['load_ms']:>10.0f} {result['rss_mb']:>8.1f}")
+        orm, rows = results['orm'], results['rows']
+        print(f"{'':>9} rows: {orm['load_ms'] / rows['load_ms']:.1f}x más rápido, "
+              f"{orm['rss_mb'] / max(rows['rss_mb'], 0.1):.1f}x menos memoria")
+
+
+if __name__ == '__main__':
+    main()
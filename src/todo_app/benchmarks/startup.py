@@ -0,0 +1,74 @@
+"""
+Tiempo de arranque de la ventana principal: interfaz compilada frente a uic.
+
+Lanza ``python -m todo_app.main --exit-after-paint`` en procesos nuevos
+(plataforma Qt ``offscreen``) y mide el tiempo desde el inicio del proceso
+hasta que termina tras el primer pintado de ``MainWindow``, alternando entre ``Ui_MainWindow`` compilada y
+``uic.loadUi`` (``TODO_UI_RUNTIME=1``).
+
+Uso (desde ``src``):
+
+    python -m todo_app.benchmarks.startup --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from todo_app.main import EXIT_AFTER_PAINT_FLAG
+from todo_app.models.database import DB_PATH_ENV_VAR, create_db_engine, sqlite_url
+from todo_app.views import RUNTIME_UI_ENV_VAR
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+MODES = {'compilada': '0', 'uic': '1'}
+
+
+def time_to_first_paint(db_path, runtime_ui):
+    """
+    Lanza un proceso de la aplicación y mide el tiempo hasta el primer pintado.
+
+    Args:
+        db_path (str): Base de datos a abrir.
+        runtime_ui (str): Valor de ``TODO_UI_RUNTIME`` ('0' o '1').
+
+    Returns:
+        float: Segundos desde el lanzamiento del proceso.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PYTHONPATH=SRC_DIR)
+    env[DB_PATH_ENV_VAR] = db_path
+    env[RUNTIME_UI_ENV_VAR] = runtime_ui
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, '-m', 'todo_app.main', EXIT_AFTER_PAINT_FLAG], env=env,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if child.wait() != 0:
+        raise RuntimeError('La aplicación terminó con error antes del primer pintado')
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    """Compara ambos modos de carga de la interfaz e imprime un resumen."""
+    parser = argparse.ArgumentParser(description='Tiempo hasta el primer pintado de MainWindow.')
+    parser.add_argument('--runs', type=int, default=5, help='Ejecuciones por modo')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, 'startup.db')
+        create_db_engine(sqlite_url(db_path)).dispose()
+
+        results = {mode: [] for mode in MODES}
+        for _ in range(args.runs):
+            for mode, flag in MODES.items():
+                results[mode].append(time_to_first_paint(db_path, flag) * 1000)
+
+    print(f"{'interfaz':<10} {'mediana ms':>11} {'mínimo ms':>10}")
+    for mode, times in results.items():
+        print(f"{mode:<10} {statistics.median(times):>11.1f} {min(times):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Herramientas de línea de comandos para la aplicación To-Do List.
+
+Permite importar y exportar tareas en masa (CSV o JSON Lines) y reconstruir
+el índice de búsqueda sin abrir la interfaz gráfica.
+
+Ejemplos (desde el directorio ``src``):
+
+    python -m todo_app.cli import tareas.csv --batch-size 5000
+    python -m todo_app.cli export copia.jsonl --include-deleted
+    python -m todo_app.cli rebuild-index
+"""
+
+import argparse
+import sys
+
+from todo_app.models.database import create_db_engine, default_url, sqlite_url
+from todo_app.models.fts import rebuild_search_index
+from todo_app.models.sqlite_profiles import PROFILES
+from todo_app.repositories.bulk import DEFAULT_IMPORT_BATCH_SIZE, FORMATS, BulkImportError, detect_format
+from todo_app.services.task_service import TaskService
+
+
+def build_parser():
+    """Construye el analizador de argumentos con sus subcomandos."""
+    parser = argparse.ArgumentParser(prog='todo_app.cli', description=__doc__.split('\n\n')[1])
+    parser.add_argument('--db', help='Archivo SQLite (por defecto, el de la aplicación)')
+    parser.add_argument('--profile', choices=list(PROFILES),
+                        help='Perfil de SQLite (por defecto, TODO_DB_PROFILE o balanced)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    importer = commands.add_parser('import', help='Importar tareas desde CSV o JSON Lines')
+    importer.add_argument('path', help='Archivo de entrada')
+    importer.add_argument('--format', choices=FORMATS, help='Formato (por defecto, según la extensión)')
+    importer.add_argument('--batch-size', type=int, default=DEFAULT_IMPORT_BATCH_SIZE,
+                          help='Tareas por transacción')
+
+    exporter = commands.add_parser('export', help='Exportar tareas a CSV o JSON Lines')
+    exporter.add_argument('path', help='Archivo de salida')
+    exporter.add_argument('--format', choices=FORMATS, help='Formato (por defecto, según la extensión)')
+    exporter.add_argument('--include-deleted', action='store_true', help='Incluir tareas eliminadas')
+
+    commands.add_parser('rebuild-index', help='Reconstruir el índice de búsqueda FTS5')
+    return parser
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    args = build_parser().parse_args(argv)
+
+    url = sqlite_url(args.db) if args.db else default_url()
+    engine = create_db_engine(url, args.profile)
+
+    if args.command == 'rebuild-index':
+        rebuild_search_index(engine)
+        print(f'Índice de búsqueda reconstruido en {engine.url.database}')
+        return 0
+
+    service = TaskService(engine=engine)
+    try:
+        fmt = args.format or detect_format(args.path)
+        if args.command == 'import':
+            with open(args.path, newline='', encoding='utf-8') as stream:
+                count = service.import_tasks(stream, fmt, args.batch_size)
+            print(f'{count} tareas importadas')
+        else:
+            with open(args.path, 'w', newline='', encoding='utf-8') as stream:
+                count = service.export_tasks(stream, fmt, args.include_deleted)
+            print(f'{count} tareas exportadas a {args.path}')
+    except (OSError, ValueError, BulkImportError) as exc:
+        print(f'Error: {exc}', file=sys.stderr)
+        return 1
+    finally:
+        service.controller.session.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
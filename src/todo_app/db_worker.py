@@ -0,0 +1,315 @@
+"""
+Acceso a la base de datos fuera del hilo de la interfaz.
+
+``DatabaseClient`` vive en el hilo de la interfaz y envía trabajos a un
+``DatabaseWorker`` que se ejecuta en un ``QThread`` propio con su propia
+sesión (la del ``TaskService`` que recibe). Cada trabajo es una función
+``job(service)``; su resultado vuelve al hilo de la interfaz mediante señales
+y se entrega a la función ``on_result`` indicada al enviarlo.
+
+Los trabajos deben devolver datos que no dependan de la sesión (por ejemplo,
+``TaskRow``), ya que los objetos del ORM pertenecen al hilo del trabajador.
+
+Los trabajos enviados por un mismo ``channel`` (por ejemplo, ``'view'`` para
+la consulta que alimenta la lista) se sustituyen entre sí: al enviar uno
+nuevo, el anterior se descarta si aún no empezó, se interrumpe si se está
+ejecutando (un manejador de progreso de ``sqlite3`` aborta la consulta en
+curso) y su resultado se ignora si ya había terminado.
+
+Si el servicio difiere las confirmaciones (``TaskService.enable_write_behind``),
+la sesión se mantiene abierta mientras haya modificaciones pendientes y
+``DatabaseClient`` envía un trabajo de confirmación cuando vence su ventana
+de espera, además de confirmar lo pendiente en ``shutdown``.
+"""
+
+import itertools
+import math
+import threading
+
+from PyQt5.QtCore import QCoreApplication, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+from sqlalchemy.exc import OperationalError
+
+# Instrucciones de la máquina virtual de SQLite entre comprobaciones de cancelación.
+PROGRESS_INTERVAL = 1000
+
+
+class DatabaseWorker(QObject):
+    """Ejecuta trabajos de base de datos en su propio hilo, de uno en uno."""
+
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+    # Segundos hasta confirmar las modificaciones diferidas pendientes.
+    writes_pending = pyqtSignal(float)
+
+    def __init__(self, service):
+        """
+        Inicializa el trabajador.
+
+        Args:
+            service (TaskService): Servicio cuya sesión solo usará este hilo.
+        """
+        super().__init__()
+        self.service = service
+        self._lock = threading.Lock()
+        self._cancelled = set()
+        self._running = None
+        self._last_finished = 0
+        self._abort = False
+
+    def cancel(self, job_id):
+        """
+        Cancela un trabajo: lo descarta si no empezó o interrumpe su consulta.
+
+        Se llama desde el hilo de la interfaz.
+
+        Args:
+            job_id (int): Identificador del trabajo.
+        """
+        with self._lock:
+            # Los trabajos se ejecutan en orden de ID; uno ya terminado no se marca.
+            if job_id <= self._last_finished:
+                return
+            self._cancelled.add(job_id)
+            if self._running == job_id:
+                self._abort = True
+
+    def _start(self, job_id):
+        """Registra el trabajo en curso; devuelve False si ya estaba cancelado."""
+        with self._lock:
+            if job_id in self._cancelled:
+                return False
+            self._running = job_id
+            self._abort = False
+            return True
+
+    def _finish(self, job_id):
+        """Da por terminado el trabajo; devuelve True si se canceló mientras tanto."""
+        with self._lock:
+            self._running = None
+            self._abort = False
+            self._last_finished = job_id
+            cancelled = job_id in self._cancelled
+            self._cancelled.discard(job_id)
+            return cancelled
+
+    def _set_progress_handler(self, connection, handler):
+        set_progress_handler = getattr(connection, 'set_progress_handler', None)
+        if set_progress_handler is not None:
+            set_progress_handler(handler, PROGRESS_INTERVAL)
+
+    def _release(self, session, connection):
+        """
+        Retira el manejador de progreso y cierra la sesión si no quedan escrituras.
+
+        Nunca lanza: una excepción que saliera del slot abortaría el proceso.
+
+        Returns:
+            tuple: (segundos hasta confirmar lo diferido o None, error o None).
+        """
+        error = delay = None
+        if connection is not None:
+            try:
+                self._set_progress_handler(connection, None)
+            except Exception as exc:
+                error = exc
+        try:
+            delay = self.service.seconds_until_flush()
+            if delay is None:
+                session.close()
+        except Exception as exc:
+            error = error or exc
+        return delay, error
+
+    @pyqtSlot(int, object)
+    def run_job(self, job_id, job):
+        """
+        Ejecuta un trabajo y emite ``finished`` o ``failed``.
+
+        Mientras se ejecuta, un manejador de progreso en la conexión de la
+        sesión aborta la sentencia en curso si el trabajo se cancela. La sesión
+        se cierra al terminar cada trabajo, de modo que el siguiente lee datos
+        frescos y no quedan objetos del ORM retenidos, salvo que queden
+        modificaciones diferidas sin confirmar.
+
+        Con confirmaciones diferidas cada trabajo se ejecuta dentro de un
+        SAVEPOINT (``session.begin_nested``; el motor debe venir de
+        ``create_db_engine``, que deja a SQLAlchemy abrir la transacción): si
+        falla, se deshace solo lo que aplicó (por ejemplo, los bloques ya
+        actualizados de un lote) y se confirman las modificaciones pendientes
+        de los trabajos anteriores.
+
+        Los errores al limpiar (p. ej. con la conexión ya cerrada) se
+        entregan con ``failed`` en lugar de salir del slot.
+
+        Args:
+            job_id (int): Identificador del trabajo.
+            job (callable): ``job(service) -> resultado``.
+        """
+        session = self.service.controller.session
+        result = error = connection = savepoint = None
+        try:
+            if self._start(job_id):
+                connection = session.connection().connection.dbapi_connection
+                # Un valor verdadero aborta la sentencia con "interrupted".
+                self._set_progress_handler(connection, lambda: self._abort)
+                if self.service.controller.defer_commits:
+                    savepoint = session.begin_nested()
+                result = job(self.service)
+                # El trabajo pudo confirmar ya todo (al alcanzar max_pending).
+                if savepoint is not None and savepoint.is_active:
+                    savepoint.commit()
+        except Exception as exc:
+            error = exc
+            try:
+                if savepoint is not None and savepoint.is_active:
+                    savepoint.rollback()
+                # Las modificaciones diferidas de trabajos anteriores no deben
+                # perderse con el rollback de este.
+                self.service.flush_writes()
+            except Exception as flush_error:
+                error = flush_error
+            try:
+                session.rollback()
+            except Exception:
+                # Se informa del error del trabajo; la sesión se cierra en ``_release``.
+                pass
+        finally:
+            delay, cleanup_error = self._release(session, connection)
+            error = error or cleanup_error
+            cancelled = self._finish(job_id)
+        if delay is not None:
+            self.writes_pending.emit(delay)
+        if cancelled:
+            # Se descarta el resultado (o la interrupción de SQLite) del trabajo sustituido.
+            return
+        if error is None:
+            self.finished.emit(job_id, result)
+        elif not (isinstance(error, OperationalError) and 'interrupted' in str(error)):
+            self.failed.emit(job_id, error)
+
+
+class DatabaseClient(QObject):
+    """Envía trabajos a un ``DatabaseWorker`` y entrega sus resultados en el hilo de la interfaz."""
+
+    _submit = pyqtSignal(int, object)
+    # Errores de trabajos enviados sin ``on_error``.
+    error = pyqtSignal(object)
+
+    def __init__(self, service, parent=None):
+        """
+        Arranca el hilo del trabajador.
+
+        Args:
+            service (TaskService): Servicio que usará el trabajador; a partir de
+                aquí no debe usarse desde otros hilos.
+            parent (QObject): Objeto padre de Qt.
+        """
+        super().__init__(parent)
+        self._ids = itertools.count(1)
+        self._callbacks = {}
+        self._channels = {}
+
+        self._thread = QThread()
+        self.worker = DatabaseWorker(service)
+        self.worker.moveToThread(self._thread)
+        self._submit.connect(self.worker.run_job)
+        self.worker.finished.connect(self._on_finished)
+        self.worker.failed.connect(self._on_failed)
+        self.worker.writes_pending.connect(self._schedule_flush)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_due)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+        self._thread.start()
+
+    def submit(self, job, on_result=None, on_error=None, channel=None):
+        """
+        Envía un trabajo al hilo de la base de datos.
+
+        Args:
+            job (callable): ``job(service) -> resultado``; se ejecuta en el trabajador.
+            on_result (callable): ``on_result(resultado)`` en el hilo de la interfaz.
+            on_error (callable): ``on_error(excepción)`` en el hilo de la interfaz;
+                sin ella, el error se emite con la señal ``error``.
+            channel (str): Si se indica, cancela el trabajo anterior del mismo canal.
+
+        Returns:
+            int: Identificador del trabajo.
+        """
+        job_id = next(self._ids)
+        if channel is not None:
+            previous = self._channels.get(channel)
+            self._channels[channel] = job_id
+            if previous is not None and self._callbacks.pop(previous, None) is not None:
+                self.worker.cancel(previous)
+        self._callbacks[job_id] = (on_result, on_error, channel)
+        self._submit.emit(job_id, job)
+        return job_id
+
+    def cancel(self, channel):
+        """
+        Cancela el trabajo en curso de un canal, si lo hay.
+
+        Args:
+            channel (str): Canal del trabajo.
+        """
+        job_id = self._channels.pop(channel, None)
+        if job_id is not None and self._callbacks.pop(job_id, None) is not None:
+            self.worker.cancel(job_id)
+
+    def pending(self):
+        """Número de trabajos enviados cuyo resultado aún no se entregó."""
+        return len(self._callbacks)
+
+    def _release(self, job_id):
+        entry = self._callbacks.pop(job_id, None)
+        if entry is not None and entry[2] is not None and self._channels.get(entry[2]) == job_id:
+            del self._channels[entry[2]]
+        return entry
+
+    def _on_finished(self, job_id, result):
+        entry = self._release(job_id)
+        if entry is not None and entry[0] is not None:
+            entry[0](result)
+
+    def _on_failed(self, job_id, exc):
+        entry = self._release(job_id)
+        if entry is None:
+            return
+        if entry[1] is None:
+            self.error.emit(exc)
+        else:
+            entry[1](exc)
+
+    def _schedule_flush(self, delay):
+        # El temporizador ya en marcha vale si vence antes.
+        milliseconds = math.ceil(delay * 1000)
+        if not self._flush_timer.isActive() or self._flush_timer.remainingTime() > milliseconds:
+            self._flush_timer.start(milliseconds)
+
+    def _flush_due(self):
+        self.submit(lambda service: service.flush_due_writes())
+
+    def flush(self):
+        """
+        Envía un trabajo que confirma ya las modificaciones diferidas pendientes.
+
+        Returns:
+            int: Identificador del trabajo.
+        """
+        self._flush_timer.stop()
+        return self.submit(lambda service: service.flush_writes())
+
+    def shutdown(self):
+        """Termina el hilo del trabajador tras los trabajos ya enviados y confirma lo pendiente."""
+        self._flush_timer.stop()
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
+        # El hilo ya terminó: la sesión puede usarse desde aquí.
+        service = self.worker.service
+        if service.pending_writes():
+            service.flush_writes()
+            service.controller.session.close()
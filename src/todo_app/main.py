@@ -1,26 +1,101 @@
-from todo_app.views import MainWindow
-from PyQt5.QtWidgets import QApplication
+"""
+Punto de entrada principal de la aplicación To-Do List.
+
+Opciones:
+    --trace-startup     Imprime el desglose de tiempos de arranque.
+    --exit-after-paint  Cierra la aplicación tras el primer pintado (benchmarks).
+    --profile-sql       Mide las sentencias SQL y los métodos del servicio, registra
+                        las consultas lentas e imprime un resumen al salir.
+"""
+
+from todo_app.startup_trace import tracer
 import sys
 import os
 
-if __name__ == '__main__':
-    """
-    Punto de entrada principal de la aplicación To-Do List.
+TRACE_FLAG = '--trace-startup'
+PROFILE_SQL_FLAG = '--profile-sql'
+EXIT_AFTER_PAINT_FLAG = '--exit-after-paint'
+
 
+def main(argv=None):
+    """
     Inicializa la aplicación Qt, carga la hoja de estilos (QSS) desde el archivo
     correspondiente y muestra la ventana principal de la interfaz gráfica.
+
+    Las importaciones pesadas se hacen aquí, dentro de fases del trazador,
+    para poder atribuir el tiempo de arranque a cada una.
+
+    Args:
+        argv (list): Argumentos de línea de comandos (por defecto, ``sys.argv``).
+
+    Returns:
+        int: Código de salida del bucle de eventos.
     """
-    app = QApplication(sys.argv)
+    argv = list(sys.argv if argv is None else argv)
+    if TRACE_FLAG in argv:
+        argv.remove(TRACE_FLAG)
+        if not tracer.enabled:
+            tracer.enable()
+    exit_after_paint = EXIT_AFTER_PAINT_FLAG in argv
+    if exit_after_paint:
+        argv.remove(EXIT_AFTER_PAINT_FLAG)
+    if PROFILE_SQL_FLAG in argv:
+        argv.remove(PROFILE_SQL_FLAG)
+        from todo_app.sql_profiler import profiler
+        profiler.enable()
+
+    with tracer.phase('importar PyQt5'):
+        from PyQt5.QtCore import QEvent, QObject
+        from PyQt5.QtWidgets import QApplication
+    with tracer.phase('importar SQLAlchemy y modelos'):
+        from sqlalchemy.orm import configure_mappers
+        from todo_app.models.database import init_db
+    with tracer.phase('importar vistas y servicios'):
+        from todo_app.views import MainWindow
+
+    with tracer.phase('crear QApplication'):
+        app = QApplication(argv)
+
+    # Abrir la base de datos (ruta configurable con TODO_DB_PATH o TODO_DB_URL)
+    with tracer.phase('configurar mappers'):
+        configure_mappers()
+    with tracer.phase('init_db (create_all y migraciones)'):
+        init_db()
 
     # Cargar hoja de estilos (QSS)
-    style_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'styles', 'dark.qss'))
-    with open(style_path, 'r') as f:
-        style = f.read()
-        app.setStyleSheet(style)
+    with tracer.phase('cargar hoja de estilos'):
+        style_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'styles', 'dark.qss'))
+        with open(style_path, 'r') as f:
+            style = f.read()
+            app.setStyleSheet(style)
 
     # Crear y mostrar ventana principal
-    window = MainWindow()
-    window.show()
+    with tracer.phase('crear MainWindow'):
+        window = MainWindow()
+
+    class FirstPaintWatcher(QObject):
+        """Registra el primer pintado de la ventana y vuelca las trazas."""
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                obj.removeEventFilter(self)
+                tracer.mark('primer pintado')
+                tracer.dump()
+                if exit_after_paint:
+                    app.quit()
+            return False
+
+    watcher = FirstPaintWatcher(window)
+    window.installEventFilter(watcher)
+    with tracer.phase('mostrar ventana'):
+        window.show()
 
     # Ejecutar bucle principal de la aplicación
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    from todo_app.sql_profiler import profiler
+    profiler.dump()
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
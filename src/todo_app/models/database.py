@@ -0,0 +1,201 @@
+"""
+Configuración de la conexión a la base de datos.
+
+El motor y la fábrica de sesiones se crean bajo demanda: importar los
+modelos no abre ni crea ningún archivo. La aplicación llama a ``init_db``
+al arrancar (o se llama implícitamente con ``get_engine``/``get_session``).
+
+La ubicación de la base se resuelve, en orden, a partir de:
+
+1. El argumento ``url`` de ``init_db``.
+2. La variable de entorno ``TODO_DB_URL`` (URL completa de SQLAlchemy).
+3. La variable de entorno ``TODO_DB_PATH`` (ruta a un archivo SQLite).
+4. ``src/tareas.db``, junto al paquete, sin depender del directorio actual.
+
+``create_db_engine`` deja además que SQLAlchemy abra las transacciones de
+SQLite (``use_explicit_begin``), para que los SAVEPOINT funcionen.
+
+``create_async_db_engine`` crea el equivalente asíncrono (``aiosqlite``) para
+``AsyncTaskService``; la dependencia solo se importa al llamarlo.
+"""
+
+import os
+
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.orm import sessionmaker
+
+from todo_app.models.models import upgrade_schema
+from todo_app.models.sqlite_profiles import install_profile
+from todo_app.sql_profiler import profiler
+
+DB_URL_ENV_VAR = 'TODO_DB_URL'
+DB_PATH_ENV_VAR = 'TODO_DB_PATH'
+# Controlador asíncrono que sustituye al síncrono en cada dialecto soportado.
+ASYNC_DRIVERS = {'sqlite': 'sqlite+aiosqlite'}
+DEFAULT_DB_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'tareas.db')
+)
+
+# Fábrica de sesiones; ``init_db`` la enlaza al motor activo.
+Session = sessionmaker()
+
+_engine = None
+
+
+def sqlite_url(path):
+    """
+    Construye la URL de SQLAlchemy para un archivo SQLite.
+
+    Args:
+        path (str): Ruta al archivo.
+
+    Returns:
+        str: URL ``sqlite:///...`` con la ruta absoluta.
+    """
+    return f'sqlite:///{os.path.abspath(path)}'
+
+
+def default_url():
+    """
+    Resuelve la URL de la base de datos a partir del entorno.
+
+    Returns:
+        str: URL de SQLAlchemy.
+    """
+    url = os.environ.get(DB_URL_ENV_VAR)
+    if url:
+        return url
+    return sqlite_url(os.environ.get(DB_PATH_ENV_VAR) or DEFAULT_DB_PATH)
+
+
+def use_explicit_begin(engine):
+    """
+    Hace que las transacciones de SQLite empiecen con el ``BEGIN`` de SQLAlchemy.
+
+    ``sqlite3`` abre la transacción por su cuenta justo antes de la primera
+    escritura, así que un ``SAVEPOINT`` anterior abriría la suya y liberarlo
+    confirmaría en el acto. Es la receta de la documentación de SQLAlchemy:
+    se desactiva esa gestión del controlador y se emite ``BEGIN`` en el
+    evento ``begin`` del motor. No hace nada con otros dialectos.
+
+    Args:
+        engine (Engine): Motor síncrono.
+    """
+    if engine.dialect.name != 'sqlite' or event.contains(engine, 'begin', _emit_begin):
+        return
+    event.listen(engine, 'connect', _disable_driver_transactions)
+    event.listen(engine, 'begin', _emit_begin)
+
+
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(connection):
+    connection.exec_driver_sql('BEGIN')
+
+
+def create_db_engine(url=None, profile=None, **options):
+    """
+    Crea un motor con el perfil de SQLite aplicado y el esquema al día.
+
+    No modifica el motor global; útil para herramientas y pruebas que
+    trabajan con otra base.
+
+    Args:
+        url (str): URL de SQLAlchemy; por defecto, ``default_url()``.
+        profile (str): Perfil de SQLite ('durable', 'balanced', 'fast').
+        **options: Argumentos adicionales de ``create_engine`` (p. ej. ``pool_size``).
+
+    Returns:
+        Engine: Motor listo para usar.
+    """
+    engine = create_engine(url or default_url(), **options)
+    use_explicit_begin(engine)
+    install_profile(engine, profile)
+    upgrade_schema(engine)
+    return engine
+
+
+def async_url(url):
+    """
+    Convierte una URL síncrona en la de su controlador asíncrono.
+
+    Args:
+        url (str): URL de SQLAlchemy (por ejemplo, ``sqlite:///tareas.db``).
+
+    Returns:
+        URL: URL con el controlador asíncrono (``sqlite+aiosqlite:///tareas.db``).
+    """
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    return url.set(drivername=driver) if driver else url
+
+
+async def create_async_db_engine(url=None, profile=None, **options):
+    """
+    Crea un motor asíncrono con el perfil de SQLite aplicado y el esquema al día.
+
+    Requiere ``aiosqlite`` (y ``greenlet``) para bases SQLite.
+
+    Args:
+        url (str): URL de SQLAlchemy síncrona o asíncrona; por defecto, ``default_url()``.
+        profile (str): Perfil de SQLite ('durable', 'balanced', 'fast').
+        **options: Argumentos adicionales de ``create_async_engine``.
+
+    Returns:
+        AsyncEngine: Motor listo para usar.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(async_url(url or default_url()), **options)
+    install_profile(engine.sync_engine, profile)
+    async with engine.begin() as connection:
+        await connection.run_sync(upgrade_schema)
+    return engine
+
+
+def init_db(url=None, profile=None):
+    """
+    Inicializa (o reemplaza) el motor global de la aplicación.
+
+    Si el perfilador SQL está activo (``TODO_PROFILE_SQL``), se engancha al motor.
+
+    Args:
+        url (str): URL de SQLAlchemy; por defecto, ``default_url()``.
+        profile (str): Perfil de SQLite ('durable', 'balanced', 'fast').
+
+    Returns:
+        Engine: El motor global.
+    """
+    global _engine
+    engine = create_db_engine(url, profile)
+    profiler.attach(engine)
+    if _engine is not None:
+        _engine.dispose()
+    _engine = engine
+    Session.configure(bind=engine)
+    return engine
+
+
+def get_engine():
+    """
+    Devuelve el motor global, inicializándolo con la configuración por defecto si hace falta.
+
+    Returns:
+        Engine: El motor global.
+    """
+    if _engine is None:
+        init_db()
+    return _engine
+
+
+def get_session():
+    """
+    Abre una sesión nueva sobre el motor global.
+
+    Returns:
+        Session: Sesión de SQLAlchemy.
+    """
+    get_engine()
+    return Session()
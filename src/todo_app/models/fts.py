@@ -0,0 +1,217 @@
+"""
+Índice de búsqueda de texto completo (SQLite FTS5) para las tareas.
+
+Este módulo define la tabla virtual ``tareas_fts``, que refleja los campos
+``titulo`` y ``descripcion`` de la tabla ``tareas``. La tabla se mantiene
+sincronizada mediante triggers, por lo que cualquier escritura (ORM, Core o
+SQL directo) queda indexada sin intervención del controlador.
+
+El tokenizador ``unicode61`` con ``remove_diacritics 2`` hace que la búsqueda
+ignore mayúsculas y tildes ("canción" coincide con "cancion"). Los índices de
+prefijos de 1 y 2 caracteres evitan recorrer todos los términos del
+vocabulario en las primeras pulsaciones de la búsqueda en vivo.
+
+Uso como comando para reconstruir el índice de una base existente:
+
+    python -m todo_app.models.fts tareas.db
+"""
+
+import argparse
+import re
+from contextlib import nullcontext
+
+from sqlalchemy import DDL, column, create_engine, event, literal_column, table, text
+from sqlalchemy.engine import Connection
+
+FTS_TABLE = 'tareas_fts'
+# Opción ``prefix`` del índice; si cambia, ``ensure_search_index`` lo reconstruye.
+FTS_PREFIX_OPTION = "prefix='1 2'"
+
+# Tabla ligera para referenciar el índice desde consultas del ORM.
+fts_table = table(FTS_TABLE, column('rowid'), column('rank'))
+
+_FTS_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        titulo, descripcion,
+        content='tareas', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', {FTS_PREFIX_OPTION}
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON tareas BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, titulo, descripcion)
+        VALUES (new.id, new.titulo, new.descripcion);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON tareas BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, titulo, descripcion)
+        VALUES ('delete', old.id, old.titulo, old.descripcion);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF titulo, descripcion ON tareas BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, titulo, descripcion)
+        VALUES ('delete', old.id, old.titulo, old.descripcion);
+        INSERT INTO {FTS_TABLE}(rowid, titulo, descripcion)
+        VALUES (new.id, new.titulo, new.descripcion);
+    END
+    """,
+]
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def attach_search_index(tareas_table):
+    """
+    Registra la creación del índice FTS5 junto con la tabla de tareas.
+
+    Al ejecutar ``Base.metadata.create_all`` sobre una base nueva, la tabla
+    virtual y sus triggers se crean inmediatamente después de ``tareas``.
+
+    Args:
+        tareas_table (Table): Tabla ``tareas`` del modelo.
+    """
+    for statement in _FTS_DDL:
+        event.listen(
+            tareas_table, 'after_create',
+            DDL(statement).execute_if(dialect='sqlite')
+        )
+
+
+def has_search_index(connection):
+    """
+    Indica si la base de datos ya contiene la tabla ``tareas_fts``.
+
+    Args:
+        connection (Connection): Conexión activa de SQLAlchemy.
+
+    Returns:
+        bool: True si el índice existe.
+    """
+    if connection.dialect.name != 'sqlite':
+        return False
+    return _search_index_sql(connection) is not None
+
+
+def _search_index_sql(connection):
+    """SQL de creación de ``tareas_fts`` guardado en ``sqlite_master``, o None si no existe."""
+    return connection.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {'name': FTS_TABLE}
+    ).scalar()
+
+
+def _begin(bind):
+    """Abre una transacción en un motor, o reutiliza una conexión ya abierta."""
+    if isinstance(bind, Connection):
+        return nullcontext(bind)
+    return bind.begin()
+
+
+def rebuild_search_index(engine):
+    """
+    Crea (si falta) y reconstruye el índice FTS5 a partir de la tabla ``tareas``.
+
+    Args:
+        engine (Engine | Connection): Motor o conexión de la base a reindexar.
+    """
+    with _begin(engine) as connection:
+        for statement in _FTS_DDL:
+            connection.exec_driver_sql(statement)
+        connection.exec_driver_sql(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+        )
+
+
+def ensure_search_index(engine):
+    """
+    Migra bases existentes creadas antes del índice FTS5.
+
+    Si la tabla virtual no existe se crea y se pobla con las tareas actuales;
+    si existe sin los índices de prefijos actuales se vuelve a crear. En caso
+    contrario no se hace nada.
+
+    Args:
+        engine (Engine | Connection): Motor o conexión de la base de datos.
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+    with _begin(engine) as connection:
+        sql = _search_index_sql(connection)
+        if sql is not None and FTS_PREFIX_OPTION not in sql:
+            connection.exec_driver_sql(f"DROP TABLE {FTS_TABLE}")
+            sql = None
+    if sql is None:
+        rebuild_search_index(engine)
+
+
+def search_terms(keyword):
+    """
+    Divide el texto del usuario en las palabras que se buscan.
+
+    Args:
+        keyword (str): Texto introducido por el usuario.
+
+    Returns:
+        list: Palabras en el orden en que aparecen.
+    """
+    return _TOKEN_RE.findall(keyword or '')
+
+
+def build_match_query(keyword, prefix_last=False):
+    """
+    Convierte el texto del usuario en una expresión MATCH de FTS5.
+
+    Cada palabra se busca como prefijo y todas deben aparecer (AND implícito),
+    de modo que "proy inf" encuentra "Proyecto final de informática".
+
+    Con ``prefix_last`` solo la última palabra es un prefijo y las anteriores
+    se buscan completas, como en la búsqueda mientras se escribe: FTS5 lee los
+    términos completos bajo demanda, mientras que cada prefijo obliga a
+    fusionar antes las listas de todos los términos que empiezan igual.
+
+    Args:
+        keyword (str): Texto introducido por el usuario.
+        prefix_last (bool): Si es True, solo la última palabra es un prefijo.
+
+    Returns:
+        str: Expresión MATCH, o cadena vacía si no hay palabras buscables.
+    """
+    tokens = search_terms(keyword)
+    return ' '.join(
+        f'"{token}"' if prefix_last and position < len(tokens) - 1 else f'"{token}"*'
+        for position, token in enumerate(tokens)
+    )
+
+
+def match_clause(match_query):
+    """
+    Construye la condición ``tareas_fts MATCH :q`` para consultas del ORM.
+
+    Args:
+        match_query (str): Expresión generada por ``build_match_query``.
+
+    Returns:
+        ColumnElement: Condición booleana.
+    """
+    return literal_column(FTS_TABLE).op('MATCH')(match_query)
+
+
+def main(argv=None):
+    """Punto de entrada del comando de reconstrucción del índice."""
+    parser = argparse.ArgumentParser(
+        description='Reconstruye el índice de búsqueda FTS5 de una base de tareas.'
+    )
+    parser.add_argument('db_path', help='Ruta al archivo SQLite (por ejemplo, tareas.db)')
+    args = parser.parse_args(argv)
+
+    engine = create_engine(f'sqlite:///{args.db_path}')
+    rebuild_search_index(engine)
+    engine.dispose()
+    print(f'Índice de búsqueda reconstruido en {args.db_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,22 @@
 """
 Modelos de datos para la aplicación de gestión de tareas.
 
-Este módulo define las entidades: Tarea, Recordatorio y PreferenciasUsuario,
+Este módulo define las entidades: Tarea, Recordatorio, TareaBorrada y PreferenciasUsuario,
 utilizando SQLAlchemy para mapearlas a una base de datos SQLite.
+
+El motor y las sesiones se configuran en ``todo_app.models.database``.
 """
 
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Date, Boolean, Enum, ForeignKey, create_engine
+    DDL, Column, Integer, String, DateTime, Date, Boolean, Enum, ForeignKey, Index, event
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 
+from todo_app.models.fts import attach_search_index, ensure_search_index
+
 # Base de datos ORM
 Base = declarative_base()
 
@@ -48,8 +52,23 @@ class Tarea(Base):
         creada_en (datetime): Fecha de creación.
         actualizada_en (datetime): Última fecha de modificación.
         recordatorios (List[Recordatorio]): Lista de recordatorios vinculados.
+
+    Los índices compuestos comienzan por ``eliminada`` porque todas las
+    consultas de listado excluyen (o seleccionan) la papelera, y luego cubren
+    los filtros que expone la interfaz: estado, prioridad y categoría. Los que
+    terminan en ``fecha_vencimiento`` entregan además el orden de los listados
+    paginados sin un paso de ordenación adicional. El registro de cambios
+    (``changes_since``) no usa ``actualizada_en``, que toma el reloj del
+    cliente, sino las versiones de ``tareas_cambios``.
     """
     __tablename__ = 'tareas'
+    __table_args__ = (
+        Index('ix_tareas_eliminada_vencimiento', 'eliminada', 'fecha_vencimiento'),
+        Index('ix_tareas_eliminada_completada_prioridad', 'eliminada', 'completada', 'prioridad'),
+        Index('ix_tareas_eliminada_completada_vencimiento', 'eliminada', 'completada', 'fecha_vencimiento'),
+        Index('ix_tareas_eliminada_prioridad_vencimiento', 'eliminada', 'prioridad', 'fecha_vencimiento'),
+        Index('ix_tareas_eliminada_categoria_vencimiento', 'eliminada', 'categoria', 'fecha_vencimiento'),
+    )
 
     id = Column(Integer, primary_key=True)
     titulo = Column(String, nullable=False)
@@ -71,6 +90,9 @@ class Tarea(Base):
     )
 
 
+attach_search_index(Tarea.__table__)
+
+
 class Recordatorio(Base):
     """
     Modelo que representa un recordatorio asociado a una tarea.
@@ -85,13 +107,104 @@ class Recordatorio(Base):
     __tablename__ = 'recordatorios'
 
     id = Column(Integer, primary_key=True)
-    tarea_id = Column(Integer, ForeignKey('tareas.id'))
+    tarea_id = Column(Integer, ForeignKey('tareas.id'), index=True)
     fecha_hora = Column(DateTime)
     notificado = Column(Boolean, default=False)
 
     tarea = relationship("Tarea", back_populates="recordatorios")
 
 
+class TareaBorrada(Base):
+    """
+    Marca (tombstone) de una tarea borrada de forma permanente.
+
+    Las filas las inserta el trigger ``tareas_borradas_ad`` al borrar de
+    ``tareas`` por cualquier vía (ORM, Core o SQL directo), para que el
+    registro de cambios pueda informar también de los borrados definitivos.
+
+    Atributos:
+        id (int): Secuencia creciente; sirve de cursor para ``changes_since``.
+        tarea_id (int): ID de la tarea borrada.
+        borrada_en (datetime): Momento del borrado (UTC).
+    """
+    __tablename__ = 'tareas_borradas'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    tarea_id = Column(Integer, nullable=False)
+    borrada_en = Column(DateTime)
+
+
+# Se crea tras ``create_all`` (también sobre bases existentes, vía
+# ``upgrade_schema``), cuando ya existen ``tareas`` y ``tareas_borradas``. El
+# formato de fecha completa los milisegundos de SQLite a microsegundos, como
+# los guarda SQLAlchemy (``%%`` porque ``DDL`` interpola con ``%``).
+_TOMBSTONE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS tareas_borradas_ad AFTER DELETE ON tareas BEGIN
+    INSERT INTO tareas_borradas(tarea_id, borrada_en)
+    VALUES (old.id, strftime('%%Y-%%m-%%d %%H:%%M:%%f000', 'now'));
+END
+"""
+event.listen(Base.metadata, 'after_create', DDL(_TOMBSTONE_TRIGGER).execute_if(dialect='sqlite'))
+
+
+class CambioTarea(Base):
+    """
+    Versión de la última escritura de cada tarea, para el registro de cambios.
+
+    Las filas las mantienen los triggers ``tareas_cambios_*``: cada INSERT o
+    UPDATE sobre ``tareas`` (por cualquier vía) sustituye la fila de la tarea
+    por otra con un ``id`` nuevo de la secuencia AUTOINCREMENT, y cada DELETE
+    la quita. SQLite admite un solo escritor y el trigger se ejecuta con el
+    bloqueo de escritura tomado, así que los ``id`` crecen en el orden en que
+    se confirman las transacciones: una escritura confirmada después de
+    entregar un token siempre queda por delante de él, cosa que no garantiza
+    ``actualizada_en`` (el reloj del cliente al volcar la sesión).
+
+    Atributos:
+        id (int): Versión; sirve de cursor para ``changes_since``.
+        tarea_id (int): ID de la tarea.
+        creacion (int): Versión con la que se creó la tarea.
+    """
+    __tablename__ = 'tareas_cambios'
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    id = Column(Integer, primary_key=True)
+    tarea_id = Column(Integer, nullable=False, index=True)
+    creacion = Column(Integer, nullable=False, default=0)
+
+
+# Como el de ``tareas_borradas``, se crean tras ``create_all``. La última
+# sentencia registra las tareas de una base anterior al registro de cambios,
+# con su propio ID como versión; con el registro ya poblado no hace nada.
+_CHANGE_LOG_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS tareas_cambios_ai AFTER INSERT ON tareas BEGIN
+        INSERT INTO tareas_cambios(tarea_id, creacion) VALUES (new.id, 0);
+        UPDATE tareas_cambios SET creacion = id WHERE id = last_insert_rowid();
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tareas_cambios_au AFTER UPDATE ON tareas BEGIN
+        INSERT INTO tareas_cambios(tarea_id, creacion)
+        SELECT new.id, coalesce(max(creacion), 0) FROM tareas_cambios WHERE tarea_id = new.id;
+        DELETE FROM tareas_cambios WHERE tarea_id = new.id AND id < last_insert_rowid();
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tareas_cambios_ad AFTER DELETE ON tareas BEGIN
+        DELETE FROM tareas_cambios WHERE tarea_id = old.id;
+    END
+    """,
+    "DROP INDEX IF EXISTS ix_tareas_actualizada_en",
+    """
+    INSERT INTO tareas_cambios(id, tarea_id, creacion)
+    SELECT id, id, id FROM tareas WHERE NOT EXISTS (SELECT 1 FROM tareas_cambios)
+    """,
+]
+for _statement in _CHANGE_LOG_DDL:
+    event.listen(Base.metadata, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+
+
 class PreferenciasUsuario(Base):
     """
     Modelo que representa las preferencias del usuario.
@@ -110,7 +223,37 @@ class PreferenciasUsuario(Base):
     notificaciones_activadas = Column(Boolean, default=True)
 
 
-# Configuración de la base de datos SQLite
-engine = create_engine('sqlite:///tareas.db')
-Base.metadata.create_all(engine)
-Session = sessionmaker(bind=engine)
+def upgrade_schema(engine):
+    """
+    Crea el esquema y migra bases existentes a la versión actual.
+
+    ``create_all`` solo crea las tablas que faltan, por lo que los índices
+    declarados después de crear una tabla se añaden aquí de forma explícita.
+    También se crea y pobla el índice de búsqueda FTS5 si no existe (o se
+    reconstruye si le faltan los índices de prefijos). Los
+    triggers de ``tareas_borradas`` y ``tareas_cambios`` los añade
+    ``create_all`` (``IF NOT EXISTS``), que también registra en
+    ``tareas_cambios`` las tareas de una base anterior.
+
+    Args:
+        engine (Engine | Connection): Motor o conexión de la base de datos
+            (una conexión permite usarla con ``AsyncConnection.run_sync``).
+    """
+    Base.metadata.create_all(engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    ensure_search_index(engine)
+
+
+def __getattr__(name):
+    """
+    Compatibilidad con el código que importaba ``engine`` o ``Session`` desde aquí.
+
+    Ambos se crean ahora bajo demanda en ``todo_app.models.database``.
+    """
+    if name in ('engine', 'Session'):
+        from todo_app.models import database
+        engine = database.get_engine()
+        return engine if name == 'engine' else database.Session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,109 @@
+"""
+Perfiles de ajuste de SQLite para el motor de base de datos.
+
+Cada perfil es un conjunto de PRAGMAs que se aplican a cada conexión nueva
+mediante el evento ``connect`` de SQLAlchemy:
+
+- ``durable``: journal de reversión y ``synchronous=FULL`` (comportamiento
+  por defecto de SQLite). Cada commit espera a que el disco confirme.
+- ``balanced``: WAL con ``synchronous=NORMAL``. Los lectores no bloquean al
+  escritor y cada commit deja de hacer fsync; ante un corte de energía solo
+  pueden perderse las últimas transacciones, nunca se corrompe la base.
+- ``fast``: WAL sin sincronización. Para importaciones o pruebas en las que
+  perder las últimas escrituras es aceptable.
+
+El perfil se elige con el argumento ``profile`` o con la variable de entorno
+``TODO_DB_PROFILE``; por defecto se usa ``balanced``.
+"""
+
+import os
+
+from sqlalchemy import event
+
+PROFILE_ENV_VAR = 'TODO_DB_PROFILE'
+DEFAULT_PROFILE = 'balanced'
+
+PROFILES = {
+    'durable': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'mmap_size': 0,
+        'cache_size': -2000,
+        'temp_store': 'DEFAULT',
+    },
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64 * 1024,
+        'temp_store': 'MEMORY',
+    },
+    'fast': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'mmap_size': 1024 * 1024 * 1024,
+        'cache_size': -256 * 1024,
+        'temp_store': 'MEMORY',
+    },
+}
+
+
+def resolve_profile(name=None):
+    """
+    Determina el perfil a usar.
+
+    Args:
+        name (str): Nombre explícito; si es None se consulta ``TODO_DB_PROFILE``.
+
+    Returns:
+        str: Nombre de un perfil existente.
+
+    Raises:
+        ValueError: Si el perfil no existe.
+    """
+    name = (name or os.environ.get(PROFILE_ENV_VAR) or DEFAULT_PROFILE).strip().lower()
+    if name not in PROFILES:
+        raise ValueError(
+            f"Perfil de SQLite desconocido: {name!r} (disponibles: {', '.join(PROFILES)})"
+        )
+    return name
+
+
+def apply_profile(dbapi_connection, name):
+    """
+    Ejecuta los PRAGMAs del perfil sobre una conexión DB-API de sqlite3.
+
+    Args:
+        dbapi_connection: Conexión ``sqlite3`` recién abierta.
+        name (str): Nombre del perfil.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in PROFILES[name].items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
+    finally:
+        cursor.close()
+
+
+def install_profile(engine, name=None):
+    """
+    Registra el perfil para que se aplique a cada conexión del motor.
+
+    Los motores que no son SQLite se dejan intactos.
+
+    Args:
+        engine (Engine): Motor de SQLAlchemy.
+        name (str): Nombre del perfil, o None para resolverlo del entorno.
+
+    Returns:
+        str: Nombre del perfil aplicado, o None si el motor no es SQLite.
+    """
+    if engine.dialect.name != 'sqlite':
+        return None
+    name = resolve_profile(name)
+
+    @event.listens_for(engine, 'connect')
+    def _apply(dbapi_connection, connection_record):
+        apply_profile(dbapi_connection, name)
+
+    return name
@@ -0,0 +1,98 @@
+"""
+Conducción del planificador de recordatorios desde el bucle de eventos de Qt.
+
+``ReminderTimer`` programa un único ``QTimer`` de disparo simple para el
+próximo recordatorio pendiente y lo reprograma cuando las tareas cambian,
+de modo que la aplicación no consulta la base de datos periódicamente.
+
+Puede moverse a un ``QThread`` propio (``moveToThread``) para que las
+consultas del planificador no se hagan en el hilo de la interfaz: sus
+métodos son slots y se ejecutan en el hilo del objeto, y ``reminders_due``
+llega a la interfaz como señal encolada.
+
+Un error de base de datos al procesar (p. ej. "database is locked") no sale
+del slot, donde PyQt abortaría el proceso: se registra y se reintenta tras
+``RETRY_DELAY``.
+"""
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+from sqlalchemy.exc import SQLAlchemyError
+
+from todo_app.services.reminder_scheduler import RETRY_DELAY, log_retry
+
+# Las esperas se limitan a un día (QTimer acepta como máximo un int de 32 bits
+# en milisegundos) y se recalculan al despertar.
+MAX_INTERVAL_MS = 24 * 60 * 60 * 1000
+
+
+class ReminderTimer(QObject):
+    """Conduce un ``ReminderScheduler`` con un ``QTimer`` de disparo simple."""
+
+    # Lista de ``DueReminder`` vencidos.
+    reminders_due = pyqtSignal(list)
+    # Permite pedir la reprogramación desde otro hilo (p. ej. el de la base de datos).
+    _reschedule_requested = pyqtSignal()
+
+    def __init__(self, scheduler, parent=None):
+        """
+        Inicializa el temporizador (sin arrancarlo).
+
+        Args:
+            scheduler (ReminderScheduler): Planificador a conducir.
+            parent (QObject): Objeto padre de Qt.
+        """
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self.scheduler.on_reschedule = self.reschedule
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+        self._reschedule_requested.connect(self._restart_now)
+
+    @pyqtSlot()
+    def start(self):
+        """Dispara los recordatorios ya vencidos y programa el siguiente."""
+        self._on_timeout()
+
+    @pyqtSlot()
+    def stop(self):
+        """Detiene el temporizador."""
+        self._timer.stop()
+
+    def reschedule(self):
+        """
+        Procesa los cambios de inmediato desde el bucle de eventos.
+
+        Se llama desde ``ReminderScheduler.tasks_changed``, posiblemente en
+        otro hilo; el trabajo se difiere con un intervalo de 0 ms en el hilo
+        del temporizador para no hacerlo dentro de la operación del servicio
+        que provocó el cambio.
+        """
+        self._reschedule_requested.emit()
+
+    @pyqtSlot()
+    def _restart_now(self):
+        self._timer.start(0)
+
+    @pyqtSlot()
+    def _on_timeout(self):
+        try:
+            due = self.scheduler.process()
+        except SQLAlchemyError as exc:
+            self._retry_later(exc)
+            return
+        if due:
+            self.reminders_due.emit(due)
+        try:
+            seconds = self.scheduler.seconds_until_next()
+        except SQLAlchemyError as exc:
+            self._retry_later(exc)
+            return
+        if seconds is None:
+            self._timer.stop()
+            return
+        self._timer.start(min(int(seconds * 1000) + 1, MAX_INTERVAL_MS))
+
+    def _retry_later(self, error):
+        log_retry(error)
+        self._timer.start(int(RETRY_DELAY * 1000))
@@ -0,0 +1,249 @@
+"""
+Importación y exportación masiva de tareas.
+
+Este módulo lee tareas desde CSV o JSON Lines y las inserta por lotes con
+``insert()`` de SQLAlchemy Core (``executemany``), confirmando una sola
+transacción por lote en lugar de una por tarea. La exportación recorre la
+tabla en flujo, sin cargar todas las filas en memoria.
+
+Los registros usan los mismos nombres de campo que el modelo ``Tarea``:
+titulo, descripcion, fecha_vencimiento, prioridad, categoria, completada,
+favorita y eliminada (las tareas de la papelera se exportan con
+``include_deleted`` y vuelven a la papelera al importarlas).
+"""
+
+import csv
+import json
+from datetime import date
+from itertools import islice
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from todo_app.models.models import Tarea as Task, NivelPrioridad, Categoria
+
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+
+FIELDS = [
+    'titulo', 'descripcion', 'fecha_vencimiento',
+    'prioridad', 'categoria', 'completada', 'favorita', 'eliminada'
+]
+
+FORMATS = ('csv', 'jsonl')
+
+_TRUE_VALUES = {'1', 'true', 'si', 'sí', 'yes', 'x'}
+_FALSE_VALUES = {'', '0', 'false', 'no'}
+
+
+class BulkImportError(Exception):
+    """La base rechazó un lote; ``inserted`` indica las tareas ya guardadas."""
+
+    def __init__(self, inserted, error):
+        super().__init__(f"Importación interrumpida tras guardar {inserted} tareas: {error}")
+        self.inserted = inserted
+
+
+def detect_format(path):
+    """
+    Deduce el formato a partir de la extensión del archivo.
+
+    Args:
+        path (str): Ruta del archivo.
+
+    Returns:
+        str: 'csv' o 'jsonl'.
+
+    Raises:
+        ValueError: Si la extensión no es reconocida.
+    """
+    lowered = path.lower()
+    if lowered.endswith('.csv'):
+        return 'csv'
+    if lowered.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    raise ValueError(f"No se reconoce el formato de {path!r}; usa .csv o .jsonl")
+
+
+def read_records(stream, fmt):
+    """
+    Lee registros de un archivo abierto en modo texto.
+
+    Args:
+        stream (TextIO): Archivo de entrada.
+        fmt (str): 'csv' o 'jsonl'.
+
+    Yields:
+        tuple: (número de línea, diccionario con los campos del registro).
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except ValueError as exc:
+                    raise ValueError(f"Línea {line_number}: JSON inválido ({exc})") from exc
+                if not isinstance(record, dict):
+                    raise ValueError(f"Línea {line_number}: se esperaba un objeto JSON")
+                yield line_number, record
+    else:
+        raise ValueError(f"Formato desconocido: {fmt!r}")
+
+
+def _parse_enum(enum_cls, value, field):
+    """Acepta el nombre ('alta') o el valor ('Alta') del enum, sin distinguir mayúsculas."""
+    text = str(value).strip().lower()
+    for member in enum_cls:
+        if text in (member.name, member.value.lower()):
+            return member
+    allowed = ', '.join(member.name for member in enum_cls)
+    raise ValueError(f"{field} inválida: {value!r} (valores permitidos: {allowed})")
+
+
+def _parse_bool(value, field, default=False):
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"{field} inválido: {value!r}")
+
+
+def parse_record(record, line_number=None):
+    """
+    Valida un registro y lo convierte en valores de columna de ``tareas``.
+
+    Args:
+        record (dict): Campos leídos del archivo.
+        line_number (int): Línea de origen, para los mensajes de error.
+
+    Returns:
+        dict: Valores listos para ``insert()``.
+
+    Raises:
+        ValueError: Si falta el título o algún valor no es válido.
+    """
+    try:
+        titulo = (record.get('titulo') or '').strip()
+        if not titulo:
+            raise ValueError("titulo es obligatorio")
+
+        due = record.get('fecha_vencimiento')
+        prioridad = record.get('prioridad')
+        categoria = record.get('categoria')
+        return {
+            'titulo': titulo,
+            'descripcion': record.get('descripcion') or None,
+            'fecha_vencimiento': date.fromisoformat(due) if due else None,
+            'prioridad': (
+                _parse_enum(NivelPrioridad, prioridad, 'prioridad')
+                if prioridad else NivelPrioridad.media
+            ),
+            'categoria': _parse_enum(Categoria, categoria, 'categoria') if categoria else None,
+            'completada': _parse_bool(record.get('completada', False), 'completada'),
+            'favorita': _parse_bool(record.get('favorita', False), 'favorita'),
+            'eliminada': _parse_bool(record.get('eliminada', False), 'eliminada'),
+        }
+    except (TypeError, ValueError) as exc:
+        where = f"Línea {line_number}: " if line_number is not None else ""
+        raise ValueError(f"{where}{exc}") from exc
+
+
+def import_tasks(session, records, batch_size=DEFAULT_IMPORT_BATCH_SIZE):
+    """
+    Inserta tareas por lotes, con una transacción por lote.
+
+    Cada lote se valida completo antes de insertarse; si un registro no es
+    válido se lanza ``ValueError`` y solo quedan guardados los lotes
+    anteriores. Si la base rechaza un lote, se revierte la transacción de
+    ese lote y se lanza ``BulkImportError`` con las tareas ya guardadas.
+
+    Args:
+        session (Session): Sesión de base de datos.
+        records (Iterable[tuple]): Pares (línea, registro) de ``read_records``.
+        batch_size (int): Número de tareas por transacción.
+
+    Returns:
+        int: Número de tareas insertadas.
+
+    Raises:
+        ValueError: Si un registro no es válido.
+        BulkImportError: Si la base falla al insertar o confirmar un lote.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser mayor que cero")
+
+    statement = Task.__table__.insert()
+    records = iter(records)
+    inserted = 0
+    while True:
+        batch = [parse_record(record, line) for line, record in islice(records, batch_size)]
+        if not batch:
+            break
+        try:
+            session.execute(statement, batch)
+            session.commit()
+        except SQLAlchemyError as exc:
+            session.rollback()
+            raise BulkImportError(inserted, exc) from exc
+        inserted += len(batch)
+    return inserted
+
+
+def export_value(value):
+    """Convierte un valor de columna a su forma exportable (enums por nombre, fechas ISO)."""
+    if isinstance(value, (NivelPrioridad, Categoria)):
+        return value.name
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def export_tasks(session, stream, fmt, include_deleted=False, batch_size=DEFAULT_IMPORT_BATCH_SIZE):
+    """
+    Escribe las tareas en CSV o JSON Lines leyendo la tabla en flujo.
+
+    Las filas se obtienen como tuplas de columnas (sin crear objetos del ORM)
+    y en lotes de ``batch_size``, por lo que la memoria no crece con el
+    número de tareas.
+
+    Args:
+        session (Session): Sesión de base de datos.
+        stream (TextIO): Archivo de salida abierto en modo texto.
+        fmt (str): 'csv' o 'jsonl'.
+        include_deleted (bool): Si True, exporta también las tareas eliminadas.
+        batch_size (int): Filas leídas por lote.
+
+    Returns:
+        int: Número de tareas exportadas.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato desconocido: {fmt!r}")
+
+    query = select(*(getattr(Task, field) for field in FIELDS)).order_by(Task.id)
+    if not include_deleted:
+        query = query.where(Task.eliminada.is_(False))
+    rows = session.execute(query.execution_options(yield_per=batch_size))
+
+    writer = None
+    if fmt == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(FIELDS)
+
+    exported = 0
+    for row in rows:
+        values = [export_value(value) for value in row]
+        if writer is not None:
+            writer.writerow(['' if value is None else value for value in values])
+        else:
+            stream.write(json.dumps(dict(zip(FIELDS, values)), ensure_ascii=False))
+            stream.write('\n')
+        exported += 1
+    return exported
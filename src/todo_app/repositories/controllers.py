@@ -8,15 +8,229 @@ filtrar, buscar, marcar como favoritas o completadas, entre otras acciones.
 Historias de Usuario: HU005 - HU018
 """
 
-from todo_app.models.models import Session, Tarea as Task, NivelPrioridad, Categoria
+import base64
+import binascii
+import json
+from collections import namedtuple
+from datetime import date
+
+from sqlalchemy import and_, case, func, null, or_, select, tuple_, union_all, update
+
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from todo_app.models.database import get_session
+from todo_app.models.fts import build_match_query, fts_table, match_clause
+from todo_app.models.models import (
+    Tarea as Task, NivelPrioridad, Categoria, Recordatorio, TareaBorrada, CambioTarea
+)
+from todo_app.repositories.task_query import (
+    DATE_VIEWS, UPCOMING_DAYS, TaskQuery, date_view_range, due_in_range
+)
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_BATCH_SIZE = 1000
+# Máximo de IDs por sentencia ... WHERE id IN (...), muy por debajo del
+# límite de parámetros de SQLite.
+MUTATION_CHUNK_SIZE = 500
+DEFAULT_CHANGES_LIMIT = 500
+# Búsquedas con más coincidencias que esto se listan de la más reciente a la
+# más antigua: ordenarlas por relevancia obligaría a puntuarlas todas en cada página.
+SEARCH_RANK_LIMIT = 1000
+
+TaskPage = namedtuple('TaskPage', ['tasks', 'next_cursor'])
+TaskPage.__doc__ = """Página de tareas y cursor opaco para pedir la siguiente (None si no hay más)."""
+
+ReminderSummary = namedtuple('ReminderSummary', ['pending', 'next_at'])
+ReminderSummary.__doc__ = """Recordatorios pendientes de una tarea y fecha del próximo (None si no hay)."""
+NO_REMINDERS = ReminderSummary(0, None)
+
+TaskStats = namedtuple('TaskStats', [
+    'total', 'pending', 'completed', 'overdue', 'favorites', 'deleted', 'by_priority', 'by_category'
+])
+TaskStats.__doc__ = """Contadores de tareas activas (``deleted`` cuenta las de la papelera).
+
+``by_priority`` y ``by_category`` son diccionarios por nombre de enum; las
+tareas sin categoría se cuentan en la clave None.
+"""
+
+DateViewCounts = namedtuple('DateViewCounts', ['overdue', 'today', 'week', 'upcoming', 'no_date'])
+DateViewCounts.__doc__ = """Tareas de cada vista por fecha, en el orden de ``DATE_VIEWS``."""
+
+ChangeSet = namedtuple('ChangeSet', ['created', 'updated', 'deleted', 'token', 'has_more'])
+ChangeSet.__doc__ = """Cambios desde un token: filas creadas y modificadas, IDs borrados y token siguiente.
+
+``has_more`` indica que se alcanzó el límite y hay que volver a pedir con
+``token`` para obtener el resto.
+"""
+
+TASK_ROW_FIELDS = [
+    'id', 'titulo', 'descripcion', 'fecha_vencimiento',
+    'completada', 'favorita', 'eliminada', 'prioridad', 'categoria'
+]
+# Columnas de la tabla en el orden de TaskRow, para SELECT sin entidades del ORM.
+TASK_ROW_COLUMNS = [Task.__table__.c[field] for field in TASK_ROW_FIELDS]
+
+
+class TaskRow(namedtuple('TaskRow', TASK_ROW_FIELDS)):
+    """
+    Fila de solo lectura de una tarea para los listados.
+
+    Se construye directamente a partir de las columnas de un SELECT, sin
+    instanciar ``Tarea`` ni registrarla en el mapa de identidad de la sesión:
+    ocupa menos memoria, no caduca con los ``commit`` y puede pasarse a otros
+    hilos. ``__slots__`` vacío evita el diccionario por instancia.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_task(cls, task):
+        """Crea la fila a partir de una tarea del ORM."""
+        return cls(*(getattr(task, field) for field in TASK_ROW_FIELDS))
+
+    @property
+    def sort_key(self):
+        """Clave de orden equivalente a ``ORDER BY fecha_vencimiento, id`` (NULL primero)."""
+        due = self.fecha_vencimiento
+        return (due is not None, due or date.min, self.id)
+
+
+def encode_cursor(task):
+    """
+    Genera un cursor opaco a partir de la última tarea de una página.
+
+    Args:
+        task (Tarea | TaskRow): Última tarea entregada.
+
+    Returns:
+        str: Cursor codificado en base64 (URL-safe).
+    """
+    due = task.fecha_vencimiento.isoformat() if task.fecha_vencimiento else None
+    raw = json.dumps([due, task.id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """
+    Decodifica un cursor generado por ``encode_cursor``.
+
+    Args:
+        cursor (str): Cursor opaco.
+
+    Returns:
+        tuple: (fecha_vencimiento o None, id).
+
+    Raises:
+        ValueError: Si el cursor no es válido.
+    """
+    try:
+        due, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return (date.fromisoformat(due) if due else None), int(task_id)
+    except (binascii.Error, TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError(f"Cursor inválido: {cursor!r}") from exc
+
+
+def encode_search_cursor(rank, task_id):
+    """
+    Genera el cursor de una página de resultados de búsqueda.
+
+    Args:
+        rank (float): Relevancia (``rank`` de FTS5) de la última tarea entregada,
+            o None si la búsqueda se lista por antigüedad.
+        task_id (int): ID de esa tarea.
+
+    Returns:
+        str: Cursor codificado en base64 (URL-safe).
+    """
+    raw = json.dumps([rank, task_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_search_cursor(cursor):
+    """
+    Decodifica un cursor generado por ``encode_search_cursor``.
+
+    Args:
+        cursor (str): Cursor opaco.
+
+    Returns:
+        tuple: (rank o None, id).
+
+    Raises:
+        ValueError: Si el cursor no es válido.
+    """
+    try:
+        rank, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return (None if rank is None else float(rank)), int(task_id)
+    except (binascii.Error, TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError(f"Cursor inválido: {cursor!r}") from exc
+
+
+def encode_change_token(version, tombstone_id):
+    """
+    Genera el token opaco del registro de cambios.
+
+    Args:
+        version (int): Última versión de ``tareas_cambios`` entregada.
+        tombstone_id (int): Último ID de ``tareas_borradas`` entregado.
+
+    Returns:
+        str: Token codificado en base64 (URL-safe).
+    """
+    raw = json.dumps([version, tombstone_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_change_token(token):
+    """
+    Decodifica un token generado por ``encode_change_token``.
+
+    Args:
+        token (str): Token opaco.
+
+    Returns:
+        tuple: (versión de ``tareas_cambios``, id de marca de borrado).
+
+    Raises:
+        ValueError: Si el token no es válido.
+    """
+    try:
+        version, tombstone_id = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+        return int(version), int(tombstone_id)
+    except (binascii.Error, TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError(f"Token de cambios inválido: {token!r}") from exc
 
 
 class TaskController:
     """Controlador para gestionar operaciones CRUD sobre tareas."""
 
-    def __init__(self):
-        """Inicializa una nueva sesión de base de datos."""
-        self.session = Session()
+    def __init__(self, session=None, engine=None):
+        """
+        Inicializa el controlador con una sesión de base de datos.
+
+        Args:
+            session (Session): Sesión a utilizar; tiene prioridad sobre ``engine``.
+            engine (Engine): Motor con el que abrir una sesión propia.
+                Si no se indica ninguno, se usa el motor global de la aplicación.
+        """
+        if session is None:
+            session = sessionmaker(bind=engine)() if engine is not None else get_session()
+        self.session = session
+        # Con confirmaciones diferidas, las modificaciones solo se vuelcan a la
+        # transacción abierta y quien las difiere decide cuándo confirmarlas.
+        self.defer_commits = False
+
+    def commit(self):
+        """
+        Confirma la transacción, o solo vuelca los cambios si ``defer_commits`` está activo.
+
+        Al volcarlos, la sesión (y quien lea a través de ella) ya ve los cambios
+        y las tareas nuevas tienen ID, pero no se escriben en disco hasta la
+        próxima confirmación.
+        """
+        if self.defer_commits:
+            self.session.flush()
+        else:
+            self.session.commit()
 
     def add_task(self, title, description, due_date, prioridad='media', categoria=None):
         """
@@ -28,6 +242,9 @@ class TaskController:
             due_date (date): Fecha de vencimiento.
             prioridad (str): Nivel de prioridad ('baja', 'media', 'alta').
             categoria (str): Categoría de la tarea ('trabajo', 'hogar', 'estudio').
+
+        Returns:
+            Tarea: La tarea creada.
         """
         task = Task(
             titulo=title,
@@ -37,22 +254,408 @@ class TaskController:
             categoria=Categoria[categoria] if categoria else None
         )
         self.session.add(task)
-        self.session.commit()
+        self.commit()
+        return task
 
-    def get_tasks(self, include_deleted=False):
+    def get_tasks(self, include_deleted=False, with_reminders=False):
         """
         Obtener todas las tareas activas (HU010).
 
         Args:
             include_deleted (bool): Si es True, también incluye tareas eliminadas.
+            with_reminders (bool): Si es True, carga los recordatorios de antemano.
 
         Returns:
-            list: Lista de tareas.
+            list: Lista de tareas ordenadas por fecha de vencimiento.
+        """
+        return list(self.iter_tasks(include_deleted=include_deleted, with_reminders=with_reminders))
+
+    def get_tasks_by_ids(self, task_ids, with_reminders=False):
+        """
+        Obtener las tareas con los IDs indicados, estén o no eliminadas.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            with_reminders (bool): Si es True, carga los recordatorios de antemano.
+
+        Returns:
+            list: Tareas encontradas (las inexistentes se omiten).
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return []
+        return self._task_query(with_reminders).filter(Task.id.in_(task_ids)).all()
+
+    def _task_query(self, with_reminders=False):
+        """
+        Consulta de tareas con la estrategia de carga de recordatorios indicada.
+
+        ``Tarea.recordatorios`` se carga de forma perezosa: recorrerlo en un
+        listado lanza un SELECT por tarea. Con ``with_reminders`` se usa
+        ``selectinload``, que trae los recordatorios de todas las tareas
+        cargadas en una consulta adicional por lote (``WHERE tarea_id IN``).
         """
         query = self.session.query(Task)
-        if not include_deleted:
-            query = query.filter(Task.eliminada.is_(False))
-        return query.all()
+        if with_reminders:
+            query = query.options(selectinload(Task.recordatorios))
+        return query
+
+    @staticmethod
+    def _listing_criteria(include_deleted=False, estado=None, prioridad=None, categoria=None,
+                          only_deleted=False):
+        """Condiciones de los filtros de los listados, comunes al ORM y a las filas."""
+        eliminada = True if only_deleted else (None if include_deleted else False)
+        return TaskQuery(estado=estado, prioridades=prioridad, categorias=categoria, eliminada=eliminada).criteria()
+
+    @staticmethod
+    def _after_cursor(cursor):
+        """Condición de las tareas posteriores al cursor en el orden (fecha_vencimiento, id)."""
+        due, task_id = decode_cursor(cursor)
+        if due is None:
+            return or_(
+                and_(Task.fecha_vencimiento.is_(None), Task.id > task_id),
+                Task.fecha_vencimiento.isnot(None)
+            )
+        return tuple_(Task.fecha_vencimiento, Task.id) > tuple_(due, task_id)
+
+    def _listing_query(self, include_deleted=False, estado=None, prioridad=None, categoria=None,
+                       with_reminders=False, only_deleted=False):
+        """
+        Construye la consulta base de los listados, ordenada por (fecha_vencimiento, id).
+
+        Las tareas sin fecha aparecen primero, como hace SQLite con los NULL en
+        orden ascendente; así el orden coincide con los índices que terminan en
+        ``fecha_vencimiento`` y la paginación por clave no necesita ordenar.
+        """
+        criteria = self._listing_criteria(include_deleted, estado, prioridad, categoria, only_deleted)
+        return self._task_query(with_reminders).filter(*criteria).order_by(Task.fecha_vencimiento, Task.id)
+
+    def page_tasks(self, cursor=None, page_size=DEFAULT_PAGE_SIZE, include_deleted=False,
+                   estado=None, prioridad=None, categoria=None, with_reminders=False,
+                   only_deleted=False):
+        """
+        Obtener una página de tareas paginando por clave (fecha_vencimiento, id).
+
+        A diferencia de OFFSET, la búsqueda por clave salta directamente a la
+        posición del cursor en el índice, por lo que cada página cuesta lo mismo
+        sin importar cuán avanzada esté.
+
+        Args:
+            cursor (str): Cursor devuelto por la página anterior, o None para la primera.
+            page_size (int): Número máximo de tareas por página.
+            include_deleted (bool): Si es True, también incluye tareas eliminadas.
+            estado (str): 'completadas' o 'pendientes'.
+            prioridad (str): 'alta', 'media' o 'baja'.
+            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            with_reminders (bool): Si es True, carga los recordatorios de antemano.
+            only_deleted (bool): Si es True, solo las tareas de la papelera.
+
+        Returns:
+            TaskPage: Tareas de la página y cursor de la siguiente.
+        """
+        query = self._listing_query(include_deleted, estado, prioridad, categoria, with_reminders,
+                                    only_deleted)
+        if cursor:
+            query = query.filter(self._after_cursor(cursor))
+
+        tasks = query.limit(page_size + 1).all()
+        if len(tasks) > page_size:
+            tasks = tasks[:page_size]
+            return TaskPage(tasks, encode_cursor(tasks[-1]))
+        return TaskPage(tasks, None)
+
+    def iter_tasks(self, include_deleted=False, estado=None, prioridad=None, categoria=None,
+                   batch_size=DEFAULT_BATCH_SIZE, with_reminders=False):
+        """
+        Recorrer las tareas en lotes sin cargarlas todas en memoria.
+
+        Usa ``yield_per``, de modo que solo ``batch_size`` filas se materializan
+        a la vez. No se debe confirmar la sesión mientras se consume el generador.
+
+        Args:
+            include_deleted (bool): Si es True, también incluye tareas eliminadas.
+            estado (str): 'completadas' o 'pendientes'.
+            prioridad (str): 'alta', 'media' o 'baja'.
+            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            batch_size (int): Número de filas leídas por lote.
+            with_reminders (bool): Si es True, carga los recordatorios de cada
+                lote con una consulta adicional.
+
+        Yields:
+            Tarea: Tareas en orden de fecha de vencimiento.
+        """
+        query = self._listing_query(include_deleted, estado, prioridad, categoria, with_reminders)
+        yield from query.yield_per(batch_size)
+
+    # MODELO DE LECTURA
+
+    def _rows(self, statement):
+        return [TaskRow._make(row) for row in self.session.execute(statement)]
+
+    def _listing_rows_statement(self, include_deleted=False, estado=None, prioridad=None, categoria=None,
+                                only_deleted=False):
+        criteria = self._listing_criteria(include_deleted, estado, prioridad, categoria, only_deleted)
+        return select(*TASK_ROW_COLUMNS).where(*criteria).order_by(Task.fecha_vencimiento, Task.id)
+
+    def get_task_rows(self, include_deleted=False, estado=None, prioridad=None, categoria=None,
+                      only_deleted=False):
+        """
+        Obtener las tareas de un listado como ``TaskRow``, sin entidades del ORM.
+
+        Args:
+            include_deleted (bool): Si es True, también incluye tareas eliminadas.
+            estado (str): 'completadas' o 'pendientes'.
+            prioridad (str): 'alta', 'media' o 'baja'.
+            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            only_deleted (bool): Si es True, solo las tareas de la papelera.
+
+        Returns:
+            list: Filas ordenadas por (fecha_vencimiento, id).
+        """
+        return self._rows(self._listing_rows_statement(include_deleted, estado, prioridad, categoria,
+                                                       only_deleted))
+
+    def page_task_rows(self, cursor=None, page_size=DEFAULT_PAGE_SIZE, include_deleted=False,
+                       estado=None, prioridad=None, categoria=None, only_deleted=False):
+        """
+        Como ``page_tasks``, pero devolviendo ``TaskRow``.
+
+        Returns:
+            TaskPage: Filas de la página y cursor de la siguiente.
+        """
+        statement = self._listing_rows_statement(include_deleted, estado, prioridad, categoria, only_deleted)
+        if cursor:
+            statement = statement.where(self._after_cursor(cursor))
+        rows = self._rows(statement.limit(page_size + 1))
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            return TaskPage(rows, encode_cursor(rows[-1]))
+        return TaskPage(rows, None)
+
+    def get_task_rows_by_ids(self, task_ids):
+        """
+        Obtener como ``TaskRow`` las tareas con los IDs indicados, estén o no eliminadas.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+
+        Returns:
+            list: Filas encontradas (las inexistentes se omiten).
+        """
+        task_ids = list(task_ids)
+        rows = []
+        for start in range(0, len(task_ids), MUTATION_CHUNK_SIZE):
+            chunk = task_ids[start:start + MUTATION_CHUNK_SIZE]
+            rows.extend(self._rows(select(*TASK_ROW_COLUMNS).where(Task.id.in_(chunk))))
+        return rows
+
+    # CONSULTAS COMPUESTAS
+
+    def query_tasks(self, query, with_reminders=False, today=None, days=UPCOMING_DAYS):
+        """
+        Obtener las tareas que cumplen una ``TaskQuery``, en su orden, con una sola consulta.
+
+        Args:
+            query (TaskQuery): Criterios y orden.
+            with_reminders (bool): Si es True, carga los recordatorios de antemano.
+            today (date): Fecha de referencia de ``query.vista`` (por defecto, hoy).
+            days (int): Días que abarca la vista 'proximas'.
+
+        Returns:
+            list: Tareas del ORM.
+        """
+        return self._task_query(with_reminders).filter(
+            *query.criteria(today, days)
+        ).order_by(*query.order_by()).all()
+
+    def query_task_rows(self, query, cursor=None, page_size=DEFAULT_PAGE_SIZE, today=None, days=UPCOMING_DAYS):
+        """
+        Obtener una página de las tareas que cumplen una ``TaskQuery`` como ``TaskRow``.
+
+        Criterios, orden y paginación se compilan en un único SELECT. Las
+        expresiones de orden se seleccionan junto a la fila para construir el
+        cursor, y la página siguiente continúa por clave a partir de ellas.
+
+        Args:
+            query (TaskQuery): Criterios y orden.
+            cursor (str): Cursor devuelto por la página anterior con la misma consulta, o None.
+            page_size (int): Número máximo de filas por página.
+            today (date): Fecha de referencia de ``query.vista`` (por defecto, hoy).
+            days (int): Días que abarca la vista 'proximas'.
+
+        Returns:
+            TaskPage: Filas de la página y cursor de la siguiente (None si no hay más).
+
+        Raises:
+            ValueError: Si el cursor no es válido para el orden de la consulta.
+        """
+        sort_columns = query.sort_columns()
+        statement = (
+            select(*TASK_ROW_COLUMNS, *sort_columns)
+            .where(*query.criteria(today, days))
+            .order_by(*query.order_by())
+        )
+        if cursor:
+            statement = statement.where(query.after(cursor))
+        result = self.session.execute(statement.limit(page_size + 1)).all()
+        width = len(TASK_ROW_COLUMNS)
+        rows = [TaskRow._make(row[:width]) for row in result[:page_size]]
+        if len(result) > page_size:
+            last = result[page_size - 1]
+            return TaskPage(rows, query.encode_cursor(last[width:], last.id))
+        return TaskPage(rows, None)
+
+    def search_task_rows(self, keyword):
+        """
+        Como ``search_tasks``, pero devolviendo ``TaskRow``.
+
+        Returns:
+            list: Filas que coincidan, por relevancia.
+        """
+        match_query = build_match_query(keyword)
+        if not match_query:
+            return []
+        return self._rows(
+            select(*TASK_ROW_COLUMNS)
+            .join(fts_table, fts_table.c.rowid == Task.id)
+            .where(match_clause(match_query), Task.eliminada.is_(False))
+            .order_by(fts_table.c.rank, Task.id)
+        )
+
+    def page_search_task_rows(self, keyword, cursor=None, page_size=DEFAULT_PAGE_SIZE, prefix_last=False):
+        """
+        Buscar tareas activas por palabra clave, página a página, como ``TaskRow``.
+
+        Si la búsqueda coincide con hasta ``SEARCH_RANK_LIMIT`` tareas, se
+        ordenan por relevancia (``rank``, id). Con más coincidencias (p. ej. la
+        primera letra tecleada) se listan por id descendente, que el índice FTS5
+        recorre sin puntuar cada fila. El orden se decide en la primera página
+        y viaja en el cursor.
+
+        Args:
+            keyword (str): Texto a buscar (cada palabra, como prefijo).
+            cursor (str): Cursor devuelto por la página anterior, o None.
+            page_size (int): Número máximo de filas por página.
+            prefix_last (bool): Si es True, solo la última palabra es un prefijo
+                (véase ``build_match_query``).
+
+        Returns:
+            TaskPage: Filas de la página y cursor de la siguiente (None si no hay más).
+
+        Raises:
+            ValueError: Si el cursor no es válido.
+        """
+        match_query = build_match_query(keyword, prefix_last)
+        if not match_query:
+            return TaskPage([], None)
+        if cursor:
+            after_rank, after_id = decode_search_cursor(cursor)
+            ranked = after_rank is not None
+        else:
+            ranked = self._count_matches(match_query, SEARCH_RANK_LIMIT + 1) <= SEARCH_RANK_LIMIT
+
+        statement = (
+            select(*TASK_ROW_COLUMNS, fts_table.c.rank if ranked else null())
+            .join(fts_table, fts_table.c.rowid == Task.id)
+            .where(match_clause(match_query), Task.eliminada.is_(False))
+        )
+        if ranked:
+            statement = statement.order_by(fts_table.c.rank, Task.id)
+            if cursor:
+                statement = statement.where(tuple_(fts_table.c.rank, Task.id) > tuple_(after_rank, after_id))
+        else:
+            statement = statement.order_by(fts_table.c.rowid.desc())
+            if cursor:
+                statement = statement.where(fts_table.c.rowid < after_id)
+
+        result = self.session.execute(statement.limit(page_size + 1)).all()
+        rows = [TaskRow._make(row[:-1]) for row in result[:page_size]]
+        if len(result) > page_size:
+            return TaskPage(rows, encode_search_cursor(result[page_size - 1][-1], rows[-1].id))
+        return TaskPage(rows, None)
+
+    def _count_matches(self, match_query, limit):
+        """Número de tareas (incluidas las de la papelera) que coinciden, contando como mucho ``limit``."""
+        matches = select(fts_table.c.rowid).where(match_clause(match_query)).limit(limit).subquery()
+        return self.session.execute(select(func.count()).select_from(matches)).scalar()
+
+    # REGISTRO DE CAMBIOS
+
+    def _last_tombstone_id(self):
+        return self.session.execute(select(func.max(TareaBorrada.id))).scalar() or 0
+
+    def current_change_token(self):
+        """
+        Token que apunta al estado actual, para recibir solo los cambios posteriores.
+
+        Returns:
+            str: Token para ``changes_since``.
+        """
+        version = self.session.execute(select(func.max(CambioTarea.id))).scalar() or 0
+        return encode_change_token(version, self._last_tombstone_id())
+
+    def changes_since(self, token=None, limit=DEFAULT_CHANGES_LIMIT):
+        """
+        Tareas creadas, modificadas y borradas desde ``token``.
+
+        Recorre ``tareas_cambios`` y ``tareas_borradas`` a partir de las
+        versiones del token, sin examinar el resto de la tabla. Ambas crecen
+        en el orden de confirmación, de modo que ninguna escritura confirmada
+        más tarde queda detrás de un token ya entregado. Una tarea se
+        considera creada si la versión con la que se creó es posterior a la
+        del token. Las tareas movidas a la papelera aparecen como modificadas
+        (con ``eliminada`` a True); ``deleted`` solo recoge los borrados
+        definitivos.
+
+        Args:
+            token (str): Token de una llamada anterior o de ``current_change_token``.
+                Si es None, se entregan todas las tareas como creadas y ningún borrado.
+            limit (int): Máximo de tareas y de borrados por llamada.
+
+        Returns:
+            ChangeSet: Filas creadas y modificadas (``TaskRow``), IDs borrados y token siguiente.
+
+        Raises:
+            ValueError: Si el token no es válido.
+        """
+        if token:
+            since, tombstone_id = decode_change_token(token)
+        else:
+            since, tombstone_id = 0, self._last_tombstone_id()
+
+        statement = (
+            select(*TASK_ROW_COLUMNS, CambioTarea.id.label('version'), CambioTarea.creacion)
+            .join(CambioTarea, CambioTarea.tarea_id == Task.id)
+            .where(CambioTarea.id > since)
+            .order_by(CambioTarea.id)
+            .limit(limit + 1)
+        )
+        rows = self.session.execute(statement).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        created, updated = [], []
+        width = len(TASK_ROW_FIELDS)
+        for row in rows:
+            is_new = not token or row.creacion > since
+            (created if is_new else updated).append(TaskRow._make(row[:width]))
+        if rows:
+            since = rows[-1].version
+
+        deleted = []
+        if token:
+            tombstones = self.session.execute(
+                select(TareaBorrada.id, TareaBorrada.tarea_id)
+                .where(TareaBorrada.id > tombstone_id)
+                .order_by(TareaBorrada.id)
+                .limit(limit + 1)
+            ).all()
+            has_more = has_more or len(tombstones) > limit
+            tombstones = tombstones[:limit]
+            deleted = [tarea_id for _, tarea_id in tombstones]
+            if tombstones:
+                tombstone_id = tombstones[-1].id
+        return ChangeSet(created, updated, deleted, encode_change_token(since, tombstone_id), has_more)
 
     def update_task(self, task_id, title=None, description=None, due_date=None, prioridad=None, categoria=None):
         """
@@ -78,7 +681,7 @@ class TaskController:
                 task.prioridad = NivelPrioridad[prioridad]
             if categoria:
                 task.categoria = Categoria[categoria]
-            self.session.commit()
+            self.commit()
 
 
     def delete_task(self, task_id):
@@ -91,7 +694,7 @@ class TaskController:
         task = self.session.query(Task).get(task_id)
         if task:
             task.eliminada = True
-            self.session.commit()
+            self.commit()
 
     def complete_task(self, task_id):
         """
@@ -103,7 +706,7 @@ class TaskController:
         task = self.session.query(Task).get(task_id)
         if task:
             task.completada = True
-            self.session.commit()
+            self.commit()
 
     def favorite_task(self, task_id, is_favorite=True):
         """
@@ -116,51 +719,312 @@ class TaskController:
         task = self.session.query(Task).get(task_id)
         if task:
             task.favorita = is_favorite
-            self.session.commit()
+            self.commit()
 
-    def filter_tasks(self, estado=None, prioridad=None, categoria=None):
+    def filter_tasks(self, estado=None, prioridad=None, categoria=None, with_reminders=False):
         """
-        Filtrar tareas por estado, prioridad y/o categoría (HU010).
+        Filtrar tareas activas por estado, prioridad y/o categoría (HU010).
+
+        Para combinar más criterios (favoritas, fechas, palabras clave) u
+        ordenar de otra forma, véase ``query_tasks``.
 
         Args:
             estado (str): 'completadas' o 'pendientes'.
-            prioridad (str): 'alta', 'media' o 'baja'.
-            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            prioridad (str | Iterable[str]): 'alta', 'media' o 'baja', o varias.
+            categoria (str | Iterable[str]): 'trabajo', 'hogar' o 'estudio', o varias.
+            with_reminders (bool): Si es True, carga los recordatorios de antemano.
 
         Returns:
-            list: Lista de tareas filtradas.
+            list: Tareas ordenadas por (fecha_vencimiento, id); vacía si algún
+            filtro no es válido.
         """
-        query = self.session.query(Task).filter(Task.eliminada.is_(False))
-
-        if estado == "completadas":
-            query = query.filter(Task.completada.is_(True))
-        elif estado == "pendientes":
-            query = query.filter(Task.completada.is_(False))
-
-        if prioridad:
-            query = query.filter(Task.prioridad == NivelPrioridad[prioridad])
-
-        if categoria:
-            query = query.filter(Task.categoria == Categoria[categoria])
-
-        return query.all()
+        try:
+            query = TaskQuery(estado=estado, prioridades=prioridad, categorias=categoria)
+        except ValueError:
+            return []
+        return self.query_tasks(query, with_reminders)
 
-    def search_tasks(self, keyword):
+    def search_tasks(self, keyword, with_reminders=False):
         """
         Buscar tareas por palabra clave en título o descripción (HU011).
 
+        Usa el índice FTS5 ``tareas_fts``: cada palabra se busca como prefijo,
+        sin distinguir mayúsculas ni tildes, y los resultados se ordenan por
+        relevancia (bm25).
+
         Args:
             keyword (str): Palabra clave a buscar.
+            with_reminders (bool): Si es True, carga los recordatorios de antemano.
 
         Returns:
             list: Lista de tareas que coincidan con la búsqueda.
         """
-        return self.session.query(Task).filter(
-            (Task.titulo.ilike(f"%{keyword}%") | Task.descripcion.ilike(f"%{keyword}%")),
+        match_query = build_match_query(keyword)
+        if not match_query:
+            return []
+        return self._task_query(with_reminders).join(
+            fts_table, fts_table.c.rowid == Task.id
+        ).filter(
+            match_clause(match_query),
             Task.eliminada.is_(False)
-        ).all()
+        ).order_by(fts_table.c.rank, Task.id).all()
+
     def restore_task(self, task_id):
         task = self.session.query(Task).get(task_id)
         if task and task.eliminada:
             task.eliminada = False
-            self.session.commit()
+            self.commit()
+
+    def add_reminder(self, task_id, fecha_hora):
+        """
+        Agregar un recordatorio a una tarea.
+
+        Args:
+            task_id (int): ID de la tarea.
+            fecha_hora (datetime): Fecha y hora del recordatorio.
+
+        Returns:
+            Recordatorio: El recordatorio creado, o None si la tarea no existe.
+        """
+        task = self.session.get(Task, task_id)
+        if task is None:
+            return None
+        reminder = Recordatorio(tarea=task, fecha_hora=fecha_hora)
+        self.session.add(reminder)
+        self.commit()
+        return reminder
+
+    def reminder_summaries(self, task_ids):
+        """
+        Resumen de recordatorios pendientes de varias tareas en una sola consulta.
+
+        Pensado para listados que solo muestran cuántos recordatorios quedan y
+        cuándo es el próximo: agrupa en SQL en lugar de cargar los objetos.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+
+        Returns:
+            dict: ``{task_id: ReminderSummary}``; las tareas sin recordatorios
+            pendientes reciben ``NO_REMINDERS``.
+        """
+        task_ids = list(task_ids)
+        summaries = dict.fromkeys(task_ids, NO_REMINDERS)
+        for start in range(0, len(task_ids), MUTATION_CHUNK_SIZE):
+            chunk = task_ids[start:start + MUTATION_CHUNK_SIZE]
+            rows = self.session.execute(
+                select(Recordatorio.tarea_id, func.count(), func.min(Recordatorio.fecha_hora))
+                .where(Recordatorio.tarea_id.in_(chunk), Recordatorio.notificado.isnot(True))
+                .group_by(Recordatorio.tarea_id)
+            )
+            for task_id, pending, next_at in rows:
+                summaries[task_id] = ReminderSummary(pending, next_at)
+        return summaries
+
+    def stats(self, today=None):
+        """
+        Contadores de tareas para el panel de resumen, en una sola consulta.
+
+        Agrupa por (eliminada, completada, prioridad, categoria), con sumas
+        condicionales para vencidas y favoritas, y combina los grupos (a lo
+        sumo unas decenas) en Python, sin cargar ninguna tarea.
+
+        Args:
+            today (date): Fecha de referencia para las vencidas (por defecto, hoy).
+
+        Returns:
+            TaskStats: Contadores de tareas activas y de la papelera.
+        """
+        today = today or date.today()
+        overdue = and_(Task.completada.is_(False), Task.fecha_vencimiento < today)
+        rows = self.session.execute(
+            select(
+                Task.eliminada, Task.completada, Task.prioridad, Task.categoria,
+                func.count(),
+                func.sum(case((overdue, 1), else_=0)),
+                func.sum(case((Task.favorita.is_(True), 1), else_=0)),
+            ).group_by(Task.eliminada, Task.completada, Task.prioridad, Task.categoria)
+        )
+
+        total = pending = completed = overdue_count = favorites = deleted = 0
+        by_priority = dict.fromkeys((nivel.name for nivel in NivelPrioridad), 0)
+        by_category = dict.fromkeys([grupo.name for grupo in Categoria] + [None], 0)
+        for eliminada, completada, prioridad, categoria, count, vencidas, favoritas in rows:
+            if eliminada:
+                deleted += count
+                continue
+            total += count
+            if completada:
+                completed += count
+            else:
+                pending += count
+            overdue_count += vencidas
+            favorites += favoritas
+            if prioridad is not None:
+                by_priority[prioridad.name] += count
+            by_category[categoria.name if categoria else None] += count
+        return TaskStats(total, pending, completed, overdue_count, favorites, deleted,
+                         by_priority, by_category)
+
+    # VISTAS POR FECHA
+
+    def page_date_view(self, vista, cursor=None, page_size=DEFAULT_PAGE_SIZE, today=None, days=UPCOMING_DAYS):
+        """
+        Obtener una página de una vista por fecha como ``TaskRow``.
+
+        Equivale a ``query_task_rows(TaskQuery(vista=vista))``: un recorrido de
+        rango del índice ``ix_tareas_eliminada_completada_vencimiento``, que
+        ya devuelve las filas en orden (fecha_vencimiento, id), así que ni se
+        ordena ni se leen tareas fuera del intervalo.
+
+        Args:
+            vista (str): 'vencidas', 'hoy', 'semana', 'proximas' o 'sin_fecha'.
+            cursor (str): Cursor devuelto por la página anterior, o None.
+            page_size (int): Número máximo de filas por página.
+            today (date): Fecha de referencia (por defecto, hoy).
+            days (int): Días que abarca ``proximas``.
+
+        Returns:
+            TaskPage: Filas de la página y cursor de la siguiente (None si no hay más).
+
+        Raises:
+            ValueError: Si la vista o el cursor no son válidos.
+        """
+        return self.query_task_rows(TaskQuery(vista=vista), cursor, page_size, today, days)
+
+    def date_view_counts(self, today=None, days=UPCOMING_DAYS):
+        """
+        Número de tareas de cada vista por fecha, en una sola consulta.
+
+        Agrupa por ``fecha_vencimiento`` las tareas activas y pendientes que
+        vencen hasta el final de la semana o de los próximos ``days`` días, y
+        las que no tienen fecha (``UNION ALL`` de dos recorridos de rango del
+        índice, sin leer la tabla). Los grupos, uno por día, se reparten entre
+        las vistas en Python.
+
+        Args:
+            today (date): Fecha de referencia (por defecto, hoy).
+            days (int): Días que abarca ``proximas``.
+
+        Returns:
+            DateViewCounts: Vencidas, hoy, esta semana, próximas y sin fecha.
+        """
+        today = today or date.today()
+        ranges = [date_view_range(vista, today, days) for vista in DATE_VIEWS]
+        horizon = max(until for since, until in filter(None, ranges))
+        pending = (Task.eliminada.is_(False), Task.completada.is_(False))
+        rows = self.session.execute(union_all(
+            select(Task.fecha_vencimiento, func.count())
+            .where(*pending, Task.fecha_vencimiento <= horizon)
+            .group_by(Task.fecha_vencimiento),
+            select(Task.fecha_vencimiento, func.count())
+            .where(*pending, Task.fecha_vencimiento.is_(None))
+            .group_by(Task.fecha_vencimiento),
+        )).all()
+        return DateViewCounts(*(
+            sum(count for due, count in rows if due_in_range(due, date_range)) for date_range in ranges
+        ))
+
+    # OPERACIONES EN LOTE
+
+    def _update_many(self, values, task_ids=None, where=None, only_if=None):
+        """
+        Aplica ``values`` a varias tareas con sentencias UPDATE por conjuntos.
+
+        Los IDs se procesan en bloques de ``MUTATION_CHUNK_SIZE`` (una sentencia
+        por bloque) y todo se confirma en una única transacción.
+
+        Args:
+            values (dict): Columnas y valores a asignar.
+            task_ids (Iterable[int]): IDs de las tareas a modificar.
+            where (ColumnElement): Condición SQLAlchemy sobre ``Tarea`` para
+                seleccionar las tareas en lugar de (o además de) los IDs.
+            only_if (ColumnElement): Condición que deben cumplir las filas para
+                cambiar; evita reescribir filas que ya tienen el valor.
+
+        Returns:
+            int: Número de tareas modificadas.
+
+        Raises:
+            ValueError: Si no se indica ni ``task_ids`` ni ``where``.
+        """
+        if task_ids is None and where is None:
+            raise ValueError("Indica task_ids o where para las operaciones en lote")
+
+        criteria = [c for c in (where, only_if) if c is not None]
+        statement = update(Task).values(**values)
+        affected = 0
+        try:
+            if task_ids is None:
+                affected = self.session.execute(statement.where(*criteria)).rowcount
+            else:
+                ids = list(dict.fromkeys(task_ids))
+                for start in range(0, len(ids), MUTATION_CHUNK_SIZE):
+                    chunk = ids[start:start + MUTATION_CHUNK_SIZE]
+                    result = self.session.execute(statement.where(Task.id.in_(chunk), *criteria))
+                    affected += result.rowcount
+            self.commit()
+        except Exception:
+            # Con confirmaciones diferidas, SQLite solo deshace la sentencia
+            # fallida; un rollback perdería también las modificaciones pendientes.
+            if not self.defer_commits:
+                self.session.rollback()
+            raise
+        return affected
+
+    def complete_tasks(self, task_ids=None, where=None):
+        """
+        Marcar varias tareas como completadas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            where (ColumnElement): Condición alternativa sobre ``Tarea``.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        return self._update_many({'completada': True}, task_ids, where,
+                                 only_if=Task.completada.isnot(True))
+
+    def delete_tasks(self, task_ids=None, where=None):
+        """
+        Marcar varias tareas como eliminadas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            where (ColumnElement): Condición alternativa sobre ``Tarea``.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        return self._update_many({'eliminada': True}, task_ids, where,
+                                 only_if=Task.eliminada.isnot(True))
+
+    def restore_tasks(self, task_ids=None, where=None):
+        """
+        Restaurar varias tareas eliminadas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            where (ColumnElement): Condición alternativa sobre ``Tarea``.
+
+        Returns:
+            int: Número de tareas restauradas.
+        """
+        return self._update_many({'eliminada': False}, task_ids, where,
+                                 only_if=Task.eliminada.is_(True))
+
+    def favorite_tasks(self, task_ids=None, is_favorite=True, where=None):
+        """
+        Marcar o desmarcar varias tareas como favoritas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            is_favorite (bool): True para marcar como favoritas.
+            where (ColumnElement): Condición alternativa sobre ``Tarea``.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        return self._update_many({'favorita': is_favorite}, task_ids, where,
+                                 only_if=Task.favorita.isnot(is_favorite))
@@ -0,0 +1,373 @@
+"""
+Especificación de consultas de tareas.
+
+``TaskQuery`` reúne en un objeto inmutable los criterios de un listado
+(estado, conjuntos de prioridades y categorías, favoritas, intervalo de
+vencimiento o vista por fecha, palabras clave y papelera) y su orden (campos
+con dirección). ``TaskController`` la compila en una única sentencia SELECT:
+los criterios van al WHERE (las palabras clave, como subconsulta sobre el
+índice FTS5), el orden al ORDER BY con ``id`` como desempate, y la
+paginación por clave compara con los valores de orden de la última fila,
+que viajan en el cursor.
+
+Es hashable, así que sirve directamente como clave de la caché de consultas,
+y ``matches`` reproduce los criterios en Python para decidir si una tarea
+modificada sigue perteneciendo a la vista.
+"""
+
+import base64
+import binascii
+import json
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import String, and_, case, false, or_, select, type_coerce
+
+from todo_app.models.fts import build_match_query, fts_table, match_clause
+from todo_app.models.models import Tarea as Task, NivelPrioridad, Categoria
+
+ESTADOS = ('pendientes', 'completadas')
+
+# Vistas por fecha de vencimiento (solo tareas pendientes).
+DATE_VIEWS = ('vencidas', 'hoy', 'semana', 'proximas', 'sin_fecha')
+UPCOMING_DAYS = 7
+
+# Prioridades de menor a mayor, para ordenar por importancia y no por nombre
+# (la columna guarda el nombre del enum).
+_PRIORITY_RANK = case(
+    {name: rank for rank, name in enumerate(('baja', 'media', 'alta'))},
+    value=type_coerce(Task.prioridad, String), else_=1
+)
+
+# Campo de orden -> (expresión SQL, admite NULL, conversión del valor del cursor).
+SORT_FIELDS = {
+    'fecha_vencimiento': (Task.fecha_vencimiento, True, date.fromisoformat),
+    'prioridad': (_PRIORITY_RANK, False, int),
+    'titulo': (Task.titulo.collate('NOCASE'), False, str),
+    'categoria': (Task.categoria, True, lambda name: Categoria[name]),
+    'creada_en': (Task.creada_en, True, datetime.fromisoformat),
+}
+DEFAULT_ORDER = ('fecha_vencimiento',)
+
+QUERY_FIELDS = [
+    'estado', 'prioridades', 'categorias', 'favorita', 'desde', 'hasta',
+    'vista', 'keyword', 'eliminada', 'orden'
+]
+
+
+def date_view_range(vista, today=None, days=UPCOMING_DAYS):
+    """
+    Intervalo de vencimiento de una vista por fecha.
+
+    - ``vencidas``: antes de hoy.
+    - ``hoy``: hoy.
+    - ``semana``: de hoy al domingo.
+    - ``proximas``: de mañana a dentro de ``days`` días.
+    - ``sin_fecha``: sin fecha de vencimiento.
+
+    Args:
+        vista (str): Una de ``DATE_VIEWS``.
+        today (date): Fecha de referencia (por defecto, hoy).
+        days (int): Días que abarca ``proximas``.
+
+    Returns:
+        tuple: (desde, hasta), ambos incluidos y None si no hay límite; None
+        para ``sin_fecha``.
+
+    Raises:
+        ValueError: Si la vista no existe.
+    """
+    today = today or date.today()
+    if vista == 'vencidas':
+        return None, today - timedelta(days=1)
+    if vista == 'hoy':
+        return today, today
+    if vista == 'semana':
+        return today, today + timedelta(days=6 - today.weekday())
+    if vista == 'proximas':
+        return today + timedelta(days=1), today + timedelta(days=days)
+    if vista == 'sin_fecha':
+        return None
+    raise ValueError(f"Vista por fecha no válida: {vista!r}")
+
+
+def due_in_range(due, date_range):
+    """
+    Indica si una fecha de vencimiento cae en un intervalo de ``date_view_range``.
+
+    Args:
+        due (date): Fecha de vencimiento, o None.
+        date_range (tuple): Intervalo (desde, hasta), o None para "sin fecha".
+
+    Returns:
+        bool: True si la fecha pertenece a la vista.
+    """
+    if date_range is None:
+        return due is None
+    since, until = date_range
+    return due is not None and (since is None or due >= since) and (until is None or due <= until)
+
+
+def _names(value, enum, label, allow_none=False):
+    """Normaliza un nombre o una colección de nombres de ``enum`` en un frozenset."""
+    if value is None or isinstance(value, (str, enum)):
+        value = () if value is None else (value,)
+    names = set()
+    for item in value:
+        if item is None and allow_none:
+            names.add(None)
+            continue
+        name = item.name if isinstance(item, enum) else item
+        if name not in enum.__members__:
+            raise ValueError(f"{label} no válida: {item!r}")
+        names.add(name)
+    return frozenset(names)
+
+
+def _order(value):
+    """Normaliza ``'-prioridad,fecha_vencimiento'`` o una secuencia equivalente."""
+    if isinstance(value, str):
+        value = [part.strip() for part in value.split(',') if part.strip()]
+    order = tuple(value) or DEFAULT_ORDER
+    fields = [key.lstrip('-') for key in order]
+    for field in fields:
+        if field not in SORT_FIELDS:
+            raise ValueError(f"Campo de orden no válido: {field!r} (valores: {', '.join(SORT_FIELDS)})")
+    if len(set(fields)) != len(fields):
+        raise ValueError(f"Campo de orden repetido: {', '.join(order)}")
+    return order
+
+
+def _cursor_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Categoria):
+        return value.name
+    return value
+
+
+class TaskQuery(namedtuple('TaskQuery', QUERY_FIELDS)):
+    """
+    Criterios y orden de un listado de tareas.
+
+    Atributos:
+        estado (str): 'pendientes', 'completadas' o None.
+        prioridades (frozenset): Nombres de ``NivelPrioridad`` admitidos (vacío: todas).
+        categorias (frozenset): Nombres de ``Categoria`` admitidos; None representa
+            las tareas sin categoría (vacío: todas).
+        favorita (bool): True o False para filtrar por favorita, None para no filtrar.
+        desde (date): Vencimiento mínimo, incluido (excluye las tareas sin fecha).
+        hasta (date): Vencimiento máximo, incluido (excluye las tareas sin fecha).
+        vista (str): Vista por fecha de ``DATE_VIEWS``: su intervalo, relativo
+            al día en que se ejecuta, y solo tareas pendientes.
+        keyword (str): Palabras a buscar en título y descripción (índice FTS5).
+        eliminada (bool): False para las activas, True para la papelera, None para ambas.
+        orden (tuple): Campos de ``SORT_FIELDS``; con un '-' delante, descendente.
+
+    Los conjuntos aceptan también un nombre suelto o un miembro del enum, y
+    ``orden`` una cadena separada por comas. Los valores desconocidos lanzan
+    ValueError. Como en las tuplas con nombre, ``_replace`` devuelve una copia
+    con campos cambiados (validada de nuevo).
+    """
+    __slots__ = ()
+
+    def __new__(cls, estado=None, prioridades=None, categorias=None, favorita=None, desde=None,
+                hasta=None, vista=None, keyword=None, eliminada=False, orden=DEFAULT_ORDER):
+        if estado is not None and estado not in ESTADOS:
+            raise ValueError(f"Estado no válido: {estado!r} (valores: {', '.join(ESTADOS)})")
+        if vista is not None and vista not in DATE_VIEWS:
+            raise ValueError(f"Vista por fecha no válida: {vista!r}")
+        return super().__new__(
+            cls, estado,
+            _names(prioridades, NivelPrioridad, "Prioridad"),
+            _names(categorias, Categoria, "Categoría", allow_none=True),
+            None if favorita is None else bool(favorita),
+            desde, hasta, vista,
+            (keyword or '').strip() or None,
+            None if eliminada is None else bool(eliminada),
+            _order(orden),
+        )
+
+    def _replace(self, **changes):
+        return type(self)(**{**self._asdict(), **changes})
+
+    def _sort_keys(self):
+        """(expresión, descendente, admite NULL, conversión) por campo de orden."""
+        keys = []
+        for key in self.orden:
+            expression, nullable, parse = SORT_FIELDS[key.lstrip('-')]
+            keys.append((expression, key.startswith('-'), nullable, parse))
+        return keys
+
+    # COMPILACIÓN A SQL
+
+    def criteria(self, today=None, days=UPCOMING_DAYS):
+        """
+        Condiciones del WHERE.
+
+        Args:
+            today (date): Fecha de referencia de ``vista`` (por defecto, hoy).
+            days (int): Días que abarca la vista 'proximas'.
+
+        Returns:
+            list: Expresiones de SQLAlchemy a combinar con AND.
+        """
+        criteria = []
+        if self.eliminada is not None:
+            criteria.append(Task.eliminada.is_(self.eliminada))
+        if self.estado == 'completadas':
+            criteria.append(Task.completada.is_(True))
+        elif self.estado == 'pendientes' or self.vista:
+            criteria.append(Task.completada.is_(False))
+        if self.prioridades:
+            niveles = [NivelPrioridad[name] for name in sorted(self.prioridades)]
+            criteria.append(Task.prioridad == niveles[0] if len(niveles) == 1 else Task.prioridad.in_(niveles))
+        if self.categorias:
+            grupos = [Categoria[name] for name in sorted(self.categorias - {None})]
+            condition = Task.categoria == grupos[0] if len(grupos) == 1 else Task.categoria.in_(grupos)
+            if None in self.categorias:
+                condition = or_(condition, Task.categoria.is_(None)) if grupos else Task.categoria.is_(None)
+            criteria.append(condition)
+        if self.favorita is not None:
+            criteria.append(Task.favorita.is_(self.favorita))
+        if self.desde is not None:
+            criteria.append(Task.fecha_vencimiento >= self.desde)
+        if self.hasta is not None:
+            criteria.append(Task.fecha_vencimiento <= self.hasta)
+        if self.vista:
+            date_range = date_view_range(self.vista, today, days)
+            if date_range is None:
+                criteria.append(Task.fecha_vencimiento.is_(None))
+            else:
+                since, until = date_range
+                if since is not None:
+                    criteria.append(Task.fecha_vencimiento >= since)
+                if until is not None:
+                    criteria.append(Task.fecha_vencimiento <= until)
+        match_query = build_match_query(self.keyword or '')
+        if match_query:
+            criteria.append(Task.id.in_(select(fts_table.c.rowid).where(match_clause(match_query))))
+        return criteria
+
+    def sort_columns(self):
+        """Expresiones de orden, que se seleccionan junto a la fila para construir el cursor."""
+        return [expression for expression, _, _, _ in self._sort_keys()]
+
+    def order_by(self):
+        """Cláusulas del ORDER BY, con ``id`` ascendente como desempate."""
+        clauses = [expression.desc() if descending else expression
+                   for expression, descending, _, _ in self._sort_keys()]
+        return clauses + [Task.id]
+
+    def after(self, cursor):
+        """
+        Condición de las filas posteriores al cursor en el orden de la consulta.
+
+        SQLite coloca los NULL primero en orden ascendente y al final en
+        descendente; la comparación lexicográfica campo a campo sigue esa
+        regla. Si el primer campo es ascendente se añade además su cota
+        inferior, para que la consulta salte a ella en el índice.
+
+        Args:
+            cursor (str): Cursor de ``encode_cursor``.
+
+        Returns:
+            ColumnElement: Condición para el WHERE.
+
+        Raises:
+            ValueError: Si el cursor no corresponde a este orden.
+        """
+        keys = self._sort_keys()
+        values, task_id = self.decode_cursor(cursor)
+        alternatives, equal = [], []
+        for (expression, descending, nullable, _), value in zip(keys, values):
+            if value is None:
+                after = false() if descending else expression.isnot(None)
+                same = expression.is_(None)
+            else:
+                after = expression < value if descending else expression > value
+                if descending and nullable:
+                    after = or_(after, expression.is_(None))
+                same = expression == value
+            alternatives.append(and_(*equal, after))
+            equal.append(same)
+        alternatives.append(and_(*equal, Task.id > task_id))
+        condition = or_(*alternatives)
+        expression, descending, _, _ = keys[0]
+        if not descending and values[0] is not None:
+            condition = and_(expression >= values[0], condition)
+        return condition
+
+    # CURSORES
+
+    def encode_cursor(self, values, task_id):
+        """
+        Genera el cursor de la última fila de una página.
+
+        Con el orden por defecto coincide con el de ``controllers.encode_cursor``.
+
+        Args:
+            values (Sequence): Valores de ``sort_columns`` de la fila.
+            task_id (int): ID de la fila.
+
+        Returns:
+            str: Cursor codificado en base64 (URL-safe).
+        """
+        raw = json.dumps([_cursor_value(value) for value in values] + [task_id], separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        """
+        Decodifica un cursor de ``encode_cursor``.
+
+        Returns:
+            tuple: (valores de orden, id).
+
+        Raises:
+            ValueError: Si el cursor no es válido o no corresponde a este orden.
+        """
+        try:
+            *raw_values, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            if len(raw_values) != len(self.orden):
+                raise ValueError
+            values = [None if value is None else parse(value)
+                      for value, (_, _, _, parse) in zip(raw_values, self._sort_keys())]
+            return values, int(task_id)
+        except (binascii.Error, KeyError, TypeError, ValueError, UnicodeError) as exc:
+            raise ValueError(f"Cursor inválido: {cursor!r}") from exc
+
+    # EVALUACIÓN EN PYTHON
+
+    def matches(self, task, today=None, days=UPCOMING_DAYS):
+        """
+        Indica si una tarea cumple los criterios, sin consultar la base de datos.
+
+        ``keyword`` no se comprueba: el tokenizador de FTS5 no tiene
+        equivalente en Python.
+
+        Args:
+            task (Tarea | TaskRow): Tarea a evaluar.
+            today (date): Fecha de referencia de ``vista`` (por defecto, hoy).
+            days (int): Días que abarca la vista 'proximas'.
+
+        Returns:
+            bool: True si la tarea pertenece al listado.
+        """
+        if self.eliminada is not None and bool(task.eliminada) != self.eliminada:
+            return False
+        if self.estado == 'completadas' and not task.completada:
+            return False
+        if (self.estado == 'pendientes' or self.vista) and task.completada:
+            return False
+        if self.prioridades and (task.prioridad is None or task.prioridad.name not in self.prioridades):
+            return False
+        if self.categorias and (task.categoria.name if task.categoria else None) not in self.categorias:
+            return False
+        if self.favorita is not None and bool(task.favorita) != self.favorita:
+            return False
+        due = task.fecha_vencimiento
+        if (self.desde or self.hasta) and not due_in_range(due, (self.desde, self.hasta)):
+            return False
+        if self.vista and not due_in_range(due, date_view_range(self.vista, today, days)):
+            return False
+        return True
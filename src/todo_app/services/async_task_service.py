@@ -0,0 +1,275 @@
+"""
+Servicio asíncrono para la gestión de tareas.
+
+Este módulo implementa la clase AsyncTaskService, con las mismas operaciones
+que TaskService pero como corrutinas sobre una ``AsyncSession`` de SQLAlchemy
+(``aiosqlite`` en SQLite), para usarlas desde un bucle de asyncio sin
+``run_in_executor``.
+
+Cada operación ejecuta la de un TaskService ligado a la sesión síncrona de la
+``AsyncSession`` mediante ``AsyncSession.run_sync``: la lógica de negocio es
+la misma en ambos servicios y solo cambia cómo se espera la E/S.
+
+La sesión se crea con ``expire_on_commit=False`` para que las tareas devueltas
+se puedan leer tras el ``commit`` sin volver a la base de datos. Las relaciones
+perezosas (``Tarea.recordatorios``) no pueden cargarse fuera de la sesión
+asíncrona; se piden con ``with_reminders=True``.
+
+Una ``AsyncSession`` no admite operaciones simultáneas: cada corrutina que
+trabaje en paralelo necesita su propio AsyncTaskService sobre el mismo motor.
+"""
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from todo_app.repositories.controllers import DEFAULT_CHANGES_LIMIT, DEFAULT_PAGE_SIZE, UPCOMING_DAYS
+from todo_app.services.task_service import TaskService
+
+
+class AsyncTaskService:
+    """Servicio asíncrono que encapsula las operaciones de negocio sobre tareas."""
+
+    def __init__(self, engine=None, session=None):
+        """
+        Inicializa el servicio con una sesión asíncrona.
+
+        Args:
+            engine (AsyncEngine): Motor con el que abrir una sesión propia
+                (ver ``create_async_db_engine``).
+            session (AsyncSession): Sesión a utilizar; tiene prioridad sobre ``engine``.
+        """
+        if session is None:
+            session = async_sessionmaker(engine, expire_on_commit=False)()
+        self.session = session
+        self._service = TaskService(session=session.sync_session)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Cierra la sesión asíncrona."""
+        await self.session.close()
+
+    async def _call(self, operation, *args, **kwargs):
+        method = getattr(self._service, operation)
+        return await self.session.run_sync(lambda sync_session: method(*args, **kwargs))
+
+    def add_change_listener(self, listener):
+        """
+        Registrar una función a la que se avisa tras cada modificación de tareas.
+
+        Args:
+            listener (callable): ``listener(task_ids)``, como en ``TaskService``.
+        """
+        self._service.add_change_listener(listener)
+
+    def remove_change_listener(self, listener):
+        """
+        Dejar de avisar a una función registrada con ``add_change_listener``.
+
+        Args:
+            listener (callable): Función registrada previamente.
+        """
+        self._service.remove_change_listener(listener)
+
+    def get_cache_stats(self):
+        """
+        Obtener las estadísticas de la caché de consultas (sin acceder a la base).
+
+        Returns:
+            CacheStats: Aciertos, fallos, entradas guardadas y generación.
+        """
+        return self._service.get_cache_stats()
+
+    async def create_task(self, title, description, due_date, prioridad='media', categoria=None):
+        """
+        Crear una nueva tarea.
+
+        Returns:
+            Tarea: La tarea creada.
+        """
+        return await self._call('create_task', title, description, due_date, prioridad, categoria)
+
+    async def get_tasks(self, include_deleted=False, with_reminders=False):
+        """
+        Obtener todas las tareas.
+
+        Returns:
+            list: Lista de tareas.
+        """
+        return await self._call('get_tasks', include_deleted, with_reminders)
+
+    async def get_tasks_by_ids(self, task_ids, with_reminders=False):
+        """
+        Obtener tareas por ID, incluidas las eliminadas.
+
+        Returns:
+            list: Tareas encontradas.
+        """
+        return await self._call('get_tasks_by_ids', list(task_ids), with_reminders)
+
+    async def get_tasks_page(self, cursor=None, page_size=DEFAULT_PAGE_SIZE, include_deleted=False,
+                             estado=None, prioridad=None, categoria=None, with_reminders=False,
+                             only_deleted=False):
+        """
+        Obtener una página de tareas ordenadas por (fecha_vencimiento, id).
+
+        Returns:
+            TaskPage: Tareas de la página y cursor de la siguiente (None si no hay más).
+        """
+        return await self._call('get_tasks_page', cursor, page_size, include_deleted,
+                                estado, prioridad, categoria, with_reminders, only_deleted)
+
+    async def update_task(self, task_id, title=None, description=None,
+                          due_date=None, prioridad=None, categoria=None):
+        """Actualizar título, descripción, fecha, prioridad o categoría de una tarea."""
+        await self._call('update_task', task_id, title, description, due_date, prioridad, categoria)
+
+    async def delete_task(self, task_id):
+        """Marcar una tarea como eliminada."""
+        await self._call('delete_task', task_id)
+
+    async def restore_task(self, task_id):
+        """Restaurar una tarea eliminada."""
+        await self._call('restore_task', task_id)
+
+    async def complete_task(self, task_id):
+        """Marcar una tarea como completada."""
+        await self._call('complete_task', task_id)
+
+    async def favorite_task(self, task_id, is_favorite=True):
+        """Marcar o desmarcar una tarea como favorita."""
+        await self._call('favorite_task', task_id, is_favorite)
+
+    async def complete_tasks(self, task_ids=None, where=None):
+        """
+        Marcar como completadas varias tareas en una sola transacción.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        return await self._call('complete_tasks', task_ids, where)
+
+    async def delete_tasks(self, task_ids=None, where=None):
+        """
+        Marcar como eliminadas varias tareas en una sola transacción.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        return await self._call('delete_tasks', task_ids, where)
+
+    async def restore_tasks(self, task_ids=None, where=None):
+        """
+        Restaurar varias tareas eliminadas en una sola transacción.
+
+        Returns:
+            int: Número de tareas restauradas.
+        """
+        return await self._call('restore_tasks', task_ids, where)
+
+    async def favorite_tasks(self, task_ids=None, is_favorite=True, where=None):
+        """
+        Marcar o desmarcar como favoritas varias tareas en una sola transacción.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        return await self._call('favorite_tasks', task_ids, is_favorite, where)
+
+    async def filter_tasks(self, estado=None, prioridad=None, categoria=None, with_reminders=False):
+        """
+        Filtrar tareas por estado, prioridad y/o categoría.
+
+        Returns:
+            list: Lista de tareas filtradas.
+        """
+        return await self._call('filter_tasks', estado, prioridad, categoria, with_reminders)
+
+    async def query_tasks(self, query, with_reminders=False, today=None):
+        """
+        Obtener las tareas que cumplen una ``TaskQuery``, en su orden.
+
+        Returns:
+            list: Tareas del ORM.
+        """
+        return await self._call('query_tasks', query, with_reminders, today)
+
+    async def search_tasks(self, keyword, with_reminders=False):
+        """
+        Buscar tareas por palabra clave en título o descripción.
+
+        Returns:
+            list: Lista de tareas que coincidan con la búsqueda.
+        """
+        return await self._call('search_tasks', keyword, with_reminders)
+
+    async def stats(self, today=None):
+        """
+        Obtener los contadores del panel de resumen con una única consulta agrupada.
+
+        Returns:
+            TaskStats: Contadores de tareas activas y de la papelera.
+        """
+        return await self._call('stats', today)
+
+    async def date_view_counts(self, today=None, days=UPCOMING_DAYS):
+        """
+        Obtener el número de tareas de cada vista por fecha con una única consulta agrupada.
+
+        Returns:
+            DateViewCounts: Vencidas, hoy, esta semana, próximas y sin fecha.
+        """
+        return await self._call('date_view_counts', today, days)
+
+    async def change_token(self):
+        """
+        Obtener un token del estado actual para ``changes_since``.
+
+        Returns:
+            str: Token opaco.
+        """
+        return await self._call('change_token')
+
+    async def changes_since(self, token=None, limit=DEFAULT_CHANGES_LIMIT):
+        """
+        Obtener las tareas creadas, modificadas y borradas desde ``token``.
+
+        Returns:
+            ChangeSet: Filas creadas y modificadas, IDs borrados, token siguiente
+            y si quedan más cambios.
+        """
+        return await self._call('changes_since', token, limit)
+
+    async def get_reminder_summaries(self, task_ids):
+        """
+        Obtener recordatorios pendientes y próximo aviso de varias tareas.
+
+        Returns:
+            dict: ``{task_id: ReminderSummary(pending, next_at)}``.
+        """
+        return await self._call('get_reminder_summaries', list(task_ids))
+
+    async def permanently_delete_task(self, task_id):
+        """Eliminar una tarea de la base de datos de forma permanente."""
+        await self._call('permanently_delete_task', task_id)
+
+    async def get_favorite_tasks(self):
+        """
+        Obtener las tareas activas marcadas como favoritas.
+
+        Returns:
+            list: Tareas favoritas que no están en la papelera.
+        """
+        return await self._call('get_favorite_tasks')
+
+    async def add_reminder(self, task_id, fecha_hora):
+        """
+        Agregar un recordatorio con fecha y hora a una tarea.
+
+        Returns:
+            Recordatorio: El recordatorio creado, o None si la tarea no existe.
+        """
+        return await self._call('add_reminder', task_id, fecha_hora)
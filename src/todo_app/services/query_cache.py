@@ -0,0 +1,106 @@
+"""
+Caché en memoria de resultados de consultas de tareas.
+
+``QueryCache`` guarda los resultados de ``filter_tasks``, ``search_tasks`` y
+``get_tasks_page`` de un ``TaskService`` en un diccionario LRU acotado,
+indexado por la operación y sus parámetros normalizados. Así, volver a una
+vista ya visitada no repite la consulta si nada cambió.
+
+La invalidación es por generación: cada entrada recuerda la generación en
+la que se guardó y cualquier modificación hecha a través del servicio la
+incrementa, de modo que todas las entradas anteriores dejan de valer.
+
+Es deliberadamente gruesa: no se sigue qué tablas o vistas toca cada
+cambio, y la caché entera se vacía con cada modificación, con cada
+confirmación o reversión de la sesión y con cada ``changes_since`` que trae
+cambios (la ventana lo consulta cada 5 s). Solo ahorra consultas entre dos
+cambios, que es el caso de navegar entre vistas sin editar.
+
+Los cambios hechos por otras conexiones (otro proceso, la API HTTP, el
+planificador de recordatorios) no se detectan hasta que
+``TaskService.changes_since`` los trae; por eso las consultas con
+``with_reminders`` no se guardan.
+
+Las operaciones sobre el diccionario se protegen con un cerrojo, de modo que
+una misma caché puede compartirse entre hilos (p. ej. la de respuestas de la
+API HTTP); la consulta de ``load()`` se ejecuta fuera del cerrojo.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+DEFAULT_MAX_ENTRIES = 64
+
+CacheStats = namedtuple('CacheStats', ['hits', 'misses', 'size', 'generation'])
+CacheStats.__doc__ = """Aciertos, fallos, entradas guardadas y generación actual de la caché."""
+
+_MISSING = object()
+
+
+class QueryCache:
+    """Caché LRU de resultados invalidada por un contador de generación."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, enabled=True):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            max_entries (int): Número máximo de resultados guardados.
+            enabled (bool): Si es False, ``get_or_load`` siempre consulta.
+        """
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Incrementa la generación: los resultados guardados dejan de valer."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def get_or_load(self, key, load):
+        """
+        Devuelve el resultado guardado para ``key`` o lo obtiene con ``load()``.
+
+        Args:
+            key (tuple): Operación y parámetros normalizados.
+            load (callable): Función que ejecuta la consulta.
+
+        Returns:
+            object: Resultado de la consulta.
+        """
+        if not self.enabled:
+            return load()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] == self.generation:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self.generation
+        result = load()
+        with self._lock:
+            if generation == self.generation:
+                self._entries[key] = (generation, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return result
+
+    def stats(self):
+        """
+        Estadísticas de uso.
+
+        Returns:
+            CacheStats: Aciertos, fallos, tamaño y generación.
+        """
+        return CacheStats(self.hits, self.misses, len(self._entries), self.generation)
+
+    def reset_stats(self):
+        """Pone a cero los contadores de aciertos y fallos."""
+        self.hits = self.misses = 0
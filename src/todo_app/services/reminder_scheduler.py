@@ -0,0 +1,295 @@
+"""
+Planificador de recordatorios.
+
+Este módulo implementa la clase ReminderScheduler, que mantiene en memoria
+un montículo (min-heap) con los recordatorios pendientes ordenados por
+``fecha_hora``. En lugar de consultar la tabla periódicamente, el
+planificador sabe cuánto falta para el siguiente aviso y duerme hasta
+entonces.
+
+Cuando las tareas cambian a través de ``TaskService`` solo se vuelven a leer
+los recordatorios de esas tareas. Los avisos vencidos se marcan como
+``notificado`` con una sentencia UPDATE por bloque, en una sola transacción.
+
+El planificador no depende de Qt: ``run`` lo ejecuta en un hilo propio, y
+``todo_app.reminder_timer.ReminderTimer`` lo conduce con un ``QTimer``.
+Si ``process`` falla (por ejemplo, "database is locked" mientras la
+confirmación diferida retiene la escritura), el estado en memoria se vuelve
+a leer en el siguiente intento, de modo que ningún aviso se pierde; ambos
+conductores lo registran en stderr y reintentan tras ``RETRY_DELAY``.
+"""
+
+import heapq
+import sys
+import threading
+from collections import namedtuple
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from todo_app.models.database import get_session
+from todo_app.models.models import Recordatorio, Tarea
+from todo_app.repositories.controllers import MUTATION_CHUNK_SIZE
+
+# Segundos de espera antes de reintentar tras un error de base de datos.
+RETRY_DELAY = 5.0
+
+DueReminder = namedtuple('DueReminder', ['id', 'tarea_id', 'fecha_hora', 'titulo'])
+DueReminder.__doc__ = """Recordatorio vencido entregado a ``on_due``."""
+
+
+class ReminderScheduler:
+    """Planificador de recordatorios basado en un min-heap por ``fecha_hora``."""
+
+    def __init__(self, session=None, engine=None, clock=datetime.now, on_due=None):
+        """
+        Inicializa el planificador (sin cargar aún los recordatorios).
+
+        Args:
+            session (Session): Sesión propia del planificador.
+            engine (Engine): Motor con el que abrir una sesión propia.
+                Si no se indica ninguno, se usa el motor global de la aplicación.
+            clock (callable): Función que devuelve la hora actual (``datetime``).
+            on_due (callable): ``on_due(list[DueReminder])`` al vencer recordatorios.
+        """
+        if session is None:
+            session = sessionmaker(bind=engine)() if engine is not None else get_session()
+        self.session = session
+        self.clock = clock
+        self.on_due = on_due
+        self.on_reschedule = None
+
+        self._heap = []
+        # id de recordatorio -> DueReminder vigente; las entradas del montículo
+        # que ya no coinciden se descartan al llegar a la cima.
+        self._active = {}
+        self._by_task = {}
+        self._dirty = set()
+        self._reload_all = True
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    # SINCRONIZACIÓN
+
+    def attach(self, service):
+        """
+        Suscribe el planificador a los cambios de un ``TaskService``.
+
+        Args:
+            service (TaskService): Servicio cuyas modificaciones se siguen.
+        """
+        service.add_change_listener(self.tasks_changed)
+
+    def tasks_changed(self, task_ids):
+        """
+        Marca tareas para volver a leer sus recordatorios.
+
+        Es seguro llamarlo desde otro hilo: el trabajo se hace en ``process``,
+        en el hilo que conduce el planificador.
+
+        Args:
+            task_ids (list): IDs de las tareas modificadas, o None para todas.
+        """
+        with self._lock:
+            if task_ids is None:
+                self._reload_all = True
+            else:
+                self._dirty.update(task_ids)
+        self._wakeup.set()
+        if self.on_reschedule is not None:
+            self.on_reschedule()
+
+    def _pending_query(self):
+        return select(
+            Recordatorio.id, Recordatorio.tarea_id, Recordatorio.fecha_hora, Tarea.titulo
+        ).join(Tarea, Recordatorio.tarea_id == Tarea.id).where(
+            Recordatorio.notificado.isnot(True),
+            Recordatorio.fecha_hora.isnot(None),
+            Tarea.eliminada.isnot(True),
+            Tarea.completada.isnot(True),
+        )
+
+    def _track(self, reminder):
+        self._active[reminder.id] = reminder
+        self._by_task.setdefault(reminder.tarea_id, set()).add(reminder.id)
+
+    def _load_all(self):
+        """Lee todos los recordatorios pendientes y reconstruye el montículo."""
+        self._active.clear()
+        self._by_task.clear()
+        rows = [DueReminder(*row) for row in self.session.execute(self._pending_query())]
+        for reminder in rows:
+            self._track(reminder)
+        self._heap = [(r.fecha_hora, r.id) for r in rows]
+        heapq.heapify(self._heap)
+        self.session.commit()
+
+    def _load_tasks(self, task_ids):
+        """Vuelve a leer los recordatorios pendientes de algunas tareas."""
+        for task_id in task_ids:
+            for reminder_id in self._by_task.pop(task_id, ()):
+                self._active.pop(reminder_id, None)
+        task_ids = list(task_ids)
+        for start in range(0, len(task_ids), MUTATION_CHUNK_SIZE):
+            chunk = task_ids[start:start + MUTATION_CHUNK_SIZE]
+            query = self._pending_query().where(Recordatorio.tarea_id.in_(chunk))
+            for row in self.session.execute(query):
+                reminder = DueReminder(*row)
+                self._track(reminder)
+                heapq.heappush(self._heap, (reminder.fecha_hora, reminder.id))
+        self.session.commit()
+        if len(self._heap) > 2 * len(self._active) + 64:
+            self._heap = [(r.fecha_hora, r.id) for r in self._active.values()]
+            heapq.heapify(self._heap)
+
+    def _apply_changes(self):
+        with self._lock:
+            reload_all, dirty = self._reload_all, self._dirty
+            self._reload_all, self._dirty = False, set()
+        try:
+            if reload_all:
+                self._load_all()
+            elif dirty:
+                self._load_tasks(dirty)
+        except SQLAlchemyError:
+            self._reload_after_error()
+            raise
+
+    def _reload_after_error(self):
+        """Descarta la transacción fallida y pide releer todo en el siguiente intento."""
+        self.session.rollback()
+        with self._lock:
+            self._reload_all = True
+
+    # CONSULTA Y DISPARO
+
+    def _peek(self):
+        """Devuelve el recordatorio vigente en la cima del montículo, o None."""
+        while self._heap:
+            fecha_hora, reminder_id = self._heap[0]
+            reminder = self._active.get(reminder_id)
+            if reminder is not None and reminder.fecha_hora == fecha_hora:
+                return reminder
+            heapq.heappop(self._heap)
+        return None
+
+    def pending_count(self):
+        """Número de recordatorios pendientes en memoria."""
+        return len(self._active)
+
+    def next_due(self):
+        """
+        Fecha y hora del próximo recordatorio pendiente.
+
+        Returns:
+            datetime: Momento del próximo aviso, o None si no hay pendientes.
+        """
+        self._apply_changes()
+        reminder = self._peek()
+        return reminder.fecha_hora if reminder else None
+
+    def seconds_until_next(self):
+        """
+        Segundos que faltan para el próximo recordatorio (0 si ya venció).
+
+        Returns:
+            float: Segundos de espera, o None si no hay pendientes.
+        """
+        due = self.next_due()
+        if due is None:
+            return None
+        return max(0.0, (due - self.clock()).total_seconds())
+
+    def process(self):
+        """
+        Aplica los cambios pendientes y dispara los recordatorios vencidos.
+
+        Los recordatorios disparados se marcan como ``notificado`` en una
+        única transacción y se entregan a ``on_due``. Si la base falla, la
+        excepción se propaga y el siguiente intento vuelve a leer todos los
+        recordatorios pendientes, incluidos los que no llegaron a marcarse.
+
+        Returns:
+            list: Recordatorios disparados (``DueReminder``).
+        """
+        try:
+            return self._process()
+        except SQLAlchemyError:
+            self._reload_after_error()
+            raise
+
+    def _process(self):
+        self._apply_changes()
+        now = self.clock()
+        fired = []
+        while True:
+            reminder = self._peek()
+            if reminder is None or reminder.fecha_hora > now:
+                break
+            heapq.heappop(self._heap)
+            del self._active[reminder.id]
+            self._by_task[reminder.tarea_id].discard(reminder.id)
+            fired.append(reminder)
+
+        if fired:
+            self._mark_notified([reminder.id for reminder in fired])
+            if self.on_due is not None:
+                self.on_due(fired)
+        return fired
+
+    def _mark_notified(self, reminder_ids):
+        try:
+            for start in range(0, len(reminder_ids), MUTATION_CHUNK_SIZE):
+                chunk = reminder_ids[start:start + MUTATION_CHUNK_SIZE]
+                self.session.execute(
+                    update(Recordatorio).where(Recordatorio.id.in_(chunk)).values(notificado=True),
+                    execution_options={'synchronize_session': False}
+                )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    # EJECUCIÓN SIN INTERFAZ
+
+    def run(self, stop_event):
+        """
+        Bucle de ejecución sin interfaz gráfica (para usar en un hilo).
+
+        Espera hasta el próximo recordatorio o hasta que ``tasks_changed``
+        lo despierte, y termina cuando se activa ``stop_event``.
+
+        Args:
+            stop_event (threading.Event): Señal de parada.
+        """
+        while not stop_event.is_set():
+            try:
+                self.process()
+                failed = False
+            except SQLAlchemyError as exc:
+                log_retry(exc)
+                failed = True
+            self._wakeup.clear()
+            if stop_event.is_set():
+                break
+            self._wakeup.wait(timeout=RETRY_DELAY if failed else self._wait_time())
+
+    def _wait_time(self):
+        try:
+            return self.seconds_until_next()
+        except SQLAlchemyError as exc:
+            log_retry(exc)
+            return RETRY_DELAY
+
+    def stop(self, stop_event):
+        """Activa ``stop_event`` y despierta el bucle de ``run``."""
+        stop_event.set()
+        self._wakeup.set()
+
+
+def log_retry(error):
+    """Registra en stderr un error de base de datos del planificador que se reintentará."""
+    print(f"Recordatorios: error de base de datos ({error}); se reintenta en {RETRY_DELAY:g} s",
+          file=sys.stderr, flush=True)
@@ -8,16 +8,165 @@ las operaciones sobre tareas.
 Historias de Usuario: HU005 - HU018
 """
 
-from todo_app.repositories.controllers import TaskController
+from datetime import date
+
+from sqlalchemy import event
+
+from todo_app.repositories import bulk
+from todo_app.repositories.controllers import (
+    DEFAULT_BATCH_SIZE, DEFAULT_CHANGES_LIMIT, DEFAULT_PAGE_SIZE, UPCOMING_DAYS, TaskController, TaskPage
+)
+from todo_app.repositories.task_query import TaskQuery
+from todo_app.models.fts import build_match_query
 from todo_app.models.models import Tarea
+from todo_app.services.query_cache import DEFAULT_MAX_ENTRIES, QueryCache
+from todo_app.services.write_behind import DEFAULT_DELAY, DEFAULT_MAX_PENDING, WriteBehind
+
+
+def _filter_key(value):
+    """Forma hashable de un filtro que admite un valor o varios (p. ej. ``prioridad``)."""
+    if value is None or isinstance(value, str):
+        return value or None
+    return frozenset(value)
 
 
 class TaskService:
     """Servicio que encapsula las operaciones de negocio sobre tareas."""
 
-    def __init__(self):
-        """Inicializa el servicio con una instancia del controlador."""
-        self.controller = TaskController()
+    def __init__(self, session=None, engine=None, query_cache=True, cache_size=DEFAULT_MAX_ENTRIES):
+        """
+        Inicializa el servicio con una instancia del controlador.
+
+        Args:
+            session (Session): Sesión a utilizar por el controlador.
+            engine (Engine): Motor con el que abrir una sesión propia.
+                Si no se indica ninguno, se usa el motor global de la aplicación.
+            query_cache (bool): Si es False, no se guardan resultados de consultas.
+            cache_size (int): Número máximo de resultados guardados.
+        """
+        self.controller = TaskController(session=session, engine=engine)
+        self._change_listeners = []
+        self.write_behind = None
+        self.query_cache = QueryCache(cache_size, enabled=query_cache)
+        # Confirmar o deshacer caduca los objetos de la sesión; los guardados
+        # en caché no deben seguir usándose después.
+        event.listen(self.controller.session, 'after_commit', self._session_ended)
+        event.listen(self.controller.session, 'after_rollback', self._session_ended)
+
+    def _session_ended(self, session):
+        self.query_cache.invalidate()
+
+    def add_change_listener(self, listener):
+        """
+        Registrar una función a la que se avisa tras cada modificación de tareas.
+
+        La función recibe la lista de IDs modificados, o None cuando no se
+        conocen (por ejemplo, en operaciones en lote por condición o en
+        importaciones), lo que equivale a "pueden haber cambiado todas".
+
+        Args:
+            listener (callable): ``listener(task_ids)``.
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        """
+        Dejar de avisar a una función registrada con ``add_change_listener``.
+
+        Args:
+            listener (callable): Función registrada previamente.
+        """
+        self._change_listeners.remove(listener)
+
+    def _tasks_changed(self, task_ids):
+        """Avisa a los oyentes de que las tareas indicadas (o todas, si es None) cambiaron."""
+        if task_ids is not None:
+            task_ids = list(task_ids)
+        self.query_cache.invalidate()
+        if self.write_behind is not None:
+            self.write_behind.record(task_ids)
+        self._notify(task_ids)
+        if self.write_behind is not None and self.write_behind.full():
+            self.flush_writes()
+
+    def _notify(self, task_ids):
+        for listener in list(self._change_listeners):
+            listener(task_ids)
+
+    # CONFIRMACIÓN DIFERIDA
+
+    def enable_write_behind(self, delay=DEFAULT_DELAY, max_pending=DEFAULT_MAX_PENDING):
+        """
+        Diferir las confirmaciones para agrupar modificaciones seguidas.
+
+        Las modificaciones se aplican a la sesión en el acto y se confirman en
+        una sola transacción con ``flush_writes``; quien use el servicio debe
+        llamar a ``flush_due_writes`` cuando venza ``seconds_until_flush()`` y a
+        ``flush_writes`` antes de cerrar la sesión. Al alcanzar ``max_pending``
+        se confirma sin esperar.
+
+        Los oyentes reciben cada modificación al aplicarse y de nuevo al
+        confirmarse, para quienes leen la base por otra conexión.
+
+        Args:
+            delay (float): Ventana de espera (y de durabilidad) en segundos.
+            max_pending (int): Modificaciones pendientes que fuerzan la confirmación.
+        """
+        if self.write_behind is None:
+            self.write_behind = WriteBehind(self.controller.session, delay, max_pending)
+        else:
+            self.write_behind.delay, self.write_behind.max_pending = delay, max_pending
+        self.controller.defer_commits = True
+
+    def disable_write_behind(self):
+        """Confirmar lo pendiente y volver a confirmar cada modificación al aplicarla."""
+        if self.write_behind is not None:
+            self.flush_writes()
+        self.write_behind = None
+        self.controller.defer_commits = False
+
+    def pending_writes(self):
+        """
+        Número de modificaciones aplicadas pero aún sin confirmar.
+
+        Returns:
+            int: Modificaciones pendientes (0 si no se difieren las confirmaciones).
+        """
+        return 0 if self.write_behind is None else self.write_behind.pending
+
+    def seconds_until_flush(self):
+        """
+        Segundos hasta que venza la ventana de espera de las modificaciones pendientes.
+
+        Returns:
+            float: Segundos, o None si no hay nada pendiente.
+        """
+        return None if self.write_behind is None else self.write_behind.seconds_until_flush()
+
+    def flush_writes(self):
+        """
+        Confirmar ya las modificaciones pendientes.
+
+        Returns:
+            int: Número de modificaciones confirmadas.
+        """
+        if self.write_behind is None:
+            return 0
+        flushed, task_ids = self.write_behind.flush()
+        if flushed:
+            self._notify(task_ids)
+        return flushed
+
+    def flush_due_writes(self):
+        """
+        Confirmar las modificaciones pendientes si venció su ventana de espera.
+
+        Returns:
+            int: Número de modificaciones confirmadas.
+        """
+        if self.write_behind is None or not self.write_behind.due():
+            return 0
+        return self.flush_writes()
 
     def create_task(self, title, description, due_date, prioridad='media', categoria=None):
         """
@@ -29,20 +178,189 @@ class TaskService:
             due_date (date): Fecha de vencimiento.
             prioridad (str): Nivel de prioridad ('baja', 'media', 'alta').
             categoria (str): Categoría ('trabajo', 'hogar', 'estudio').
+
+        Returns:
+            Tarea: La tarea creada.
         """
-        self.controller.add_task(title, description, due_date, prioridad, categoria)
+        task = self.controller.add_task(title, description, due_date, prioridad, categoria)
+        self._tasks_changed([task.id])
+        return task
 
-    def get_tasks(self, include_deleted=False):
+    def get_tasks(self, include_deleted=False, with_reminders=False):
         """
         Obtener todas las tareas (HU010).
 
         Args:
             include_deleted (bool): Si True, incluye tareas eliminadas.
+            with_reminders (bool): Si True, carga los recordatorios de antemano.
 
         Returns:
             list: Lista de tareas.
         """
-        return self.controller.get_tasks(include_deleted)
+        return self.controller.get_tasks(include_deleted, with_reminders)
+
+    def get_tasks_by_ids(self, task_ids, with_reminders=False):
+        """
+        Obtener tareas por ID, incluidas las eliminadas.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            with_reminders (bool): Si True, carga los recordatorios de antemano.
+
+        Returns:
+            list: Tareas encontradas.
+        """
+        return self.controller.get_tasks_by_ids(task_ids, with_reminders)
+
+    def get_tasks_page(self, cursor=None, page_size=DEFAULT_PAGE_SIZE, include_deleted=False,
+                       estado=None, prioridad=None, categoria=None, with_reminders=False,
+                       only_deleted=False):
+        """
+        Obtener una página de tareas ordenadas por (fecha_vencimiento, id).
+
+        Args:
+            cursor (str): Cursor opaco de la página anterior, o None para la primera.
+            page_size (int): Número máximo de tareas por página.
+            include_deleted (bool): Si True, incluye tareas eliminadas.
+            estado (str): 'completadas' o 'pendientes'.
+            prioridad (str): 'alta', 'media' o 'baja'.
+            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            with_reminders (bool): Si True, carga los recordatorios de antemano.
+            only_deleted (bool): Si True, solo las tareas de la papelera.
+
+        Returns:
+            TaskPage: Tareas de la página y cursor de la siguiente (None si no hay más).
+        """
+        if with_reminders:
+            return self.controller.page_tasks(cursor, page_size, include_deleted,
+                                              estado, prioridad, categoria, with_reminders,
+                                              only_deleted)
+        key = ('page', cursor or None, page_size, bool(include_deleted),
+               estado or None, _filter_key(prioridad), _filter_key(categoria), bool(only_deleted))
+        page = self.query_cache.get_or_load(key, lambda: self.controller.page_tasks(
+            cursor, page_size, include_deleted, estado, prioridad, categoria,
+            only_deleted=only_deleted))
+        return TaskPage(list(page.tasks), page.next_cursor)
+
+    def iter_tasks(self, include_deleted=False, estado=None, prioridad=None, categoria=None,
+                   batch_size=DEFAULT_BATCH_SIZE, with_reminders=False):
+        """
+        Recorrer tareas en lotes con memoria constante.
+
+        Args:
+            include_deleted (bool): Si True, incluye tareas eliminadas.
+            estado (str): 'completadas' o 'pendientes'.
+            prioridad (str): 'alta', 'media' o 'baja'.
+            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            batch_size (int): Filas leídas por lote.
+            with_reminders (bool): Si True, carga los recordatorios de cada lote.
+
+        Returns:
+            Iterator[Tarea]: Generador de tareas.
+        """
+        return self.controller.iter_tasks(include_deleted, estado, prioridad, categoria,
+                                          batch_size, with_reminders)
+
+    # MODELO DE LECTURA
+
+    def get_task_rows(self, include_deleted=False, estado=None, prioridad=None, categoria=None,
+                      only_deleted=False):
+        """
+        Obtener un listado como filas ``TaskRow`` de solo lectura, sin entidades del ORM.
+
+        Args:
+            include_deleted (bool): Si True, incluye tareas eliminadas.
+            estado (str): 'completadas' o 'pendientes'.
+            prioridad (str): 'alta', 'media' o 'baja'.
+            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            only_deleted (bool): Si True, solo las tareas de la papelera.
+
+        Returns:
+            list: Filas ordenadas por (fecha_vencimiento, id).
+        """
+        key = ('rows', bool(include_deleted), estado or None, _filter_key(prioridad), _filter_key(categoria),
+               bool(only_deleted))
+        return list(self.query_cache.get_or_load(key, lambda: self.controller.get_task_rows(
+            include_deleted, estado, prioridad, categoria, only_deleted)))
+
+    def get_task_rows_page(self, cursor=None, page_size=DEFAULT_PAGE_SIZE, include_deleted=False,
+                           estado=None, prioridad=None, categoria=None, only_deleted=False):
+        """
+        Obtener una página de filas ``TaskRow`` ordenadas por (fecha_vencimiento, id).
+
+        Returns:
+            TaskPage: Filas de la página y cursor de la siguiente (None si no hay más).
+        """
+        key = ('rows_page', cursor or None, page_size, bool(include_deleted),
+               estado or None, _filter_key(prioridad), _filter_key(categoria), bool(only_deleted))
+        page = self.query_cache.get_or_load(key, lambda: self.controller.page_task_rows(
+            cursor, page_size, include_deleted, estado, prioridad, categoria, only_deleted))
+        return TaskPage(list(page.tasks), page.next_cursor)
+
+    def get_task_rows_by_ids(self, task_ids):
+        """
+        Obtener como filas ``TaskRow`` las tareas indicadas, incluidas las eliminadas.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+
+        Returns:
+            list: Filas encontradas.
+        """
+        return self.controller.get_task_rows_by_ids(task_ids)
+
+    def search_task_rows(self, keyword):
+        """
+        Buscar tareas por palabra clave y devolverlas como filas ``TaskRow``.
+
+        Args:
+            keyword (str): Palabra clave a buscar.
+
+        Returns:
+            list: Filas que coincidan, por relevancia.
+        """
+        key = ('search_rows', build_match_query(keyword).lower())
+        return list(self.query_cache.get_or_load(key, lambda: self.controller.search_task_rows(keyword)))
+
+    def search_task_rows_page(self, keyword, cursor=None, page_size=DEFAULT_PAGE_SIZE, prefix_last=False):
+        """
+        Obtener una página de resultados de búsqueda como filas ``TaskRow``.
+
+        Args:
+            keyword (str): Texto a buscar.
+            cursor (str): Cursor de la página anterior, o None.
+            page_size (int): Número máximo de filas.
+            prefix_last (bool): Si es True, solo la última palabra es un prefijo.
+
+        Returns:
+            TaskPage: Filas por relevancia (o de la más reciente a la más antigua
+            si hay demasiadas coincidencias) y cursor de la siguiente página.
+        """
+        key = ('search_rows_page', build_match_query(keyword, prefix_last).lower(), cursor or None, page_size)
+        page = self.query_cache.get_or_load(key, lambda: self.controller.page_search_task_rows(
+            keyword, cursor, page_size, prefix_last))
+        return TaskPage(list(page.tasks), page.next_cursor)
+
+    def get_date_view_page(self, vista, cursor=None, page_size=DEFAULT_PAGE_SIZE, today=None, days=UPCOMING_DAYS):
+        """
+        Obtener una página de una vista por fecha como filas ``TaskRow``.
+
+        Args:
+            vista (str): 'vencidas', 'hoy', 'semana', 'proximas' o 'sin_fecha'.
+            cursor (str): Cursor de la página anterior, o None.
+            page_size (int): Número máximo de filas.
+            today (date): Fecha de referencia (por defecto, hoy).
+            days (int): Días que abarca 'proximas'.
+
+        Returns:
+            TaskPage: Tareas activas y pendientes de la vista, ordenadas por
+            (fecha_vencimiento, id), y cursor de la siguiente página.
+        """
+        today = today or date.today()
+        key = ('date_view_page', vista, cursor or None, page_size, today, days)
+        page = self.query_cache.get_or_load(key, lambda: self.controller.page_date_view(
+            vista, cursor, page_size, today, days))
+        return TaskPage(list(page.tasks), page.next_cursor)
 
     def update_task(self, task_id, title=None, description=None,
                     due_date=None, prioridad=None, categoria=None):
@@ -58,6 +376,7 @@ class TaskService:
             categoria (str): Nueva categoría ('trabajo', 'hogar', 'estudio').
         """
         self.controller.update_task(task_id, title, description, due_date, prioridad, categoria)
+        self._tasks_changed([task_id])
 
     def delete_task(self, task_id):
         """
@@ -67,6 +386,7 @@ class TaskService:
             task_id (int): ID de la tarea.
         """
         self.controller.delete_task(task_id)
+        self._tasks_changed([task_id])
 
     def restore_task(self, task_id):
         """
@@ -76,6 +396,7 @@ class TaskService:
             task_id (int): ID de la tarea.
         """
         self.controller.restore_task(task_id)
+        self._tasks_changed([task_id])
 
     def complete_task(self, task_id):
         """
@@ -85,6 +406,7 @@ class TaskService:
             task_id (int): ID de la tarea.
         """
         self.controller.complete_task(task_id)
+        self._tasks_changed([task_id])
 
     def favorite_task(self, task_id, is_favorite=True):
         """
@@ -95,32 +417,236 @@ class TaskService:
             is_favorite (bool): True para marcar como favorita.
         """
         self.controller.favorite_task(task_id, is_favorite)
+        self._tasks_changed([task_id])
+
+    def complete_tasks(self, task_ids=None, where=None):
+        """
+        Marcar varias tareas como completadas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            where (ColumnElement): Condición SQLAlchemy sobre ``Tarea`` en lugar de IDs.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        if task_ids is not None:
+            task_ids = list(task_ids)
+        affected = self.controller.complete_tasks(task_ids, where)
+        self._tasks_changed(task_ids if where is None else None)
+        return affected
 
-    def filter_tasks(self, estado=None, prioridad=None, categoria=None):
+    def delete_tasks(self, task_ids=None, where=None):
         """
-        Filtrar tareas por estado, prioridad y/o categoría (HU010).
+        Marcar varias tareas como eliminadas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            where (ColumnElement): Condición SQLAlchemy sobre ``Tarea`` en lugar de IDs.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        if task_ids is not None:
+            task_ids = list(task_ids)
+        affected = self.controller.delete_tasks(task_ids, where)
+        self._tasks_changed(task_ids if where is None else None)
+        return affected
+
+    def restore_tasks(self, task_ids=None, where=None):
+        """
+        Restaurar varias tareas eliminadas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            where (ColumnElement): Condición SQLAlchemy sobre ``Tarea`` en lugar de IDs.
+
+        Returns:
+            int: Número de tareas restauradas.
+        """
+        if task_ids is not None:
+            task_ids = list(task_ids)
+        affected = self.controller.restore_tasks(task_ids, where)
+        self._tasks_changed(task_ids if where is None else None)
+        return affected
+
+    def favorite_tasks(self, task_ids=None, is_favorite=True, where=None):
+        """
+        Marcar o desmarcar varias tareas como favoritas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            is_favorite (bool): True para marcar como favoritas.
+            where (ColumnElement): Condición SQLAlchemy sobre ``Tarea`` en lugar de IDs.
+
+        Returns:
+            int: Número de tareas que cambiaron.
+        """
+        if task_ids is not None:
+            task_ids = list(task_ids)
+        affected = self.controller.favorite_tasks(task_ids, is_favorite, where)
+        self._tasks_changed(task_ids if where is None else None)
+        return affected
+
+    def filter_tasks(self, estado=None, prioridad=None, categoria=None, with_reminders=False):
+        """
+        Filtrar tareas activas por estado, prioridad y/o categoría (HU010).
 
         Args:
             estado (str): 'completadas' o 'pendientes'.
-            prioridad (str): 'alta', 'media' o 'baja'.
-            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            prioridad (str | Iterable[str]): 'alta', 'media' o 'baja', o varias.
+            categoria (str | Iterable[str]): 'trabajo', 'hogar' o 'estudio', o varias.
+            with_reminders (bool): Si True, carga los recordatorios de antemano.
 
         Returns:
-            list: Lista de tareas filtradas.
+            list: Lista de tareas filtradas; vacía si algún filtro no es válido.
+        """
+        try:
+            query = TaskQuery(estado=estado, prioridades=prioridad, categorias=categoria)
+        except ValueError:
+            return []
+        return self._query_tasks(query, with_reminders)
+
+    def query_tasks(self, query, with_reminders=False, today=None):
         """
-        return self.controller.filter_tasks(estado, prioridad, categoria)
+        Obtener las tareas que cumplen una ``TaskQuery``, en su orden.
 
-    def search_tasks(self, keyword):
+        Args:
+            query (TaskQuery): Criterios y orden.
+            with_reminders (bool): Si True, carga los recordatorios de antemano.
+            today (date): Fecha de referencia de ``query.vista`` (por defecto, hoy).
+
+        Returns:
+            list: Tareas del ORM.
+        """
+        return self._query_tasks(query, with_reminders, today)
+
+    def _query_tasks(self, query, with_reminders=False, today=None):
+        if with_reminders:
+            return self.controller.query_tasks(query, with_reminders, today)
+        # La consulta es hashable; las vistas por fecha dependen además del día.
+        today = (today or date.today()) if query.vista else None
+        return list(self.query_cache.get_or_load(
+            ('query', query, today), lambda: self.controller.query_tasks(query, today=today)))
+
+    def query_task_rows_page(self, query, cursor=None, page_size=DEFAULT_PAGE_SIZE, today=None):
+        """
+        Obtener una página de las tareas que cumplen una ``TaskQuery`` como filas ``TaskRow``.
+
+        Args:
+            query (TaskQuery): Criterios y orden.
+            cursor (str): Cursor de la página anterior con la misma consulta, o None.
+            page_size (int): Número máximo de filas.
+            today (date): Fecha de referencia de ``query.vista`` (por defecto, hoy).
+
+        Returns:
+            TaskPage: Filas de la página y cursor de la siguiente.
+        """
+        today = (today or date.today()) if query.vista else None
+        key = ('query_rows_page', query, today, cursor or None, page_size)
+        page = self.query_cache.get_or_load(key, lambda: self.controller.query_task_rows(
+            query, cursor, page_size, today))
+        return TaskPage(list(page.tasks), page.next_cursor)
+
+    def search_tasks(self, keyword, with_reminders=False):
         """
         Buscar tareas por palabra clave en título o descripción (HU011).
 
         Args:
             keyword (str): Palabra clave a buscar.
+            with_reminders (bool): Si True, carga los recordatorios de antemano.
 
         Returns:
             list: Lista de tareas que coincidan con la búsqueda.
         """
-        return self.controller.search_tasks(keyword)
+        if with_reminders:
+            return self.controller.search_tasks(keyword, with_reminders)
+        # Textos que generan la misma expresión MATCH comparten entrada.
+        key = ('search', build_match_query(keyword).lower())
+        return list(self.query_cache.get_or_load(key, lambda: self.controller.search_tasks(keyword)))
+
+    def stats(self, today=None):
+        """
+        Obtener los contadores del panel de resumen con una única consulta agrupada.
+
+        Args:
+            today (date): Fecha de referencia para las vencidas (por defecto, hoy).
+
+        Returns:
+            TaskStats: Total, pendientes, completadas, vencidas, favoritas,
+            en la papelera y recuentos por prioridad y por categoría.
+        """
+        today = today or date.today()
+        return self.query_cache.get_or_load(('stats', today), lambda: self.controller.stats(today))
+
+    def date_view_counts(self, today=None, days=UPCOMING_DAYS):
+        """
+        Obtener el número de tareas de cada vista por fecha con una única consulta agrupada.
+
+        Args:
+            today (date): Fecha de referencia (por defecto, hoy).
+            days (int): Días que abarca 'proximas'.
+
+        Returns:
+            DateViewCounts: Vencidas, hoy, esta semana, próximas y sin fecha.
+        """
+        today = today or date.today()
+        return self.query_cache.get_or_load(
+            ('date_view_counts', today, days), lambda: self.controller.date_view_counts(today, days))
+
+    def change_token(self):
+        """
+        Obtener un token del estado actual para ``changes_since``.
+
+        Returns:
+            str: Token opaco.
+        """
+        return self.controller.current_change_token()
+
+    def changes_since(self, token=None, limit=DEFAULT_CHANGES_LIMIT):
+        """
+        Obtener las tareas creadas, modificadas y borradas desde ``token``.
+
+        Si hay cambios se invalida la caché de consultas, porque pueden venir
+        de otras conexiones que la caché no detecta.
+
+        Args:
+            token (str): Token de una llamada anterior o de ``change_token``;
+                None para recibir todas las tareas como creadas.
+            limit (int): Máximo de tareas y de borrados por llamada.
+
+        Returns:
+            ChangeSet: Filas creadas y modificadas, IDs borrados, token siguiente
+            y si quedan más cambios.
+
+        Raises:
+            ValueError: Si el token no es válido.
+        """
+        changes = self.controller.changes_since(token, limit)
+        if changes.created or changes.updated or changes.deleted:
+            self.query_cache.invalidate()
+        return changes
+
+    def get_cache_stats(self):
+        """
+        Obtener las estadísticas de la caché de consultas.
+
+        Returns:
+            CacheStats: Aciertos, fallos, entradas guardadas y generación.
+        """
+        return self.query_cache.stats()
+
+    def get_reminder_summaries(self, task_ids):
+        """
+        Obtener recordatorios pendientes y próximo aviso de varias tareas.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+
+        Returns:
+            dict: ``{task_id: ReminderSummary(pending, next_at)}``.
+        """
+        return self.controller.reminder_summaries(task_ids)
 
     def permanently_delete_task(self, task_id):
         """
@@ -130,13 +656,63 @@ class TaskService:
             task_id (int): ID de la tarea a eliminar.
         """
         self.controller.session.query(Tarea).filter_by(id=task_id).delete()
-        self.controller.session.commit()
+        self.controller.commit()
+        self._tasks_changed([task_id])
 
     def get_favorite_tasks(self):
         """
-        Obtener tareas marcadas como favoritas.
+        Obtener las tareas activas marcadas como favoritas.
+
+        Returns:
+            list: Tareas favoritas que no están en la papelera, por (fecha_vencimiento, id).
+        """
+        return self._query_tasks(TaskQuery(favorita=True))
+
+    def add_reminder(self, task_id, fecha_hora):
+        """
+        Agregar un recordatorio con fecha y hora a una tarea.
+
+        Args:
+            task_id (int): ID de la tarea.
+            fecha_hora (datetime): Momento en que debe avisarse.
+
+        Returns:
+            Recordatorio: El recordatorio creado, o None si la tarea no existe.
+        """
+        reminder = self.controller.add_reminder(task_id, fecha_hora)
+        if reminder is not None:
+            self._tasks_changed([task_id])
+        return reminder
+
+    def import_tasks(self, stream, fmt, batch_size=bulk.DEFAULT_IMPORT_BATCH_SIZE):
+        """
+        Importar tareas desde un archivo CSV o JSON Lines por lotes.
+
+        Args:
+            stream (TextIO): Archivo de entrada abierto en modo texto.
+            fmt (str): 'csv' o 'jsonl'.
+            batch_size (int): Número de tareas por transacción.
+
+        Returns:
+            int: Número de tareas importadas.
+        """
+        records = bulk.read_records(stream, fmt)
+        try:
+            return bulk.import_tasks(self.controller.session, records, batch_size)
+        finally:
+            # Los lotes anteriores a un error ya están guardados.
+            self._tasks_changed(None)
+
+    def export_tasks(self, stream, fmt, include_deleted=False):
+        """
+        Exportar tareas a un archivo CSV o JSON Lines.
+
+        Args:
+            stream (TextIO): Archivo de salida abierto en modo texto.
+            fmt (str): 'csv' o 'jsonl'.
+            include_deleted (bool): Si True, incluye tareas eliminadas.
 
         Returns:
-            list: Lista de tareas favoritas.
+            int: Número de tareas exportadas.
         """
-        return self.controller.session.query(Tarea).filter_by(favorita=True).all()
+        return bulk.export_tasks(self.controller.session, stream, fmt, include_deleted)
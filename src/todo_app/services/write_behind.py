@@ -0,0 +1,129 @@
+"""
+Confirmación diferida (write-behind) de las modificaciones de tareas.
+
+Por defecto cada modificación de ``TaskController`` confirma su propia
+transacción, lo que en SQLite supone una sincronización a disco por clic.
+Con ``TaskService.enable_write_behind`` las modificaciones se aplican a la
+sesión en el acto (la interfaz las ve de inmediato) y se confirman juntas en
+una sola transacción cuando pasa la ventana de espera (``delay``) desde la
+primera pendiente o cuando se acumulan ``max_pending``.
+
+La ventana de espera es también la ventana de durabilidad: si el proceso
+muere antes de confirmar, se pierden como mucho las modificaciones de ese
+intervalo. Se configura con ``TODO_WRITE_DELAY_MS`` (0 o sin definir: sin
+diferir).
+
+Mientras haya modificaciones pendientes la transacción de escritura sigue
+abierta, de modo que otras conexiones no las ven ni pueden escribir hasta
+que se confirman.
+"""
+
+import os
+import time
+
+WRITE_DELAY_ENV_VAR = 'TODO_WRITE_DELAY_MS'
+DEFAULT_DELAY = 0.5
+DEFAULT_MAX_PENDING = 50
+
+
+def delay_from_environment():
+    """
+    Lee la ventana de espera de ``TODO_WRITE_DELAY_MS``.
+
+    Returns:
+        float: Segundos de espera, o None si no se deben diferir las confirmaciones.
+
+    Raises:
+        ValueError: Si el valor no es un número de milisegundos válido.
+    """
+    value = os.environ.get(WRITE_DELAY_ENV_VAR, '').strip()
+    if not value:
+        return None
+    try:
+        milliseconds = float(value)
+    except ValueError:
+        raise ValueError(f"{WRITE_DELAY_ENV_VAR} debe ser un número de milisegundos: {value!r}") from None
+    if milliseconds < 0:
+        raise ValueError(f"{WRITE_DELAY_ENV_VAR} no puede ser negativo: {value!r}")
+    return milliseconds / 1000 if milliseconds else None
+
+
+class WriteBehind:
+    """Lleva la cuenta de las modificaciones sin confirmar de una sesión."""
+
+    def __init__(self, session, delay=DEFAULT_DELAY, max_pending=DEFAULT_MAX_PENDING,
+                 clock=time.monotonic):
+        """
+        Inicializa el contador.
+
+        Args:
+            session (Session): Sesión cuyas modificaciones se confirman juntas.
+            delay (float): Segundos desde la primera modificación pendiente
+                hasta confirmar.
+            max_pending (int): Modificaciones pendientes que fuerzan la confirmación.
+            clock (callable): Reloj monótono en segundos.
+        """
+        self.session = session
+        self.delay = delay
+        self.max_pending = max_pending
+        self.clock = clock
+        self.pending = 0
+        self.deadline = None
+        # IDs de las tareas modificadas desde la última confirmación; None si
+        # alguna modificación no los indicó.
+        self.task_ids = set()
+
+    def record(self, task_ids):
+        """
+        Registra una modificación ya aplicada a la sesión.
+
+        Args:
+            task_ids (list): IDs modificados, o None si pueden ser todos.
+        """
+        if self.pending == 0:
+            self.deadline = self.clock() + self.delay
+        self.pending += 1
+        if task_ids is None:
+            self.task_ids = None
+        elif self.task_ids is not None:
+            self.task_ids.update(task_ids)
+
+    def full(self):
+        """True si se alcanzó ``max_pending``."""
+        return self.pending >= self.max_pending
+
+    def due(self):
+        """True si hay modificaciones pendientes y venció su ventana de espera."""
+        return self.pending > 0 and self.clock() >= self.deadline
+
+    def seconds_until_flush(self):
+        """
+        Segundos hasta la próxima confirmación.
+
+        Returns:
+            float: Segundos (0 si ya venció), o None si no hay nada pendiente.
+        """
+        if self.pending == 0:
+            return None
+        return max(0.0, self.deadline - self.clock())
+
+    def flush(self):
+        """
+        Confirma las modificaciones pendientes en una sola transacción.
+
+        Si la confirmación falla se deshace la transacción y las modificaciones
+        pendientes se descartan.
+
+        Returns:
+            tuple: (número de modificaciones confirmadas, IDs modificados o None).
+        """
+        if self.pending == 0:
+            return 0, []
+        flushed, task_ids = self.pending, self.task_ids
+        self.pending, self.deadline, self.task_ids = 0, None, set()
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return flushed, None if task_ids is None else sorted(task_ids)
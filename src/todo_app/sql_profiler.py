@@ -0,0 +1,318 @@
+"""
+Perfilado de las sentencias SQL y de los métodos del servicio.
+
+El perfilador se engancha a los eventos ``before_cursor_execute`` y
+``after_cursor_execute`` de un motor de SQLAlchemy y acumula, por sentencia
+(con las listas ``IN (?, ?, ...)`` normalizadas), el número de ejecuciones y
+el tiempo total y máximo. ``instrument`` envuelve los métodos públicos de un
+objeto (``TaskService``, ``TaskController``) para guardar un histograma de
+latencias por método y atribuir cada sentencia al método que la lanzó.
+
+Las sentencias que superan el umbral se escriben en stderr con su
+``EXPLAIN QUERY PLAN``. En SQLite el cursor devuelve el control al tener la
+primera fila, así que el tiempo de una sentencia no incluye recorrer el
+resto del resultado; ese coste sí aparece en la latencia del método.
+
+Está desactivado por defecto. Se activa con ``TODO_PROFILE_SQL=1`` (o con
+la opción ``--profile-sql`` de ``main.py``); el umbral de las lentas se fija
+con ``TODO_SLOW_QUERY_MS`` (50 ms por defecto; un valor no numérico se
+avisa en stderr y se ignora). El resumen se imprime al
+salir y desde el menú Depuración de la ventana principal.
+"""
+
+import bisect
+import functools
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+
+PROFILE_ENV_VAR = 'TODO_PROFILE_SQL'
+SLOW_QUERY_ENV_VAR = 'TODO_SLOW_QUERY_MS'
+DEFAULT_SLOW_MS = 50.0
+# Límites superiores (ms) de los intervalos del histograma; el último es abierto.
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+MAX_SLOW_QUERIES = 100
+
+_EXPLAINABLE = ('SELECT', 'WITH', 'UPDATE', 'DELETE', 'INSERT')
+_PLACEHOLDER_LIST = re.compile(r'\?(?:\s*,\s*\?)+')
+
+
+def normalize_statement(statement):
+    """
+    Agrupa las sentencias que solo difieren en la longitud de sus listas de parámetros.
+
+    Args:
+        statement (str): SQL enviado al cursor.
+
+    Returns:
+        str: SQL con cada lista ``?, ?, ...`` sustituida por ``?, ...``.
+    """
+    return _PLACEHOLDER_LIST.sub('?, ...', ' '.join(statement.split()))
+
+
+class LatencyHistogram:
+    """Histograma de latencias con intervalos fijos en milisegundos."""
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms):
+        """Añade una medición."""
+        self.counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, fraction):
+        """
+        Estima un percentil como el límite superior de su intervalo.
+
+        Args:
+            fraction (float): Percentil entre 0 y 1 (0.95 = p95).
+
+        Returns:
+            float: Milisegundos (el máximo observado si cae en el último intervalo).
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(HISTOGRAM_BOUNDS_MS, self.counts):
+            seen += count
+            if seen >= target:
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+    def as_dict(self):
+        """
+        Devuelve el histograma en milisegundos.
+
+        Returns:
+            dict: ``{'count', 'total_ms', 'max_ms', 'p50_ms', 'p95_ms', 'buckets'}``.
+        """
+        labels = [f'<={bound}' for bound in HISTOGRAM_BOUNDS_MS] + [f'>{HISTOGRAM_BOUNDS_MS[-1]}']
+        return {
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'buckets': {label: count for label, count in zip(labels, self.counts) if count},
+        }
+
+
+class QueryProfiler:
+    """Tiempos por sentencia SQL y por método, con registro de consultas lentas."""
+
+    def __init__(self, enabled=False, slow_ms=DEFAULT_SLOW_MS, stream=None):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            enabled (bool): Si es False, ``attach`` e ``instrument`` no hacen nada.
+            slow_ms (float): Umbral de las consultas lentas, o None para no registrarlas.
+            stream (TextIO): Destino del registro de lentas y del resumen
+                (por defecto, ``sys.stderr``).
+        """
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.stream = stream
+        self.statements = {}
+        self.methods = {}
+        self.slow_queries = deque(maxlen=MAX_SLOW_QUERIES)
+        self._engines = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, slow_ms=None):
+        """Activa el perfilador (y, si se indica, cambia el umbral de las lentas)."""
+        self.enabled = True
+        if slow_ms is not None:
+            self.slow_ms = slow_ms
+
+    def reset(self):
+        """Descarta las mediciones acumuladas."""
+        with self._lock:
+            self.statements.clear()
+            self.methods.clear()
+            self.slow_queries.clear()
+
+    # ENGANCHES
+
+    def attach(self, engine):
+        """
+        Registra los eventos de cursor en ``engine`` si el perfilador está activo.
+
+        Args:
+            engine (Engine): Motor a medir.
+        """
+        if not self.enabled or engine in self._engines:
+            return
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        self._engines.append(engine)
+
+    def detach(self, engine):
+        """Retira los eventos registrados por ``attach``."""
+        if engine in self._engines:
+            event.remove(engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.remove(engine, 'after_cursor_execute', self._after_cursor_execute)
+            self._engines.remove(engine)
+
+    def instrument(self, target, prefix=None):
+        """
+        Envuelve los métodos públicos de ``target`` para medir su latencia.
+
+        Los envoltorios se guardan como atributos de la instancia, así que la
+        clase no cambia y otras instancias no se ven afectadas.
+
+        Args:
+            target (object): Objeto cuyos métodos medir.
+            prefix (str): Prefijo de los nombres (por defecto, el de la clase).
+
+        Returns:
+            object: ``target``.
+        """
+        if not self.enabled:
+            return target
+        prefix = prefix or type(target).__name__
+        for name in dir(type(target)):
+            if name.startswith('_') or not callable(getattr(type(target), name)):
+                continue
+            method = getattr(target, name)
+            setattr(target, name, self._timed(f'{prefix}.{name}', method))
+        return target
+
+    def _timed(self, label, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            stack = self._method_stack()
+            stack.append(label)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                stack.pop()
+                with self._lock:
+                    self.methods.setdefault(label, LatencyHistogram()).record(elapsed_ms)
+        return wrapper
+
+    def _method_stack(self):
+        stack = getattr(self._local, 'methods', None)
+        if stack is None:
+            stack = self._local.methods = []
+        return stack
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('profiler_start', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info['profiler_start'].pop()) * 1000
+        key = normalize_statement(statement)
+        with self._lock:
+            self.statements.setdefault(key, LatencyHistogram()).record(elapsed_ms)
+        if self.slow_ms is not None and elapsed_ms >= self.slow_ms:
+            stack = self._method_stack()
+            self._log_slow_query(
+                elapsed_ms, key, stack[-1] if stack else None,
+                None if executemany else self._explain(conn, statement, parameters)
+            )
+
+    @staticmethod
+    def _explain(conn, statement, parameters):
+        """Plan de la sentencia, leído con el cursor crudo para no volver a disparar los eventos."""
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+        cursor = conn.connection.driver_connection.cursor()
+        try:
+            cursor.execute('EXPLAIN QUERY PLAN ' + statement, parameters)
+            return [row[-1] for row in cursor.fetchall()]
+        except Exception as exc:  # El plan es informativo: nunca debe romper la consulta.
+            return [f'(sin plan: {exc})']
+        finally:
+            cursor.close()
+
+    def _log_slow_query(self, elapsed_ms, statement, method, plan):
+        entry = {'elapsed_ms': round(elapsed_ms, 3), 'statement': statement, 'method': method, 'plan': plan}
+        with self._lock:
+            self.slow_queries.append(entry)
+        origin = f' en {method}' if method else ''
+        lines = [f'[SQL lenta] {elapsed_ms:.1f} ms{origin}: {statement}']
+        lines.extend(f'    {step}' for step in plan or [])
+        print('\n'.join(lines), file=self.stream or sys.stderr, flush=True)
+
+    # RESUMEN
+
+    def as_dict(self):
+        """
+        Devuelve las mediciones acumuladas.
+
+        Returns:
+            dict: ``{'statements': {sql: histograma}, 'methods': {método: histograma},
+            'slow_queries': [...]}``.
+        """
+        with self._lock:
+            return {
+                'statements': {sql: stats.as_dict() for sql, stats in self.statements.items()},
+                'methods': {name: stats.as_dict() for name, stats in self.methods.items()},
+                'slow_queries': list(self.slow_queries),
+            }
+
+    def report(self, limit=15):
+        """
+        Genera el resumen como texto.
+
+        Args:
+            limit (int): Sentencias y métodos a mostrar, por tiempo total.
+
+        Returns:
+            str: Tablas de métodos y sentencias más costosos.
+        """
+        data = self.as_dict()
+        lines = [f"{'llamadas':>9} {'total ms':>10} {'p50 ms':>8} {'p95 ms':>8} {'máx ms':>9}  método"]
+        methods = sorted(data['methods'].items(), key=lambda item: -item[1]['total_ms'])
+        for name, stats in methods[:limit]:
+            lines.append(f"{stats['count']:>9} {stats['total_ms']:>10.1f} {stats['p50_ms']:>8.0f} "
+                         f"{stats['p95_ms']:>8.0f} {stats['max_ms']:>9.1f}  {name}")
+        lines.append('')
+        lines.append(f"{'veces':>9} {'total ms':>10} {'media ms':>8} {'máx ms':>9}  sentencia")
+        statements = sorted(data['statements'].items(), key=lambda item: -item[1]['total_ms'])
+        for sql, stats in statements[:limit]:
+            mean = stats['total_ms'] / stats['count']
+            shown = sql if len(sql) <= 120 else sql[:117] + '...'
+            lines.append(f"{stats['count']:>9} {stats['total_ms']:>10.1f} {mean:>8.2f} "
+                         f"{stats['max_ms']:>9.1f}  {shown}")
+        lines.append('')
+        if self.slow_ms is not None:
+            lines.append(f"Consultas lentas (>= {self.slow_ms:g} ms): {len(data['slow_queries'])}")
+        return '\n'.join(lines)
+
+    def dump(self):
+        """Imprime el resumen en stderr si el perfilador está activo."""
+        if self.enabled:
+            print(self.report(), file=self.stream or sys.stderr, flush=True)
+
+
+def _from_environment():
+    enabled = os.environ.get(PROFILE_ENV_VAR, '').strip().lower() not in ('', '0')
+    value = os.environ.get(SLOW_QUERY_ENV_VAR, '').strip()
+    try:
+        slow_ms = float(value) if value else DEFAULT_SLOW_MS
+    except ValueError:
+        print(f"Aviso: {SLOW_QUERY_ENV_VAR} debe ser un número de milisegundos ({value!r}); "
+              f"se usa {DEFAULT_SLOW_MS:g} ms", file=sys.stderr)
+        slow_ms = DEFAULT_SLOW_MS
+    return QueryProfiler(enabled, slow_ms)
+
+
+# Perfilador global; ``init_db`` lo engancha al motor de la aplicación.
+profiler = _from_environment()
@@ -0,0 +1,109 @@
+"""
+Trazas de tiempo del arranque de la aplicación.
+
+El trazador registra fases con nombre (importaciones, base de datos, hoja de
+estilos, interfaz, carga inicial, primer pintado) y al final imprime un
+desglose. Está desactivado por defecto y no mide nada hasta que se activa
+con la variable de entorno ``TODO_TRACE_STARTUP=1`` (o ``=json`` para una
+línea JSON en stdout) o con la opción ``--trace-startup`` de ``main.py``.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+TRACE_ENV_VAR = 'TODO_TRACE_STARTUP'
+
+
+class StartupTracer:
+    """Registro de fases de arranque con sus duraciones."""
+
+    def __init__(self, mode=None):
+        """
+        Inicializa el trazador.
+
+        Args:
+            mode (str): None (desactivado), 'text' o 'json'.
+        """
+        self.mode = mode
+        self.origin = time.perf_counter()
+        self.phases = []
+
+    @property
+    def enabled(self):
+        """Indica si el trazador está registrando fases."""
+        return self.mode is not None
+
+    def enable(self, mode='text'):
+        """Activa el trazador en el formato indicado ('text' o 'json')."""
+        self.mode = mode
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Mide la duración del bloque ``with`` como una fase.
+
+        Args:
+            name (str): Nombre de la fase.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self.origin, time.perf_counter() - start))
+
+    def mark(self, name):
+        """Registra un instante (fase de duración cero), por ejemplo el primer pintado."""
+        if self.enabled:
+            self.phases.append((name, time.perf_counter() - self.origin, 0.0))
+
+    def as_dict(self):
+        """
+        Devuelve las fases medidas en milisegundos.
+
+        Returns:
+            dict: ``{'phases': [{'name', 'start_ms', 'duration_ms'}], 'total_ms'}``.
+        """
+        phases = [
+            {'name': name, 'start_ms': round(start * 1000, 3), 'duration_ms': round(duration * 1000, 3)}
+            for name, start, duration in sorted(self.phases, key=lambda phase: phase[1])
+        ]
+        total = max((start + duration for _, start, duration in self.phases), default=0.0)
+        return {'phases': phases, 'total_ms': round(total * 1000, 3)}
+
+    def report(self):
+        """
+        Genera el desglose de fases como texto.
+
+        Returns:
+            str: Tabla con inicio, duración y nombre de cada fase.
+        """
+        data = self.as_dict()
+        lines = [f"{'inicio ms':>10} {'duración ms':>12}  fase"]
+        for phase in data['phases']:
+            lines.append(f"{phase['start_ms']:>10.1f} {phase['duration_ms']:>12.1f}  {phase['name']}")
+        lines.append(f"{data['total_ms']:>10.1f} {'':>12}  total")
+        return '\n'.join(lines)
+
+    def dump(self):
+        """Imprime el desglose (texto en stderr o JSON en stdout) si está activado."""
+        if self.mode == 'json':
+            print(json.dumps(self.as_dict()), flush=True)
+        elif self.enabled:
+            print(self.report(), file=sys.stderr, flush=True)
+
+
+def _mode_from_environment():
+    value = os.environ.get(TRACE_ENV_VAR, '').strip().lower()
+    if value in ('', '0'):
+        return None
+    return 'json' if value == 'json' else 'text'
+
+
+# Trazador global; se crea al importar el módulo, que main.py importa primero.
+tracer = StartupTracer(_mode_from_environment())
@@ -0,0 +1,391 @@
+"""
+Modelo de lista de tareas para la vista principal.
+
+Este módulo contiene la clase TaskListModel, un ``QAbstractListModel`` que
+obtiene las tareas por páginas desde el servicio a medida que el usuario se
+desplaza (``canFetchMore``/``fetchMore``) y genera el texto de cada fila solo
+cuando la vista lo solicita en ``data()``.
+
+Las páginas pueden obtenerse de forma síncrona (``set_source``) o pedirse a
+otro hilo y entregarse más tarde (``set_async_source``).
+
+Con ``set_highlight`` el modelo ofrece además cada fila como HTML con las
+palabras buscadas resaltadas, que ``HighlightDelegate`` dibuja en la vista.
+"""
+
+import html
+import re
+import unicodedata
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt5.QtGui import QAbstractTextDocumentLayout, QPalette, QTextDocument
+from PyQt5.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from todo_app.models.fts import search_terms
+from todo_app.repositories.controllers import DEFAULT_PAGE_SIZE, TaskRow
+
+# Rol con el que la vista recupera el ID de la tarea de cada fila.
+TASK_ID_ROLE = 1000
+# Rol con el texto de la fila en HTML y las coincidencias resaltadas (None si no hay búsqueda).
+HIGHLIGHT_ROLE = 1001
+
+# Copia inmutable de los campos de una tarea que muestra la lista. El modelo
+# guarda filas y no objetos del ORM: tras cada ``commit`` la sesión expira sus
+# objetos, y leerlos desde ``data()`` lanzaría una consulta por fila visible.
+TaskItem = TaskRow
+
+
+def _fold(text):
+    """Minúsculas y sin tildes, carácter a carácter, como compara el tokenizador de FTS5."""
+    return ''.join(unicodedata.normalize('NFD', char)[0].lower()[:1] for char in text)
+
+
+def highlight_terms(text, terms, prefix_last=False):
+    """
+    Marca en HTML las palabras de ``text`` que coinciden con los términos buscados.
+
+    Reproduce la búsqueda de FTS5: sin distinguir mayúsculas ni tildes, solo
+    al comienzo de una palabra y, como en ``build_match_query``, cada término
+    como prefijo (o solo el último con ``prefix_last``).
+
+    Args:
+        text (str): Texto a mostrar.
+        terms (list): Palabras buscadas, en orden.
+        prefix_last (bool): Si es True, las palabras anteriores a la última
+            solo coinciden completas.
+
+    Returns:
+        str: Texto escapado con las coincidencias entre ``<b>`` y ``</b>``.
+    """
+    folded = [_fold(term) for term in terms if term]
+    if not folded:
+        return html.escape(text)
+    whole = folded[:-1] if prefix_last else []
+    prefixes = folded[len(whole):]
+    alternatives = [re.escape(term) + r'(?!\w)' for term in whole]
+    alternatives += [re.escape(term) + r'\w*' for term in prefixes]
+    # Las alternativas más largas primero, para marcar la palabra entera.
+    alternatives.sort(key=len, reverse=True)
+    pattern = re.compile(r'(?<!\w)(?:%s)' % '|'.join(alternatives))
+    parts = []
+    position = 0
+    # El plegado conserva la longitud, así que las posiciones valen para el texto original.
+    for match in pattern.finditer(_fold(text)):
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(f'<b>{html.escape(text[match.start():match.end()])}</b>')
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    return ''.join(parts)
+
+
+def format_task(task, highlight=None):
+    """
+    Genera el texto de una fila de la lista.
+
+    Args:
+        task (TaskItem): Tarea a mostrar.
+        highlight (callable): Si se indica, el texto se genera como HTML y
+            ``highlight(texto)`` marca las coincidencias del título y la descripción.
+
+    Returns:
+        str: Texto de tres líneas con título, descripción y estado.
+    """
+    mark, plain = (highlight, html.escape) if highlight else (str, str)
+    estado = "🟢 Completada" if task.completada else "🔴 Pendiente"
+    estrella = "⭐" if task.favorita else ""
+    prioridad = f"⚡{task.prioridad.value}" if task.prioridad else ""
+    categoria = f"📂{task.categoria.value}" if task.categoria else ""
+    vencimiento = (
+        task.fecha_vencimiento.strftime('%d-%m-%Y')
+        if task.fecha_vencimiento else "Sin fecha"
+    )
+
+    return (
+        f"{estrella} {mark(task.titulo)}\n"
+        f"🗒️ {mark(str(task.descripcion))}\n"
+        f"📅 {plain(vencimiento)}  |  {estado}  |  {plain(prioridad)}  |  {plain(categoria)}"
+    )
+
+
+def format_task_html(task, terms, prefix_last=False):
+    """
+    Genera la fila como HTML con las palabras buscadas resaltadas.
+
+    Args:
+        task (TaskItem): Tarea a mostrar.
+        terms (list): Palabras buscadas.
+        prefix_last (bool): Si es True, solo la última palabra es un prefijo.
+
+    Returns:
+        str: HTML que conserva los saltos de línea y espacios de ``format_task``.
+    """
+    text = format_task(task, lambda value: highlight_terms(value, terms, prefix_last))
+    return f'<div style="white-space: pre-wrap">{text}</div>'
+
+
+class HighlightDelegate(QStyledItemDelegate):
+    """Dibuja las filas con ``HIGHLIGHT_ROLE`` como texto enriquecido."""
+
+    def paint(self, painter, option, index):
+        """Dibuja el fondo y la selección con el estilo, y encima el HTML de la fila."""
+        text = index.data(HIGHLIGHT_ROLE)
+        if text is None:
+            super().paint(painter, option, index)
+            return
+        options = QStyleOptionViewItem(option)
+        self.initStyleOption(options, index)
+        options.text = ''
+        style = options.widget.style() if options.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, options, painter, options.widget)
+
+        document = QTextDocument()
+        document.setDocumentMargin(0)
+        document.setDefaultFont(options.font)
+        document.setHtml(text)
+        context = QAbstractTextDocumentLayout.PaintContext()
+        if options.state & QStyle.State_Selected:
+            context.palette.setColor(QPalette.Text, options.palette.color(QPalette.HighlightedText))
+        rect = style.subElementRect(QStyle.SE_ItemViewItemText, options, options.widget)
+        painter.save()
+        painter.translate(rect.topLeft())
+        painter.setClipRect(rect.translated(-rect.topLeft()))
+        document.documentLayout().draw(painter, context)
+        painter.restore()
+
+
+class TaskListModel(QAbstractListModel):
+    """Modelo de lista que carga tareas por páginas y aplica cambios fila a fila."""
+
+    def __init__(self, parent=None, page_size=DEFAULT_PAGE_SIZE):
+        """
+        Inicializa un modelo vacío.
+
+        Args:
+            parent (QObject): Objeto padre de Qt.
+            page_size (int): Número de tareas pedidas en cada ``fetchMore``.
+        """
+        super().__init__(parent)
+        self.page_size = page_size
+        self._rows = []
+        self._fetch_page = None
+        self._request_page = None
+        self._accepts = lambda task: True
+        self._ranked = False
+        self._terms = []
+        self._prefix_last = False
+        self._cursor = None
+        self._has_more = False
+        self._loading = False
+        # Se incrementa con cada cambio de fuente para descartar páginas tardías.
+        self._generation = 0
+
+    # CONFIGURACIÓN DE LA FUENTE
+
+    def set_source(self, fetch_page, accepts=None):
+        """
+        Cambia la consulta que alimenta el modelo y vacía las filas cargadas.
+
+        Args:
+            fetch_page (callable): ``fetch_page(cursor, page_size) -> TaskPage``.
+            accepts (callable): Predicado que indica si una tarea pertenece a la
+                vista actual; se usa al aplicar cambios individuales.
+        """
+        self._reset([], fetch_page, None, accepts, has_more=True)
+
+    def set_async_source(self, request_page, accepts=None, ranked=False):
+        """
+        Cambia a una consulta asíncrona y vacía las filas cargadas.
+
+        ``fetchMore`` solo pide la página; las filas se añaden cuando se llama
+        a ``deliver``. Las páginas de una fuente anterior se descartan.
+
+        Args:
+            request_page (callable): ``request_page(cursor, page_size, deliver)``,
+                donde ``deliver(page)`` recibe la ``TaskPage`` obtenida.
+            accepts (callable): Predicado de pertenencia a la vista.
+            ranked (bool): Si True, las páginas no siguen el orden por fecha
+                (p. ej. resultados de búsqueda por relevancia): los cambios
+                actualizan o retiran las filas cargadas, pero no las mueven ni
+                insertan tareas nuevas.
+        """
+        self._reset([], None, request_page, accepts, has_more=True, ranked=ranked)
+
+    def set_tasks(self, tasks, accepts=None):
+        """
+        Muestra una lista de tareas ya obtenida, sin carga incremental.
+
+        Args:
+            tasks (list): Tareas a mostrar.
+            accepts (callable): Predicado de pertenencia a la vista.
+        """
+        self._reset([TaskItem.from_task(task) for task in tasks], None, None, accepts, has_more=False)
+
+    def set_highlight(self, keyword, prefix_last=False):
+        """
+        Resalta en las filas las palabras de una búsqueda.
+
+        La fuente se cambia antes, porque ``set_async_source`` y el resto de
+        cambios de fuente quitan el resaltado.
+
+        Args:
+            keyword (str): Texto buscado; vacío o None para no resaltar.
+            prefix_last (bool): Si es True, solo la última palabra es un prefijo.
+        """
+        self._terms = search_terms(keyword)
+        self._prefix_last = prefix_last
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [HIGHLIGHT_ROLE])
+
+    def _reset(self, rows, fetch_page, request_page, accepts, has_more, ranked=False):
+        self.beginResetModel()
+        self._rows = rows
+        self._fetch_page = fetch_page
+        self._request_page = request_page
+        self._accepts = accepts or (lambda task: True)
+        self._ranked = ranked
+        self._terms = []
+        self._cursor = None
+        self._has_more = has_more
+        self._loading = False
+        self._generation += 1
+        self.endResetModel()
+
+    @property
+    def loading(self):
+        """Indica si hay una página asíncrona pedida y aún no entregada."""
+        return self._loading
+
+    # INTERFAZ DE QAbstractListModel
+
+    def rowCount(self, parent=QModelIndex()):
+        """Número de filas cargadas hasta el momento."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Devuelve el texto (plano o resaltado) o el ID de la tarea de una fila."""
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        task = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return format_task(task)
+        if role == TASK_ID_ROLE:
+            return task.id
+        if role == HIGHLIGHT_ROLE and self._terms:
+            return format_task_html(task, self._terms, self._prefix_last)
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """Indica si quedan páginas por pedir al servicio."""
+        has_source = self._fetch_page is not None or self._request_page is not None
+        return not parent.isValid() and self._has_more and not self._loading and has_source
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Pide la siguiente página al servicio y la añade al final."""
+        if not self.canFetchMore(parent):
+            return
+        if self._request_page is not None:
+            self._loading = True
+            generation = self._generation
+            self._request_page(self._cursor, self.page_size,
+                               lambda page: self._page_loaded(generation, page))
+            return
+        self._append_page(self._fetch_page(self._cursor, self.page_size))
+
+    def abort_fetch(self):
+        """Da por fallida la página asíncrona pendiente y deja de pedir más."""
+        self._loading = False
+        self._has_more = False
+
+    def _page_loaded(self, generation, page):
+        if generation != self._generation:
+            return
+        self._loading = False
+        self._append_page(page)
+
+    def _append_page(self, page):
+        self._cursor = page.next_cursor
+        self._has_more = page.next_cursor is not None
+        items = [TaskItem.from_task(task) for task in page.tasks]
+        if items:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+            self._rows.extend(items)
+            self.endInsertRows()
+
+    # CAMBIOS INDIVIDUALES
+
+    def task_id(self, row):
+        """Devuelve el ID de la tarea en la fila indicada."""
+        return self._rows[row].id
+
+    def row_of(self, task_id):
+        """Devuelve la fila de una tarea cargada, o -1 si no está en el modelo."""
+        for row, task in enumerate(self._rows):
+            if task.id == task_id:
+                return row
+        return -1
+
+    def upsert_task(self, task):
+        """
+        Aplica el estado actual de una tarea a la vista.
+
+        Si la tarea ya no pertenece a la vista se retira; si cambió su posición
+        se mueve; si es nueva se inserta en su lugar según el orden del listado.
+        Las tareas que caerían después de la última fila cargada se omiten:
+        aparecerán en una página posterior. En una fuente ``ranked`` solo se
+        actualizan o retiran las filas ya cargadas.
+
+        Args:
+            task (Tarea): Tarea del ORM recién leída o modificada.
+        """
+        item = TaskItem.from_task(task)
+        row = self.row_of(item.id)
+        if not self._accepts(item):
+            if row >= 0:
+                self._remove_row(row)
+            return
+
+        if self._ranked:
+            if row >= 0:
+                self._replace_row(row, item)
+            return
+
+        if row >= 0:
+            if self._rows[row].sort_key == item.sort_key:
+                self._replace_row(row, item)
+                return
+            self._remove_row(row)
+
+        position = self._insert_position(item.sort_key)
+        if position == len(self._rows) and self._has_more:
+            return
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, item)
+        self.endInsertRows()
+
+    def remove_task(self, task_id):
+        """Retira una tarea del modelo si está cargada."""
+        row = self.row_of(task_id)
+        if row >= 0:
+            self._remove_row(row)
+
+    def _replace_row(self, row, item):
+        self._rows[row] = item
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def _remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def _insert_position(self, key):
+        """Búsqueda binaria de la posición de inserción para ``key``."""
+        low, high = 0, len(self._rows)
+        while low < high:
+            middle = (low + high) // 2
+            if self._rows[middle].sort_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,226 @@
+"""
+Módulo de pruebas unitarias para la API HTTP local.
+
+Estas pruebas cubren:
+- Listado paginado con filtros y cursor
+- Búsqueda, consulta, creación, actualización y eliminación de tareas
+- Operaciones en lote
+- Registro de cambios para sincronización incremental
+- GET condicionales con ETag (304 Not Modified) e invalidación tras cambios
+- Caché de respuestas del servidor: 304 y aciertos sin consultar, cambios de otras conexiones
+- Errores de validación (incluidos tipos JSON incorrectos), rutas desconocidas y métodos no permitidos
+- Errores inesperados respondidos con 500 y cuerpo JSON
+- Opciones de pool solo para motores con QueuePool
+- Servidor HTTP real en un puerto libre con una conexión persistente
+
+Se utiliza una base de datos SQLite en un archivo temporal, ya que cada
+petición abre su propia sesión sobre el pool del motor.
+"""
+
+import http.client
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date
+from unittest import mock
+
+from todo_app.api import TaskAPI, _pool_options, make_server
+from todo_app.models.database import create_db_engine, sqlite_url
+from todo_app.services.task_service import TaskService
+
+
+class TaskAPITestCase(unittest.TestCase):
+    """Casos de prueba para TaskAPI y el servidor HTTP."""
+
+    def setUp(self):
+        """Crea una base temporal con tres tareas."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = create_db_engine(sqlite_url(os.path.join(self.tmp.name, 'tareas.db')))
+        seed = TaskService(engine=self.engine)
+        self.ids = [
+            seed.create_task("Leer libro", "Capítulo 1", date(2025, 6, 3), 'alta', 'estudio').id,
+            seed.create_task("Lavar ropa", "Blanca", date(2025, 6, 1), 'baja', 'hogar').id,
+            seed.create_task("Informe", "Trimestral", None, 'media', 'trabajo').id,
+        ]
+        seed.controller.session.close()
+        self.api = TaskAPI(self.engine)
+
+    def tearDown(self):
+        """Libera el motor y elimina la base temporal."""
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def request(self, method, target, body=None, if_none_match=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        status, payload, headers = self.api.handle(method, target, data, if_none_match)
+        return status, json.loads(payload) if payload else None, headers
+
+    def test_list_pages_with_cursor(self):
+        status, first, _ = self.request('GET', '/tasks?page_size=2')
+        self.assertEqual(status, 200)
+        self.assertEqual([t['titulo'] for t in first['tasks']], ["Informe", "Lavar ropa"])
+        _, second, _ = self.request('GET', f"/tasks?page_size=2&cursor={first['next_cursor']}")
+        self.assertEqual([t['titulo'] for t in second['tasks']], ["Leer libro"])
+        self.assertIsNone(second['next_cursor'])
+
+    def test_list_filters_and_serialization(self):
+        _, page, _ = self.request('GET', '/tasks?prioridad=alta')
+        self.assertEqual(page['tasks'], [{
+            'id': self.ids[0], 'titulo': "Leer libro", 'descripcion': "Capítulo 1",
+            'fecha_vencimiento': '2025-06-03', 'prioridad': 'alta', 'categoria': 'estudio',
+            'completada': False, 'favorita': False, 'eliminada': False,
+        }])
+
+    def test_search_and_get(self):
+        _, found, _ = self.request('GET', '/tasks/search?q=ropa')
+        self.assertEqual([t['id'] for t in found['tasks']], [self.ids[1]])
+        status, task, _ = self.request('GET', f'/tasks/{self.ids[2]}')
+        self.assertEqual(status, 200)
+        self.assertEqual(task['titulo'], "Informe")
+        self.assertEqual(self.request('GET', '/tasks/9999')[0], 404)
+
+    def test_create_update_and_delete(self):
+        status, created, _ = self.request('POST', '/tasks', {
+            'titulo': "Nueva", 'fecha_vencimiento': '2025-07-01', 'categoria': 'hogar'
+        })
+        self.assertEqual(status, 201)
+        self.assertEqual((created['prioridad'], created['categoria']), ('media', 'hogar'))
+
+        status, updated, _ = self.request('PATCH', f"/tasks/{created['id']}", {'prioridad': 'alta'})
+        self.assertEqual((status, updated['prioridad'], updated['titulo']), (200, 'alta', "Nueva"))
+
+        self.request('DELETE', f"/tasks/{created['id']}")
+        self.assertTrue(self.request('GET', f"/tasks/{created['id']}")[1]['eliminada'])
+        self.request('DELETE', f"/tasks/{created['id']}?permanent=1")
+        self.assertEqual(self.request('GET', f"/tasks/{created['id']}")[0], 404)
+
+    def test_batch_actions(self):
+        status, result, _ = self.request('POST', '/tasks/batch', {'action': 'complete', 'ids': self.ids[:2]})
+        self.assertEqual((status, result), (200, {'changed': 2}))
+        _, pending, _ = self.request('GET', '/tasks?estado=pendientes')
+        self.assertEqual([t['id'] for t in pending['tasks']], [self.ids[2]])
+        self.assertEqual(self.request('POST', '/tasks/batch', {'action': 'borrar', 'ids': []})[0], 400)
+        self.assertEqual(self.request('POST', '/tasks/batch', {'action': 'delete', 'ids': 'x'})[0], 400)
+        self.assertEqual(self.request('POST', '/tasks/batch', {'action': 'delete', 'ids': [True]})[0], 400)
+        self.assertFalse(self.request('GET', f'/tasks/{self.ids[0]}')[1]['eliminada'])
+
+    def test_changes_feed(self):
+        status, full, _ = self.request('GET', '/tasks/changes?limit=2')
+        self.assertEqual(status, 200)
+        self.assertEqual((len(full['created']), full['has_more']), (2, True))
+        _, rest, _ = self.request('GET', f"/tasks/changes?since={full['token']}")
+        self.assertEqual([t['id'] for t in full['created'] + rest['created']], self.ids)
+
+        self.request('POST', '/tasks/batch', {'action': 'complete', 'ids': [self.ids[0]]})
+        self.request('DELETE', f'/tasks/{self.ids[1]}?permanent=1')
+        _, changes, _ = self.request('GET', f"/tasks/changes?since={rest['token']}")
+        self.assertEqual([(t['id'], t['completada']) for t in changes['updated']], [(self.ids[0], True)])
+        self.assertEqual((changes['created'], changes['deleted']), ([], [self.ids[1]]))
+
+        self.assertEqual(self.request('GET', '/tasks/changes?since=roto')[0], 400)
+        self.assertEqual(self.request('GET', '/tasks/changes?limit=0')[0], 400)
+
+    def test_etag_conditional_get(self):
+        status, _, headers = self.request('GET', '/tasks')
+        etag = headers['ETag']
+        status, body, headers = self.request('GET', '/tasks', if_none_match=etag)
+        self.assertEqual((status, body, headers['ETag']), (304, None, etag))
+
+        self.request('POST', '/tasks/batch', {'action': 'favorite', 'ids': [self.ids[0]]})
+        status, body, headers = self.request('GET', '/tasks', if_none_match=etag)
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['ETag'], etag)
+
+    def test_conditional_and_repeated_gets_skip_the_query(self):
+        _, first, headers = self.request('GET', '/tasks?page_size=2')
+        etag = headers['ETag']
+        with mock.patch.object(TaskService, 'get_task_rows_page', side_effect=AssertionError("consulta")):
+            self.assertEqual(self.request('GET', '/tasks?page_size=2', if_none_match=etag)[0], 304)
+            status, body, headers = self.request('GET', '/tasks?page_size=2')
+        self.assertEqual((status, body, headers['ETag']), (200, first, etag))
+        self.assertEqual(self.api.responses.stats().hits, 1)
+        self.assertNotEqual(self.request('GET', '/tasks?page_size=3')[2]['ETag'], etag)
+
+        external = TaskService(engine=self.engine, query_cache=False)
+        external.favorite_task(self.ids[2])
+        external.controller.session.close()
+        status, body, headers = self.request('GET', '/tasks?page_size=2', if_none_match=etag)
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['ETag'], etag)
+        self.assertTrue(body['tasks'][0]['favorita'])
+
+    def test_errors(self):
+        self.assertEqual(self.request('POST', '/tasks', {'descripcion': "Sin título"})[0], 400)
+        self.assertEqual(self.request('POST', '/tasks', {'titulo': "X", 'prioridad': 'urgente'})[0], 400)
+        self.assertEqual(self.request('POST', '/tasks', {'titulo': "X", 'fecha_vencimiento': 'mañana'})[0], 400)
+        self.assertEqual(self.request('PATCH', f'/tasks/{self.ids[0]}', {'otro': 1})[0], 400)
+        self.assertEqual(self.request('GET', '/tasks?estado=todas')[0], 400)
+        self.assertEqual(self.request('GET', '/tasks?page_size=0')[0], 400)
+        self.assertEqual(self.request('GET', '/tasks?cursor=roto')[0], 400)
+        self.assertEqual(self.api.handle('POST', '/tasks', b'{no es json')[0], 400)
+        self.assertEqual(self.request('GET', '/otra')[0], 404)
+        self.assertEqual(self.request('PUT', '/tasks')[0], 405)
+
+    def test_wrong_json_types_are_rejected(self):
+        task_id = self.ids[0]
+        for method, target, body in (
+            ('POST', '/tasks', {'titulo': 5}),
+            ('POST', '/tasks', {'titulo': "X", 'descripcion': {'a': 1}}),
+            ('POST', '/tasks', {'titulo': "X", 'categoria': ['hogar']}),
+            ('POST', '/tasks', {'titulo': "X", 'prioridad': 2}),
+            ('PATCH', f'/tasks/{task_id}', {'titulo': 7}),
+            ('PATCH', f'/tasks/{task_id}', {'descripcion': False}),
+        ):
+            with self.subTest(method=method, body=body):
+                status, payload, _ = self.request(method, target, body)
+                self.assertEqual(status, 400)
+                self.assertIn('error', payload)
+        self.assertEqual(self.request('GET', f'/tasks/{task_id}')[1]['titulo'], "Leer libro")
+        self.assertEqual(self.request('PATCH', f'/tasks/{task_id}', {'descripcion': None})[0], 200)
+
+    def test_unexpected_errors_return_json_500(self):
+        with mock.patch.object(TaskService, 'search_task_rows', side_effect=RuntimeError("fallo")), \
+                mock.patch('sys.stderr', new_callable=io.StringIO):
+            status, payload, _ = self.request('GET', '/tasks/search?q=libro')
+        self.assertEqual(status, 500)
+        self.assertEqual(payload, {'error': "Error interno del servidor"})
+
+    def test_pool_options_only_for_queue_pool(self):
+        url = sqlite_url(os.path.join(self.tmp.name, 'tareas.db'))
+        self.assertEqual(_pool_options(url, 4), {'pool_size': 4})
+        self.assertEqual(_pool_options('sqlite://', 4), {})
+        create_db_engine('sqlite://', **_pool_options('sqlite://', 4)).dispose()
+
+    def test_http_server_keep_alive(self):
+        server = make_server(self.engine, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        try:
+            connection.request('GET', '/tasks?page_size=1')
+            response = connection.getresponse()
+            page = json.loads(response.read())
+            self.assertEqual(response.status, 200)
+            self.assertEqual(len(page['tasks']), 1)
+
+            connection.request('GET', '/tasks?page_size=1', headers={'If-None-Match': response.getheader('ETag')})
+            response = connection.getresponse()
+            self.assertEqual((response.status, response.read()), (304, b''))
+
+            connection.request('POST', '/tasks', json.dumps({'titulo': "Por HTTP"}),
+                               {'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            self.assertEqual(response.status, 201)
+            self.assertEqual(json.loads(response.read())['titulo'], "Por HTTP")
+        finally:
+            connection.close()
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
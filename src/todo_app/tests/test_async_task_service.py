@@ -0,0 +1,130 @@
+"""
+Módulo de pruebas unitarias para la clase AsyncTaskService.
+
+Estas pruebas cubren:
+- Paridad de resultados con TaskService en el mismo escenario de operaciones
+- Lectura de tareas devueltas tras el commit fuera de la sesión asíncrona
+- Carga anticipada de recordatorios en modo asíncrono
+- Lectores simultáneos con un servicio por corrutina
+
+Se omiten si no están instalados ``aiosqlite`` y ``greenlet``. Cada prueba
+usa bases SQLite en un directorio temporal.
+"""
+
+import asyncio
+import importlib.util
+import inspect
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+
+from todo_app.models.database import create_db_engine, sqlite_url
+from todo_app.services.task_service import TaskService
+from todo_app.task_list_model import TaskItem
+
+HAS_ASYNC_DRIVER = all(importlib.util.find_spec(name) for name in ('aiosqlite', 'greenlet'))
+
+
+async def run_scenario(service):
+    """Ejecuta las mismas operaciones sobre un servicio síncrono o asíncrono."""
+    async def call(operation, *args, **kwargs):
+        result = getattr(service, operation)(*args, **kwargs)
+        return await result if inspect.isawaitable(result) else result
+
+    def snapshot(tasks):
+        return [TaskItem.from_task(task) for task in tasks]
+
+    results = {}
+    leer = await call('create_task', "Leer libro", "Capítulo 1", date(2025, 6, 3), 'alta', 'estudio')
+    lavar = await call('create_task', "Lavar ropa", "Blanca", date(2025, 6, 1), 'baja', 'hogar')
+    informe = await call('create_task', "Informe", "Trimestral", None, 'media', 'trabajo')
+    results['created'] = [TaskItem.from_task(t) for t in (leer, lavar, informe)]
+
+    await call('update_task', lavar.id, title="Lavar ropa oscura", prioridad='media')
+    await call('complete_task', leer.id)
+    await call('favorite_task', informe.id)
+    results['after_updates'] = snapshot(await call('get_tasks'))
+    results['pendientes'] = snapshot(await call('filter_tasks', estado="pendientes"))
+    results['alta'] = snapshot(await call('filter_tasks', prioridad="alta"))
+    results['search'] = snapshot(await call('search_tasks', "ropa"))
+
+    await call('delete_task', lavar.id)
+    results['after_delete'] = snapshot(await call('get_tasks'))
+    results['trash'] = snapshot(await call('get_tasks', include_deleted=True))
+    await call('restore_task', lavar.id)
+    results['favorites'] = snapshot(await call('get_favorite_tasks'))
+
+    page = await call('get_tasks_page', page_size=2)
+    results['page'] = (snapshot(page.tasks), page.next_cursor)
+    results['batch'] = await call('complete_tasks', [leer.id, lavar.id, informe.id])
+
+    await call('add_reminder', informe.id, datetime(2025, 6, 1, 9, 0))
+    results['summaries'] = await call('get_reminder_summaries', [informe.id, leer.id])
+
+    await call('permanently_delete_task', leer.id)
+    results['final'] = snapshot(await call('get_tasks', include_deleted=True))
+    return results
+
+
+@unittest.skipUnless(HAS_ASYNC_DRIVER, "requiere aiosqlite y greenlet")
+class AsyncTaskServiceTestCase(unittest.IsolatedAsyncioTestCase):
+    """Casos de prueba para la clase AsyncTaskService."""
+
+    async def asyncSetUp(self):
+        """Crea un motor asíncrono sobre una base temporal."""
+        from todo_app.models.database import create_async_db_engine
+        from todo_app.services.async_task_service import AsyncTaskService
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = await create_async_db_engine(sqlite_url(os.path.join(self.tmp.name, 'async.db')))
+        self.service = AsyncTaskService(self.engine)
+        self.make_service = lambda: AsyncTaskService(self.engine)
+
+    async def asyncTearDown(self):
+        """Cierra la sesión, el motor y la base temporal."""
+        await self.service.close()
+        await self.engine.dispose()
+        self.tmp.cleanup()
+
+    async def test_parity_with_sync_service(self):
+        sync_engine = create_db_engine(sqlite_url(os.path.join(self.tmp.name, 'sync.db')))
+        sync_service = TaskService(engine=sync_engine)
+        try:
+            expected = await run_scenario(sync_service)
+        finally:
+            sync_service.controller.session.close()
+            sync_engine.dispose()
+        actual = await run_scenario(self.service)
+        for key in expected:
+            with self.subTest(step=key):
+                self.assertEqual(actual[key], expected[key])
+
+    async def test_listeners_are_notified(self):
+        changes = []
+        self.service.add_change_listener(changes.append)
+        task = await self.service.create_task("Aviso", "Desc", date(2025, 6, 1))
+        await self.service.delete_tasks([task.id])
+        self.assertEqual(changes, [[task.id], [task.id]])
+
+    async def test_with_reminders_is_loaded_eagerly(self):
+        task = await self.service.create_task("Con aviso", "Desc", date(2025, 6, 1))
+        await self.service.add_reminder(task.id, datetime(2025, 6, 1, 8, 0))
+        self.service.session.expunge_all()
+        tasks = await self.service.get_tasks(with_reminders=True)
+        self.assertEqual([r.fecha_hora for r in tasks[0].recordatorios], [datetime(2025, 6, 1, 8, 0)])
+
+    async def test_concurrent_readers(self):
+        for day in range(1, 21):
+            await self.service.create_task(f"Tarea {day}", "Desc", date(2025, 6, day))
+
+        async def reader():
+            async with self.make_service() as service:
+                return len(await service.filter_tasks(estado="pendientes"))
+
+        counts = await asyncio.gather(*(reader() for _ in range(25)))
+        self.assertEqual(counts, [20] * 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Módulo de pruebas unitarias para la importación y exportación masiva.
+
+Estas pruebas cubren:
+- Importar tareas desde CSV y JSON Lines
+- Validación de prioridad, categoría, fechas y campos obligatorios
+- Valores null de JSON Lines tratados como el valor por defecto
+- Inserción por lotes con una transacción por lote
+- Lote rechazado por la base: reversión y número de tareas ya guardadas
+- Exportación en flujo e ida y vuelta de los datos, incluidas las tareas de la papelera
+- Errores de archivo de la línea de comandos sin traza
+
+Se utiliza una base de datos SQLite en memoria para aislamiento de pruebas.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from todo_app import cli
+from todo_app.models.models import Base, Categoria, NivelPrioridad
+from todo_app.repositories import bulk
+from todo_app.repositories.controllers import TaskController
+
+CSV_DATA = """titulo,descripcion,fecha_vencimiento,prioridad,categoria,completada,favorita
+Informe,Mensual,2025-07-01,Alta,trabajo,false,true
+Barrer,,,baja,Hogar,1,0
+Repasar,Capítulo 3,2025-07-03,,,,
+"""
+
+
+class BulkTestCase(unittest.TestCase):
+    """Casos de prueba para el módulo bulk."""
+
+    def setUp(self):
+        """Configura una base de datos SQLite en memoria antes de cada prueba."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.controller = TaskController(session=self.session)
+
+    def tearDown(self):
+        """Cierra la sesión al finalizar cada prueba."""
+        self.session.close()
+
+    def test_import_csv(self):
+        count = bulk.import_tasks(self.session, bulk.read_records(io.StringIO(CSV_DATA), 'csv'))
+        self.assertEqual(count, 3)
+        tasks = {t.titulo: t for t in self.controller.get_tasks()}
+        self.assertEqual(tasks["Informe"].prioridad, NivelPrioridad.alta)
+        self.assertEqual(tasks["Informe"].categoria, Categoria.trabajo)
+        self.assertTrue(tasks["Informe"].favorita)
+        self.assertTrue(tasks["Barrer"].completada)
+        self.assertIsNone(tasks["Barrer"].fecha_vencimiento)
+        self.assertEqual(tasks["Repasar"].prioridad, NivelPrioridad.media)
+        self.assertFalse(tasks["Repasar"].eliminada)
+        self.assertEqual(len(self.controller.search_tasks("capitulo")), 1)
+
+    def test_import_commits_once_per_batch(self):
+        lines = "\n".join(json.dumps({"titulo": f"T{i}"}) for i in range(10))
+        commits = []
+        event.listen(self.engine, 'commit', lambda conn: commits.append(1))
+        count = bulk.import_tasks(self.session, bulk.read_records(io.StringIO(lines), 'jsonl'), batch_size=4)
+        self.assertEqual(count, 10)
+        self.assertEqual(len(commits), 3)
+        self.assertEqual(len(self.controller.get_tasks()), 10)
+
+    def test_rejected_batch_rolls_back_and_reports_saved_tasks(self):
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TRIGGER rechazar BEFORE INSERT ON tareas WHEN NEW.titulo = 'Mala' "
+                "BEGIN SELECT RAISE(ABORT, 'rechazada'); END"
+            ))
+        lines = "\n".join(json.dumps({"titulo": title}) for title in ("A", "B", "C", "Mala", "D"))
+        with self.assertRaises(bulk.BulkImportError) as caught:
+            bulk.import_tasks(self.session, bulk.read_records(io.StringIO(lines), 'jsonl'), batch_size=2)
+        self.assertEqual(caught.exception.inserted, 2)
+        self.assertIn("2 tareas", str(caught.exception))
+        self.assertFalse(self.session.in_transaction())
+        self.assertEqual(sorted(t.titulo for t in self.controller.get_tasks()), ["A", "B"])
+
+    def test_json_nulls_use_defaults(self):
+        line = json.dumps({"titulo": "Nula", "descripcion": None, "prioridad": None, "categoria": None,
+                           "completada": None, "favorita": None, "eliminada": None})
+        self.assertEqual(bulk.import_tasks(self.session, bulk.read_records(io.StringIO(line), 'jsonl')), 1)
+        task = self.controller.get_tasks()[0]
+        self.assertEqual((task.prioridad, task.completada, task.favorita, task.eliminada),
+                         (NivelPrioridad.media, False, False, False))
+
+    def test_invalid_priority_reports_line(self):
+        data = CSV_DATA + "Mala,,,urgente,,,\n"
+        with self.assertRaisesRegex(ValueError, "Línea 5: prioridad inválida"):
+            bulk.import_tasks(self.session, bulk.read_records(io.StringIO(data), 'csv'))
+
+    def test_invalid_rows(self):
+        for record in ({"titulo": ""}, {"titulo": "X", "categoria": "ocio"},
+                       {"titulo": "X", "fecha_vencimiento": "31/12/2025"},
+                       {"titulo": "X", "completada": "quizás"}):
+            with self.subTest(record=record), self.assertRaises(ValueError):
+                bulk.parse_record(record, 1)
+
+    def test_export_round_trip(self):
+        self.controller.add_task("Uno", "Desc", date(2025, 1, 2), prioridad='alta', categoria='estudio')
+        self.controller.add_task("Dos", None, None)
+        for fmt in bulk.FORMATS:
+            with self.subTest(fmt=fmt):
+                out = io.StringIO()
+                self.assertEqual(bulk.export_tasks(self.session, out, fmt), 2)
+                out.seek(0)
+                records = [parse for _, parse in bulk.read_records(out, fmt)]
+                parsed = [bulk.parse_record(record) for record in records]
+                self.assertEqual(parsed[0]['prioridad'], NivelPrioridad.alta)
+                self.assertEqual(parsed[0]['fecha_vencimiento'], date(2025, 1, 2))
+                self.assertIsNone(parsed[1]['descripcion'])
+
+    def test_export_skips_deleted(self):
+        task = self.controller.add_task("Borrada", "Desc", date.today())
+        self.controller.delete_task(task.id)
+        self.assertEqual(bulk.export_tasks(self.session, io.StringIO(), 'jsonl'), 0)
+        self.assertEqual(bulk.export_tasks(self.session, io.StringIO(), 'jsonl', include_deleted=True), 1)
+
+    def test_deleted_tasks_round_trip(self):
+        self.controller.add_task("Activa", "Desc", None)
+        deleted = self.controller.add_task("Borrada", "Desc", None)
+        self.controller.delete_task(deleted.id)
+        for fmt in bulk.FORMATS:
+            with self.subTest(fmt=fmt):
+                out = io.StringIO()
+                bulk.export_tasks(self.session, out, fmt, include_deleted=True)
+                out.seek(0)
+                target = sessionmaker(bind=self._empty_engine())()
+                self.assertEqual(bulk.import_tasks(target, bulk.read_records(out, fmt)), 2)
+                imported = TaskController(session=target).get_tasks(include_deleted=True)
+                self.assertEqual({t.titulo: t.eliminada for t in imported}, {"Activa": False, "Borrada": True})
+                target.close()
+
+    def _empty_engine(self):
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine)
+        return engine
+
+    def test_cli_reports_file_errors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = os.path.join(tmp, 'tareas.db')
+            for argv in (['--db', db, 'import', os.path.join(tmp, 'no_existe.csv')],
+                         ['--db', db, 'export', os.path.join(tmp, 'falta', 'copia.jsonl')]):
+                with self.subTest(argv=argv[2]):
+                    stderr = io.StringIO()
+                    with contextlib.redirect_stderr(stderr):
+                        self.assertEqual(cli.main(argv), 1)
+                    self.assertIn('Error:', stderr.getvalue())
+
+    def test_detect_format(self):
+        self.assertEqual(bulk.detect_format("a.CSV"), 'csv')
+        self.assertEqual(bulk.detect_format("a.ndjson"), 'jsonl')
+        with self.assertRaises(ValueError):
+            bulk.detect_format("a.xlsx")
+
+
+if __name__ == '__main__':
+    unittest.main()
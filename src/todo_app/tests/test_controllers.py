@@ -8,17 +8,31 @@ Estas pruebas cubren:
 - Filtrar por estado, prioridad y categoría
 - Casos adicionales como tareas sin categoría o restaurar no eliminadas
 - Casos extremos: duplicados, tareas ya completadas o eliminadas, filtros inválidos
+- Carga anticipada de recordatorios con un número constante de consultas
+- Contadores del panel de resumen en una única consulta agrupada y listado de la papelera
+- Modelo de lectura (TaskRow) equivalente a los listados del ORM y sin entidades en la sesión
+- Registro de cambios (changes_since): creadas, modificadas y borradas, por páginas y por índice,
+  en el orden de las versiones de tareas_cambios y no del reloj de actualizada_en
+- Búsqueda por páginas: por relevancia, o de la más reciente a la más antigua si es muy amplia
+- Vistas por fecha (vencidas, hoy, esta semana, próximas, sin fecha): intervalos, páginas
+  por índice y recuentos en una única consulta agrupada
 
 Se utiliza una base de datos SQLite en memoria para aislamiento de pruebas.
 """
 
+import itertools
 import unittest
-from datetime import date
-from sqlalchemy import create_engine
+from datetime import date, datetime, timedelta
+from unittest import mock
+from sqlalchemy import create_engine, delete, event, insert, inspect, update
 from sqlalchemy.orm import sessionmaker
 
-from todo_app.models.models import Base, NivelPrioridad, Categoria
-from todo_app.repositories.controllers import TaskController
+from todo_app.models.fts import ensure_search_index
+from todo_app.models.models import Base, CambioTarea, NivelPrioridad, Categoria, Tarea, upgrade_schema
+from todo_app.repositories.controllers import (
+    DATE_VIEWS, NO_REMINDERS, DateViewCounts, ReminderSummary, TaskController, TaskRow, TaskStats,
+    date_view_range, decode_change_token, due_in_range
+)
 
 
 class TaskControllerTestCase(unittest.TestCase):
@@ -28,10 +42,10 @@ class TaskControllerTestCase(unittest.TestCase):
         """Configura una base de datos SQLite en memoria antes de cada prueba."""
         engine = create_engine('sqlite:///:memory:')
         Base.metadata.create_all(engine)
+        self.engine = engine
         TestingSession = sessionmaker(bind=engine)
         self.session = TestingSession()
-        self.controller = TaskController()
-        self.controller.session = self.session
+        self.controller = TaskController(session=self.session)
 
     def tearDown(self):
         """Cierra la sesión al finalizar cada prueba."""
@@ -243,6 +257,583 @@ class TaskControllerTestCase(unittest.TestCase):
         self.assertEqual(task.prioridad, NivelPrioridad.alta)
         self.assertEqual(task.categoria, Categoria.estudio)
 
+    # BÚSQUEDA DE TEXTO COMPLETO (FTS5)
+
+    def test_search_ignores_accents(self):
+        self.controller.add_task("Ensayar canción", "Coro", date.today())
+        self.assertEqual(len(self.controller.search_tasks("cancion")), 1)
+        self.controller.add_task("Cancion nueva", "Sin tilde", date.today())
+        self.assertEqual(len(self.controller.search_tasks("canción")), 2)
+
+    def test_search_prefix_and_all_words(self):
+        self.controller.add_task("Proyecto final", "Informática", date.today())
+        self.controller.add_task("Proyecto casa", "Pintar", date.today())
+        self.assertEqual(len(self.controller.search_tasks("proy")), 2)
+        results = self.controller.search_tasks("proy inform")
+        self.assertEqual([t.titulo for t in results], ["Proyecto final"])
+
+    def test_search_ranks_better_matches_first(self):
+        self.controller.add_task("Comprar pan", "Ir al mercado", date.today())
+        self.controller.add_task("Mercado", "Mercado mercado semanal", date.today())
+        results = self.controller.search_tasks("mercado")
+        self.assertEqual(results[0].titulo, "Mercado")
+
+    def test_search_index_follows_updates_and_deletes(self):
+        self.controller.add_task("Viejo", "Desc", date.today())
+        task = self.controller.get_tasks()[0]
+        self.controller.update_task(task.id, title="Renovado")
+        self.assertEqual(len(self.controller.search_tasks("viejo")), 0)
+        self.assertEqual(len(self.controller.search_tasks("renovado")), 1)
+        self.controller.delete_task(task.id)
+        self.assertEqual(len(self.controller.search_tasks("renovado")), 0)
+
+    def test_search_without_words_returns_empty(self):
+        self.controller.add_task("Algo", "Desc", date.today())
+        self.assertEqual(self.controller.search_tasks("  ¿? "), [])
+
+    def test_ensure_search_index_rebuilds_existing_database(self):
+        self.controller.add_task("Antigua", "Creada antes del índice", date.today())
+        self.session.commit()
+        with self.engine.begin() as connection:
+            for name in ("ai", "ad", "au"):
+                connection.exec_driver_sql(f"DROP TRIGGER tareas_fts_{name}")
+            connection.exec_driver_sql("DROP TABLE tareas_fts")
+        ensure_search_index(self.engine)
+        self.assertEqual(len(self.controller.search_tasks("antigua")), 1)
+
+    def test_ensure_search_index_adds_prefix_indexes(self):
+        self.controller.add_task("Antigua", "Índice sin prefijos", date.today())
+        self.session.commit()
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql("DROP TABLE tareas_fts")
+            connection.exec_driver_sql(
+                "CREATE VIRTUAL TABLE tareas_fts USING fts5(titulo, descripcion, "
+                "content='tareas', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+            )
+        ensure_search_index(self.engine)
+        with self.engine.connect() as connection:
+            sql = connection.exec_driver_sql("SELECT sql FROM sqlite_master WHERE name = 'tareas_fts'").scalar()
+        self.assertIn("prefix='1 2'", sql)
+        self.assertEqual(len(self.controller.search_tasks("a")), 1)
+
+    def _search_pages(self, keyword, page_size):
+        ids, cursor = [], None
+        while True:
+            page = self.controller.page_search_task_rows(keyword, cursor, page_size)
+            self.assertTrue(all(isinstance(row, TaskRow) for row in page.tasks))
+            ids.extend(row.id for row in page.tasks)
+            if page.next_cursor is None:
+                return ids
+            cursor = page.next_cursor
+
+    def test_page_search_task_rows_follows_rank(self):
+        for i in range(7):
+            self.controller.add_task(f"Mercado {i}", "mercado " * (i % 3), date.today())
+        trashed = self.controller.add_task("Mercado borrado", "Desc", date.today())
+        self.controller.delete_task(trashed.id)
+        expected = [row.id for row in self.controller.search_task_rows("merc")]
+        self.assertNotIn(trashed.id, expected)
+        for page_size in (1, 3, 7, 50):
+            with self.subTest(page_size=page_size):
+                self.assertEqual(self._search_pages("merc", page_size), expected)
+        self.assertEqual(self.controller.page_search_task_rows("¿?"), ([], None))
+
+    def test_page_search_task_rows_broad_query_lists_newest_first(self):
+        ids = [self.controller.add_task(f"Informe {i}", "Desc", date.today()).id for i in range(6)]
+        self.controller.delete_task(ids[2])
+        with mock.patch('todo_app.repositories.controllers.SEARCH_RANK_LIMIT', 3):
+            self.assertEqual(self._search_pages("inf", 2), [ids[5], ids[4], ids[3], ids[1], ids[0]])
+        with self.assertRaises(ValueError):
+            self.controller.page_search_task_rows("inf", cursor="no-es-un-cursor")
+
+    def test_page_search_task_rows_prefix_last(self):
+        self.controller.add_task("Proyecto final", "Informática", date.today())
+        self.assertEqual(len(self.controller.page_search_task_rows("proy inf").tasks), 1)
+        self.assertEqual(self.controller.page_search_task_rows("proy inf", prefix_last=True).tasks, [])
+        found = self.controller.page_search_task_rows("proyecto inf", prefix_last=True).tasks
+        self.assertEqual([row.titulo for row in found], ["Proyecto final"])
+
+    # ÍNDICES Y PLAN DE CONSULTAS
+
+    def _query_plan(self, action, statement=-1):
+        """Ejecuta ``action`` y devuelve el plan de una de sus consultas (por defecto, la última)."""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(self.engine, 'before_cursor_execute', capture)
+        try:
+            action()
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', capture)
+        statement, parameters = statements[statement]
+        with self.engine.connect() as connection:
+            rows = connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).fetchall()
+        return [row[-1] for row in rows]
+
+    def test_filter_combinations_use_index(self):
+        estados = [None, 'completadas', 'pendientes']
+        prioridades = [None] + [p.name for p in NivelPrioridad]
+        categorias = [None] + [c.name for c in Categoria]
+        for estado, prioridad, categoria in itertools.product(estados, prioridades, categorias):
+            plan = self._query_plan(lambda: self.controller.filter_tasks(estado, prioridad, categoria))
+            with self.subTest(estado=estado, prioridad=prioridad, categoria=categoria):
+                self.assertTrue(any('USING' in step and 'INDEX' in step for step in plan), plan)
+
+    def test_get_tasks_uses_index(self):
+        plan = self._query_plan(self.controller.get_tasks)
+        self.assertTrue(any('INDEX' in step for step in plan), plan)
+
+    def test_upgrade_schema_adds_missing_indexes(self):
+        engine = create_engine('sqlite:///:memory:')
+        Tarea.__table__.create(engine)
+        with engine.begin() as connection:
+            for index in Tarea.__table__.indexes:
+                connection.exec_driver_sql(f'DROP INDEX {index.name}')
+        upgrade_schema(engine)
+        existing = {index['name'] for index in inspect(engine).get_indexes('tareas')}
+        self.assertTrue({index.name for index in Tarea.__table__.indexes} <= existing)
+
+    # PAGINACIÓN POR CLAVE Y RECORRIDO EN LOTES
+
+    def test_page_tasks_walks_all_pages_in_order(self):
+        self.controller.add_task("Sin fecha", "Desc", None)
+        for day in (5, 3, 3, 1, 9):
+            self.controller.add_task(f"Día {day}", "Desc", date(2025, 1, day))
+        seen, cursor = [], None
+        while True:
+            page = self.controller.page_tasks(cursor, page_size=2)
+            seen.extend(page.tasks)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual([t.id for t in seen], [t.id for t in self.controller.get_tasks()])
+        self.assertEqual(len(seen), 6)
+        self.assertIsNone(seen[0].fecha_vencimiento)
+        dates = [t.fecha_vencimiento for t in seen[1:]]
+        self.assertEqual(dates, sorted(dates))
+
+    def test_page_tasks_respects_filters(self):
+        self.controller.add_task("A", "Desc", date.today(), prioridad='alta')
+        self.controller.add_task("B", "Desc", date.today(), prioridad='baja')
+        self.controller.add_task("C", "Desc", date.today(), prioridad='alta')
+        page = self.controller.page_tasks(page_size=1, prioridad='alta')
+        self.assertEqual([t.titulo for t in page.tasks], ["A"])
+        page = self.controller.page_tasks(page.next_cursor, page_size=1, prioridad='alta')
+        self.assertEqual([t.titulo for t in page.tasks], ["C"])
+        self.assertIsNone(page.next_cursor)
+
+    def test_page_tasks_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            self.controller.page_tasks("no-es-un-cursor")
+
+    def test_iter_tasks_matches_get_tasks(self):
+        for i in range(7):
+            self.controller.add_task(f"T{i}", "Desc", date(2025, 2, 7 - i))
+        streamed = list(self.controller.iter_tasks(batch_size=3))
+        self.assertEqual([t.id for t in streamed], [t.id for t in self.controller.get_tasks()])
+
+    # OPERACIONES EN LOTE
+
+    def _add_many(self, count):
+        for i in range(count):
+            self.controller.add_task(f"Lote {i}", "Desc", date.today(), prioridad='baja' if i % 2 else 'alta')
+        return [t.id for t in self.controller.get_tasks()]
+
+    def test_complete_tasks_by_ids(self):
+        ids = self._add_many(4)
+        self.assertEqual(self.controller.complete_tasks(ids[:3]), 3)
+        self.assertEqual(len(self.controller.filter_tasks(estado="completadas")), 3)
+        self.assertEqual(self.controller.complete_tasks(ids), 1)
+
+    def test_delete_and_restore_tasks(self):
+        ids = self._add_many(3)
+        self.assertEqual(self.controller.delete_tasks(ids + ids), 3)
+        self.assertEqual(self.controller.get_tasks(), [])
+        self.assertEqual(self.controller.restore_tasks(ids[:2]), 2)
+        self.assertEqual(len(self.controller.get_tasks()), 2)
+
+    def test_favorite_tasks_with_predicate(self):
+        self._add_many(4)
+        changed = self.controller.favorite_tasks(where=Tarea.prioridad == NivelPrioridad.alta)
+        self.assertEqual(changed, 2)
+        favoritas = [t for t in self.controller.get_tasks() if t.favorita]
+        self.assertEqual({t.prioridad for t in favoritas}, {NivelPrioridad.alta})
+        self.assertEqual(self.controller.favorite_tasks(where=Tarea.favorita.is_(True), is_favorite=False), 2)
+
+    def test_batch_update_chunks_in_single_transaction(self):
+        from todo_app.repositories import controllers
+        ids = self._add_many(5)
+        statements, commits = [], []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, 'before_cursor_execute', capture)
+        event.listen(self.engine, 'commit', lambda conn: commits.append(1))
+        original = controllers.MUTATION_CHUNK_SIZE
+        controllers.MUTATION_CHUNK_SIZE = 2
+        try:
+            self.assertEqual(self.controller.delete_tasks(ids), 5)
+        finally:
+            controllers.MUTATION_CHUNK_SIZE = original
+        self.assertEqual(len([s for s in statements if s.startswith('UPDATE')]), 3)
+        self.assertEqual(len(commits), 1)
+
+    def test_batch_update_requires_target(self):
+        with self.assertRaises(ValueError):
+            self.controller.complete_tasks()
+
+    # CARGA DE RECORDATORIOS
+
+    def _add_with_reminders(self, count, per_task=2):
+        start = datetime(2025, 4, 1, 8, 0)
+        for i in range(count):
+            task = self.controller.add_task(f"Aviso {i}", "Desc", date(2025, 4, 1))
+            for hour in range(per_task):
+                self.controller.add_reminder(task.id, start + timedelta(hours=hour + i))
+        self.session.expire_all()
+
+    def _count_selects(self, fn):
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('SELECT'):
+                statements.append(statement)
+
+        event.listen(self.engine, 'before_cursor_execute', capture)
+        try:
+            fn()
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', capture)
+        return len(statements)
+
+    def _touch_reminders(self, tasks):
+        return sum(len(task.recordatorios) for task in tasks)
+
+    def test_lazy_reminders_issue_one_query_per_task(self):
+        self._add_with_reminders(5)
+        count = self._count_selects(lambda: self._touch_reminders(self.controller.get_tasks()))
+        self.assertEqual(count, 1 + 5)
+
+    def test_listings_with_reminders_use_constant_queries(self):
+        for total in (5, 20):
+            self._add_with_reminders(total - len(self.controller.get_tasks()))
+            listings = {
+                'get_tasks': lambda: self.controller.get_tasks(with_reminders=True),
+                'filter_tasks': lambda: self.controller.filter_tasks(estado="pendientes", with_reminders=True),
+                'page_tasks': lambda: self.controller.page_tasks(page_size=50, with_reminders=True).tasks,
+                'search_tasks': lambda: self.controller.search_tasks("aviso", with_reminders=True),
+            }
+            for name, listing in listings.items():
+                with self.subTest(listing=name, total=total):
+                    self.session.expire_all()
+                    touched = []
+                    count = self._count_selects(lambda: touched.append(self._touch_reminders(listing())))
+                    self.assertEqual(count, 2)
+                    self.assertEqual(touched, [2 * total])
+
+    def test_reminder_summaries_single_grouped_query(self):
+        self._add_with_reminders(3)
+        task_ids = [task.id for task in self.controller.get_tasks()]
+        first = self.session.get(Tarea, task_ids[0])
+        first.recordatorios[0].notificado = True
+        self.session.commit()
+        empty_id = self.controller.add_task("Sin avisos", "Desc", None).id
+
+        summaries = {}
+        count = self._count_selects(
+            lambda: summaries.update(self.controller.reminder_summaries(task_ids + [empty_id]))
+        )
+        self.assertEqual(count, 1)
+        self.assertEqual(summaries[task_ids[0]], ReminderSummary(1, datetime(2025, 4, 1, 9, 0)))
+        self.assertEqual(summaries[task_ids[2]], ReminderSummary(2, datetime(2025, 4, 1, 10, 0)))
+        self.assertEqual(summaries[empty_id], NO_REMINDERS)
+
+
+    # PANEL DE RESUMEN
+
+    def test_stats_single_grouped_query(self):
+        today = date(2025, 6, 10)
+        self.controller.add_task("Vencida", "Desc", date(2025, 6, 1), prioridad='alta', categoria='trabajo')
+        self.controller.add_task("Hoy", "Desc", today, prioridad='alta', categoria='hogar')
+        done = self.controller.add_task("Hecha", "Desc", date(2025, 6, 1), prioridad='baja')
+        fav = self.controller.add_task("Favorita", "Desc", None, categoria='trabajo')
+        gone = self.controller.add_task("Borrada", "Desc", date(2025, 6, 1), prioridad='alta')
+        self.controller.complete_task(done.id)
+        self.controller.favorite_task(fav.id)
+        self.controller.delete_task(gone.id)
+
+        stats = []
+        count = self._count_selects(lambda: stats.append(self.controller.stats(today)))
+        self.assertEqual(count, 1)
+        self.assertEqual(stats[0], TaskStats(
+            total=4, pending=3, completed=1, overdue=1, favorites=1, deleted=1,
+            by_priority={'baja': 1, 'media': 1, 'alta': 2},
+            by_category={'trabajo': 2, 'hogar': 1, 'estudio': 0, None: 1},
+        ))
+
+    def test_stats_empty(self):
+        stats = self.controller.stats()
+        self.assertEqual((stats.total, stats.deleted), (0, 0))
+        self.assertEqual(set(stats.by_priority.values()), {0})
+
+    def test_page_tasks_only_deleted(self):
+        kept = self.controller.add_task("Activa", "Desc", date.today())
+        gone = self.controller.add_task("Borrada", "Desc", date.today())
+        self.controller.delete_task(gone.id)
+        page = self.controller.page_tasks(only_deleted=True)
+        self.assertEqual([t.id for t in page.tasks], [gone.id])
+        self.assertNotIn(kept.id, [t.id for t in page.tasks])
+
+    # VISTAS POR FECHA
+
+    def test_date_view_range(self):
+        wednesday = date(2025, 6, 4)
+        self.assertEqual(date_view_range('vencidas', wednesday), (None, date(2025, 6, 3)))
+        self.assertEqual(date_view_range('hoy', wednesday), (wednesday, wednesday))
+        self.assertEqual(date_view_range('semana', wednesday), (wednesday, date(2025, 6, 8)))
+        self.assertEqual(date_view_range('semana', date(2025, 6, 8)), (date(2025, 6, 8), date(2025, 6, 8)))
+        self.assertEqual(date_view_range('proximas', wednesday, days=3), (date(2025, 6, 5), date(2025, 6, 7)))
+        self.assertIsNone(date_view_range('sin_fecha', wednesday))
+        with self.assertRaises(ValueError):
+            date_view_range('mañana', wednesday)
+
+    def _add_dated(self, today):
+        for offset in (-9, -1, 0, 0, 1, 4, 5, 7, 8, 30, None, None):
+            due = today + timedelta(days=offset) if offset is not None else None
+            self.controller.add_task(f"Día {offset}", "Desc", due)
+        done = self.controller.add_task("Hecha", "Desc", today)
+        gone = self.controller.add_task("Borrada", "Desc", today - timedelta(days=1))
+        self.controller.complete_task(done.id)
+        self.controller.delete_task(gone.id)
+
+    def test_page_date_view_walks_range_in_order(self):
+        today = date(2025, 6, 4)
+        self._add_dated(today)
+        tasks = self.controller.get_tasks()
+        for vista in DATE_VIEWS:
+            date_range = date_view_range(vista, today)
+            expected = sorted(
+                ((t.fecha_vencimiento or date.min, t.id) for t in tasks
+                 if not t.completada and due_in_range(t.fecha_vencimiento, date_range)),
+            )
+            seen, cursor = [], None
+            while True:
+                page = self.controller.page_date_view(vista, cursor, page_size=2, today=today)
+                seen.extend((row.fecha_vencimiento or date.min, row.id) for row in page.tasks)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+            with self.subTest(vista=vista):
+                self.assertEqual(seen, expected)
+
+    def test_date_view_counts_single_grouped_query(self):
+        today = date(2025, 6, 4)
+        self._add_dated(today)
+        counts = []
+        self.assertEqual(self._count_selects(lambda: counts.append(self.controller.date_view_counts(today))), 1)
+        self.assertEqual(counts[0], DateViewCounts(overdue=2, today=2, week=4, upcoming=4, no_date=2))
+        for vista, count in zip(DATE_VIEWS, counts[0]):
+            with self.subTest(vista=vista):
+                self.assertEqual(len(self.controller.page_date_view(vista, page_size=100, today=today).tasks), count)
+        self.assertEqual(self.controller.date_view_counts(today, days=30).upcoming, 6)
+        self.assertEqual(self.controller.stats(today).overdue, counts[0].overdue)
+
+    def test_date_views_use_index(self):
+        today = date(2025, 6, 4)
+        index = 'ix_tareas_eliminada_completada_vencimiento'
+        for vista in DATE_VIEWS:
+            plan = self._query_plan(lambda: self.controller.page_date_view(vista, today=today))
+            with self.subTest(vista=vista):
+                self.assertTrue(any(index in step for step in plan), plan)
+                self.assertFalse(any('TEMP B-TREE' in step for step in plan), plan)
+        plan = self._query_plan(lambda: self.controller.date_view_counts(today))
+        self.assertTrue(all(index in step for step in plan if 'tareas' in step), plan)
+        self.assertTrue(any('COVERING INDEX' in step for step in plan), plan)
+
+    # MODELO DE LECTURA
+
+    def _add_mixed(self):
+        for i in range(12):
+            task = self.controller.add_task(
+                f"Tarea {i} informe", "Desc", date(2025, 1, 1 + i % 4) if i % 5 else None,
+                prioridad=['baja', 'media', 'alta'][i % 3], categoria=['trabajo', 'hogar', None][i % 3]
+            )
+            if i % 4 == 0:
+                self.controller.complete_task(task.id)
+            if i % 6 == 0:
+                self.controller.delete_task(task.id)
+
+    def test_task_rows_match_orm_listings(self):
+        self._add_mixed()
+        cases = [
+            {}, {'estado': 'pendientes'}, {'estado': 'completadas', 'prioridad': 'alta'},
+            {'categoria': 'hogar'}, {'include_deleted': True}, {'only_deleted': True},
+        ]
+        for filters in cases:
+            with self.subTest(**filters):
+                expected = [TaskRow.from_task(t) for t in self.controller.page_tasks(page_size=100, **filters).tasks]
+                self.assertEqual(self.controller.get_task_rows(**filters), expected)
+        search = [TaskRow.from_task(t) for t in self.controller.search_tasks("informe")]
+        self.assertEqual(self.controller.search_task_rows("informe"), search)
+
+    def test_page_task_rows_walks_all_pages(self):
+        self._add_mixed()
+        seen, cursor = [], None
+        while True:
+            page = self.controller.page_task_rows(cursor, page_size=5)
+            seen.extend(page.tasks)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(seen, self.controller.get_task_rows())
+        self.assertEqual(self.controller.page_tasks(page_size=5).next_cursor,
+                         self.controller.page_task_rows(page_size=5).next_cursor)
+
+    def test_task_rows_are_not_tracked_by_session(self):
+        self._add_mixed()
+        self.session.expunge_all()
+        rows = self.controller.get_task_rows(include_deleted=True)
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(len(self.session.identity_map), 0)
+        self.assertIsInstance(rows[0].prioridad, NivelPrioridad)
+        self.assertFalse(hasattr(rows[0], '__dict__'))
+
+    def test_task_rows_by_ids(self):
+        self._add_mixed()
+        ids = [row.id for row in self.controller.get_task_rows(include_deleted=True)][:3]
+        rows = self.controller.get_task_rows_by_ids(ids + [9999])
+        self.assertEqual(sorted(row.id for row in rows), sorted(ids))
+
+    # REGISTRO DE CAMBIOS
+
+    def test_changes_since_start_returns_everything_as_created(self):
+        ids = [self.controller.add_task(f"Tarea {i}", "Desc", None).id for i in range(3)]
+        self.controller.delete_task(ids[0])
+        changes = self.controller.changes_since()
+        self.assertEqual(sorted(row.id for row in changes.created), ids)
+        self.assertEqual((changes.updated, changes.deleted, changes.has_more), ([], [], False))
+        self.assertEqual(self.controller.changes_since(changes.token)[:3], ([], [], []))
+
+    def test_changes_since_token_classifies_changes(self):
+        edited, trashed, done, purged = (
+            self.controller.add_task(f"Tarea {i}", "Desc", None) for i in range(4)
+        )
+        purged_id = purged.id
+        token = self.controller.current_change_token()
+
+        created = self.controller.add_task("Nueva", "Desc", date(2025, 6, 1))
+        self.controller.update_task(edited.id, title="Editada")
+        self.controller.delete_task(trashed.id)
+        self.controller.complete_tasks([done.id])
+        self.session.execute(delete(Tarea).where(Tarea.id == purged_id))
+        self.session.commit()
+
+        changes = self.controller.changes_since(token)
+        self.assertEqual([row.id for row in changes.created], [created.id])
+        self.assertEqual(sorted(row.id for row in changes.updated), sorted([edited.id, trashed.id, done.id]))
+        updated = {row.id: row for row in changes.updated}
+        self.assertEqual(updated[edited.id].titulo, "Editada")
+        self.assertTrue(updated[trashed.id].eliminada)
+        self.assertTrue(updated[done.id].completada)
+        self.assertEqual(changes.deleted, [purged_id])
+        self.assertEqual(self.controller.changes_since(changes.token)[:3], ([], [], []))
+
+    def test_changes_since_pages_with_limit(self):
+        ids = [self.controller.add_task(f"Tarea {i}", "Desc", None).id for i in range(5)]
+        token = self.controller.current_change_token()
+        for task_id in ids[:3]:
+            self.session.delete(self.session.get(Tarea, task_id))
+        self.session.commit()
+        self.controller.complete_tasks(ids[3:])
+
+        updated, deleted, rounds = [], [], 0
+        while True:
+            changes = self.controller.changes_since(token, limit=2)
+            updated += [row.id for row in changes.updated]
+            deleted += changes.deleted
+            token, rounds = changes.token, rounds + 1
+            if not changes.has_more:
+                break
+        self.assertEqual((sorted(updated), deleted, rounds), (ids[3:], ids[:3], 2))
+
+    def test_changes_since_uses_index(self):
+        self.controller.add_task("Tarea", "Desc", None)
+        token = self.controller.current_change_token()
+        plan = self._query_plan(lambda: self.controller.changes_since(token), statement=0)
+        self.assertTrue(any('tareas_cambios' in step and 'PRIMARY KEY' in step for step in plan), plan)
+        self.assertFalse(any(step.startswith('SCAN') for step in plan), plan)
+
+    def test_changes_since_ignores_client_clock(self):
+        # Una escritura con una marca de tiempo anterior al token (un volcado
+        # que se confirma tarde, o un reloj que retrocede) se entrega igual.
+        old, edited = (self.controller.add_task(f"Tarea {i}", "Desc", None) for i in range(2))
+        token = self.controller.current_change_token()
+        past = datetime(2000, 1, 1)
+        self.session.execute(update(Tarea).where(Tarea.id == edited.id).values(titulo="Tarde", actualizada_en=past))
+        self.session.execute(insert(Tarea).values(titulo="Antigua", creada_en=past, actualizada_en=past))
+        self.session.commit()
+
+        changes = self.controller.changes_since(token)
+        self.assertEqual([row.titulo for row in changes.created], ["Antigua"])
+        self.assertEqual([row.titulo for row in changes.updated], ["Tarde"])
+        self.assertNotIn(old.id, [row.id for row in changes.created + changes.updated])
+
+    def test_changes_since_classifies_by_version_not_creada_en(self):
+        task = self.controller.add_task("Tarea", "Desc", None)
+        token = self.controller.current_change_token()
+        self.session.execute(update(Tarea).where(Tarea.id == task.id).values(creada_en=datetime(2999, 1, 1)))
+        self.session.commit()
+        changes = self.controller.changes_since(token)
+        self.assertEqual(([row.id for row in changes.created], [row.id for row in changes.updated]),
+                         ([], [task.id]))
+
+    def test_change_log_keeps_one_row_per_task(self):
+        task = self.controller.add_task("Tarea", "Desc", None)
+        for i in range(3):
+            self.controller.update_task(task.id, title=f"Edición {i}")
+        self.assertEqual(self.session.query(CambioTarea).filter_by(tarea_id=task.id).count(), 1)
+        self.session.execute(delete(Tarea).where(Tarea.id == task.id))
+        self.session.commit()
+        self.assertEqual(self.session.query(CambioTarea).count(), 0)
+
+    def test_changes_since_invalid_token(self):
+        with self.assertRaises(ValueError):
+            self.controller.changes_since("no-es-un-token")
+        self.assertEqual(decode_change_token(self.controller.current_change_token()), (0, 0))
+
+    def test_upgrade_schema_adds_tombstone_trigger(self):
+        engine = create_engine('sqlite:///:memory:')
+        Tarea.__table__.create(engine)
+        upgrade_schema(engine)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("INSERT INTO tareas (titulo) VALUES ('x')")
+            connection.exec_driver_sql("DELETE FROM tareas")
+            self.assertEqual(connection.exec_driver_sql("SELECT tarea_id FROM tareas_borradas").scalar(), 1)
+
+    def test_upgrade_schema_backfills_change_log(self):
+        engine = create_engine('sqlite:///:memory:')
+        Tarea.__table__.create(engine)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("INSERT INTO tareas (titulo) VALUES ('a'), ('b')")
+            connection.exec_driver_sql("CREATE INDEX ix_tareas_actualizada_en ON tareas (actualizada_en)")
+        upgrade_schema(engine)
+        upgrade_schema(engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            controller = TaskController(session=session)
+            self.assertEqual(sorted(row.id for row in controller.changes_since().created), [1, 2])
+            token = controller.current_change_token()
+            controller.update_task(2, title="B")
+            changes = controller.changes_since(token)
+            self.assertEqual(([row.id for row in changes.created], [row.titulo for row in changes.updated]),
+                             ([], ["B"]))
+            self.assertNotIn('ix_tareas_actualizada_en', {index['name'] for index in inspect(engine).get_indexes('tareas')})
+        finally:
+            session.close()
+
 
 if __name__ == '__main__':
     unittest.main()
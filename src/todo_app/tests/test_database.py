@@ -0,0 +1,76 @@
+"""
+Módulo de pruebas unitarias para la configuración de la base de datos.
+
+Estas pruebas cubren:
+- Importar los modelos y el controlador sin crear motor ni archivos
+- Resolución de la ruta de la base por argumento o variables de entorno
+- Inyección de sesión o motor en TaskController y TaskService
+- SAVEPOINT dentro de la transacción abierta por SQLAlchemy
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+from sqlalchemy import func, select
+
+from todo_app.models import database
+from todo_app.models.models import Tarea
+from todo_app.services.task_service import TaskService
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Casos de prueba para el módulo database."""
+
+    def test_import_has_no_side_effects(self):
+        with tempfile.TemporaryDirectory() as cwd:
+            code = (
+                "import todo_app.services.task_service\n"
+                "from todo_app.models import database\n"
+                "assert database._engine is None\n"
+            )
+            env = dict(os.environ, PYTHONPATH=SRC_DIR)
+            subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True)
+            self.assertEqual(os.listdir(cwd), [])
+
+    def test_default_url_from_environment(self):
+        with mock.patch.dict(os.environ, {database.DB_PATH_ENV_VAR: 'datos/t.db'}, clear=True):
+            self.assertEqual(database.default_url(), database.sqlite_url('datos/t.db'))
+        with mock.patch.dict(os.environ, {database.DB_URL_ENV_VAR: 'sqlite://'}, clear=True):
+            self.assertEqual(database.default_url(), 'sqlite://')
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(database.default_url(), database.sqlite_url(database.DEFAULT_DB_PATH))
+
+    def test_service_with_injected_engine(self):
+        with tempfile.TemporaryDirectory() as directory:
+            engine = database.create_db_engine(database.sqlite_url(os.path.join(directory, 't.db')))
+            service = TaskService(engine=engine)
+            service.create_task("Inyectada", "Desc", date.today())
+            self.assertEqual(len(TaskService(engine=engine).get_tasks()), 1)
+            service.controller.session.close()
+            engine.dispose()
+
+    def test_savepoint_release_does_not_commit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            engine = database.create_db_engine(database.sqlite_url(os.path.join(directory, 't.db')))
+            service = TaskService(engine=engine)
+            session = service.controller.session
+            savepoint = session.begin_nested()
+            session.add(Tarea(titulo="Dentro", descripcion="Desc"))
+            savepoint.commit()
+            with engine.connect() as other:
+                self.assertEqual(other.execute(select(func.count()).select_from(Tarea)).scalar(), 0)
+            session.rollback()
+            self.assertEqual(len(service.get_tasks()), 0)
+            session.close()
+            engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,389 @@
+"""
+Módulo de pruebas unitarias para el acceso a datos en segundo plano.
+
+Estas pruebas cubren:
+- Ejecución de trabajos en el hilo de DatabaseClient y entrega por señales
+- Errores entregados a on_error o a la señal error
+- Errores al limpiar tras un trabajo entregados sin salir del slot
+- Cancelación de consultas en curso de una vista sustituida
+- MainWindow cargando y modificando tareas sin consultar desde el hilo de la interfaz
+- Panel de resumen de MainWindow y vista de la papelera
+- MainWindow aplicando el registro de cambios con escrituras de otras conexiones
+- Búsqueda en vivo de MainWindow: espera a la pausa, resalta y vuelve al listado
+- Botones de las vistas por fecha de MainWindow con sus recuentos
+- Botones de filtro de MainWindow que se combinan en una sola consulta
+- Búsqueda dentro de los filtros sin añadir tareas nuevas que no coinciden
+- Recordatorios de MainWindow procesados fuera del hilo de la interfaz
+
+Se utiliza una base de datos SQLite en un archivo temporal, compartido por
+el hilo de la interfaz y el de la base de datos.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from PyQt5.QtCore import QThread
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from todo_app.db_worker import DatabaseClient, DatabaseWorker
+from todo_app.models.database import create_db_engine, sqlite_url
+from todo_app.services.task_service import TaskService
+
+app = QApplication.instance() or QApplication([])
+
+
+def wait_until(predicate, timeout=5.0):
+    """Procesa eventos de Qt hasta que ``predicate()`` sea verdadero."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("Tiempo de espera agotado")
+        app.processEvents()
+        time.sleep(0.001)
+
+
+class DatabaseWorkerTestCase(unittest.TestCase):
+    """Casos de prueba para DatabaseClient y MainWindow en segundo plano."""
+
+    def setUp(self):
+        """Crea una base temporal y un cliente con su propio servicio."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = create_db_engine(sqlite_url(os.path.join(self.tmp.name, 'tareas.db')))
+        self.client = DatabaseClient(TaskService(engine=self.engine))
+
+    def tearDown(self):
+        """Detiene el hilo y elimina la base temporal."""
+        self.client.shutdown()
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def test_job_runs_off_gui_thread(self):
+        gui_thread = QThread.currentThread()
+        results = []
+
+        def job(service):
+            results.append(QThread.currentThread() is not gui_thread)
+            return service.create_task("Fondo", "Desc", date(2025, 5, 1)).id
+
+        self.client.submit(job, results.append)
+        wait_until(lambda: len(results) == 2)
+        self.assertEqual(results[0], True)
+        self.assertIsInstance(results[1], int)
+        self.assertEqual(self.client.pending(), 0)
+
+    def test_errors_go_to_handler_or_signal(self):
+        errors, signalled = [], []
+        self.client.error.connect(signalled.append)
+
+        def failing(service):
+            raise ValueError("fallo")
+
+        self.client.submit(failing, on_error=errors.append)
+        self.client.submit(failing)
+        wait_until(lambda: errors and signalled)
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertIsInstance(signalled[0], ValueError)
+
+    def test_cleanup_errors_are_reported(self):
+        closed = ProgrammingError(None, None, Exception("Cannot operate on a closed database."))
+
+        def set_progress_handler(connection, handler):
+            if handler is None:
+                raise closed
+
+        results, errors = [], []
+        with mock.patch.object(DatabaseWorker, '_set_progress_handler', side_effect=set_progress_handler):
+            self.client.submit(lambda service: len(service.get_tasks()), results.append, errors.append)
+            wait_until(lambda: errors)
+        self.assertEqual((results, errors), ([], [closed]))
+        self.client.submit(lambda service: len(service.get_tasks()), results.append, errors.append)
+        wait_until(lambda: results)
+        self.assertEqual(results, [0])
+
+    def test_new_view_job_interrupts_running_query(self):
+        started = threading.Event()
+        stale, fresh, errors = [], [], []
+
+        def endless(service):
+            started.set()
+            return service.controller.session.execute(text(
+                "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) "
+                "SELECT count(*) FROM c"
+            )).scalar()
+
+        self.client.submit(endless, stale.append, errors.append, channel='view')
+        self.assertTrue(started.wait(timeout=5))
+        self.client.submit(lambda service: len(service.get_tasks()), fresh.append,
+                           errors.append, channel='view')
+        wait_until(lambda: fresh)
+        self.assertEqual(fresh, [0])
+        self.assertEqual(stale, [])
+        self.assertEqual(errors, [])
+
+    def test_queued_view_job_is_skipped(self):
+        gate = threading.Event()
+        ran = []
+        self.client.submit(lambda service: gate.wait(5))
+        self.client.submit(lambda service: ran.append('viejo'), channel='view')
+        self.client.submit(lambda service: ran.append('nuevo'), channel='view')
+        gate.set()
+        wait_until(lambda: self.client.pending() == 0)
+        self.assertEqual(ran, ['nuevo'])
+
+    def test_main_window_loads_and_mutates_in_background(self):
+        from todo_app.views import MainWindow
+        seed = TaskService(engine=self.engine)
+        first_id = seed.create_task("Primera", "Desc", date(2025, 5, 1)).id
+        seed.create_task("Segunda", "Desc", date(2025, 5, 2))
+        seed.controller.session.close()
+
+        window = MainWindow(TaskService(engine=self.engine))
+        try:
+            model = window.task_model
+            wait_until(lambda: model.rowCount() == 2 and not model.loading)
+
+            window._mutate([first_id], lambda service: service.complete_tasks([first_id]))
+            window.show_pending_tasks()
+            wait_until(lambda: window.db.pending() == 0 and not model.loading)
+            self.assertEqual(model.rowCount(), 1)
+            self.assertEqual(model.row_of(first_id), -1)
+
+            window.show_completed_tasks()
+            wait_until(lambda: window.db.pending() == 0 and not model.loading)
+            self.assertEqual(model.row_of(first_id), 0)
+        finally:
+            window.close()
+            window.db.shutdown()
+
+    def test_main_window_stats_and_trash(self):
+        from todo_app.views import MainWindow
+        seed = TaskService(engine=self.engine)
+        kept_id = seed.create_task("Activa", "Desc", date(2099, 5, 1)).id
+        gone_id = seed.create_task("Borrada", "Desc", date(2099, 5, 2)).id
+        seed.delete_task(gone_id)
+        seed.controller.session.close()
+
+        window = MainWindow(TaskService(engine=self.engine))
+        try:
+            label = window.stats_label
+            wait_until(lambda: window.db.pending() == 0 and label.text())
+            self.assertIn("Pendientes: 1", label.text())
+            self.assertIn("Papelera: 1", label.text())
+
+            window.show_deleted_tasks()
+            wait_until(lambda: window.db.pending() == 0 and not window.task_model.loading)
+            self.assertEqual(window.task_model.rowCount(), 1)
+            self.assertEqual(window.task_model.row_of(gone_id), 0)
+
+            window._mutate([kept_id], lambda service: service.complete_tasks([kept_id]))
+            wait_until(lambda: "Completadas: 1" in label.text())
+            self.assertIn("Pendientes: 0", label.text())
+        finally:
+            window.close()
+            window.db.shutdown()
+
+    def test_main_window_syncs_external_changes(self):
+        from todo_app.views import MainWindow
+        seed = TaskService(engine=self.engine)
+        purged_id = seed.create_task("Purgada", "Desc", date(2099, 5, 1)).id
+        seed.controller.session.close()
+
+        window = MainWindow(TaskService(engine=self.engine))
+        try:
+            wait_until(lambda: window.db.pending() == 0 and window._change_token)
+            self.assertEqual(window.task_model.row_of(purged_id), 0)
+            external = TaskService(engine=self.engine, query_cache=False)
+            added_id = external.create_task("Externa", "Desc", date(2099, 5, 2)).id
+            external.permanently_delete_task(purged_id)
+            external.controller.session.close()
+
+            window.sync_changes()
+            wait_until(lambda: window.task_model.row_of(added_id) >= 0)
+            self.assertEqual(window.task_model.rowCount(), 1)
+            self.assertEqual(window.task_model.row_of(purged_id), -1)
+        finally:
+            window.close()
+            window.db.shutdown()
+
+    def test_main_window_live_search(self):
+        from todo_app.task_list_model import HIGHLIGHT_ROLE
+        from todo_app.views import MainWindow
+        seed = TaskService(engine=self.engine)
+        market_id = seed.create_task("Ir al mercado", "Fruta", date(2099, 5, 1)).id
+        seed.create_task("Leer", "Libro", date(2099, 5, 2))
+        seed.controller.session.close()
+
+        window = MainWindow(TaskService(engine=self.engine))
+        try:
+            model = window.task_model
+            wait_until(lambda: model.rowCount() == 2 and not model.loading)
+            QTest.keyClicks(window.input_search, "merc")
+            self.assertTrue(window.search_timer.isActive())
+            self.assertEqual(model.rowCount(), 2)
+            wait_until(lambda: model.rowCount() == 1 and not model.loading)
+            self.assertEqual(model.row_of(market_id), 0)
+            self.assertIn("<b>mercado</b>", model.index(0).data(HIGHLIGHT_ROLE))
+            self.assertFalse(window.list_tasks.grab().isNull())
+
+            window.show_pending_tasks()
+            self.assertEqual(window.input_search.text(), "")
+            wait_until(lambda: model.rowCount() == 2 and not model.loading)
+            self.assertIsNone(model.index(0).data(HIGHLIGHT_ROLE))
+        finally:
+            window.close()
+            window.db.shutdown()
+
+    def test_main_window_date_views(self):
+        from todo_app.views import MainWindow
+        today = date.today()
+        seed = TaskService(engine=self.engine)
+        overdue_id = seed.create_task("Vencida", "Desc", today - timedelta(days=2)).id
+        today_id = seed.create_task("Hoy", "Desc", today).id
+        seed.create_task("Sin fecha", "Desc", None)
+        seed.controller.session.close()
+
+        window = MainWindow(TaskService(engine=self.engine))
+        try:
+            model = window.task_model
+            wait_until(lambda: window.db.pending() == 0 and not model.loading)
+            self.assertEqual(window.btn_view_overdue.text(), "Vencidas ⏰ (1)")
+            self.assertEqual(window.btn_view_no_date.text(), "Sin fecha ➖ (1)")
+
+            window.btn_view_overdue.click()
+            wait_until(lambda: window.db.pending() == 0 and not model.loading)
+            self.assertEqual([model.task_id(row) for row in range(model.rowCount())], [overdue_id])
+
+            window.show_date_view('hoy')
+            wait_until(lambda: window.db.pending() == 0 and not model.loading)
+            self.assertEqual(model.row_of(today_id), 0)
+            window._mutate([today_id], lambda service: service.complete_tasks([today_id]))
+            wait_until(lambda: model.row_of(today_id) == -1)
+            wait_until(lambda: window.btn_view_today.text() == "Hoy 📌 (0)")
+        finally:
+            window.close()
+            window.db.shutdown()
+
+    def test_main_window_combined_filters(self):
+        from todo_app.views import MainWindow
+        seed = TaskService(engine=self.engine)
+        wanted_id = seed.create_task("Alta favorita", "Desc", None, "alta").id
+        seed.favorite_task(wanted_id)
+        low_id = seed.create_task("Baja favorita", "Desc", None, "baja").id
+        seed.favorite_task(low_id)
+        done_id = seed.create_task("Alta completada", "Desc", None, "alta").id
+        seed.favorite_task(done_id)
+        seed.complete_task(done_id)
+        seed.create_task("Alta normal", "Desc", None, "alta")
+        seed.controller.session.close()
+
+        window = MainWindow(TaskService(engine=self.engine))
+        try:
+            model = window.task_model
+
+            def shown():
+                wait_until(lambda: window.db.pending() == 0 and not model.loading)
+                return sorted(model.task_id(row) for row in range(model.rowCount()))
+
+            shown()
+            window.btn_show_pending.click()
+            window.btn_show_high.click()
+            window.btn_show_favorites.click()
+            self.assertEqual(shown(), [wanted_id])
+            self.assertTrue(window.btn_show_pending.isChecked())
+            self.assertTrue(window.btn_show_high.isChecked())
+
+            window.btn_show_low.click()
+            self.assertEqual(shown(), sorted([wanted_id, low_id]))
+            window.btn_show_completed.click()
+            self.assertEqual(shown(), [done_id])
+            self.assertFalse(window.btn_show_pending.isChecked())
+
+            window.input_search.setText("completada")
+            window.search_timer.timeout.emit()
+            self.assertEqual(shown(), [done_id])
+            window.input_search.setText("normal")
+            window.search_timer.timeout.emit()
+            self.assertEqual(shown(), [])
+
+            window.btn_clear_filters.click()
+            self.assertEqual(len(shown()), 4)
+            self.assertFalse(window.btn_show_favorites.isChecked())
+            self.assertEqual(window.input_search.text(), "")
+        finally:
+            window.close()
+            window.db.shutdown()
+
+    def test_main_window_filtered_search_ignores_new_tasks(self):
+        from todo_app.views import MainWindow
+        seed = TaskService(engine=self.engine)
+        report_id = seed.create_task("Informe mensual", "Desc", date(2099, 5, 1)).id
+        seed.create_task("Comprar pan", "Desc", date(2099, 5, 2))
+        seed.controller.session.close()
+
+        window = MainWindow(TaskService(engine=self.engine))
+        try:
+            model = window.task_model
+
+            def shown():
+                wait_until(lambda: window.db.pending() == 0 and not model.loading)
+                return [model.task_id(row) for row in range(model.rowCount())]
+
+            window.btn_show_pending.click()
+            window.input_search.setText("informe")
+            window.search_timer.timeout.emit()
+            self.assertEqual(shown(), [report_id])
+
+            window.input_title.setText("Regar plantas")
+            window.create_task()
+            external = TaskService(engine=self.engine, query_cache=False)
+            external.create_task("Lavar el coche", "Desc", date(2099, 5, 3))
+            external.controller.session.close()
+            window.sync_changes()
+            self.assertEqual(shown(), [report_id])
+
+            window._mutate([report_id], lambda service: service.complete_task(report_id))
+            self.assertEqual(shown(), [])
+        finally:
+            window.close()
+            window.db.shutdown()
+
+    def test_main_window_reminders_run_off_gui_thread(self):
+        from todo_app.services.reminder_scheduler import ReminderScheduler
+        from todo_app.views import MainWindow
+        seed = TaskService(engine=self.engine)
+        task_id = seed.create_task("Llamar", "Desc", date(2099, 5, 1)).id
+        seed.add_reminder(task_id, datetime.now() - timedelta(minutes=1))
+        seed.controller.session.close()
+
+        gui_thread = QThread.currentThread()
+        threads = []
+        original = ReminderScheduler.process
+
+        def process(scheduler):
+            threads.append(QThread.currentThread() is gui_thread)
+            return original(scheduler)
+
+        with mock.patch.object(ReminderScheduler, 'process', process):
+            window = MainWindow(TaskService(engine=self.engine))
+            try:
+                wait_until(lambda: window.statusBar().currentMessage() == "Recordatorio: Llamar")
+                window._mutate([task_id], lambda service: service.add_reminder(
+                    task_id, datetime.now() - timedelta(seconds=1)))
+                wait_until(lambda: len(threads) >= 2 and window.db.pending() == 0)
+                self.assertEqual(set(threads), {False})
+            finally:
+                window.close()
+                window.db.shutdown()
+        self.assertFalse(window.reminder_thread.isRunning())
+
+
+if __name__ == '__main__':
+    unittest.main()
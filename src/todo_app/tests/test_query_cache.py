@@ -0,0 +1,145 @@
+"""
+Módulo de pruebas unitarias para la caché de consultas de TaskService.
+
+Estas pruebas cubren:
+- Aciertos al repetir filtros, búsquedas y páginas sin cambios
+- Listados con varias prioridades o categorías como clave de la caché
+- Invalidación por cada operación de modificación del servicio
+- Expulsión LRU al superar el tamaño máximo
+- Desactivación de la caché y consultas con recordatorios fuera de ella
+- Invalidación al confirmar o deshacer la sesión
+- Invalidación cuando el registro de cambios trae escrituras de otras conexiones
+
+Se utiliza una base de datos SQLite en memoria para cada prueba.
+"""
+
+import unittest
+from datetime import date
+
+from sqlalchemy import create_engine
+
+from todo_app.models.models import Base
+from todo_app.services.task_service import TaskService
+
+
+class QueryCacheTestCase(unittest.TestCase):
+    """Casos de prueba para la caché de consultas de TaskService."""
+
+    def setUp(self):
+        """Crea una base en memoria con dos tareas."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.service = TaskService(engine=self.engine)
+        self.first = self.service.create_task("Leer libro", "Capítulo 1", date(2025, 6, 3), 'alta')
+        self.second = self.service.create_task("Lavar ropa", "Blanca", date(2025, 6, 1), 'baja')
+
+    def tearDown(self):
+        """Cierra la sesión y el motor."""
+        self.service.controller.session.close()
+        self.engine.dispose()
+
+    def test_repeated_queries_hit(self):
+        pending = self.service.filter_tasks(estado="pendientes")
+        pending.clear()
+        self.assertEqual(len(self.service.filter_tasks(estado="pendientes")), 2)
+        self.service.filter_tasks(prioridad="alta")
+        self.service.get_tasks_page(page_size=1)
+        self.service.get_tasks_page(page_size=1)
+        stats = self.service.get_cache_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (2, 3, 3))
+
+    def test_several_values_per_filter(self):
+        expected = [self.first.id, self.second.id]
+        for call in (lambda values: self.service.get_tasks_page(prioridad=values).tasks,
+                     lambda values: self.service.get_task_rows(prioridad=values),
+                     lambda values: self.service.get_task_rows_page(prioridad=values).tasks):
+            with self.subTest(call=call):
+                self.assertEqual(sorted(t.id for t in call(['alta', 'baja'])), sorted(expected))
+                self.assertEqual(sorted(t.id for t in call(('baja', 'alta'))), sorted(expected))
+        self.assertEqual(self.service.get_cache_stats().hits, 3)
+
+    def test_search_keys_are_normalized(self):
+        self.assertEqual([t.id for t in self.service.search_tasks("ROPA")], [self.second.id])
+        self.assertEqual([t.id for t in self.service.search_tasks("  ropa ")], [self.second.id])
+        self.assertEqual(self.service.get_cache_stats().hits, 1)
+
+    def test_mutations_invalidate(self):
+        task_id = self.first.id
+        mutations = [
+            ('create_task', lambda: self.service.create_task("Nueva", "Desc", date(2025, 6, 2))),
+            ('update_task', lambda: self.service.update_task(task_id, title="Leer otro libro")),
+            ('complete_task', lambda: self.service.complete_task(task_id)),
+            ('favorite_task', lambda: self.service.favorite_task(task_id)),
+            ('delete_task', lambda: self.service.delete_task(task_id)),
+            ('restore_task', lambda: self.service.restore_task(task_id)),
+            ('complete_tasks', lambda: self.service.complete_tasks([self.second.id])),
+            ('permanently_delete_task', lambda: self.service.permanently_delete_task(task_id)),
+        ]
+        for name, mutate in mutations:
+            with self.subTest(mutation=name):
+                before = [(t.id, t.titulo, t.completada, t.favorita, t.eliminada)
+                          for t in self.service.get_tasks_page(include_deleted=True).tasks]
+                generation = self.service.get_cache_stats().generation
+                mutate()
+                self.assertGreater(self.service.get_cache_stats().generation, generation)
+                misses = self.service.get_cache_stats().misses
+                after = [(t.id, t.titulo, t.completada, t.favorita, t.eliminada)
+                         for t in self.service.get_tasks_page(include_deleted=True).tasks]
+                self.assertEqual(self.service.get_cache_stats().misses, misses + 1)
+                self.assertNotEqual(after, before)
+
+    def test_least_recently_used_is_evicted(self):
+        service = TaskService(session=self.service.controller.session, cache_size=2)
+        service.filter_tasks(prioridad="alta")
+        service.filter_tasks(prioridad="baja")
+        service.filter_tasks(prioridad="alta")
+        service.filter_tasks(prioridad="media")
+        service.filter_tasks(prioridad="alta")
+        service.filter_tasks(prioridad="baja")
+        stats = service.get_cache_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (2, 4, 2))
+
+    def test_disabled_cache_always_queries(self):
+        service = TaskService(session=self.service.controller.session, query_cache=False)
+        service.filter_tasks(estado="pendientes")
+        service.filter_tasks(estado="pendientes")
+        self.assertEqual(service.get_cache_stats(), (0, 0, 0, 0))
+
+    def test_with_reminders_bypasses_cache(self):
+        self.service.filter_tasks(estado="pendientes", with_reminders=True)
+        self.service.search_tasks("ropa", with_reminders=True)
+        self.assertEqual(self.service.get_cache_stats().size, 0)
+
+    def test_commit_and_rollback_invalidate(self):
+        self.service.filter_tasks(estado="pendientes")
+        self.service.controller.session.rollback()
+        self.assertEqual(self.service.get_cache_stats().size, 0)
+
+        self.service.enable_write_behind(delay=60)
+        self.service.favorite_task(self.first.id)
+        favorites = [t.favorita for t in self.service.filter_tasks(estado="pendientes")]
+        self.service.flush_writes()
+        self.service.controller.session.close()
+        refreshed = self.service.filter_tasks(estado="pendientes")
+        self.assertEqual(self.service.get_cache_stats().hits, 0)
+        self.assertEqual([t.favorita for t in refreshed], favorites)
+
+    def test_changes_from_other_connections_invalidate(self):
+        token = self.service.change_token()
+        self.assertEqual(len(self.service.filter_tasks(estado="pendientes")), 2)
+        self.service.controller.session.close()
+        other = TaskService(engine=self.engine, query_cache=False)
+        other.create_task("Externa", "Desc", date(2025, 6, 4))
+        other.controller.session.close()
+
+        self.assertEqual(len(self.service.filter_tasks(estado="pendientes")), 2)
+        changes = self.service.changes_since(token)
+        self.assertEqual([t.titulo for t in changes.created], ["Externa"])
+        self.assertEqual(len(self.service.filter_tasks(estado="pendientes")), 3)
+        generation = self.service.get_cache_stats().generation
+        self.service.changes_since(changes.token)
+        self.assertEqual(self.service.get_cache_stats().generation, generation)
+
+
+if __name__ == '__main__':
+    unittest.main()
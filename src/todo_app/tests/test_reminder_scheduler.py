@@ -0,0 +1,228 @@
+"""
+Módulo de pruebas unitarias para la clase ReminderScheduler.
+
+Estas pruebas cubren:
+- Orden de disparo por fecha_hora con un reloj simulado
+- Marcado de notificado en la base de datos
+- Resincronización incremental al crear, completar y eliminar tareas
+- Carga y disparo de 100.000 recordatorios
+- Ejecución sin interfaz en un hilo y conducción con QTimer
+- Errores de base de datos al disparar: sin avisos perdidos y reintento del QTimer
+
+Se utiliza una base de datos SQLite en memoria para aislamiento de pruebas.
+"""
+
+import io
+import threading
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from todo_app.models.models import Base, Recordatorio, Tarea
+from todo_app.services.reminder_scheduler import RETRY_DELAY, ReminderScheduler
+from todo_app.services.task_service import TaskService
+
+START = datetime(2025, 3, 1, 9, 0)
+
+
+class FakeClock:
+    """Reloj controlado por la prueba."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+class ReminderSchedulerTestCase(unittest.TestCase):
+    """Casos de prueba para la clase ReminderScheduler."""
+
+    def setUp(self):
+        """Configura una base en memoria compartida por el servicio y el planificador."""
+        self.engine = create_engine(
+            'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.service = TaskService(session=self.session)
+        self.clock = FakeClock(START)
+        self.fired = []
+        self.scheduler = ReminderScheduler(
+            engine=self.engine, clock=self.clock, on_due=self.fired.extend
+        )
+        self.scheduler.attach(self.service)
+
+    def tearDown(self):
+        """Cierra las sesiones al finalizar cada prueba."""
+        self.scheduler.session.close()
+        self.session.close()
+
+    def _notified_count(self):
+        return self.session.execute(
+            select(func.count()).where(Recordatorio.notificado.is_(True))
+        ).scalar()
+
+    def test_fires_in_order_with_fake_clock(self):
+        task = self.service.create_task("Reunión", "Desc", date(2025, 3, 1))
+        later = self.service.add_reminder(task.id, START + timedelta(hours=2))
+        sooner = self.service.add_reminder(task.id, START + timedelta(hours=1))
+
+        self.assertEqual(self.scheduler.process(), [])
+        self.assertEqual(self.scheduler.seconds_until_next(), 3600)
+
+        self.clock.advance(hours=3)
+        fired = self.scheduler.process()
+        self.assertEqual([r.id for r in fired], [sooner.id, later.id])
+        self.assertEqual(fired[0].titulo, "Reunión")
+        self.assertEqual(self.fired, fired)
+        self.assertIsNone(self.scheduler.next_due())
+        self.assertEqual(self._notified_count(), 2)
+
+    def test_notified_reminders_are_not_reloaded(self):
+        task = self.service.create_task("Tarea", "Desc", date(2025, 3, 1))
+        self.service.add_reminder(task.id, START)
+        self.scheduler.process()
+        other = ReminderScheduler(engine=self.engine, clock=self.clock)
+        self.assertEqual(other.process(), [])
+        self.assertEqual(other.pending_count(), 0)
+        other.session.close()
+
+    def test_resyncs_on_task_changes(self):
+        done = self.service.create_task("Completar", "Desc", date(2025, 3, 1))
+        gone = self.service.create_task("Eliminar", "Desc", date(2025, 3, 1))
+        kept = self.service.create_task("Mantener", "Desc", date(2025, 3, 1))
+        for task in (done, gone, kept):
+            self.service.add_reminder(task.id, START + timedelta(minutes=30))
+        self.assertEqual(self.scheduler.seconds_until_next(), 1800)
+        self.assertEqual(self.scheduler.pending_count(), 3)
+
+        self.service.complete_task(done.id)
+        self.service.delete_tasks([gone.id])
+        self.assertEqual(self.scheduler.next_due(), START + timedelta(minutes=30))
+        self.assertEqual(self.scheduler.pending_count(), 1)
+
+        self.service.restore_task(gone.id)
+        self.clock.advance(hours=1)
+        fired = self.scheduler.process()
+        self.assertEqual(sorted(r.tarea_id for r in fired), [gone.id, kept.id])
+
+    def test_incremental_sync_reads_only_changed_tasks(self):
+        first = self.service.create_task("Uno", "Desc", date(2025, 3, 1))
+        self.service.add_reminder(first.id, START + timedelta(hours=1))
+        self.scheduler.process()
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(self.engine, 'before_cursor_execute', listener)
+        try:
+            second = self.service.create_task("Dos", "Desc", date(2025, 3, 1))
+            self.service.add_reminder(second.id, START + timedelta(minutes=5))
+            statements.clear()
+            self.assertEqual(self.scheduler.seconds_until_next(), 300)
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', listener)
+        selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+        self.assertEqual(len(selects), 1)
+        self.assertIn('recordatorios.tarea_id IN', selects[0])
+
+    def test_hundred_thousand_reminders(self):
+        count = 100_000
+        self.session.execute(insert(Tarea), [
+            {'id': i, 'titulo': f"T{i}", 'completada': False, 'eliminada': False}
+            for i in range(1, count + 1)
+        ])
+        # Fechas desordenadas: (i * 7919) % count recorre todos los minutos
+        self.session.execute(insert(Recordatorio), [
+            {'tarea_id': i, 'fecha_hora': START + timedelta(minutes=(i * 7919) % count),
+             'notificado': False}
+            for i in range(1, count + 1)
+        ])
+        self.session.commit()
+        self.scheduler.tasks_changed(None)
+
+        self.assertEqual(self.scheduler.next_due(), START)
+        self.assertEqual(self.scheduler.pending_count(), count)
+
+        self.clock.advance(minutes=count // 2 - 1)
+        fired = self.scheduler.process()
+        self.assertEqual(len(fired), count // 2)
+        self.assertEqual([r.fecha_hora for r in fired], sorted(r.fecha_hora for r in fired))
+        self.assertEqual(self._notified_count(), count // 2)
+        self.assertEqual(self.scheduler.seconds_until_next(), 60)
+
+    def test_run_headless_in_thread(self):
+        task = self.service.create_task("Hilo", "Desc", date(2025, 3, 1))
+        self.service.add_reminder(task.id, START)
+        delivered = threading.Event()
+        self.scheduler.on_due = lambda reminders: delivered.set()
+        stop = threading.Event()
+        worker = threading.Thread(target=self.scheduler.run, args=(stop,))
+        worker.start()
+        try:
+            self.assertTrue(delivered.wait(timeout=5))
+        finally:
+            self.scheduler.stop(stop)
+            worker.join(timeout=5)
+        self.assertFalse(worker.is_alive())
+
+    def test_qtimer_driver_emits_and_reschedules(self):
+        from PyQt5.QtWidgets import QApplication
+        from todo_app.reminder_timer import ReminderTimer
+        app = QApplication.instance() or QApplication([])
+
+        task = self.service.create_task("Qt", "Desc", date(2025, 3, 1))
+        self.service.add_reminder(task.id, START)
+        self.service.add_reminder(task.id, START + timedelta(minutes=10))
+        timer = ReminderTimer(self.scheduler)
+        emitted = []
+        timer.reminders_due.connect(emitted.append)
+        timer.start()
+        self.assertEqual([[r.fecha_hora for r in batch] for batch in emitted], [[START]])
+        self.assertTrue(timer._timer.isActive())
+        self.assertEqual(timer._timer.interval(), 10 * 60 * 1000 + 1)
+
+        self.service.add_reminder(task.id, START + timedelta(minutes=1))
+        self.assertEqual(timer._timer.interval(), 0)
+        app.processEvents()
+        self.assertEqual(timer._timer.interval(), 60 * 1000 + 1)
+        timer.stop()
+
+    def test_database_errors_are_retried(self):
+        from PyQt5.QtWidgets import QApplication
+        from todo_app.reminder_timer import ReminderTimer
+        QApplication.instance() or QApplication([])
+
+        task = self.service.create_task("Bloqueada", "Desc", date(2025, 3, 1))
+        self.service.add_reminder(task.id, START)
+        locked = OperationalError('UPDATE recordatorios', {}, Exception('database is locked'))
+        with mock.patch.object(self.scheduler, '_mark_notified', side_effect=locked):
+            with self.assertRaises(OperationalError):
+                self.scheduler.process()
+        self.assertEqual(self._notified_count(), 0)
+
+        timer = ReminderTimer(self.scheduler)
+        emitted = []
+        timer.reminders_due.connect(emitted.append)
+        with mock.patch.object(self.scheduler, '_mark_notified', side_effect=locked), \
+                mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            timer.start()
+        self.assertIn('database is locked', stderr.getvalue())
+        self.assertEqual(emitted, [])
+        self.assertEqual(timer._timer.interval(), int(RETRY_DELAY * 1000))
+
+        timer._on_timeout()
+        self.assertEqual([[r.fecha_hora for r in batch] for batch in emitted], [[START]])
+        self.assertEqual(self._notified_count(), 1)
+        timer.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Módulo de pruebas unitarias para el perfilador SQL.
+
+Estas pruebas cubren:
+- Normalización de sentencias con listas IN de distinta longitud
+- Histogramas de latencia y estimación de percentiles
+- Tiempos por sentencia y por método de TaskService y TaskController
+- Registro de consultas lentas con su EXPLAIN QUERY PLAN y el método de origen
+- Perfilador desactivado y retirada de los eventos
+- Configuración desde el entorno con un umbral mal formado
+- Menú Depuración de MainWindow con el resumen
+
+Se utiliza una base de datos SQLite en memoria para cada prueba (en un
+archivo temporal para la ventana, que consulta desde otro hilo).
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit
+from sqlalchemy import create_engine, text
+
+from todo_app.models.database import create_db_engine, sqlite_url
+from todo_app.models.models import Base
+from todo_app.services.task_service import TaskService
+from todo_app.sql_profiler import (DEFAULT_SLOW_MS, LatencyHistogram, QueryProfiler, _from_environment,
+                                   normalize_statement)
+from todo_app.tests.test_db_worker import wait_until
+
+app = QApplication.instance() or QApplication([])
+
+
+class SQLProfilerTestCase(unittest.TestCase):
+    """Casos de prueba para QueryProfiler."""
+
+    def setUp(self):
+        """Crea una base en memoria y un perfilador activo que escribe en memoria."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.log = io.StringIO()
+        self.profiler = QueryProfiler(enabled=True, slow_ms=None, stream=self.log)
+        self.profiler.attach(self.engine)
+        self.service = TaskService(engine=self.engine, query_cache=False)
+
+    def tearDown(self):
+        """Retira los eventos y cierra la sesión."""
+        self.profiler.detach(self.engine)
+        self.service.controller.session.close()
+        self.engine.dispose()
+
+    def test_normalize_statement(self):
+        self.assertEqual(
+            normalize_statement("SELECT id\n  FROM tareas WHERE id IN (?, ?,?)"),
+            normalize_statement("SELECT id FROM tareas WHERE id IN (?, ?)"),
+        )
+        self.assertEqual(normalize_statement("SELECT ? , ?"), "SELECT ?, ...")
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for elapsed in (0.5, 0.7, 3, 4, 40, 6000):
+            histogram.record(elapsed)
+        data = histogram.as_dict()
+        self.assertEqual((data['count'], data['max_ms']), (6, 6000))
+        self.assertEqual((histogram.percentile(0.5), histogram.percentile(0.95)), (5.0, 6000))
+        self.assertEqual(data['buckets'], {'<=1': 2, '<=5': 2, '<=50': 1, '>5000': 1})
+
+    def test_statements_and_methods_are_timed(self):
+        self.profiler.instrument(self.service)
+        self.profiler.instrument(self.service.controller)
+        self.service.create_task("Leer", "Libro", date(2025, 6, 1))
+        self.service.get_task_rows_by_ids([1, 2])
+        self.service.get_task_rows_by_ids([1, 2, 3])
+
+        data = self.profiler.as_dict()
+        self.assertEqual(data['methods']['TaskService.get_task_rows_by_ids']['count'], 2)
+        self.assertEqual(data['methods']['TaskController.get_task_rows_by_ids']['count'], 2)
+        self.assertIn('TaskController.add_task', data['methods'])
+        by_ids = [sql for sql in data['statements'] if 'IN (?, ...)' in sql]
+        self.assertEqual(len(by_ids), 1)
+        self.assertEqual(data['statements'][by_ids[0]]['count'], 2)
+        report = self.profiler.report()
+        self.assertIn('TaskService.get_task_rows_by_ids', report)
+        self.assertIn('INSERT INTO tareas', report)
+
+    def test_slow_queries_logged_with_plan(self):
+        self.profiler.instrument(self.service)
+        self.profiler.slow_ms = 0
+        self.service.filter_tasks(prioridad='alta')
+        self.service.controller.session.commit()
+
+        slow = self.profiler.as_dict()['slow_queries']
+        select = next(entry for entry in slow if entry['statement'].startswith('SELECT'))
+        self.assertEqual(select['method'], 'TaskService.filter_tasks')
+        self.assertTrue(any('ix_tareas' in step for step in select['plan']), select['plan'])
+        self.assertIn('[SQL lenta]', self.log.getvalue())
+        self.assertIn('TaskService.filter_tasks', self.log.getvalue())
+
+    def test_disabled_profiler_does_nothing(self):
+        profiler = QueryProfiler(stream=self.log)
+        profiler.attach(self.engine)
+        service = profiler.instrument(TaskService(engine=self.engine))
+        service.get_task_rows()
+        self.assertEqual(profiler.as_dict(), {'statements': {}, 'methods': {}, 'slow_queries': []})
+        self.assertNotIn('get_task_rows', vars(service))
+
+    def test_detach_and_reset(self):
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        self.profiler.detach(self.engine)
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 2"))
+        self.assertEqual(list(self.profiler.as_dict()['statements']), ["SELECT 1"])
+        self.profiler.reset()
+        self.assertEqual(self.profiler.as_dict()['statements'], {})
+
+    def test_malformed_threshold_falls_back_to_default(self):
+        environ = {'TODO_PROFILE_SQL': '1', 'TODO_SLOW_QUERY_MS': 'rápido'}
+        with mock.patch.dict(os.environ, environ), mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            configured = _from_environment()
+        self.assertTrue(configured.enabled)
+        self.assertEqual(configured.slow_ms, DEFAULT_SLOW_MS)
+        self.assertIn('TODO_SLOW_QUERY_MS', stderr.getvalue())
+        with mock.patch.dict(os.environ, {'TODO_SLOW_QUERY_MS': '5'}):
+            self.assertEqual(_from_environment().slow_ms, 5.0)
+
+    def test_main_window_debug_menu(self):
+        from todo_app.views import MainWindow
+        # El hilo de la base de datos necesita un archivo: cada hilo tiene su propia base en memoria.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        engine = create_db_engine(sqlite_url(os.path.join(tmp.name, 'tareas.db')))
+        self.addCleanup(engine.dispose)
+        self.profiler.attach(engine)
+        self.addCleanup(self.profiler.detach, engine)
+        with mock.patch('todo_app.views.profiler', self.profiler):
+            window = MainWindow(TaskService(engine=engine))
+            try:
+                menus = [action.text() for action in window.menuBar().actions()]
+                self.assertEqual(menus, ["Depuración"])
+                wait_until(lambda: window.db.pending() == 0)
+                dialog = window.show_profile_summary()
+                self.assertIn('TaskService.query_task_rows_page', dialog.findChild(QPlainTextEdit).toPlainText())
+                dialog.close()
+            finally:
+                window.close()
+                window.db.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Módulo de pruebas unitarias para los perfiles de SQLite.
+
+Estas pruebas cubren:
+- Aplicación de los PRAGMAs de cada perfil a las conexiones nuevas
+- Selección del perfil por argumento o variable de entorno
+- Rechazo de perfiles desconocidos
+
+Se utiliza una base de datos SQLite temporal en disco, ya que WAL no aplica
+a bases en memoria.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from sqlalchemy import create_engine
+
+from todo_app.models.sqlite_profiles import (
+    DEFAULT_PROFILE, PROFILE_ENV_VAR, install_profile, resolve_profile
+)
+
+
+class SqliteProfilesTestCase(unittest.TestCase):
+    """Casos de prueba para el módulo sqlite_profiles."""
+
+    def setUp(self):
+        """Crea una carpeta temporal para la base de datos."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _pragmas(self, profile):
+        engine = create_engine(f"sqlite:///{os.path.join(self.directory.name, profile + '.db')}")
+        self.addCleanup(engine.dispose)
+        install_profile(engine, profile)
+        with engine.connect() as connection:
+            return {
+                name: connection.exec_driver_sql(f'PRAGMA {name}').scalar()
+                for name in ('journal_mode', 'synchronous', 'temp_store')
+            }
+
+    def test_balanced_profile(self):
+        pragmas = self._pragmas('balanced')
+        self.assertEqual(pragmas['journal_mode'], 'wal')
+        self.assertEqual(pragmas['synchronous'], 1)
+        self.assertEqual(pragmas['temp_store'], 2)
+
+    def test_durable_profile(self):
+        pragmas = self._pragmas('durable')
+        self.assertEqual(pragmas['journal_mode'], 'delete')
+        self.assertEqual(pragmas['synchronous'], 2)
+
+    def test_resolve_profile_from_environment(self):
+        with mock.patch.dict(os.environ, {PROFILE_ENV_VAR: 'FAST'}):
+            self.assertEqual(resolve_profile(), 'fast')
+            self.assertEqual(resolve_profile('durable'), 'durable')
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(resolve_profile(), DEFAULT_PROFILE)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            resolve_profile('turbo')
+
+
+if __name__ == '__main__':
+    unittest.main()
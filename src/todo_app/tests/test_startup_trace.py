@@ -0,0 +1,44 @@
+"""
+Módulo de pruebas unitarias para el trazador de arranque.
+
+Estas pruebas cubren:
+- Que el trazador desactivado no registre nada
+- Registro de fases, marcas y desglose en texto y JSON
+"""
+
+import unittest
+
+from todo_app.startup_trace import StartupTracer
+
+
+class StartupTracerTestCase(unittest.TestCase):
+    """Casos de prueba para la clase StartupTracer."""
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = StartupTracer()
+        with tracer.phase('importar'):
+            pass
+        tracer.mark('primer pintado')
+        self.assertEqual(tracer.phases, [])
+
+    def test_phases_are_recorded_in_start_order(self):
+        tracer = StartupTracer('text')
+        with tracer.phase('externa'):
+            with tracer.phase('interna'):
+                pass
+        tracer.mark('primer pintado')
+        data = tracer.as_dict()
+        self.assertEqual([p['name'] for p in data['phases']], ['externa', 'interna', 'primer pintado'])
+        self.assertGreaterEqual(data['total_ms'], data['phases'][0]['duration_ms'])
+        self.assertIn('primer pintado', tracer.report())
+
+    def test_enable_after_creation(self):
+        tracer = StartupTracer()
+        tracer.enable('json')
+        with tracer.phase('fase'):
+            pass
+        self.assertEqual(len(tracer.as_dict()['phases']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
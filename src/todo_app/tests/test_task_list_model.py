@@ -0,0 +1,153 @@
+"""
+Módulo de pruebas unitarias para la clase TaskListModel.
+
+Estas pruebas cubren:
+- Carga incremental con canFetchMore/fetchMore
+- Texto generado bajo demanda en data()
+- Inserciones, actualizaciones y retiradas de filas individuales
+- Resaltado de las palabras buscadas y fuentes ordenadas por relevancia
+- Predicado de las vistas por fecha equivalente a su consulta
+
+Se utiliza una base de datos SQLite en memoria para aislamiento de pruebas.
+"""
+
+import unittest
+from datetime import date, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from todo_app.models.models import Base
+from todo_app.repositories.controllers import DATE_VIEWS, TaskController
+from todo_app.task_list_model import HIGHLIGHT_ROLE, TASK_ID_ROLE, TaskListModel, highlight_terms
+from todo_app.views import view_filter
+
+
+class TaskListModelTestCase(unittest.TestCase):
+    """Casos de prueba para la clase TaskListModel."""
+
+    def setUp(self):
+        """Configura una base de datos SQLite en memoria y un modelo paginado."""
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.controller = TaskController(session=self.session)
+        self.model = TaskListModel(page_size=2)
+
+    def tearDown(self):
+        """Cierra la sesión al finalizar cada prueba."""
+        self.session.close()
+
+    def _show(self, **filters):
+        self.model.set_source(
+            lambda cursor, size: self.controller.page_tasks(cursor, size, **filters),
+            accepts=view_filter(**filters)
+        )
+
+    def test_fetch_more_loads_pages(self):
+        for day in range(1, 6):
+            self.controller.add_task(f"Día {day}", "Desc", date(2025, 3, day))
+        self._show()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertTrue(self.model.canFetchMore())
+        self.model.fetchMore()
+        self.assertEqual(self.model.rowCount(), 2)
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+        self.assertEqual(self.model.rowCount(), 5)
+
+    def test_data_renders_text_and_id(self):
+        task = self.controller.add_task("Leer", "Capítulo 1", date(2025, 3, 1), prioridad='alta')
+        self._show()
+        self.model.fetchMore()
+        index = self.model.index(0)
+        self.assertIn("Leer", index.data())
+        self.assertIn("01-03-2025", index.data())
+        self.assertEqual(index.data(TASK_ID_ROLE), task.id)
+
+    def test_upsert_inserts_in_order_and_removes_filtered(self):
+        self.controller.add_task("A", "Desc", date(2025, 3, 1))
+        self.controller.add_task("C", "Desc", date(2025, 3, 3))
+        self._show(estado="pendientes")
+        self.model.fetchMore()
+        self.model.fetchMore()
+        middle = self.controller.add_task("B", "Desc", date(2025, 3, 2))
+        self.model.upsert_task(middle)
+        self.assertEqual(self.model.row_of(middle.id), 1)
+
+        self.controller.complete_task(middle.id)
+        self.model.upsert_task(middle)
+        self.assertEqual(self.model.row_of(middle.id), -1)
+        self.assertEqual(self.model.rowCount(), 2)
+
+    def test_upsert_skips_rows_beyond_loaded_page(self):
+        for day in range(1, 4):
+            self.controller.add_task(f"Día {day}", "Desc", date(2025, 3, day))
+        self._show()
+        self.model.fetchMore()
+        late = self.controller.add_task("Tarde", "Desc", date(2025, 12, 31))
+        self.model.upsert_task(late)
+        self.assertEqual(self.model.row_of(late.id), -1)
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+        self.assertEqual(self.model.row_of(late.id), 3)
+
+    def test_highlight_terms(self):
+        self.assertEqual(
+            highlight_terms("Ensayar Canción <coro> & cantar", ["cancion", "CA"]),
+            "Ensayar <b>Canción</b> &lt;coro&gt; &amp; <b>cantar</b>"
+        )
+        self.assertEqual(highlight_terms("Reinforme", ["inf"]), "Reinforme")
+        self.assertEqual(
+            highlight_terms("Informe informes reunión", ["informe", "reu"], prefix_last=True),
+            "<b>Informe</b> informes <b>reunión</b>"
+        )
+        self.assertEqual(highlight_terms("a < b", []), "a &lt; b")
+
+    def test_highlight_role_follows_search(self):
+        self.controller.add_task("Leer libro", "Capítulo 1", date(2025, 3, 1))
+        self._show()
+        self.model.fetchMore()
+        index = self.model.index(0)
+        self.assertIsNone(index.data(HIGHLIGHT_ROLE))
+        self.model.set_highlight("cap")
+        self.assertIn("<b>Capítulo</b>", index.data(HIGHLIGHT_ROLE))
+        self.assertNotIn("<b>", index.data())
+        self._show()
+        self.assertIsNone(self.model.index(0).data(HIGHLIGHT_ROLE))
+
+    def test_ranked_source_updates_rows_in_place(self):
+        first = self.controller.add_task("Mercado", "Desc", date(2025, 3, 2))
+        second = self.controller.add_task("Mercado 2", "Desc", date(2025, 3, 1))
+        self.model.set_async_source(
+            lambda cursor, size, deliver: deliver(self.controller.page_search_task_rows("mercado", cursor, size)),
+            accepts=lambda task: not task.eliminada, ranked=True
+        )
+        self.model.fetchMore()
+        order = [self.model.task_id(row) for row in range(2)]
+
+        self.controller.update_task(second.id, due_date=date(2025, 12, 31))
+        self.model.upsert_task(second)
+        self.assertEqual([self.model.task_id(row) for row in range(2)], order)
+        self.model.upsert_task(self.controller.add_task("Mercado 3", "Desc", date(2025, 3, 3)))
+        self.assertEqual(self.model.rowCount(), 2)
+        self.controller.delete_task(first.id)
+        self.model.upsert_task(first)
+        self.assertEqual(self.model.row_of(first.id), -1)
+
+    def test_date_view_filter_matches_query(self):
+        today = date.today()
+        for offset in (-3, -1, 0, 1, 6, 7, 8, None):
+            due = today + timedelta(days=offset) if offset is not None else None
+            self.controller.add_task(f"Día {offset}", "Desc", due)
+            done = self.controller.add_task(f"Hecha {offset}", "Desc", due)
+            self.controller.complete_task(done.id)
+        tasks = self.controller.get_tasks(include_deleted=True)
+        for vista in DATE_VIEWS:
+            accepts = view_filter(vista=vista)
+            rows = self.controller.page_date_view(vista, page_size=100, today=today).tasks
+            with self.subTest(vista=vista):
+                self.assertEqual({t.id for t in tasks if accepts(t)}, {row.id for row in rows})
+
+
+if __name__ == '__main__':
+    unittest.main()
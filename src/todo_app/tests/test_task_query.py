@@ -0,0 +1,189 @@
+"""
+Módulo de pruebas unitarias para la especificación de consultas TaskQuery.
+
+Estas pruebas cubren:
+- Normalización y validación de los criterios y del orden
+- Equivalencia entre la consulta SQL y el predicado en Python (matches)
+- Orden por varios campos con dirección y paginación por clave con NULL
+- Palabras clave combinadas con filtros en una única sentencia
+- filter_tasks con varios valores y favoritas sin las tareas de la papelera
+
+Se utiliza una base de datos SQLite en memoria para aislamiento de pruebas.
+"""
+
+import itertools
+import unittest
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, event
+
+from todo_app.models.models import Base
+from todo_app.repositories.controllers import encode_cursor
+from todo_app.repositories.task_query import DEFAULT_ORDER, TaskQuery
+from todo_app.services.task_service import TaskService
+
+TODAY = date(2025, 6, 4)
+PRIORITY_RANK = {'baja': 0, 'media': 1, 'alta': 2}
+
+
+class TaskQueryTestCase(unittest.TestCase):
+    """Casos de prueba para TaskQuery y su compilación en TaskController."""
+
+    def setUp(self):
+        """Crea una base en memoria con tareas que combinan todos los criterios."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.service = TaskService(engine=self.engine, query_cache=False)
+        self.controller = self.service.controller
+        prioridades = itertools.cycle(['alta', 'baja', 'media', 'media'])
+        categorias = itertools.cycle(['trabajo', None, 'hogar', 'estudio', 'hogar'])
+        for i, offset in enumerate([-5, 0, None, 3, 0, 12, -1, None, 6, 1, 0, 40, 2, -20, None, 5]):
+            due = TODAY + timedelta(days=offset) if offset is not None else None
+            task = self.controller.add_task(
+                f"Tarea {chr(ord('a') + (i * 7) % 16)} informe" if i % 3 else f"Tarea {i} reunión",
+                "Desc", due, next(prioridades), next(categorias)
+            )
+            if i % 4 == 1:
+                self.controller.complete_task(task.id)
+            if i % 5 == 2:
+                self.controller.favorite_task(task.id)
+            if i % 7 == 3:
+                self.controller.delete_task(task.id)
+        self.tasks = self.controller.get_tasks(include_deleted=True)
+
+    def tearDown(self):
+        """Cierra la sesión al finalizar cada prueba."""
+        self.controller.session.close()
+        self.engine.dispose()
+
+    def _walk(self, query, page_size=3):
+        rows, cursor = [], None
+        while True:
+            page = self.controller.query_task_rows(query, cursor, page_size, today=TODAY)
+            rows.extend(page.tasks)
+            cursor = page.next_cursor
+            if cursor is None:
+                return rows
+
+    def _expected(self, query):
+        """Filtra con ``matches`` y ordena en Python como SQLite (NULL primero en ascendente)."""
+        def key(task):
+            parts = []
+            for field in query.orden:
+                value = getattr(task, field.lstrip('-'))
+                if field.lstrip('-') == 'prioridad':
+                    value = PRIORITY_RANK[value.name]
+                elif field.lstrip('-') == 'categoria':
+                    value = value.name if value else None
+                elif field.lstrip('-') == 'titulo':
+                    value = value.lower()
+                descending = field.startswith('-')
+                parts.append((value is not None) != descending)
+                if value is not None:
+                    parts.append(_Reversed(value) if descending else value)
+                else:
+                    parts.append(0)
+            return parts + [task.id]
+        return [t.id for t in sorted((t for t in self.tasks if query.matches(t, today=TODAY)), key=key)]
+
+    def test_normalizes_and_validates(self):
+        query = TaskQuery(prioridades='alta', categorias=['hogar', None], orden='-prioridad, titulo',
+                          keyword='  ', favorita=1)
+        self.assertEqual(query.prioridades, frozenset({'alta'}))
+        self.assertEqual(query.categorias, frozenset({'hogar', None}))
+        self.assertEqual(query.orden, ('-prioridad', 'titulo'))
+        self.assertIsNone(query.keyword)
+        self.assertIs(query.favorita, True)
+        self.assertEqual(TaskQuery().orden, DEFAULT_ORDER)
+        self.assertEqual(hash(query), hash(TaskQuery(prioridades=['alta'], categorias=[None, 'hogar'],
+                                                     orden=['-prioridad', 'titulo'], favorita=True)))
+        self.assertEqual(query._replace(prioridades=['baja', 'alta']).prioridades, frozenset({'alta', 'baja'}))
+        for invalid in ({'estado': 'archivadas'}, {'prioridades': 'urgente'}, {'categorias': 'ocio'},
+                        {'vista': 'mañana'}, {'orden': 'color'}, {'orden': 'titulo,-titulo'}):
+            with self.subTest(invalid=invalid), self.assertRaises(ValueError):
+                TaskQuery(**invalid)
+
+    def test_sql_matches_python_predicate(self):
+        queries = [
+            TaskQuery(),
+            TaskQuery(estado='pendientes', prioridades={'alta', 'media'}),
+            TaskQuery(categorias={'hogar', None}, favorita=False),
+            TaskQuery(favorita=True, eliminada=None),
+            TaskQuery(eliminada=True),
+            TaskQuery(desde=TODAY, hasta=TODAY + timedelta(days=6), estado='completadas'),
+            TaskQuery(hasta=TODAY, categorias='trabajo', eliminada=None),
+        ] + [TaskQuery(vista=vista, prioridades='media') for vista in
+             ('vencidas', 'hoy', 'semana', 'proximas', 'sin_fecha')]
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual([row.id for row in self._walk(query)], self._expected(query))
+                self.assertEqual([t.id for t in self.controller.query_tasks(query, today=TODAY)],
+                                 self._expected(query))
+
+    def test_sort_keys_with_direction_and_nulls(self):
+        for orden in ['-fecha_vencimiento', '-prioridad,fecha_vencimiento', 'titulo', '-titulo',
+                      'categoria,-prioridad', '-categoria', 'prioridad,-fecha_vencimiento', '-creada_en']:
+            query = TaskQuery(eliminada=None, orden=orden)
+            for page_size in (1, 4):
+                with self.subTest(orden=orden, page_size=page_size):
+                    self.assertEqual([row.id for row in self._walk(query, page_size)], self._expected(query))
+
+    def test_default_order_cursor_matches_listing(self):
+        page = self.controller.query_task_rows(TaskQuery(), page_size=4)
+        self.assertEqual(page.next_cursor, encode_cursor(page.tasks[-1]))
+        self.assertEqual(self.controller.page_task_rows(page.next_cursor, 4).tasks,
+                         self.controller.query_task_rows(TaskQuery(), page.next_cursor, 4).tasks)
+        with self.assertRaises(ValueError):
+            self.controller.query_task_rows(TaskQuery(orden='-prioridad,titulo'), page.next_cursor)
+
+    def test_keyword_combines_with_filters_in_one_statement(self):
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        query = TaskQuery(keyword='informe', estado='pendientes', prioridades={'media', 'baja'},
+                          orden='-prioridad,titulo')
+        event.listen(self.engine, 'before_cursor_execute', capture)
+        try:
+            page = self.controller.query_task_rows(query, page_size=100)
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', capture)
+        self.assertEqual(len(statements), 1)
+        expected = [t.id for t in self.controller.search_tasks('informe') if query.matches(t)]
+        self.assertEqual(sorted(row.id for row in page.tasks), sorted(expected))
+        self.assertTrue(page.tasks)
+        ranks = [(-PRIORITY_RANK[row.prioridad.name], row.titulo.lower()) for row in page.tasks]
+        self.assertEqual(ranks, sorted(ranks))
+
+    def test_filter_tasks_accepts_several_values(self):
+        result = self.controller.filter_tasks(prioridad=['alta', 'baja'], categoria={'hogar', 'trabajo'})
+        expected = TaskQuery(prioridades={'alta', 'baja'}, categorias={'hogar', 'trabajo'})
+        self.assertEqual([t.id for t in result], [t.id for t in self.tasks if expected.matches(t)])
+        self.assertTrue(result)
+
+    def test_favorites_exclude_deleted(self):
+        favorite = self.service.create_task("Favorita borrada", "Desc", None)
+        self.service.favorite_task(favorite.id)
+        self.service.delete_task(favorite.id)
+        favorites = self.service.get_favorite_tasks()
+        self.assertTrue(favorites)
+        self.assertTrue(all(t.favorita and not t.eliminada for t in favorites))
+        self.assertNotIn(favorite.id, [t.id for t in favorites])
+
+
+class _Reversed:
+    """Invierte la comparación de un valor para ordenar de forma descendente en Python."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+if __name__ == '__main__':
+    unittest.main()
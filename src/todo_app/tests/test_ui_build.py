@@ -0,0 +1,21 @@
+"""
+Módulo de pruebas unitarias para la interfaz compilada.
+
+Verifica que ``ui/main_window_ui.py`` corresponde al contenido actual de
+``ui/main_window.ui``; si falla, regenerarlo con ``python -m todo_app.ui.build``.
+"""
+
+import unittest
+
+from todo_app.ui import build
+
+
+class UiBuildTestCase(unittest.TestCase):
+    """Casos de prueba para el módulo build de la interfaz."""
+
+    def test_compiled_ui_is_up_to_date(self):
+        self.assertTrue(build.is_up_to_date(), "Ejecuta: python -m todo_app.ui.build")
+
+
+if __name__ == '__main__':
+    unittest.main()
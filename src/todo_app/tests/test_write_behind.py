@@ -0,0 +1,225 @@
+"""
+Módulo de pruebas unitarias para la confirmación diferida (write-behind).
+
+Estas pruebas cubren:
+- Modificaciones visibles en la sesión al instante y en otras conexiones solo al confirmar
+- Confirmación al vencer la ventana de espera o al alcanzar max_pending
+- Aviso a los oyentes al aplicar y al confirmar
+- Desactivación con confirmación de lo pendiente
+- Lectura de TODO_WRITE_DELAY_MS
+- DatabaseClient confirmando por temporizador, tras errores y en shutdown
+- Lotes diferidos que fallan a medias sin confirmar sus bloques ya aplicados
+
+Se utiliza una base de datos SQLite en un archivo temporal para poder leerla
+desde una segunda conexión.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+from PyQt5.QtWidgets import QApplication
+from sqlalchemy import func, select, text
+
+from todo_app.db_worker import DatabaseClient
+from todo_app.models.database import create_db_engine, sqlite_url
+from todo_app.models.models import Tarea
+from todo_app.services.task_service import TaskService
+from todo_app.services.write_behind import WRITE_DELAY_ENV_VAR, delay_from_environment
+from todo_app.tests.test_db_worker import wait_until
+
+app = QApplication.instance() or QApplication([])
+
+
+class FakeClock:
+    """Reloj monótono controlado por la prueba."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class WriteBehindTestCase(unittest.TestCase):
+    """Casos de prueba para TaskService con confirmaciones diferidas."""
+
+    def setUp(self):
+        """Crea una base temporal, un servicio con write-behind y un reloj falso."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = create_db_engine(sqlite_url(os.path.join(self.tmp.name, 'tareas.db')))
+        self.service = TaskService(engine=self.engine)
+        self.task_id = self.service.create_task("Base", "Desc", date(2025, 5, 1)).id
+        self.service.enable_write_behind(delay=0.5, max_pending=5)
+        self.clock = FakeClock()
+        self.service.write_behind.clock = self.clock
+
+    def tearDown(self):
+        """Cierra la sesión y elimina la base temporal."""
+        self.service.controller.session.close()
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def committed(self, column):
+        """Lee ``column`` de la tarea base desde otra conexión."""
+        with self.engine.connect() as connection:
+            return connection.execute(select(column).where(Tarea.id == self.task_id)).scalar()
+
+    def test_changes_are_visible_before_commit(self):
+        self.service.favorite_task(self.task_id)
+        self.service.complete_task(self.task_id)
+        self.assertEqual(self.service.pending_writes(), 2)
+        task = self.service.get_tasks_by_ids([self.task_id])[0]
+        self.assertEqual((task.favorita, task.completada), (True, True))
+        self.assertFalse(self.committed(Tarea.favorita))
+
+        self.assertEqual(self.service.flush_writes(), 2)
+        self.assertEqual(self.service.pending_writes(), 0)
+        self.assertTrue(self.committed(Tarea.favorita))
+
+    def test_flush_when_window_elapses(self):
+        self.service.favorite_task(self.task_id)
+        self.clock.now += 0.2
+        self.service.complete_task(self.task_id)
+        self.assertAlmostEqual(self.service.seconds_until_flush(), 0.3)
+        self.assertEqual(self.service.flush_due_writes(), 0)
+
+        self.clock.now += 0.3
+        self.assertEqual(self.service.seconds_until_flush(), 0.0)
+        self.assertEqual(self.service.flush_due_writes(), 2)
+        self.assertIsNone(self.service.seconds_until_flush())
+        self.assertTrue(self.committed(Tarea.completada))
+
+    def test_flush_when_max_pending_reached(self):
+        for i in range(4):
+            self.service.favorite_task(self.task_id, is_favorite=bool(i % 2))
+        self.assertEqual(self.service.pending_writes(), 4)
+        created = self.service.create_task("Quinta", "Desc", date(2025, 5, 2))
+        self.assertIsNotNone(created.id)
+        self.assertEqual(self.service.pending_writes(), 0)
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.execute(select(func.count()).select_from(Tarea)).scalar(), 2)
+
+    def test_listeners_notified_on_apply_and_commit(self):
+        changes = []
+        self.service.add_change_listener(changes.append)
+        other = self.service.create_task("Otra", "Desc", date(2025, 5, 2))
+        self.service.delete_tasks([self.task_id])
+        self.service.flush_writes()
+        self.assertEqual(changes, [[other.id], [self.task_id], sorted([other.id, self.task_id])])
+
+        changes.clear()
+        self.service.complete_tasks(where=Tarea.completada.is_(False))
+        self.service.flush_writes()
+        self.assertEqual(changes, [None, None])
+
+    def test_permanent_delete_is_deferred(self):
+        self.service.permanently_delete_task(self.task_id)
+        self.assertEqual(self.service.get_tasks_by_ids([self.task_id]), [])
+        self.assertIsNotNone(self.committed(Tarea.id))
+        self.service.flush_writes()
+        self.assertIsNone(self.committed(Tarea.id))
+
+    def test_disable_flushes_pending(self):
+        self.service.favorite_task(self.task_id)
+        self.service.disable_write_behind()
+        self.assertTrue(self.committed(Tarea.favorita))
+        self.service.complete_task(self.task_id)
+        self.assertTrue(self.committed(Tarea.completada))
+        self.assertEqual(self.service.pending_writes(), 0)
+
+    def test_delay_from_environment(self):
+        for value, expected in (('', None), ('0', None), ('250', 0.25)):
+            with self.subTest(value=value), mock.patch.dict(os.environ, {WRITE_DELAY_ENV_VAR: value}):
+                self.assertEqual(delay_from_environment(), expected)
+        for value in ('rápido', '-5'):
+            with self.subTest(value=value), mock.patch.dict(os.environ, {WRITE_DELAY_ENV_VAR: value}):
+                with self.assertRaises(ValueError):
+                    delay_from_environment()
+
+
+class WriteBehindClientTestCase(unittest.TestCase):
+    """Casos de prueba para DatabaseClient con un servicio que difiere las confirmaciones."""
+
+    def setUp(self):
+        """Crea una base temporal con una tarea y un cliente con write-behind."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = create_db_engine(sqlite_url(os.path.join(self.tmp.name, 'tareas.db')))
+        service = TaskService(engine=self.engine)
+        self.task_id = service.create_task("Base", "Desc", date(2025, 5, 1)).id
+        service.controller.session.close()
+        service.enable_write_behind(delay=0.05)
+        self.client = DatabaseClient(service)
+
+    def tearDown(self):
+        """Detiene el hilo y elimina la base temporal."""
+        self.client.shutdown()
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def committed_favorite(self):
+        with self.engine.connect() as connection:
+            return connection.execute(select(Tarea.favorita).where(Tarea.id == self.task_id)).scalar()
+
+    def test_timer_flushes_after_window(self):
+        results = []
+        self.client.submit(lambda service: service.favorite_task(self.task_id), results.append)
+        wait_until(lambda: results)
+        wait_until(self.committed_favorite)
+        self.assertEqual(self.client.worker.service.pending_writes(), 0)
+
+    def test_failed_job_keeps_earlier_writes(self):
+        errors = []
+
+        def failing(service):
+            raise ValueError("fallo")
+
+        self.client.submit(lambda service: service.favorite_task(self.task_id))
+        self.client.submit(failing, on_error=errors.append)
+        wait_until(lambda: errors)
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertTrue(self.committed_favorite())
+
+    def test_failed_bulk_job_discards_its_applied_chunks(self):
+        seed = TaskService(engine=self.engine)
+        ids = [seed.create_task(f"Lote {i}", "Desc", None).id for i in range(4)]
+        seed.controller.session.close()
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                f"CREATE TRIGGER falla_lote BEFORE UPDATE OF completada ON tareas WHEN NEW.id = {ids[-1]} "
+                "BEGIN SELECT RAISE(ABORT, 'fallo del lote'); END"
+            ))
+        done, errors = [], []
+        self.client.worker.service.write_behind.delay = 60
+        self.client.submit(lambda service: service.favorite_task(self.task_id), done.append)
+        with mock.patch('todo_app.repositories.controllers.MUTATION_CHUNK_SIZE', 2):
+            self.client.submit(lambda service: service.complete_tasks(ids), on_error=errors.append)
+            wait_until(lambda: done and errors)
+        self.assertTrue(self.committed_favorite())
+        with self.engine.connect() as connection:
+            completed = connection.execute(
+                select(func.count()).select_from(Tarea).where(Tarea.completada.is_(True))
+            ).scalar()
+        self.assertEqual(completed, 0)
+
+        # El trabajo siguiente sigue difiriendo sus modificaciones.
+        self.client.submit(lambda service: service.favorite_task(ids[0]), done.append)
+        wait_until(lambda: len(done) == 2)
+        self.assertEqual(self.client.worker.service.pending_writes(), 1)
+        with self.engine.connect() as connection:
+            self.assertFalse(connection.execute(select(Tarea.favorita).where(Tarea.id == ids[0])).scalar())
+
+    def test_shutdown_flushes_pending(self):
+        self.client.worker.service.write_behind.delay = 60
+        done = []
+        self.client.submit(lambda service: service.favorite_task(self.task_id), done.append)
+        wait_until(lambda: done)
+        self.assertFalse(self.committed_favorite())
+        self.client.shutdown()
+        self.assertTrue(self.committed_favorite())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+"""Definición de la interfaz gráfica (.ui) y su versión compilada con pyuic5."""
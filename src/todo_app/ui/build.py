@@ -0,0 +1,79 @@
+"""
+Compilación de ``main_window.ui`` a ``main_window_ui.py``.
+
+La aplicación usa la clase compilada ``Ui_MainWindow`` para no analizar el
+XML del archivo .ui en cada arranque. Tras editar ``main_window.ui`` en Qt
+Designer hay que regenerar el módulo compilado:
+
+    python -m todo_app.ui.build          # regenera main_window_ui.py
+    python -m todo_app.ui.build --check  # falla si está desactualizado
+"""
+
+import argparse
+import io
+import os
+import sys
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+UI_FILE = os.path.join(UI_DIR, 'main_window.ui')
+COMPILED_FILE = os.path.join(UI_DIR, 'main_window_ui.py')
+
+
+def generate():
+    """
+    Compila el archivo .ui con el generador de PyQt5.
+
+    Returns:
+        str: Código fuente de ``main_window_ui.py``.
+    """
+    from PyQt5 import uic
+
+    output = io.StringIO()
+    with open(UI_FILE, 'r', encoding='utf-8') as ui_file:
+        uic.compileUi(ui_file, output)
+    return output.getvalue().replace(
+        f"reading ui file '{UI_FILE}'", "reading ui file 'main_window.ui'"
+    )
+
+
+def _code_lines(source):
+    """Líneas de código sin comentarios de cabecera (ruta y versión del generador)."""
+    return [line for line in source.splitlines() if not line.startswith('#')]
+
+
+def is_up_to_date():
+    """
+    Indica si ``main_window_ui.py`` corresponde al contenido actual del .ui.
+
+    Returns:
+        bool: True si el módulo compilado está al día.
+    """
+    if not os.path.exists(COMPILED_FILE):
+        return False
+    with open(COMPILED_FILE, 'r', encoding='utf-8') as compiled:
+        return _code_lines(compiled.read()) == _code_lines(generate())
+
+
+def main(argv=None):
+    """Regenera o verifica el módulo compilado de la interfaz."""
+    parser = argparse.ArgumentParser(description='Compila main_window.ui con pyuic5.')
+    parser.add_argument('--check', action='store_true',
+                        help='Solo verificar; termina con error si está desactualizado')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        if is_up_to_date():
+            print('main_window_ui.py está al día')
+            return 0
+        print('main_window_ui.py está desactualizado; ejecuta python -m todo_app.ui.build',
+              file=sys.stderr)
+        return 1
+
+    with open(COMPILED_FILE, 'w', encoding='utf-8', newline='\r\n') as compiled:
+        compiled.write(generate())
+    print(f'Generado {COMPILED_FILE}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-# Form implementation generated from reading ui file 'e:\todolist\src\todo_app\ui\main_window.ui'
+# Form implementation generated from reading ui file 'main_window.ui'
 #
 # Created by: PyQt5 UI code generator 5.15.11
 #
@@ -18,80 +18,146 @@ class Ui_MainWindow(object):
         self.centralwidget.setObjectName("centralwidget")
         self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
         self.verticalLayout.setObjectName("verticalLayout")
-        self.horizontalInputLayout = QtWidgets.QHBoxLayout()
-        self.horizontalInputLayout.setObjectName("horizontalInputLayout")
-        self.input_title = QtWidgets.QLineEdit(self.centralwidget)
+        self.group_input = QtWidgets.QGroupBox(self.centralwidget)
+        self.group_input.setObjectName("group_input")
+        self.formInputLayout = QtWidgets.QHBoxLayout(self.group_input)
+        self.formInputLayout.setObjectName("formInputLayout")
+        self.leftInputLayout = QtWidgets.QVBoxLayout()
+        self.leftInputLayout.setObjectName("leftInputLayout")
+        self.input_title = QtWidgets.QLineEdit(self.group_input)
         self.input_title.setObjectName("input_title")
-        self.horizontalInputLayout.addWidget(self.input_title)
-        self.input_description = QtWidgets.QTextEdit(self.centralwidget)
+        self.leftInputLayout.addWidget(self.input_title)
+        self.input_description = QtWidgets.QTextEdit(self.group_input)
         self.input_description.setObjectName("input_description")
-        self.horizontalInputLayout.addWidget(self.input_description)
-        self.input_due_date = QtWidgets.QDateEdit(self.centralwidget)
+        self.leftInputLayout.addWidget(self.input_description)
+        self.formInputLayout.addLayout(self.leftInputLayout)
+        self.rightInputLayout = QtWidgets.QVBoxLayout()
+        self.rightInputLayout.setObjectName("rightInputLayout")
+        self.input_due_date = QtWidgets.QDateEdit(self.group_input)
         self.input_due_date.setCalendarPopup(True)
         self.input_due_date.setObjectName("input_due_date")
-        self.horizontalInputLayout.addWidget(self.input_due_date)
-        self.input_priority = QtWidgets.QComboBox(self.centralwidget)
+        self.rightInputLayout.addWidget(self.input_due_date)
+        self.input_priority = QtWidgets.QComboBox(self.group_input)
         self.input_priority.setObjectName("input_priority")
         self.input_priority.addItem("")
         self.input_priority.addItem("")
         self.input_priority.addItem("")
-        self.horizontalInputLayout.addWidget(self.input_priority)
-        self.input_category = QtWidgets.QComboBox(self.centralwidget)
+        self.rightInputLayout.addWidget(self.input_priority)
+        self.input_category = QtWidgets.QComboBox(self.group_input)
         self.input_category.setObjectName("input_category")
         self.input_category.addItem("")
         self.input_category.addItem("")
         self.input_category.addItem("")
-        self.horizontalInputLayout.addWidget(self.input_category)
-        self.verticalLayout.addLayout(self.horizontalInputLayout)
-        self.buttonLayout = QtWidgets.QHBoxLayout()
-        self.buttonLayout.setObjectName("buttonLayout")
-        self.btn_add = QtWidgets.QPushButton(self.centralwidget)
+        self.rightInputLayout.addWidget(self.input_category)
+        self.formInputLayout.addLayout(self.rightInputLayout)
+        self.verticalLayout.addWidget(self.group_input)
+        self.group_actions = QtWidgets.QGroupBox(self.centralwidget)
+        self.group_actions.setObjectName("group_actions")
+        self.buttonMainLayout = QtWidgets.QVBoxLayout(self.group_actions)
+        self.buttonMainLayout.setObjectName("buttonMainLayout")
+        self.buttonTopLayout = QtWidgets.QHBoxLayout()
+        self.buttonTopLayout.setObjectName("buttonTopLayout")
+        self.btn_add = QtWidgets.QPushButton(self.group_actions)
         self.btn_add.setObjectName("btn_add")
-        self.buttonLayout.addWidget(self.btn_add)
-        self.btn_update = QtWidgets.QPushButton(self.centralwidget)
+        self.buttonTopLayout.addWidget(self.btn_add)
+        self.btn_update = QtWidgets.QPushButton(self.group_actions)
         self.btn_update.setObjectName("btn_update")
-        self.buttonLayout.addWidget(self.btn_update)
-        self.btn_delete = QtWidgets.QPushButton(self.centralwidget)
+        self.buttonTopLayout.addWidget(self.btn_update)
+        self.btn_delete = QtWidgets.QPushButton(self.group_actions)
         self.btn_delete.setObjectName("btn_delete")
-        self.buttonLayout.addWidget(self.btn_delete)
-        self.btn_restore = QtWidgets.QPushButton(self.centralwidget)
+        self.buttonTopLayout.addWidget(self.btn_delete)
+        self.btn_restore = QtWidgets.QPushButton(self.group_actions)
         self.btn_restore.setObjectName("btn_restore")
-        self.buttonLayout.addWidget(self.btn_restore)
-        self.btn_delete_forever = QtWidgets.QPushButton(self.centralwidget)
+        self.buttonTopLayout.addWidget(self.btn_restore)
+        self.buttonMainLayout.addLayout(self.buttonTopLayout)
+        self.buttonBottomLayout = QtWidgets.QHBoxLayout()
+        self.buttonBottomLayout.setObjectName("buttonBottomLayout")
+        self.btn_delete_forever = QtWidgets.QPushButton(self.group_actions)
         self.btn_delete_forever.setObjectName("btn_delete_forever")
-        self.buttonLayout.addWidget(self.btn_delete_forever)
-        self.btn_complete = QtWidgets.QPushButton(self.centralwidget)
+        self.buttonBottomLayout.addWidget(self.btn_delete_forever)
+        self.btn_complete = QtWidgets.QPushButton(self.group_actions)
         self.btn_complete.setObjectName("btn_complete")
-        self.buttonLayout.addWidget(self.btn_complete)
-        self.btn_favorite = QtWidgets.QPushButton(self.centralwidget)
+        self.buttonBottomLayout.addWidget(self.btn_complete)
+        self.btn_favorite = QtWidgets.QPushButton(self.group_actions)
         self.btn_favorite.setObjectName("btn_favorite")
-        self.buttonLayout.addWidget(self.btn_favorite)
-        self.verticalLayout.addLayout(self.buttonLayout)
-        self.filterLayout = QtWidgets.QHBoxLayout()
-        self.filterLayout.setObjectName("filterLayout")
-        self.btn_filter = QtWidgets.QPushButton(self.centralwidget)
+        self.buttonBottomLayout.addWidget(self.btn_favorite)
+        self.buttonMainLayout.addLayout(self.buttonBottomLayout)
+        self.verticalLayout.addWidget(self.group_actions)
+        self.group_filters = QtWidgets.QGroupBox(self.centralwidget)
+        self.group_filters.setObjectName("group_filters")
+        self.filterMainLayout = QtWidgets.QVBoxLayout(self.group_filters)
+        self.filterMainLayout.setObjectName("filterMainLayout")
+        self.filterTopLayout = QtWidgets.QHBoxLayout()
+        self.filterTopLayout.setObjectName("filterTopLayout")
+        self.btn_filter = QtWidgets.QPushButton(self.group_filters)
         self.btn_filter.setObjectName("btn_filter")
-        self.filterLayout.addWidget(self.btn_filter)
-        self.btn_show_deleted = QtWidgets.QPushButton(self.centralwidget)
+        self.filterTopLayout.addWidget(self.btn_filter)
+        self.btn_show_deleted = QtWidgets.QPushButton(self.group_filters)
+        self.btn_show_deleted.setCheckable(True)
         self.btn_show_deleted.setObjectName("btn_show_deleted")
-        self.filterLayout.addWidget(self.btn_show_deleted)
-        self.btn_show_completed = QtWidgets.QPushButton(self.centralwidget)
+        self.filterTopLayout.addWidget(self.btn_show_deleted)
+        self.btn_show_completed = QtWidgets.QPushButton(self.group_filters)
+        self.btn_show_completed.setCheckable(True)
         self.btn_show_completed.setObjectName("btn_show_completed")
-        self.filterLayout.addWidget(self.btn_show_completed)
-        self.btn_show_pending = QtWidgets.QPushButton(self.centralwidget)
+        self.filterTopLayout.addWidget(self.btn_show_completed)
+        self.btn_show_pending = QtWidgets.QPushButton(self.group_filters)
+        self.btn_show_pending.setCheckable(True)
         self.btn_show_pending.setObjectName("btn_show_pending")
-        self.filterLayout.addWidget(self.btn_show_pending)
-        self.btn_show_high = QtWidgets.QPushButton(self.centralwidget)
+        self.filterTopLayout.addWidget(self.btn_show_pending)
+        self.btn_show_favorites = QtWidgets.QPushButton(self.group_filters)
+        self.btn_show_favorites.setCheckable(True)
+        self.btn_show_favorites.setObjectName("btn_show_favorites")
+        self.filterTopLayout.addWidget(self.btn_show_favorites)
+        self.filterMainLayout.addLayout(self.filterTopLayout)
+        self.filterBottomLayout = QtWidgets.QHBoxLayout()
+        self.filterBottomLayout.setObjectName("filterBottomLayout")
+        self.btn_show_high = QtWidgets.QPushButton(self.group_filters)
+        self.btn_show_high.setCheckable(True)
         self.btn_show_high.setObjectName("btn_show_high")
-        self.filterLayout.addWidget(self.btn_show_high)
-        self.btn_show_medium = QtWidgets.QPushButton(self.centralwidget)
+        self.filterBottomLayout.addWidget(self.btn_show_high)
+        self.btn_show_medium = QtWidgets.QPushButton(self.group_filters)
+        self.btn_show_medium.setCheckable(True)
         self.btn_show_medium.setObjectName("btn_show_medium")
-        self.filterLayout.addWidget(self.btn_show_medium)
-        self.btn_show_low = QtWidgets.QPushButton(self.centralwidget)
+        self.filterBottomLayout.addWidget(self.btn_show_medium)
+        self.btn_show_low = QtWidgets.QPushButton(self.group_filters)
+        self.btn_show_low.setCheckable(True)
         self.btn_show_low.setObjectName("btn_show_low")
-        self.filterLayout.addWidget(self.btn_show_low)
-        self.verticalLayout.addLayout(self.filterLayout)
-        self.list_tasks = QtWidgets.QListWidget(self.centralwidget)
+        self.filterBottomLayout.addWidget(self.btn_show_low)
+        self.btn_clear_filters = QtWidgets.QPushButton(self.group_filters)
+        self.btn_clear_filters.setObjectName("btn_clear_filters")
+        self.filterBottomLayout.addWidget(self.btn_clear_filters)
+        self.filterMainLayout.addLayout(self.filterBottomLayout)
+        self.filterDateLayout = QtWidgets.QHBoxLayout()
+        self.filterDateLayout.setObjectName("filterDateLayout")
+        self.btn_view_overdue = QtWidgets.QPushButton(self.group_filters)
+        self.btn_view_overdue.setCheckable(True)
+        self.btn_view_overdue.setObjectName("btn_view_overdue")
+        self.filterDateLayout.addWidget(self.btn_view_overdue)
+        self.btn_view_today = QtWidgets.QPushButton(self.group_filters)
+        self.btn_view_today.setCheckable(True)
+        self.btn_view_today.setObjectName("btn_view_today")
+        self.filterDateLayout.addWidget(self.btn_view_today)
+        self.btn_view_week = QtWidgets.QPushButton(self.group_filters)
+        self.btn_view_week.setCheckable(True)
+        self.btn_view_week.setObjectName("btn_view_week")
+        self.filterDateLayout.addWidget(self.btn_view_week)
+        self.btn_view_upcoming = QtWidgets.QPushButton(self.group_filters)
+        self.btn_view_upcoming.setCheckable(True)
+        self.btn_view_upcoming.setObjectName("btn_view_upcoming")
+        self.filterDateLayout.addWidget(self.btn_view_upcoming)
+        self.btn_view_no_date = QtWidgets.QPushButton(self.group_filters)
+        self.btn_view_no_date.setCheckable(True)
+        self.btn_view_no_date.setObjectName("btn_view_no_date")
+        self.filterDateLayout.addWidget(self.btn_view_no_date)
+        self.filterMainLayout.addLayout(self.filterDateLayout)
+        self.verticalLayout.addWidget(self.group_filters)
+        self.input_search = QtWidgets.QLineEdit(self.centralwidget)
+        self.input_search.setClearButtonEnabled(True)
+        self.input_search.setObjectName("input_search")
+        self.verticalLayout.addWidget(self.input_search)
+        self.list_tasks = QtWidgets.QListView(self.centralwidget)
+        self.list_tasks.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.list_tasks.setUniformItemSizes(True)
         self.list_tasks.setObjectName("list_tasks")
         self.verticalLayout.addWidget(self.list_tasks)
         MainWindow.setCentralWidget(self.centralwidget)
@@ -101,6 +167,7 @@ class Ui_MainWindow(object):
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "To-Do List"))
+        self.group_input.setTitle(_translate("MainWindow", "📋 Nueva Tarea"))
         self.input_title.setPlaceholderText(_translate("MainWindow", "Título de la tarea"))
         self.input_description.setPlaceholderText(_translate("MainWindow", "Descripción de la tarea"))
         self.input_priority.setToolTip(_translate("MainWindow", "Prioridad de la tarea"))
@@ -111,6 +178,7 @@ class Ui_MainWindow(object):
         self.input_category.setItemText(0, _translate("MainWindow", "Trabajo"))
         self.input_category.setItemText(1, _translate("MainWindow", "Hogar"))
         self.input_category.setItemText(2, _translate("MainWindow", "Estudio"))
+        self.group_actions.setTitle(_translate("MainWindow", "⚙️ Acciones"))
         self.btn_add.setText(_translate("MainWindow", "Agregar ➕"))
         self.btn_update.setText(_translate("MainWindow", "Actualizar 🔄"))
         self.btn_delete.setText(_translate("MainWindow", "Eliminar ❌"))
@@ -118,10 +186,19 @@ class Ui_MainWindow(object):
         self.btn_delete_forever.setText(_translate("MainWindow", "Eliminar Definitivo 🗑️"))
         self.btn_complete.setText(_translate("MainWindow", "Marcar Completada ✅"))
         self.btn_favorite.setText(_translate("MainWindow", "Marcar Favorita ⭐"))
+        self.group_filters.setTitle(_translate("MainWindow", "🔎 Filtros"))
         self.btn_filter.setText(_translate("MainWindow", "Filtrar por fecha 📆"))
         self.btn_show_deleted.setText(_translate("MainWindow", "Ver Eliminadas 🗑️"))
         self.btn_show_completed.setText(_translate("MainWindow", "Ver Completadas ✅"))
         self.btn_show_pending.setText(_translate("MainWindow", "Ver Pendientes 🔴"))
+        self.btn_show_favorites.setText(_translate("MainWindow", "Ver Favoritas ⭐"))
         self.btn_show_high.setText(_translate("MainWindow", "Alta ⚡"))
         self.btn_show_medium.setText(_translate("MainWindow", "Media ⚠️"))
         self.btn_show_low.setText(_translate("MainWindow", "Baja 🐢"))
+        self.btn_clear_filters.setText(_translate("MainWindow", "Quitar filtros ✖️"))
+        self.btn_view_overdue.setText(_translate("MainWindow", "Vencidas ⏰"))
+        self.btn_view_today.setText(_translate("MainWindow", "Hoy 📌"))
+        self.btn_view_week.setText(_translate("MainWindow", "Esta semana 🗓️"))
+        self.btn_view_upcoming.setText(_translate("MainWindow", "Próximos días ⏩"))
+        self.btn_view_no_date.setText(_translate("MainWindow", "Sin fecha ➖"))
+        self.input_search.setPlaceholderText(_translate("MainWindow", "Buscar tareas… 🔍"))
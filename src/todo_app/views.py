@@ -3,33 +3,149 @@ Interfaz gráfica principal de la aplicación To-Do List.
 
 Este módulo contiene la clase MainWindow, que implementa la lógica de la ventana
 principal y conecta la interfaz de usuario con los servicios de negocio.
+
+Las llamadas al servicio se ejecutan en el hilo de ``DatabaseClient``; la
+ventana solo recibe filas de solo lectura (``TaskRow``, que la lista usa como
+``TaskItem``) y nunca bloquea el bucle de eventos esperando a la base de datos.
 """
 
 import os
-from datetime import datetime
-from PyQt5 import uic
-from PyQt5.QtCore import QDate
+from PyQt5.QtCore import QCoreApplication, QDate, QThread, QTimer
+from PyQt5.QtGui import QFontDatabase
 from PyQt5.QtWidgets import (
+    QDialog,
+    QLabel,
     QMainWindow,
-    QPushButton,
-    QListWidgetItem,
-    QMessageBox
+    QMessageBox,
+    QPlainTextEdit,
+    QVBoxLayout
 )
+from todo_app.db_worker import DatabaseClient
+from todo_app.models.fts import search_terms
+from todo_app.models.models import NivelPrioridad
+from todo_app.repositories.task_query import DATE_VIEWS, TaskQuery
+from todo_app.reminder_timer import ReminderTimer
+from todo_app.services.reminder_scheduler import ReminderScheduler
 from todo_app.services.task_service import TaskService
-
-
-class MainWindow(QMainWindow):
+from todo_app.services.write_behind import delay_from_environment
+from todo_app.sql_profiler import profiler
+from todo_app.startup_trace import tracer
+from todo_app.task_list_model import TASK_ID_ROLE, HighlightDelegate, TaskItem, TaskListModel
+from todo_app.ui.main_window_ui import Ui_MainWindow
+
+# Canal de los trabajos que alimentan la lista: cambiar de vista cancela el anterior.
+VIEW_CHANNEL = 'view'
+# Canal del panel de resumen: solo interesa el recuento más reciente.
+STATS_CHANNEL = 'stats'
+# Canal de la sincronización con el registro de cambios, que recoge también
+# lo escrito por otros procesos (p. ej. la API HTTP) cada SYNC_INTERVAL_MS.
+SYNC_CHANNEL = 'sync'
+SYNC_INTERVAL_MS = 5000
+# Pausa de escritura tras la que se lanza la búsqueda en vivo.
+SEARCH_DEBOUNCE_MS = 150
+
+# Con TODO_UI_RUNTIME=1 la interfaz se carga desde el .ui con uic (útil al
+# editar en Qt Designer, antes de regenerar con ``python -m todo_app.ui.build``).
+RUNTIME_UI_ENV_VAR = 'TODO_UI_RUNTIME'
+UI_PATH = os.path.join(os.path.dirname(__file__), 'ui', 'main_window.ui')
+
+
+def use_runtime_ui():
+    """Indica si la interfaz debe cargarse desde el .ui en lugar del módulo compilado."""
+    return os.environ.get(RUNTIME_UI_ENV_VAR, '') not in ('', '0')
+
+
+def view_filter(estado=None, prioridad=None, categoria=None, deleted=False, vista=None):
+    """
+    Construye el predicado que indica si una tarea pertenece a una vista.
+
+    Reproduce en Python (``TaskQuery.matches``) los filtros de la consulta de
+    la vista para decidir, tras una modificación, si la fila debe mostrarse o
+    retirarse sin volver a consultar toda la lista.
+
+    Args:
+        estado (str): 'completadas' o 'pendientes'.
+        prioridad (str | Iterable[str]): 'alta', 'media' o 'baja', o varias.
+        categoria (str | Iterable[str]): 'trabajo', 'hogar' o 'estudio', o varias.
+        deleted (bool): Si True, la vista es la papelera.
+        vista (str): Vista por fecha ('vencidas', 'hoy', 'semana', 'proximas'
+            o 'sin_fecha'); solo admite tareas pendientes.
+
+    Returns:
+        callable: Predicado ``accepts(task) -> bool``.
+    """
+    return TaskQuery(estado=estado, prioridades=prioridad, categorias=categoria, eliminada=deleted,
+                     vista=vista).matches
+
+
+def format_stats(stats):
+    """
+    Texto del panel de resumen de la barra de estado.
+
+    Args:
+        stats (TaskStats): Contadores devueltos por ``TaskService.stats``.
+
+    Returns:
+        str: Resumen en una línea.
+    """
+    prioridades = " / ".join(
+        f"{nivel.value} {stats.by_priority[nivel.name]}" for nivel in NivelPrioridad
+    )
+    return (f"Pendientes: {stats.pending} · Vencidas: {stats.overdue} · "
+            f"Completadas: {stats.completed} · Favoritas: {stats.favorites} · "
+            f"Papelera: {stats.deleted} | {prioridades}")
+
+
+class MainWindow(QMainWindow, Ui_MainWindow):
     """Ventana principal de la aplicación To-Do List."""
 
-    def __init__(self):
-        """Inicializa la interfaz de usuario y conecta señales con acciones."""
-        super().__init__()
-        ui_path = os.path.join(os.path.dirname(__file__), 'ui', 'main_window.ui')
-        uic.loadUi(ui_path, self)
+    def __init__(self, service=None):
+        """
+        Inicializa la interfaz de usuario y conecta señales con acciones.
 
-        self.service = TaskService()
+        Args:
+            service (TaskService): Servicio a utilizar; por defecto, uno sobre
+                la base de datos de la aplicación. Pasa a usarse solo desde el
+                hilo de la base de datos.
+        """
+        super().__init__()
+        with tracer.phase('MainWindow: cargar interfaz'):
+            if use_runtime_ui():
+                from PyQt5 import uic
+                uic.loadUi(UI_PATH, self)
+            else:
+                self.setupUi(self)
+
+        self.service = service or TaskService()
+        # Confirmaciones agrupadas para clics seguidos (TODO_WRITE_DELAY_MS)
+        write_delay = delay_from_environment()
+        if write_delay is not None:
+            self.service.enable_write_behind(write_delay)
+        # Perfilado opcional (TODO_PROFILE_SQL o --profile-sql): latencia por método
+        if profiler.enabled:
+            profiler.instrument(self.service)
+            profiler.instrument(self.service.controller)
+            self._add_debug_menu()
+        self.db = DatabaseClient(self.service, self)
+        self.db.error.connect(self.show_error)
         self.input_due_date.setDate(QDate(2025, 6, 27))
 
+        self.task_model = TaskListModel(self)
+        self.list_tasks.setModel(self.task_model)
+        self.list_tasks.setItemDelegate(HighlightDelegate(self.list_tasks))
+
+        # Búsqueda en vivo: se espera a una pausa al escribir y cada pulsación
+        # cancela la consulta que quedó atrás.
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(lambda: self.search_tasks(self.input_search.text()))
+        self.input_search.textEdited.connect(self._search_edited)
+
+        # Panel de resumen: contadores calculados con una consulta agrupada
+        self.stats_label = QLabel(self)
+        self.statusBar().addPermanentWidget(self.stats_label)
+
         # Conexiones de botones a métodos
         self.btn_add.clicked.connect(self.create_task)
         self.btn_update.clicked.connect(self.update_task)
@@ -37,15 +153,75 @@ class MainWindow(QMainWindow):
         self.btn_complete.clicked.connect(self.complete_task)
         self.btn_favorite.clicked.connect(self.favorite_task)
         self.btn_restore.clicked.connect(self.restore_task)
-        self.btn_show_deleted.clicked.connect(self.show_deleted_tasks)
         self.btn_delete_forever.clicked.connect(self.permanently_delete_task)
+
+        # Filtros combinables: cada botón activa o desactiva un criterio de la
+        # consulta en curso (``self.filters``) en lugar de sustituir la vista.
+        self.filters = TaskQuery()
+        self.btn_show_deleted.clicked.connect(self.show_deleted_tasks)
         self.btn_show_completed.clicked.connect(self.show_completed_tasks)
         self.btn_show_pending.clicked.connect(self.show_pending_tasks)
-        self.btn_show_high.clicked.connect(lambda: self.show_tasks_by_priority('alta'))
-        self.btn_show_medium.clicked.connect(lambda: self.show_tasks_by_priority('media'))
-        self.btn_show_low.clicked.connect(lambda: self.show_tasks_by_priority('baja'))
-
-        self.load_tasks()
+        self.btn_show_favorites.clicked.connect(self.show_favorite_tasks)
+        self.btn_clear_filters.clicked.connect(self.clear_filters)
+        self.priority_buttons = {'alta': self.btn_show_high, 'media': self.btn_show_medium, 'baja': self.btn_show_low}
+        for nivel, button in self.priority_buttons.items():
+            button.clicked.connect(lambda checked, nivel=nivel: self.show_tasks_by_priority(nivel, checked))
+
+        # Vistas por fecha: cada botón muestra su recuento junto al rótulo
+        self.date_view_buttons = dict(zip(DATE_VIEWS, (
+            self.btn_view_overdue, self.btn_view_today, self.btn_view_week,
+            self.btn_view_upcoming, self.btn_view_no_date
+        )))
+        self._date_view_labels = {vista: button.text() for vista, button in self.date_view_buttons.items()}
+        for vista, button in self.date_view_buttons.items():
+            button.clicked.connect(lambda checked, vista=vista: self.show_date_view(vista, checked))
+
+        # El token se pide antes que la primera página: lo que cambie entre
+        # ambas se vuelve a aplicar, sin perder nada.
+        self._change_token = None
+        self.db.submit(lambda service: service.change_token(), self._set_change_token)
+        with tracer.phase('MainWindow: pedir primera página de tareas'):
+            self.load_tasks()
+            self.refresh_stats()
+        self.sync_timer = QTimer(self)
+        self.sync_timer.setInterval(SYNC_INTERVAL_MS)
+        self.sync_timer.timeout.connect(self.sync_changes)
+        self.sync_timer.start()
+
+        # Recordatorios: un temporizador hasta el próximo aviso pendiente, en un
+        # hilo propio para que sus consultas no se hagan en el de la interfaz.
+        with tracer.phase('MainWindow: recordatorios pendientes'):
+            scheduler = ReminderScheduler(engine=self.service.controller.session.get_bind())
+            scheduler.attach(self.service)
+            self.reminder_thread = QThread(self)
+            self.reminder_timer = ReminderTimer(scheduler)
+            self.reminder_timer.moveToThread(self.reminder_thread)
+            self.reminder_timer.reminders_due.connect(self.show_due_reminders)
+            self.reminder_thread.started.connect(self.reminder_timer.start)
+            self.reminder_thread.finished.connect(self.reminder_timer.stop)
+            self.reminder_thread.start()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._stop_reminders)
+
+    def _add_debug_menu(self):
+        menu = self.menuBar().addMenu("Depuración")
+        menu.addAction("Resumen de consultas SQL", self.show_profile_summary)
+        menu.addAction("Reiniciar mediciones", profiler.reset)
+
+    def show_profile_summary(self):
+        """Muestra el resumen del perfilador SQL (métodos y sentencias más costosos)."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Resumen de consultas SQL")
+        text = QPlainTextEdit(profiler.report(), dialog)
+        text.setReadOnly(True)
+        text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(text)
+        dialog.resize(900, 500)
+        dialog.show()
+        return dialog
 
     def create_task(self):
         """Crea una nueva tarea a partir de los campos de entrada."""
@@ -59,71 +235,71 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "El título es obligatorio.")
             return
 
-        self.service.create_task(title, description, due_date, priority, category)
-        self.load_tasks()
+        self.db.submit(
+            lambda service: TaskItem.from_task(
+                service.create_task(title, description, due_date, priority, category)
+            ),
+            self._task_created
+        )
         self.clear_inputs()
 
+    def _task_created(self, task):
+        self.task_model.upsert_task(task)
+        self.refresh_stats()
+
     def update_task(self):
         """Actualiza una tarea seleccionada con los nuevos valores del formulario."""
-        item = self.list_tasks.currentItem()
-        if item is None:
+        task_id = self.selected_task_id()
+        if task_id is None:
             return
 
-        task_id = item.data(1000)
         title = self.input_title.text()
         description = self.input_description.toPlainText()
         due_date = self.input_due_date.date().toPyDate()
         priority = self.input_priority.currentText().lower()
         category = self.input_category.currentText().lower()
 
-        self.service.update_task(task_id, title, description, due_date, priority, category)
-        self.load_tasks()
+        self._mutate([task_id], lambda service: service.update_task(
+            task_id, title, description, due_date, priority, category
+        ))
 
     def delete_task(self):
-        """Marca como eliminada la tarea seleccionada."""
-        item = self.list_tasks.currentItem()
-        if item is None:
+        """Marca como eliminadas las tareas seleccionadas."""
+        task_ids = self.selected_task_ids()
+        if not task_ids:
             return
 
-        task_id = item.data(1000)
-        self.service.delete_task(task_id)
-        self.load_tasks()
+        self._mutate(task_ids, lambda service: service.delete_tasks(task_ids))
 
     def complete_task(self):
-        """Marca como completada la tarea seleccionada."""
-        item = self.list_tasks.currentItem()
-        if item is None:
+        """Marca como completadas las tareas seleccionadas."""
+        task_ids = self.selected_task_ids()
+        if not task_ids:
             return
 
-        task_id = item.data(1000)
-        self.service.complete_task(task_id)
-        self.load_tasks()
+        self._mutate(task_ids, lambda service: service.complete_tasks(task_ids))
 
     def favorite_task(self):
-        """Marca como favorita la tarea seleccionada."""
-        item = self.list_tasks.currentItem()
-        if item is None:
+        """Marca como favoritas las tareas seleccionadas."""
+        task_ids = self.selected_task_ids()
+        if not task_ids:
             return
 
-        task_id = item.data(1000)
-        self.service.favorite_task(task_id, is_favorite=True)
-        self.load_tasks()
+        self._mutate(task_ids, lambda service: service.favorite_tasks(task_ids, is_favorite=True))
 
     def restore_task(self):
-        """Restaura una tarea eliminada previamente."""
-        item = self.list_tasks.currentItem()
-        if item is None:
+        """Restaura las tareas eliminadas seleccionadas."""
+        task_ids = self.selected_task_ids()
+        if not task_ids:
             QMessageBox.information(self, "Info", "Selecciona una tarea eliminada para restaurar.")
             return
 
-        task_id = item.data(1000)
-        self.service.restore_task(task_id)
-        self.load_tasks()
+        self._mutate(task_ids, lambda service: service.restore_tasks(task_ids))
 
     def permanently_delete_task(self):
         """Elimina permanentemente una tarea eliminada, con confirmación previa."""
-        item = self.list_tasks.currentItem()
-        if item is None:
+        task_id = self.selected_task_id()
+        if task_id is None:
             QMessageBox.warning(self, "Aviso", "Selecciona una tarea eliminada para borrar definitivamente.")
             return
 
@@ -135,66 +311,306 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
-            task_id = item.data(1000)
-            self.service.permanently_delete_task(task_id)
-            self.show_deleted_tasks()
+            self.db.submit(
+                lambda service: service.permanently_delete_task(task_id),
+                lambda _: self.refresh_tasks([task_id], [])
+            )
+
+    def show_deleted_tasks(self, checked=True):
+        """Muestra (o deja de mostrar) la papelera, con los demás filtros activos."""
+        self.apply_filters(self.filters._replace(eliminada=bool(checked)))
 
-    def show_deleted_tasks(self):
-        """Muestra solo las tareas eliminadas."""
-        deleted_tasks = self.service.get_tasks(include_deleted=True)
-        only_deleted = [t for t in deleted_tasks if t.eliminada]
-        self.load_tasks(only_deleted)
+    def show_completed_tasks(self, checked=True):
+        """Muestra solo las tareas completadas (quita la vista por fecha, que solo admite pendientes)."""
+        if checked:
+            self.apply_filters(self.filters._replace(estado="completadas", vista=None))
+        else:
+            self.apply_filters(self.filters._replace(estado=None))
 
-    def show_completed_tasks(self):
-        """Muestra solo las tareas completadas."""
-        completed_tasks = self.service.filter_tasks(estado="completadas")
-        self.load_tasks(completed_tasks)
+    def show_pending_tasks(self, checked=True):
+        """Muestra solo las tareas pendientes, o las de ambos estados si se desactiva."""
+        self.apply_filters(self.filters._replace(estado="pendientes" if checked else None))
 
-    def show_pending_tasks(self):
-        """Muestra solo las tareas pendientes."""
-        tasks = self.service.filter_tasks(estado="pendientes")
-        self.load_tasks(tasks)
+    def show_favorite_tasks(self, checked=True):
+        """Muestra solo las tareas favoritas, o todas si se desactiva."""
+        self.apply_filters(self.filters._replace(favorita=True if checked else None))
 
-    def show_tasks_by_priority(self, priority_level):
+    def show_tasks_by_priority(self, priority_level, checked=True):
         """
-        Muestra tareas según el nivel de prioridad especificado.
+        Añade o quita un nivel de prioridad de los mostrados.
+
+        Con varios niveles activos se muestran las tareas de cualquiera de ellos.
 
         Args:
             priority_level (str): 'alta', 'media' o 'baja'.
+            checked (bool): Si es False, se quita el nivel.
         """
-        tasks = self.service.filter_tasks(prioridad=priority_level)
-        self.load_tasks(tasks)
+        prioridades = self.filters.prioridades
+        prioridades = prioridades | {priority_level} if checked else prioridades - {priority_level}
+        self.apply_filters(self.filters._replace(prioridades=prioridades))
 
-    def load_tasks(self, tasks=None):
+    def show_date_view(self, vista, checked=True):
         """
-        Carga tareas en la lista visual de tareas.
+        Limita la lista a las tareas pendientes de una vista por fecha, o quita la vista.
 
         Args:
-            tasks (list): Lista de tareas a mostrar. Si es None, se cargan todas.
+            vista (str): 'vencidas', 'hoy', 'semana', 'proximas' o 'sin_fecha'.
+            checked (bool): Si es False, se quita la vista.
         """
-        if tasks is None:
-            tasks = self.service.get_tasks()
+        if not checked:
+            self.apply_filters(self.filters._replace(vista=None))
+            return
+        estado = None if self.filters.estado == "completadas" else self.filters.estado
+        self.apply_filters(self.filters._replace(vista=vista, estado=estado))
 
-        self.list_tasks.clear()
+    def clear_filters(self):
+        """Quita todos los filtros y muestra las tareas activas."""
+        self.apply_filters(TaskQuery())
 
-        for task in tasks:
-            estado = "🟢 Completada" if task.completada else "🔴 Pendiente"
-            estrella = "⭐" if task.favorita else ""
-            prioridad = f"⚡{task.prioridad.value}" if task.prioridad else ""
-            categoria = f"📂{task.categoria.value}" if task.categoria else ""
-            vencimiento = (
-                task.fecha_vencimiento.strftime('%d-%m-%Y')
-                if task.fecha_vencimiento else "Sin fecha"
+    def show_due_reminders(self, reminders):
+        """
+        Muestra en la barra de estado los recordatorios que acaban de vencer.
+
+        Args:
+            reminders (list): Recordatorios vencidos (``DueReminder``).
+        """
+        titles = ", ".join(reminder.titulo for reminder in reminders)
+        self.statusBar().showMessage(f"Recordatorio: {titles}")
+
+    def refresh_stats(self):
+        """Vuelve a calcular los contadores del panel y de las vistas por fecha en el hilo de la base de datos."""
+        self.db.submit(
+            lambda service: (service.stats(), service.date_view_counts()),
+            self._show_stats,
+            channel=STATS_CHANNEL
+        )
+
+    def _show_stats(self, result):
+        stats, counts = result
+        self.stats_label.setText(format_stats(stats))
+        for vista, count in zip(DATE_VIEWS, counts):
+            self.date_view_buttons[vista].setText(f"{self._date_view_labels[vista]} ({count})")
+
+    def load_tasks(self, estado=None, prioridad=None, categoria=None, deleted=False):
+        """
+        Muestra en la lista las tareas activas (o las de la papelera) que cumplen los filtros.
+
+        Las filas se piden al servicio página a página a medida que la vista
+        las necesita, en lugar de construirlas todas de una vez. Cada página se
+        consulta en el hilo de la base de datos; cambiar de vista cancela la
+        consulta de la anterior y vacía la búsqueda.
+
+        Args:
+            estado (str): 'completadas' o 'pendientes'.
+            prioridad (str): 'alta', 'media' o 'baja'.
+            categoria (str): 'trabajo', 'hogar' o 'estudio'.
+            deleted (bool): Si True, muestra la papelera.
+        """
+        self.apply_filters(TaskQuery(estado=estado, prioridades=prioridad, categorias=categoria,
+                                     eliminada=deleted))
+
+    def apply_filters(self, query):
+        """
+        Muestra las tareas que cumplen ``query``, marca los botones de sus filtros y vacía la búsqueda.
+
+        Args:
+            query (TaskQuery): Filtros a aplicar.
+        """
+        self.filters = query
+        self._sync_filter_buttons()
+        self._clear_search()
+        self._load_query(query)
+
+    def _sync_filter_buttons(self):
+        query = self.filters
+        self.btn_show_pending.setChecked(query.estado == "pendientes")
+        self.btn_show_completed.setChecked(query.estado == "completadas")
+        self.btn_show_deleted.setChecked(bool(query.eliminada))
+        self.btn_show_favorites.setChecked(query.favorita is True)
+        for nivel, button in self.priority_buttons.items():
+            button.setChecked(nivel in query.prioridades)
+        for vista, button in self.date_view_buttons.items():
+            button.setChecked(query.vista == vista)
+
+    def _clear_search(self):
+        self.search_timer.stop()
+        if self.input_search.text():
+            self.input_search.clear()
+
+    def _load_query(self, query):
+        def request_page(cursor, page_size, deliver):
+            self.db.submit(
+                lambda service: service.query_task_rows_page(query, cursor, page_size),
+                deliver,
+                self._view_failed,
+                channel=VIEW_CHANNEL
             )
 
-            item_text = (
-                f"{estrella} {task.titulo}\n"
-                f"🗒️ {task.descripcion}\n"
-                f"📅 {vencimiento}  |  {estado}  |  {prioridad}  |  {categoria}"
+        accepts = query.matches
+        if query.keyword:
+            # ``matches`` no comprueba las palabras buscadas: solo se actualizan
+            # o retiran las filas ya mostradas, sin insertar tareas nuevas.
+            model = self.task_model
+            accepts = lambda task: model.row_of(task.id) >= 0 and query.matches(task)
+        self.task_model.set_async_source(request_page, accepts=accepts)
+        if query.keyword:
+            self.task_model.set_highlight(query.keyword)
+        self.task_model.fetchMore()
+
+    def _search_edited(self, text):
+        """Descarta la consulta de la vista en curso y reinicia la espera de la búsqueda."""
+        self.db.cancel(VIEW_CHANNEL)
+        self.search_timer.start()
+
+    def search_tasks(self, keyword):
+        """
+        Muestra las tareas activas que coinciden con ``keyword`` y resalta las palabras buscadas.
+
+        Sin filtros, como al escribir las palabras anteriores ya están
+        completas, solo la última se busca como prefijo. La primera página
+        llega por relevancia (o de la más reciente a la más antigua si la
+        búsqueda es muy amplia) y el resto se pide al desplazarse, como en los
+        listados. Con filtros activos, la búsqueda se añade a su consulta y se
+        conserva su orden. Sin palabras buscables se vuelve al listado filtrado.
+
+        Args:
+            keyword (str): Texto de la caja de búsqueda.
+        """
+        if not search_terms(keyword):
+            self._load_query(self.filters)
+            return
+        if self.filters != TaskQuery():
+            self._load_query(self.filters._replace(keyword=keyword))
+            return
+
+        def request_page(cursor, page_size, deliver):
+            self.db.submit(
+                lambda service: service.search_task_rows_page(
+                    keyword, cursor, page_size, prefix_last=True
+                ),
+                deliver,
+                self._view_failed,
+                channel=VIEW_CHANNEL
             )
-            item = QListWidgetItem(item_text)
-            item.setData(1000, task.id)
-            self.list_tasks.addItem(item)
+
+        self.task_model.set_async_source(request_page, accepts=lambda task: not task.eliminada, ranked=True)
+        self.task_model.set_highlight(keyword, prefix_last=True)
+        self.task_model.fetchMore()
+
+    def _mutate(self, task_ids, action):
+        """
+        Ejecuta ``action(service)`` en el hilo de la base de datos y refresca las filas.
+
+        Args:
+            task_ids (list): IDs de las tareas afectadas.
+            action (callable): Operación sobre el servicio.
+        """
+        def job(service):
+            action(service)
+            return service.get_task_rows_by_ids(task_ids)
+
+        self.db.submit(job, lambda found: self.refresh_tasks(task_ids, found))
+
+    def refresh_tasks(self, task_ids, found):
+        """
+        Aplica a la lista el estado recién leído de las tareas indicadas.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas modificadas.
+            found (list): Copias (``TaskItem``) de las que aún existen.
+        """
+        for task in found:
+            self.task_model.upsert_task(task)
+        for task_id in set(task_ids) - {task.id for task in found}:
+            self.task_model.remove_task(task_id)
+        self.refresh_stats()
+
+    def _set_change_token(self, token):
+        self._change_token = token
+
+    def sync_changes(self):
+        """
+        Pide al registro de cambios lo ocurrido desde la última sincronización.
+
+        Recoge también lo escrito por otros procesos sobre la misma base de
+        datos, sin volver a cargar la vista.
+        """
+        if self._change_token is None:
+            return
+        token = self._change_token
+        self.db.submit(
+            lambda service: service.changes_since(token),
+            self.apply_changes,
+            lambda exc: self.statusBar().showMessage(f"Sincronización fallida: {exc}"),
+            channel=SYNC_CHANNEL
+        )
+
+    def apply_changes(self, changes):
+        """
+        Aplica a la lista un ``ChangeSet`` del registro de cambios.
+
+        Args:
+            changes (ChangeSet): Filas creadas y modificadas, IDs borrados y token siguiente.
+        """
+        self._change_token = changes.token
+        for task in changes.created + changes.updated:
+            self.task_model.upsert_task(task)
+        for task_id in changes.deleted:
+            self.task_model.remove_task(task_id)
+        if changes.created or changes.updated or changes.deleted:
+            self.refresh_stats()
+        if changes.has_more:
+            self.sync_changes()
+
+    def _view_failed(self, exc):
+        self.task_model.abort_fetch()
+        self.show_error(exc)
+
+    def show_error(self, exc):
+        """
+        Informa de un error ocurrido en el hilo de la base de datos.
+
+        Args:
+            exc (Exception): Excepción recibida.
+        """
+        QMessageBox.warning(self, "Error", str(exc))
+
+    def _stop_reminders(self):
+        if self.reminder_thread.isRunning():
+            self.reminder_thread.quit()
+            self.reminder_thread.wait()
+            # El hilo ya terminó: la sesión del planificador puede cerrarse desde aquí.
+            self.reminder_timer.scheduler.session.close()
+
+    def closeEvent(self, event):
+        """Detiene recordatorios, sincronización y búsqueda, espera a los trabajos pendientes y confirma lo diferido."""
+        self._stop_reminders()
+        self.sync_timer.stop()
+        self.search_timer.stop()
+        self.db.shutdown()
+        super().closeEvent(event)
+
+    def selected_task_id(self):
+        """
+        Devuelve el ID de la tarea seleccionada en la lista.
+
+        Returns:
+            int: ID de la tarea, o None si no hay selección.
+        """
+        index = self.list_tasks.currentIndex()
+        if not index.isValid():
+            return None
+        return index.data(TASK_ID_ROLE)
+
+    def selected_task_ids(self):
+        """
+        Devuelve los IDs de todas las tareas seleccionadas en la lista.
+
+        Returns:
+            list: IDs en el orden en que aparecen en la lista.
+        """
+        rows = sorted(index.row() for index in self.list_tasks.selectionModel().selectedIndexes())
+        return [self.task_model.task_id(row) for row in rows]
 
     def clear_inputs(self):
         """Limpia todos los campos del formulario de entrada."""